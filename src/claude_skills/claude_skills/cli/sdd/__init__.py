@@ -91,6 +91,7 @@ def reorder_args_for_subcommand(cmd_line):
         'debug': False,
         'verbose': False,
         'no_color': False,
+        'no_cache': False,
         'refresh': False,
         'skip_refresh': False,
         'no_staleness_check': False,
@@ -241,6 +242,13 @@ def main():
                 print(f"\nRun 'sdd --help' to see all available commands.\n", file=sys.stderr)
         raise
 
+    # --no-cache bypasses the AI response cache for every consultation in this run
+    # (checked on the raw command line too, like --no-json, since subparser
+    # defaults can reset flags given before the subcommand)
+    if getattr(args, 'no_cache', False) or '--no-cache' in original_cmd_line:
+        from claude_skills.common.cache.response_cache import set_response_cache_bypass
+        set_response_cache_bypass(True)
+
     # Initialize printer based on parsed global flags
     # When JSON output is requested, suppress all printer output (quiet mode)
     from claude_skills.cli.sdd.verbosity import VerbosityLevel
@@ -131,6 +131,11 @@ def add_global_options(parser, config=None):
         action='store_true',
         help='Disable colored output'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the AI response cache for this run (always consult tools)'
+    )
 
 
 def add_spec_options(parser):
@@ -227,6 +227,10 @@ CACHE_STATS_STANDARD = {
     'expired_entries', 'total_size_mb', 'total_size_bytes'
 }
 
+# cache refresh-tools command (cache)
+CACHE_REFRESH_TOOLS_ESSENTIAL = {'available_tools'}
+CACHE_REFRESH_TOOLS_STANDARD = {'tools', 'available_tools', 'entries_cleared'}
+
 # list-plan-review-tools command (sdd_plan_review)
 LIST_TOOLS_ESSENTIAL = {'available_count', 'total'}
 LIST_TOOLS_STANDARD = {'available', 'disabled', 'not_installed', 'total', 'available_count'}
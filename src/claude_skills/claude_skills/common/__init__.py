@@ -35,6 +35,7 @@ from .paths import (
     normalize_path,
     batch_check_paths_exist,
     find_files_by_pattern,
+    iter_matching_files,
     ensure_directory,
     ensure_reports_directory,
     generate_reports_readme_content,
@@ -114,7 +115,11 @@ from .metrics import (
     capture_metrics,
     record_metric,
     get_metrics_file_path,
-    is_metrics_enabled
+    is_metrics_enabled,
+    record_provider_latency,
+    get_provider_latency,
+    get_adaptive_timeout,
+    get_hedge_delay,
 )
 
 # Documentation helpers
@@ -220,6 +225,7 @@ __all__ = [
     "normalize_path",
     "batch_check_paths_exist",
     "find_files_by_pattern",
+    "iter_matching_files",
     "ensure_directory",
     "ensure_reports_directory",
     "generate_reports_readme_content",
@@ -293,6 +299,10 @@ __all__ = [
     "record_metric",
     "get_metrics_file_path",
     "is_metrics_enabled",
+    "record_provider_latency",
+    "get_provider_latency",
+    "get_adaptive_timeout",
+    "get_hedge_delay",
 
     # Documentation helpers
     "check_doc_query_available",
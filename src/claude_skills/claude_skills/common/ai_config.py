@@ -8,13 +8,17 @@ checks.
 This module provides a common interface for all skills to load their AI tool configurations.
 """
 
+import logging
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import yaml
 
-from claude_skills.common.ai_tools import build_tool_command
+from claude_skills.common.ai_tools import CompletionPolicy, build_tool_command
+from claude_skills.common.config_snapshot import load_config_snapshot
+
+logger = logging.getLogger(__name__)
 
 # Default provider/tool configuration (fallback if config file not found)
 DEFAULT_TOOLS = {
@@ -49,6 +53,9 @@ DEFAULT_TOOLS = {
 # This is the single source of truth for tool names across the toolkit
 ALL_SUPPORTED_TOOLS = ["gemini", "cursor-agent", "codex", "claude", "opencode"]
 
+# In-process provider for offline load testing; only used when enabled in config
+STUB_TOOL = "stub"
+
 DEFAULT_MODELS = {
     "gemini": {"priority": ["gemini-2.5-flash", "gemini-2.5-pro", "pro"]},
     "cursor-agent": {"priority": ["composer-1", "gpt-5.1-codex"]},
@@ -555,22 +562,20 @@ def get_global_config_path() -> Path:
 def load_global_config() -> Dict:
     """Load the global AI configuration file.
 
+    The YAML is parsed once per process and cached until the file's mtime changes
+    (see `config_snapshot`), so repeated getters do not re-parse it.
+
     Returns:
         Dictionary with global configuration, or empty dict if file doesn't exist
     """
     config_path = get_global_config_path()
 
     try:
-        if not config_path.exists():
+        snapshot = load_config_snapshot(config_path, yaml.safe_load, "yaml")
+        if snapshot is None or not snapshot.data:
             return {}
 
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
-
-        if not config_data:
-            return {}
-
-        return config_data
+        return snapshot.to_dict()
 
     except (yaml.YAMLError, IOError) as e:
         # Error loading global config, continue without it
@@ -977,6 +982,10 @@ def get_fallback_config(skill_name: str) -> Dict[str, Any]:
             - retry_on_status (List[str]): Status codes that trigger retry
             - skip_on_status (List[str]): Status codes that skip to next tool
             - retry_delay_seconds (int): Delay between retry attempts
+            - adaptive_timeouts (bool): Derive first-attempt timeouts from
+              recorded p95 latency (never above the configured timeout)
+            - hedge_requests (bool): Start the next tool in priority order once
+              a tool runs past its recorded p90 latency
     """
     config = load_skill_config(skill_name)
     global_config = load_global_config()
@@ -988,6 +997,8 @@ def get_fallback_config(skill_name: str) -> Dict[str, Any]:
         "retry_on_status": ["timeout", "error"],
         "skip_on_status": ["not_found", "invalid_output"],
         "retry_delay_seconds": 1,
+        "adaptive_timeouts": True,
+        "hedge_requests": False,
     }
 
     # Try global fallback config
@@ -1037,3 +1048,131 @@ def get_consultation_limit(skill_name: str) -> Optional[int]:
 
     # No limit configured
     return None
+
+
+def get_completion_policy(skill_name: str) -> str:
+    """Get the multi-tool completion policy for a skill.
+
+    Controls how long parallel consultations wait for slower tools (see
+    ai_tools.CompletionPolicy): "all", "first_success", "quorum(k)" or
+    "deadline(seconds)". Read from ``consultation.completion_policy``, with
+    skill-specific settings overriding the global value.
+
+    Args:
+        skill_name: Name of the skill
+
+    Returns:
+        Policy spec string (defaults to "all", also used with a warning when
+        the configured policy is invalid)
+    """
+    config = load_skill_config(skill_name)
+    consultation = config.get("consultation")
+    if isinstance(consultation, dict):
+        policy = consultation.get("completion_policy")
+        if isinstance(policy, str) and policy.strip():
+            try:
+                CompletionPolicy.parse(policy.strip())
+            except ValueError as e:
+                logger.warning(f"{e} in ai_config.yaml for {skill_name}; waiting for all tools")
+                return "all"
+            return policy.strip()
+    return "all"
+
+
+def get_scheduler_config() -> Dict[str, Any]:
+    """Get process-wide provider scheduling limits.
+
+    Read from the global ``scheduler`` section; these limits apply to every
+    provider call in the process, so there are no skill-specific overrides.
+
+    Returns:
+        Dict with keyword arguments for providers.scheduler.configure_scheduler:
+            - max_concurrency (int): Provider calls running at once (default 8)
+            - provider_limits (Dict[str, int]): Per-provider caps ("default" key
+              applies to unlisted providers; default 4)
+            - rate_per_minute (Optional[float]): Token-bucket start rate (None = unlimited)
+            - burst (Optional[int]): Token-bucket capacity
+    """
+    section = load_global_config().get("scheduler")
+    section = section if isinstance(section, dict) else {}
+
+    max_concurrency = section.get("max_concurrency")
+    provider_limits = section.get("per_provider")
+    rate = section.get("rate_limit")
+    rate = rate if isinstance(rate, dict) else {}
+    rate_per_minute = rate.get("per_minute")
+    burst = rate.get("burst")
+
+    return {
+        "max_concurrency": max_concurrency if isinstance(max_concurrency, int) and max_concurrency > 0 else 8,
+        "provider_limits": {
+            str(name): limit
+            for name, limit in (provider_limits or {}).items()
+            if isinstance(limit, int) and limit > 0
+        } if isinstance(provider_limits, dict) else {},
+        "rate_per_minute": rate_per_minute if isinstance(rate_per_minute, (int, float)) and rate_per_minute > 0 else None,
+        "burst": burst if isinstance(burst, int) and burst > 0 else None,
+    }
+
+
+def get_availability_cache_config() -> Dict[str, Any]:
+    """Get settings for the on-disk tool availability cache.
+
+    Read from the global ``availability_cache`` section.
+
+    Returns:
+        Dict with:
+            - enabled (bool): Whether availability checks are cached (default True)
+            - ttl_seconds (float): Lifetime of an entry (default 300)
+    """
+    section = load_global_config().get("availability_cache")
+    section = section if isinstance(section, dict) else {}
+
+    ttl_seconds = section.get("ttl_seconds")
+    return {
+        "enabled": section.get("enabled") is not False,
+        "ttl_seconds": ttl_seconds if isinstance(ttl_seconds, (int, float)) and ttl_seconds > 0 else 300,
+    }
+
+
+def get_response_cache_config() -> Dict[str, Any]:
+    """Get settings for the AI tool response cache.
+
+    Read from the global ``response_cache`` section. The cache is opt-in.
+
+    Returns:
+        Dict with:
+            - enabled (bool): Whether execute_tool caches responses (default False)
+            - ttl_hours (float): Lifetime of an entry (default 24)
+            - max_size_mb (float): Size cap for response entries (default 200)
+    """
+    section = load_global_config().get("response_cache")
+    section = section if isinstance(section, dict) else {}
+
+    ttl_hours = section.get("ttl_hours")
+    max_size_mb = section.get("max_size_mb")
+    return {
+        "enabled": section.get("enabled") is True,
+        "ttl_hours": ttl_hours if isinstance(ttl_hours, (int, float)) and ttl_hours > 0 else 24,
+        "max_size_mb": max_size_mb if isinstance(max_size_mb, (int, float)) and max_size_mb > 0 else 200,
+    }
+
+
+def get_stub_provider_config() -> Dict[str, Any]:
+    """Get the simulated behaviour of the offline ``stub`` provider.
+
+    Read from the global ``stub_provider`` section. Keys are validated by
+    ``StubSettings.from_mapping`` (latency_distribution, latency_ms,
+    latency_jitter_ms, failure_rate, timeout_rate, chunk_count,
+    chunk_interval_ms, response, canned_response, response_file, seed).
+
+    Returns:
+        The section as a dict (empty when not configured)
+    """
+    section = load_global_config().get("stub_provider")
+    return dict(section) if isinstance(section, dict) else {}
+
+
+def is_supported_tool(tool: str) -> bool:
+    """Whether a tool name refers to a known provider (including the stub)."""
+    return tool in ALL_SUPPORTED_TOOLS or tool == STUB_TOOL
@@ -9,14 +9,16 @@ See docs/AI_TOOL_INTERFACES_DESIGN.md for complete design documentation.
 """
 
 import os
-from dataclasses import dataclass, field
-from typing import Optional
+import re
+from dataclasses import dataclass, field, replace
+from typing import Optional, Union
 from datetime import datetime
 from enum import Enum
 import shutil
 import subprocess
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from claude_skills.common.providers import (
     GenerationRequest,
@@ -29,10 +31,22 @@ from claude_skills.common.providers import (
     TokenUsage,
     resolve_provider,
     get_provider_detector,
+    list_provider_detectors,
     check_provider_available,
+    get_provider_metadata,
 )
+from claude_skills.common.providers.cancellation import CancellationToken, cancel_all, cancellation_scope
+from claude_skills.common.providers.scheduler import configure_scheduler
 from claude_skills.common import ai_config
 from claude_skills.common import consultation_limits
+from claude_skills.common.cache.availability_cache import Fingerprint, ToolAvailabilityCache, executable_fingerprint
+from claude_skills.common.cache.response_cache import ResponseCache, is_response_cache_bypassed
+from claude_skills.common.metrics import (
+    _is_test_environment,
+    get_adaptive_timeout,
+    get_hedge_delay,
+    record_provider_latency,
+)
 
 
 class ToolStatus(Enum):
@@ -151,6 +165,9 @@ class MultiToolResponse:
         failure_count: Number of failed tool calls
         timestamp: When the multi-tool consultation started
         failure_type: Optional failure type that triggered consultation
+        policy: Completion policy the consultation ran under (e.g. "quorum(2)")
+        abandoned: Tools cancelled once the completion policy was satisfied
+            (they have no entry in responses)
 
     Example:
         >>> responses = {
@@ -176,6 +193,8 @@ class MultiToolResponse:
     failure_count: int = 0
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     failure_type: Optional[str] = None
+    policy: str = "all"
+    abandoned: list[str] = field(default_factory=list)
 
     @property
     def success(self) -> bool:
@@ -236,7 +255,9 @@ class MultiToolResponse:
             "success_count": self.success_count,
             "failure_count": self.failure_count,
             "timestamp": self.timestamp,
-            "failure_type": self.failure_type
+            "failure_type": self.failure_type,
+            "policy": self.policy,
+            "abandoned": list(self.abandoned),
         }
 
     @classmethod
@@ -259,6 +280,103 @@ class MultiToolResponse:
         return cls(**data)
 
 
+_POLICY_PATTERN = re.compile(r"^\s*(all|first_success|quorum|deadline)\s*(?:[(:]\s*([\d.]+)\s*\)?)?\s*$")
+
+
+@dataclass(frozen=True)
+class CompletionPolicy:
+    """
+    When execute_tools_parallel() may stop waiting for the remaining tools.
+
+    Policies:
+        all: Wait for every tool (default)
+        first_success: Stop at the first successful response
+        quorum(k): Stop once k tools have succeeded
+        deadline(seconds): Stop once the deadline passes, keeping whatever finished
+
+    Tools still running when the policy is satisfied are cancelled (their CLI
+    processes are terminated) and recorded in MultiToolResponse.abandoned.
+
+    Example:
+        >>> CompletionPolicy.parse("quorum(2)")
+        CompletionPolicy(mode='quorum', count=2, deadline=None)
+    """
+    mode: str = "all"
+    count: int = 0
+    deadline: Optional[float] = None
+
+    @classmethod
+    def all(cls) -> "CompletionPolicy":
+        return cls("all")
+
+    @classmethod
+    def first_success(cls) -> "CompletionPolicy":
+        return cls("first_success", count=1)
+
+    @classmethod
+    def quorum(cls, count: int) -> "CompletionPolicy":
+        if count < 1:
+            raise ValueError("quorum requires at least one tool")
+        return cls("quorum", count=count)
+
+    @classmethod
+    def with_deadline(cls, seconds: float) -> "CompletionPolicy":
+        if seconds <= 0:
+            raise ValueError("deadline must be positive")
+        return cls("deadline", deadline=float(seconds))
+
+    @classmethod
+    def parse(cls, value: Union[str, "CompletionPolicy", None]) -> "CompletionPolicy":
+        """
+        Parse a policy spec such as "all", "first_success", "quorum(2)" or "deadline(45)".
+
+        Raises:
+            ValueError: If the spec is not recognized
+        """
+        if value is None:
+            return cls.all()
+        if isinstance(value, CompletionPolicy):
+            return value
+
+        match = _POLICY_PATTERN.match(str(value).lower())
+        if not match:
+            raise ValueError(
+                f"Invalid completion policy '{value}' "
+                "(expected all, first_success, quorum(k) or deadline(seconds))"
+            )
+        mode, argument = match.groups()
+        if mode in ("quorum", "deadline") and argument is None:
+            raise ValueError(f"Completion policy '{mode}' requires a value, e.g. {mode}(2)")
+        if mode == "quorum":
+            return cls.quorum(int(float(argument)))
+        if mode == "deadline":
+            return cls.with_deadline(float(argument))
+        if mode == "first_success":
+            return cls.first_success()
+        return cls.all()
+
+    def __str__(self) -> str:
+        if self.mode == "quorum":
+            return f"quorum({self.count})"
+        if self.mode == "deadline":
+            return f"deadline({self.deadline:g})"
+        return self.mode
+
+    def is_satisfied(self, success_count: int, elapsed: float) -> bool:
+        """Check whether the remaining tools can be abandoned."""
+        if self.mode in ("first_success", "quorum"):
+            return success_count >= self.count
+        if self.mode == "deadline":
+            return elapsed >= self.deadline
+        return False
+
+    def wait_timeout(self, elapsed: float) -> Optional[float]:
+        """Seconds to wait for the next completion (None = until one finishes)."""
+        if self.mode == "deadline":
+            return max(self.deadline - elapsed, 0.0)
+        return None
+
+
 # =============================================================================
 # TOOL AVAILABILITY FUNCTIONS
 # =============================================================================
@@ -290,35 +408,59 @@ def _resolve_tool_executable(tool: str) -> Optional[str]:
     return shutil.which(tool)
 
 
-def check_tool_available(
-    tool: str,
-    *,
-    check_version: bool = False,
-    timeout: int = 5
-) -> bool:
-    """
-    Check if a tool is available and optionally working.
+_availability_cache: Optional[ToolAvailabilityCache] = None
+_availability_cache_ttl: Optional[float] = None
+_availability_cache_lock = threading.Lock()
 
-    Uses both detector-based PATH lookup and provider registry availability checks
-    to ensure comprehensive validation (especially important for SDK-based providers
-    like opencode that require additional dependencies).
 
-    Args:
-        tool: Tool name to check (e.g., "gemini", "codex", "cursor-agent", "opencode")
-        check_version: If True, verify tool responds to --version
-        timeout: Timeout in seconds for version check (default 5)
+def _get_availability_cache() -> Optional[ToolAvailabilityCache]:
+    """Return the on-disk availability cache, or None when disabled (or under tests)."""
+    global _availability_cache, _availability_cache_ttl
+    if _is_test_environment():
+        return None
+    settings = ai_config.get_availability_cache_config()
+    if not settings["enabled"]:
+        return None
+    with _availability_cache_lock:
+        if _availability_cache is None or _availability_cache_ttl != settings["ttl_seconds"]:
+            _availability_cache = ToolAvailabilityCache(ttl_seconds=settings["ttl_seconds"])
+            _availability_cache_ttl = settings["ttl_seconds"]
+        return _availability_cache
+
+
+def clear_tool_availability_cache() -> int:
+    """
+    Discard all cached tool availability results.
 
     Returns:
-        True if tool is available (and working if check_version=True)
+        Number of entries removed (0 when the cache is disabled)
+    """
+    cache = _get_availability_cache()
+    return cache.clear() if cache is not None else 0
 
-    Example:
-        >>> check_tool_available("gemini")
-        True
-        >>> check_tool_available("nonexistent")
-        False
-        >>> check_tool_available("gemini", check_version=True)
-        True
+
+def _tool_fingerprint(tool: str) -> Optional[Fingerprint]:
+    """
+    Identify the executable a tool check would probe.
+
+    Returns None when the result should not be cached: the tool is not on the
+    search path (cheap to re-check) or its availability is forced via an
+    override environment variable.
     """
+    detector = get_provider_detector(tool)
+    if detector is not None:
+        if detector.availability_override() is not None:
+            return None
+        executable = detector.resolve_executable()
+    else:
+        executable = _resolve_tool_executable(tool)
+    if not executable:
+        return None
+    return executable_fingerprint(executable)
+
+
+def _probe_tool_available(tool: str, *, check_version: bool, timeout: int) -> bool:
+    """Run the (uncached) availability check for one tool."""
     # First check using detector (fast PATH-based check)
     detector = get_provider_detector(tool)
     if detector is not None:
@@ -329,6 +471,11 @@ def check_tool_available(
         # (e.g., opencode needs SDK + wrapper + server, not just node binary)
         return check_provider_available(tool)
 
+    # In-process providers (e.g. the benchmark stub) have no executable to find
+    metadata = get_provider_metadata(tool)
+    if metadata is not None and metadata.extra.get("in_process"):
+        return check_provider_available(tool)
+
     # Fallback for tools without detectors
     executable = _resolve_tool_executable(tool)
 
@@ -352,6 +499,54 @@ def check_tool_available(
     return True
 
 
+def check_tool_available(
+    tool: str,
+    *,
+    check_version: bool = False,
+    timeout: int = 5,
+    use_cache: bool = True
+) -> bool:
+    """
+    Check if a tool is available and optionally working.
+
+    Uses both detector-based PATH lookup and provider registry availability checks
+    to ensure comprehensive validation (especially important for SDK-based providers
+    like opencode that require additional dependencies).
+
+    Results are cached on disk per (executable path, mtime) for a short TTL
+    (``availability_cache`` in ai_config.yaml), so repeated invocations skip the
+    CLI probes until the executable changes or the entry expires.
+
+    Args:
+        tool: Tool name to check (e.g., "gemini", "codex", "cursor-agent", "opencode")
+        check_version: If True, verify tool responds to --version
+        timeout: Timeout in seconds for version check (default 5)
+        use_cache: If False, always probe and overwrite the cached result
+
+    Returns:
+        True if tool is available (and working if check_version=True)
+
+    Example:
+        >>> check_tool_available("gemini")
+        True
+        >>> check_tool_available("nonexistent")
+        False
+        >>> check_tool_available("gemini", check_version=True)
+        True
+    """
+    cache = _get_availability_cache()
+    fingerprint = _tool_fingerprint(tool) if cache is not None else None
+    if fingerprint is not None and use_cache:
+        cached = cache.get(tool, fingerprint, check_version=check_version)
+        if cached is not None:
+            return cached
+
+    available = _probe_tool_available(tool, check_version=check_version, timeout=timeout)
+    if fingerprint is not None:
+        cache.set(tool, fingerprint, available, check_version=check_version)
+    return available
+
+
 _PROVIDER_STATUS_MAP = {
     ProviderStatus.SUCCESS: ToolStatus.SUCCESS,
     ProviderStatus.TIMEOUT: ToolStatus.TIMEOUT,
@@ -403,12 +598,46 @@ def detect_available_tools(
     if tools is None:
         tools = ["gemini", "codex", "cursor-agent"]
 
-    available = []
-    for tool in tools:
-        if check_tool_available(tool, check_version=check_version):
-            available.append(tool)
+    if len(tools) <= 1:
+        return [tool for tool in tools if check_tool_available(tool, check_version=check_version)]
 
-    return available
+    # Probes for different tools are independent; run them concurrently so a
+    # cold cache costs one probe's latency rather than the sum of all of them
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        results = list(executor.map(
+            lambda tool: check_tool_available(tool, check_version=check_version),
+            tools,
+        ))
+    return [tool for tool, available in zip(tools, results) if available]
+
+
+def refresh_tool_availability(
+    tools: Optional[list[str]] = None,
+    *,
+    check_version: bool = False
+) -> dict[str, bool]:
+    """
+    Re-probe tools, bypassing and overwriting the availability cache.
+
+    Args:
+        tools: Tool names to refresh. If None, every tool with a registered
+            detector is refreshed.
+        check_version: If True, verify each tool responds to --version
+
+    Returns:
+        Mapping of tool name to availability
+    """
+    if tools is None:
+        tools = [detector.provider_id for detector in list_provider_detectors()]
+    if not tools:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        results = list(executor.map(
+            lambda tool: check_tool_available(tool, check_version=check_version, use_cache=False),
+            tools,
+        ))
+    return dict(zip(tools, results))
 
 
 def get_enabled_and_available_tools(skill_name: str) -> list[str]:
@@ -566,6 +795,76 @@ def _remove_first_occurrence(items: list[str], token: str) -> tuple[list[str], b
 # =============================================================================
 
 
+def _execute_hedged(
+    primary: str,
+    secondary: str,
+    prompt: str,
+    *,
+    model: Optional[str],
+    timeout: float,
+    hedge_timeout: float,
+    delay: float,
+    on_hedge=None,
+) -> dict[str, ToolResponse]:
+    """
+    Run ``primary``, starting ``secondary`` too if it has not finished after ``delay``.
+
+    The first successful response wins and the other tool's CLI process is
+    terminated. The winner's metadata records ``hedged_with`` when the hedge
+    was launched.
+
+    Args:
+        primary: Tool consulted first
+        secondary: Tool started as a hedge
+        prompt: Prompt sent to both tools
+        model: Model override passed to both tools
+        timeout: Timeout for the primary tool
+        hedge_timeout: Timeout for the secondary tool
+        delay: Seconds to wait for the primary before hedging
+        on_hedge: Optional callback invoked with the secondary tool name when
+                  the hedge is launched (e.g. to record the consultation)
+
+    Returns:
+        Responses of the tools that finished, keyed by tool name in completion
+        order. Only the winner is present when one tool succeeded first.
+    """
+    tokens = {primary: CancellationToken(), secondary: CancellationToken()}
+    tool_timeouts = {primary: timeout, secondary: hedge_timeout}
+
+    def _run(tool: str) -> ToolResponse:
+        with cancellation_scope(tokens[tool]):
+            return execute_tool(tool, prompt, model=model, timeout=tool_timeouts[tool])
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        future_to_tool = {executor.submit(_run, primary): primary}
+        done, pending = wait(set(future_to_tool), timeout=delay)
+        if not done:
+            if on_hedge is not None:
+                on_hedge(secondary)
+            future_to_tool[executor.submit(_run, secondary)] = secondary
+            pending = set(future_to_tool)
+
+        responses: dict[str, ToolResponse] = {}
+        while pending or done:
+            for future in done:
+                tool = future_to_tool[future]
+                response = future.result()
+                if response.success and len(future_to_tool) > 1:
+                    other = secondary if tool == primary else primary
+                    response = replace(response, metadata={**response.metadata, "hedged_with": other})
+                responses[tool] = response
+                if response.success:
+                    cancel_all(tokens[future_to_tool[loser]] for loser in pending)
+                    return {tool: response}
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        return responses
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def execute_tool_with_fallback(
     skill_name: str,
     tool: str,
@@ -585,6 +884,13 @@ def execute_tool_with_fallback(
     - Skips to next tool on permanent errors (not_found, invalid_output)
     - Respects per-invocation consultation limits (max unique tools)
 
+    With ``adaptive_timeouts`` (fallback config, default on) the first attempt
+    on each tool uses a timeout derived from that tool's recorded p95 latency,
+    capped at ``timeout``; retries use the full ``timeout``. With
+    ``hedge_requests`` (default off), once the first attempt on a tool runs
+    past its recorded p90 latency, the next tool in the priority list is
+    started as well and whichever succeeds first is returned.
+
     Args:
         skill_name: Name of the skill (for config resolution)
         tool: Primary tool name ("gemini", "codex", "cursor-agent")
@@ -629,6 +935,8 @@ def execute_tool_with_fallback(
     retry_delay = fallback_config.get("retry_delay_seconds", 1)
     retry_on_status = fallback_config.get("retry_on_status", ["timeout", "error"])
     skip_on_status = fallback_config.get("skip_on_status", ["not_found", "invalid_output"])
+    adaptive_timeouts = fallback_config.get("adaptive_timeouts", True)
+    hedge_requests = fallback_config.get("hedge_requests", False)
 
     # Convert status names to ToolStatus enum values for comparison
     retry_statuses = {ToolStatus(s) for s in retry_on_status if s in {e.value for e in ToolStatus}}
@@ -647,9 +955,14 @@ def execute_tool_with_fallback(
         tool_priority = [tool] + tool_priority
 
     last_response: Optional[ToolResponse] = None
+    # Tools that already failed as the hedge of an earlier tool
+    hedge_failed: set[str] = set()
 
     # Try each tool in priority order
-    for current_tool in tool_priority:
+    for index, current_tool in enumerate(tool_priority):
+        if current_tool in hedge_failed:
+            continue
+
         # Check if we've exceeded the consultation limit
         if not tracker.check_limit(current_tool, max_tools):
             # Can't consult this tool - would exceed limit
@@ -660,7 +973,41 @@ def execute_tool_with_fallback(
 
         # Try this tool with retries
         for attempt in range(max_retries + 1):  # +1 for initial attempt
-            response = execute_tool(current_tool, prompt, model=model, timeout=timeout)
+            attempt_timeout = timeout
+            if attempt == 0 and adaptive_timeouts:
+                attempt_timeout = get_adaptive_timeout(current_tool, model, timeout)
+
+            hedge_tool = None
+            hedge_delay = get_hedge_delay(current_tool, model) if attempt == 0 and hedge_requests else None
+            if hedge_delay is not None and hedge_delay < attempt_timeout:
+                hedge_tool = next(
+                    (
+                        candidate for candidate in tool_priority[index + 1:]
+                        if candidate not in hedge_failed and tracker.check_limit(candidate, max_tools)
+                    ),
+                    None,
+                )
+
+            if hedge_tool is None:
+                response = execute_tool(current_tool, prompt, model=model, timeout=attempt_timeout)
+            else:
+                responses = _execute_hedged(
+                    current_tool,
+                    hedge_tool,
+                    prompt,
+                    model=model,
+                    timeout=attempt_timeout,
+                    hedge_timeout=timeout,
+                    delay=hedge_delay,
+                    on_hedge=tracker.record_consultation,
+                )
+                winner = next((resp for resp in responses.values() if resp.success), None)
+                if winner is not None:
+                    return winner
+                if hedge_tool in responses:
+                    hedge_failed.add(hedge_tool)
+                    last_response = responses[hedge_tool]
+                response = responses[current_tool]
             last_response = response
 
             # Success! Return immediately
@@ -692,12 +1039,78 @@ def execute_tool_with_fallback(
     )
 
 
+_scheduler_configured = False
+_scheduler_config_lock = threading.Lock()
+
+
+def _ensure_scheduler_configured() -> None:
+    """Apply the ``scheduler`` section of ai_config.yaml to the provider scheduler once per process."""
+    global _scheduler_configured
+    if _scheduler_configured:
+        return
+    with _scheduler_config_lock:
+        if not _scheduler_configured:
+            configure_scheduler(**ai_config.get_scheduler_config())
+            _scheduler_configured = True
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_settings: Optional[tuple] = None
+_response_cache_lock = threading.Lock()
+
+# Response metadata that is too large or too run-specific to cache
+_UNCACHED_METADATA_KEYS = ("raw_payload", "stderr")
+
+
+def _get_response_cache(use_cache: Optional[bool]) -> Optional[ResponseCache]:
+    """Return the response cache for a call, or None when caching is off for it."""
+    global _response_cache, _response_cache_settings
+    if use_cache is False or is_response_cache_bypassed():
+        return None
+    settings = ai_config.get_response_cache_config()
+    if use_cache is None and not settings["enabled"]:
+        return None
+
+    cache_settings = (settings["ttl_hours"], settings["max_size_mb"])
+    with _response_cache_lock:
+        if _response_cache is None or _response_cache_settings != cache_settings:
+            _response_cache = ResponseCache(ttl_hours=cache_settings[0], max_size_mb=cache_settings[1])
+            _response_cache_settings = cache_settings
+        return _response_cache
+
+
+def _cache_model(tool: str, model: Optional[str]) -> Optional[str]:
+    """Model a response is cached under: the requested one, else the provider default."""
+    if model:
+        return model
+    metadata = get_provider_metadata(tool)
+    return metadata.default_model if metadata is not None else None
+
+
+def _cached_tool_response(tool: str, prompt: str, cached: dict, start_time: float, timestamp: str) -> ToolResponse:
+    """Rebuild a ToolResponse from a response-cache entry."""
+    metadata = dict(cached.get("metadata") or {})
+    metadata["cache_hit"] = True
+    metadata["cached_duration"] = cached.get("duration")
+    return ToolResponse(
+        tool=tool,
+        status=ToolStatus.SUCCESS,
+        output=cached.get("output", ""),
+        duration=time.time() - start_time,
+        timestamp=timestamp,
+        model=cached.get("model"),
+        prompt=prompt,
+        metadata=metadata,
+    )
+
+
 def execute_tool(
     tool: str,
     prompt: str,
     *,
     model: Optional[str] = None,
-    timeout: float = 90
+    timeout: float = 90,
+    use_cache: Optional[bool] = None,
 ) -> ToolResponse:
 
     """
@@ -706,11 +1119,18 @@ def execute_tool(
     Handles all subprocess error modes: timeout, not found, invalid output,
     and general errors. Always returns a ToolResponse with appropriate status.
 
+    When the response cache is enabled (``response_cache.enabled`` in
+    ai_config.yaml, or ``use_cache=True``), a successful response for the same
+    tool, requested model and prompt is served from disk, marked with
+    ``metadata["cache_hit"]``.
+
     Args:
         tool: Tool name ("gemini", "codex", "cursor-agent")
         prompt: The prompt to send to the tool
         model: Optional model override
         timeout: Timeout in seconds (default 90)
+        use_cache: Force the response cache on (True) or off (False); None
+                   follows the config. The global --no-cache flag always wins.
 
     Returns:
         ToolResponse with execution results and metadata
@@ -725,6 +1145,12 @@ def execute_tool(
     start_time = time.time()
     timestamp = datetime.now().isoformat()
 
+    response_cache = _get_response_cache(use_cache)
+    if response_cache is not None:
+        cached = response_cache.get(tool, prompt, model=_cache_model(tool, model))
+        if cached is not None:
+            return _cached_tool_response(tool, prompt, cached, start_time, timestamp)
+
     def _failure_response(status: ToolStatus, error: str) -> ToolResponse:
         duration = time.time() - start_time
         return ToolResponse(
@@ -740,6 +1166,7 @@ def execute_tool(
         )
 
     try:
+        _ensure_scheduler_configured()
         hooks = ProviderHooks()
         context = resolve_provider(tool, hooks=hooks, model=model)
         request = GenerationRequest(
@@ -762,7 +1189,7 @@ def execute_tool(
             metadata["stderr"] = result.stderr
 
         duration = time.time() - start_time
-        return ToolResponse(
+        response = ToolResponse(
             tool=tool,
             status=status,
             output=result.content,
@@ -774,9 +1201,28 @@ def execute_tool(
             exit_code=None,
             metadata=metadata,
         )
+        if status == ToolStatus.SUCCESS:
+            record_provider_latency(tool, model, duration)
+            if response_cache is not None:
+                response_cache.set(
+                    tool,
+                    prompt,
+                    {
+                        "output": response.output,
+                        "model": response.model,
+                        "duration": response.duration,
+                        "metadata": {
+                            key: value for key, value in metadata.items()
+                            if key not in _UNCACHED_METADATA_KEYS
+                        },
+                    },
+                    model=_cache_model(tool, model),
+                )
+        return response
     except ProviderUnavailableError as exc:
         return _failure_response(ToolStatus.NOT_FOUND, str(exc))
     except ProviderTimeoutError as exc:
+        record_provider_latency(tool, model, time.time() - start_time, timed_out=True)
         return _failure_response(ToolStatus.TIMEOUT, str(exc) or f"Tool timed out after {timeout}s")
     except ProviderExecutionError as exc:
         return _failure_response(ToolStatus.ERROR, str(exc))
@@ -794,33 +1240,41 @@ def execute_tools_parallel(
     prompt: str,
     *,
     models: Optional[dict[str, str]] = None,
-    timeout: float = 90
+    timeout: float = 90,
+    policy: Union[str, CompletionPolicy, None] = None,
 ) -> MultiToolResponse:
     """
     Execute multiple AI tools in parallel with same prompt.
 
-    Uses ThreadPoolExecutor to run tools concurrently. Returns as soon
-    as each tool completes (doesn't wait for slowest).
+    Uses ThreadPoolExecutor to run tools concurrently. With the default "all"
+    policy every tool is awaited; other completion policies return as soon as
+    they are satisfied (e.g. at the k-th successful response for quorum(k)),
+    terminating the CLI processes of tools that are still running.
 
     Args:
         tools: List of tool names to execute
         prompt: The prompt to send to all tools
         models: Optional dict mapping tool names to models
         timeout: Timeout per tool in seconds (default 90)
+        policy: Completion policy (CompletionPolicy or spec string such as
+                "first_success", "quorum(2)", "deadline(60)"; default "all")
 
     Returns:
-        MultiToolResponse with all results and aggregated statistics
+        MultiToolResponse with all results and aggregated statistics. Tools
+        cancelled by the policy are listed in ``abandoned``.
 
     Example:
         >>> response = execute_tools_parallel(
-        ...     tools=["gemini", "codex"],
+        ...     tools=["gemini", "codex", "cursor-agent"],
         ...     prompt="Analyze code",
-        ...     models={"gemini": "gemini-exp-1114"}
+        ...     models={"gemini": "gemini-exp-1114"},
+        ...     policy="quorum(2)"
         ... )
         >>> print(f"Success: {response.success_count}/{len(response.responses)}")
-        >>> for tool, resp in response.get_successful_responses().items():
-        ...     print(f"{tool}: {resp.output[:50]}...")
+        >>> print(f"Abandoned: {response.abandoned}")
     """
+    completion_policy = CompletionPolicy.parse(policy)
+
     if not tools:
         # No tools provided
         return MultiToolResponse(
@@ -828,7 +1282,8 @@ def execute_tools_parallel(
             success_count=0,
             failure_count=0,
             total_duration=0.0,
-            max_duration=0.0
+            max_duration=0.0,
+            policy=str(completion_policy)
         )
 
     start_time = time.time()
@@ -836,40 +1291,60 @@ def execute_tools_parallel(
     models = models or {}
 
     responses = {}
+    tokens = {tool: CancellationToken() for tool in tools}
 
-    # Execute tools in parallel
-    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
-        # Submit all tasks
-        future_to_tool = {
-            executor.submit(
-                execute_tool,
-                tool,
-                prompt,
-                model=models.get(tool),
-                timeout=timeout
-            ): tool
-            for tool in tools
-        }
+    def _run(tool: str) -> ToolResponse:
+        with cancellation_scope(tokens[tool]):
+            return execute_tool(tool, prompt, model=models.get(tool), timeout=timeout)
 
-        # Collect results as they complete
-        for future in as_completed(future_to_tool):
-            tool = future_to_tool[future]
-            try:
-                response = future.result(timeout=timeout + 5)  # Small buffer
+    # Execute tools in parallel (not as a context manager: abandoned tools must
+    # not be joined before returning)
+    executor = ThreadPoolExecutor(max_workers=len(tools))
+    try:
+        future_to_tool = {executor.submit(_run, tool): tool for tool in tools}
+        pending = set(future_to_tool)
+        success_count = 0
+
+        # Collect results as they complete until the policy is satisfied
+        while pending:
+            elapsed = time.time() - start_time
+            if completion_policy.is_satisfied(success_count, elapsed):
+                break
+            done, pending = wait(
+                pending,
+                timeout=completion_policy.wait_timeout(elapsed),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                tool = future_to_tool[future]
+                try:
+                    response = future.result()
+                except Exception as e:
+                    # Shouldn't happen (execute_tool handles all errors)
+                    # but handle it just in case
+                    response = ToolResponse(
+                        tool=tool,
+                        status=ToolStatus.ERROR,
+                        output="",
+                        error=f"Parallel execution error: {str(e)}",
+                        duration=0.0,
+                        timestamp=timestamp,
+                        model=models.get(tool),
+                        prompt=prompt
+                    )
                 responses[tool] = response
-            except Exception as e:
-                # Shouldn't happen (execute_tool handles all errors)
-                # but handle it just in case
-                responses[tool] = ToolResponse(
-                    tool=tool,
-                    status=ToolStatus.ERROR,
-                    output="",
-                    error=f"Parallel execution error: {str(e)}",
-                    duration=0.0,
-                    timestamp=timestamp,
-                    model=models.get(tool),
-                    prompt=prompt
-                )
+                if response.success:
+                    success_count += 1
+
+        # Cancel whatever is still running
+        abandoned = [future_to_tool[future] for future in pending]
+        cancel_all(tokens[tool] for tool in abandoned)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Keep responses in request order
+    responses = {tool: responses[tool] for tool in tools if tool in responses}
+    abandoned = [tool for tool in tools if tool in abandoned]
 
     total_duration = time.time() - start_time
 
@@ -886,7 +1361,9 @@ def execute_tools_parallel(
         success_count=success_count,
         failure_count=failure_count,
         timestamp=timestamp,
-        failure_type=None
+        failure_type=None,
+        policy=str(completion_policy),
+        abandoned=abandoned
     )
 
 
@@ -895,8 +1372,11 @@ __all__ = [
     "ToolStatus",
     "ToolResponse",
     "MultiToolResponse",
+    "CompletionPolicy",
     "check_tool_available",
     "detect_available_tools",
+    "refresh_tool_availability",
+    "clear_tool_availability_cache",
     "get_enabled_and_available_tools",
     "build_tool_command",
     "execute_tool",
@@ -8,14 +8,33 @@ from .cache_manager import CacheManager
 from .cache_key import (
     generate_cache_key,
     generate_fidelity_review_key,
+    generate_narrative_key,
     generate_plan_review_key,
+    generate_plan_review_section_key,
+    generate_response_key,
+    generate_test_results_key,
     is_cache_key_valid
 )
+from .availability_cache import ToolAvailabilityCache, executable_fingerprint
+from .response_cache import (
+    ResponseCache,
+    is_response_cache_bypassed,
+    set_response_cache_bypass,
+)
 
 __all__ = [
     "CacheManager",
     "generate_cache_key",
     "generate_fidelity_review_key",
+    "generate_narrative_key",
     "generate_plan_review_key",
-    "is_cache_key_valid"
+    "generate_plan_review_section_key",
+    "generate_response_key",
+    "generate_test_results_key",
+    "is_cache_key_valid",
+    "ResponseCache",
+    "is_response_cache_bypassed",
+    "set_response_cache_bypass",
+    "ToolAvailabilityCache",
+    "executable_fingerprint",
 ]
@@ -0,0 +1,129 @@
+"""
+On-disk cache for AI tool availability checks.
+
+``ai_tools.check_tool_available`` probes provider CLIs (``<tool> --version`` /
+``--help``) before every plan review, fidelity review, render and test
+consultation. The result only changes when the executable changes, so it is
+stored per tool keyed by the resolved executable path and its mtime, and
+expires after a short TTL. Reinstalling or upgrading a CLI changes the mtime
+and invalidates the entry immediately; ``sdd cache refresh-tools`` re-checks
+every tool on demand.
+
+All entries live in a single small JSON file that is rewritten atomically.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AVAILABILITY_FILE = Path.home() / ".cache" / "sdd-toolkit" / "tool_availability.json"
+DEFAULT_AVAILABILITY_TTL_SECONDS = 300
+
+# (resolved executable path, executable mtime)
+Fingerprint = Tuple[str, float]
+
+
+def executable_fingerprint(executable: str) -> Optional[Fingerprint]:
+    """Return (path, mtime) for an executable, or None if it cannot be stat'ed."""
+    try:
+        return executable, os.stat(executable).st_mtime
+    except OSError:
+        return None
+
+
+class ToolAvailabilityCache:
+    """
+    Availability results per tool, valid while the executable is unchanged.
+
+    Attributes:
+        path: JSON file holding the entries
+        ttl_seconds: Maximum age of an entry
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_AVAILABILITY_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path or DEFAULT_AVAILABILITY_FILE
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_key(tool: str, check_version: bool) -> str:
+        return f"{tool}:{'version' if check_version else 'basic'}"
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, entries: Dict[str, Any]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".availability-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write tool availability cache {self.path}: {e}")
+
+    def get(self, tool: str, fingerprint: Fingerprint, *, check_version: bool = False) -> Optional[bool]:
+        """
+        Look up a cached availability result.
+
+        Returns:
+            The cached result, or None if missing, expired or recorded for a
+            different executable
+        """
+        entry = self._load().get(self._entry_key(tool, check_version))
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("executable") != fingerprint[0] or entry.get("mtime") != fingerprint[1]:
+            return None
+        checked_at = entry.get("checked_at")
+        if not isinstance(checked_at, (int, float)) or self._clock() - checked_at > self.ttl_seconds:
+            return None
+        available = entry.get("available")
+        return available if isinstance(available, bool) else None
+
+    def set(self, tool: str, fingerprint: Fingerprint, available: bool, *, check_version: bool = False) -> None:
+        """Record the availability of a tool for its current executable."""
+        with self._lock:
+            entries = self._load()
+            entries[self._entry_key(tool, check_version)] = {
+                "executable": fingerprint[0],
+                "mtime": fingerprint[1],
+                "available": available,
+                "checked_at": self._clock(),
+            }
+            self._save(entries)
+
+    def clear(self) -> int:
+        """
+        Remove every entry.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            count = len(self._load())
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove tool availability cache {self.path}: {e}")
+            return count
@@ -161,6 +161,7 @@ def generate_fidelity_review_key(
     file_paths: Optional[List[str]] = None,
     model: Optional[str] = None,
     models: Any = None,
+    content_hash: Optional[str] = None,
 ) -> str:
     """
     Generate cache key for fidelity review consultations.
@@ -172,6 +173,8 @@ def generate_fidelity_review_key(
         file_paths: Files being reviewed (optional)
         model: Single model identifier override (optional)
         models: Structured model mapping or list (optional)
+        content_hash: Hash of non-file review inputs, e.g. the spec requirements
+            of the tasks in scope (optional)
 
     Returns:
         Deterministic cache key
@@ -184,6 +187,8 @@ def generate_fidelity_review_key(
         "review_type": "fidelity",
         "models": normalized_model or "default",
     }
+    if content_hash:
+        extra_params["content_hash"] = content_hash
 
     return generate_cache_key(
         spec_id=spec_id,
@@ -226,6 +231,134 @@ def generate_plan_review_key(
     )
 
 
+def generate_plan_review_section_key(
+    spec_id: str,
+    review_type: str,
+    tool: str,
+    model: Optional[str] = None
+) -> str:
+    """
+    Generate cache key for one tool's per-section plan review findings.
+
+    The entry holds findings keyed by section content hash, so it stays valid
+    across edits: only sections whose hash changed are reviewed again.
+
+    Args:
+        spec_id: Specification identifier
+        review_type: Review type (quick, full, security, feasibility)
+        tool: Tool/provider name
+        model: Requested model (None for the provider default)
+
+    Returns:
+        Deterministic cache key
+    """
+    return generate_cache_key(
+        spec_id=spec_id,
+        model=_normalize_model_identifier(model=model),
+        prompt_version="plan-review-sections-v1",
+        extra_params={"review_type": review_type, "tool": tool}
+    )
+
+
+def generate_test_results_key(
+    test_files: List[str],
+    source_files: Optional[List[str]] = None,
+    extra_params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Generate cache key for test results collected during fidelity review.
+
+    The key covers the contents of the test files and of the source files under
+    review, so results are reused only while neither has changed.
+
+    Args:
+        test_files: Test files that were executed
+        source_files: Source files under review (optional)
+        extra_params: Additional parameters that affect the run (optional)
+
+    Returns:
+        Deterministic cache key
+    """
+    params: Dict[str, Any] = {
+        "review_type": "fidelity-tests",
+        "test_files": sorted(test_files),
+        "source_hash": _hash_files(list(source_files)) if source_files else None,
+    }
+    if extra_params:
+        params.update(extra_params)
+
+    return generate_cache_key(
+        spec_id="fidelity-tests",
+        file_paths=list(test_files),
+        prompt_version="fidelity-tests-v1",
+        extra_params=params
+    )
+
+
+# Response-cache keys carry a prefix so their entries can be sized and pruned
+# without reading every file in the shared cache directory
+RESPONSE_KEY_PREFIX = "response-"
+
+
+def generate_response_key(
+    tool: str,
+    prompt: str,
+    model: Optional[str] = None,
+    extra_params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Generate a content-addressed cache key for a single AI tool response.
+
+    Args:
+        tool: Tool/provider name
+        prompt: Exact prompt sent to the tool (hashed, not stored)
+        model: Requested model (None for the provider default)
+        extra_params: Other inputs that change the output (optional)
+
+    Returns:
+        Cache key of the form ``response-<sha256>``
+    """
+    params: Dict[str, Any] = {
+        "review_type": "ai-response",
+        "tool": tool,
+        "prompt_hash": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+    }
+    if extra_params:
+        params.update(extra_params)
+
+    key = generate_cache_key(
+        spec_id="ai-response",
+        model=_normalize_model_identifier(model=model),
+        prompt_version="ai-response-v1",
+        extra_params=params
+    )
+    return f"{RESPONSE_KEY_PREFIX}{key}"
+
+
+def generate_narrative_key(prompt: str, agent: str, model: Optional[str] = None) -> str:
+    """
+    Generate a cache key for one rendered-spec narrative item.
+
+    Args:
+        prompt: Item prompt (it embeds every spec input the narrative uses)
+        agent: Agent that generates the narrative
+        model: Resolved model for that agent (None for the provider default)
+
+    Returns:
+        Deterministic cache key
+    """
+    return generate_cache_key(
+        spec_id="sdd-render-narrative",
+        model=_normalize_model_identifier(model=model),
+        prompt_version="narrative-v2",
+        extra_params={
+            "review_type": "narrative",
+            "agent": agent,
+            "input_hash": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        }
+    )
+
+
 def is_cache_key_valid(key: str) -> bool:
     """
     Validate cache key format.
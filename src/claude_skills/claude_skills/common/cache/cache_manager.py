@@ -409,6 +409,47 @@ class CacheManager:
             logger.warning(f"Failed to cleanup expired entries: {e}")
             return count
 
+    def prune(self, prefix: str, max_size_bytes: int) -> int:
+        """
+        Delete the oldest entries whose key starts with prefix until their
+        combined size is at most max_size_bytes.
+
+        Args:
+            prefix: Key prefix selecting the entries to size (e.g. "response-")
+            max_size_bytes: Size budget for those entries
+
+        Returns:
+            Number of entries deleted
+        """
+        count = 0
+        try:
+            entries = []
+            for cache_file in self.cache_dir.glob(f"{prefix}*.json"):
+                try:
+                    stat = cache_file.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, cache_file))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, cache_file in sorted(entries, key=lambda entry: entry[0]):
+                if total_size <= max_size_bytes:
+                    break
+                try:
+                    cache_file.unlink()
+                    total_size -= size
+                    count += 1
+                except OSError as e:
+                    logger.warning(f"Failed to prune cache file {cache_file}: {e}")
+
+            if count > 0:
+                logger.debug(f"Pruned {count} '{prefix}' cache entries")
+            return count
+
+        except Exception as e:
+            logger.warning(f"Failed to prune cache entries: {e}")
+            return count
+
     def get_incremental_state(self, spec_id: str) -> Dict[str, str]:
         """
         Retrieve previous file hashes for incremental review.
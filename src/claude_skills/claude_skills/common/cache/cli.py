@@ -12,6 +12,7 @@ import sys
 from pathlib import Path
 
 from claude_skills.common import PrettyPrinter
+from claude_skills.common import ai_tools
 from claude_skills.common.cache import CacheManager
 from claude_skills.common.config import get_cache_config, is_cache_enabled
 from claude_skills.common.json_output import output_json
@@ -19,6 +20,8 @@ from claude_skills.cli.sdd.output_utils import (
     prepare_output,
     CACHE_CLEAR_ESSENTIAL,
     CACHE_CLEAR_STANDARD,
+    CACHE_REFRESH_TOOLS_ESSENTIAL,
+    CACHE_REFRESH_TOOLS_STANDARD,
     CACHE_STATS_ESSENTIAL,
     CACHE_STATS_STANDARD,
 )
@@ -30,7 +33,7 @@ def handle_cache_clear(args, printer: PrettyPrinter):
 
     Clears cache entries with optional filters:
     - --spec: Clear only entries for a specific spec ID
-    - --type: Clear only entries of a specific review type (fidelity, plan)
+    - --type: Clear only entries of a specific review type (fidelity, plan, ai-response)
 
     Args:
         args: Parsed command-line arguments
@@ -192,6 +195,58 @@ def handle_cache_info(args, printer: PrettyPrinter):
         return 1
 
 
+def handle_cache_refresh_tools(args, printer: PrettyPrinter):
+    """
+    Handle 'sdd cache refresh-tools' command.
+
+    Discards cached tool availability results and re-probes every AI tool
+    (or only those given with --tool), storing the fresh results.
+
+    Args:
+        args: Parsed command-line arguments
+        printer: PrettyPrinter instance for formatted output
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    try:
+        tools = getattr(args, 'tools', None) or None
+        cleared = 0
+        if tools is None:
+            cleared = ai_tools.clear_tool_availability_cache()
+
+        statuses = ai_tools.refresh_tool_availability(
+            tools, check_version=getattr(args, 'check_version', False)
+        )
+        available_tools = [tool for tool, available in statuses.items() if available]
+
+        if getattr(args, 'json', None):
+            payload = {
+                "tools": statuses,
+                "available_tools": available_tools,
+                "entries_cleared": cleared,
+            }
+            filtered_output = prepare_output(
+                payload, args, CACHE_REFRESH_TOOLS_ESSENTIAL, CACHE_REFRESH_TOOLS_STANDARD
+            )
+            output_json(filtered_output, args.compact)
+            return 0
+
+        printer.header("Tool Availability")
+        for tool, available in statuses.items():
+            printer.result(tool, "available" if available else "not available")
+        printer.blank()
+        printer.success(f"Refreshed {len(statuses)} tool(s); {len(available_tools)} available")
+        return 0
+
+    except Exception as e:
+        printer.error(f"Error refreshing tool availability: {e}")
+        if getattr(args, 'debug', False):
+            import traceback
+            printer.error(traceback.format_exc())
+        return 1
+
+
 def register_cache(subparsers, parent_parser):
     """
     Register 'cache' subcommand for unified SDD CLI.
@@ -243,11 +298,33 @@ def register_cache(subparsers, parent_parser):
         type=str,
         dest='review_type',
         metavar='TYPE',
-        choices=['fidelity', 'plan'],
-        help='Clear only entries of the specified review type (fidelity or plan)'
+        choices=['fidelity', 'plan', 'ai-response'],
+        help='Clear only entries of the specified review type (fidelity, plan or ai-response)'
     )
     clear_parser.set_defaults(func=handle_cache_clear)
 
+    # Register 'refresh-tools' subcommand
+    refresh_parser = cache_subparsers.add_parser(
+        'refresh-tools',
+        parents=[parent_parser],
+        help='Re-check AI tool availability and update the cached results',
+        description='Re-probe AI tool CLIs, replacing cached availability results'
+    )
+    refresh_parser.add_argument(
+        '--tool',
+        action='append',
+        dest='tools',
+        metavar='TOOL',
+        help='Refresh only this tool (repeatable; default: all known tools)'
+    )
+    refresh_parser.add_argument(
+        '--check-version',
+        action='store_true',
+        dest='check_version',
+        help='Also verify each tool responds to its version probe'
+    )
+    refresh_parser.set_defaults(func=handle_cache_refresh_tools)
+
     # Note: Additional subcommand (cleanup) will be added in future task
     # This follows the spec's task breakdown:
     # - task-1-4-1: Implement 'info' command (completed)
@@ -0,0 +1,118 @@
+"""
+Content-addressed cache for individual AI tool responses.
+
+Fidelity and plan reviews cache whole consultations under their own keys. This
+cache sits one level lower, inside ``ai_tools.execute_tool``: a successful
+response is stored under (tool, resolved model, prompt hash), so any caller
+that repeats an identical prompt (narrative enhancement, doc generation, test
+consultations, synthesis) is answered from disk.
+
+The cache is opt-in (``response_cache.enabled`` in ai_config.yaml) and can be
+bypassed for a whole run with the global ``--no-cache`` flag. Entries share the
+consultation cache directory and expire by TTL; their combined size is capped
+by pruning the oldest entries. Pruning scans the cache directory, so it runs
+on the first write of a process and then only after another PRUNE_FRACTION of
+the cap has been written.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from .cache_key import RESPONSE_KEY_PREFIX, generate_response_key
+from .cache_manager import CacheManager
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_REVIEW_TYPE = "ai-response"
+
+# Share of max_size_mb written between two prunes (bounds the overshoot)
+PRUNE_FRACTION = 0.1
+
+_bypass = False
+_bypass_lock = threading.Lock()
+
+
+def set_response_cache_bypass(bypass: bool) -> None:
+    """Disable (or re-enable) response caching for the rest of the process."""
+    global _bypass
+    with _bypass_lock:
+        _bypass = bypass
+
+
+def is_response_cache_bypassed() -> bool:
+    """Whether response caching was disabled for this process (e.g. --no-cache)."""
+    return _bypass
+
+
+class ResponseCache:
+    """
+    Stores successful AI tool responses keyed by tool, model and prompt.
+
+    Attributes:
+        ttl_hours: Lifetime of an entry
+        max_size_mb: Combined size cap for response entries (oldest pruned first)
+    """
+
+    def __init__(
+        self,
+        cache_manager: Optional[CacheManager] = None,
+        ttl_hours: float = 24,
+        max_size_mb: float = 200,
+    ):
+        self.cache = cache_manager or CacheManager()
+        self.ttl_hours = ttl_hours
+        self.max_size_mb = max_size_mb
+        # Bytes written since the last prune (None: not pruned yet)
+        self._written_since_prune: Optional[int] = None
+        self._prune_lock = threading.Lock()
+
+    def get(self, tool: str, prompt: str, model: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            tool: Tool/provider name
+            prompt: Prompt the response answers
+            model: Model that answers the prompt (resolved, not None for
+                "provider default", so a default change misses the cache)
+
+        Returns:
+            The stored response dictionary, or None on a miss
+        """
+        cached = self.cache.get(generate_response_key(tool, prompt, model=model))
+        return cached if isinstance(cached, dict) else None
+
+    def set(self, tool: str, prompt: str, response: Dict[str, Any], model: Optional[str] = None) -> bool:
+        """
+        Store a response and, periodically, prune old entries beyond the size cap.
+
+        Args:
+            tool: Tool/provider name
+            prompt: Prompt the response answers
+            response: JSON-serializable response dictionary
+            model: Model that answered the prompt (see get())
+
+        Returns:
+            True if the entry was written
+        """
+        stored = self.cache.set(
+            generate_response_key(tool, prompt, model=model),
+            response,
+            ttl_hours=self.ttl_hours,
+            metadata={"review_type": RESPONSE_REVIEW_TYPE, "tool": tool, "model": model},
+        )
+        if stored and self.max_size_mb:
+            self._maybe_prune(len(json.dumps(response, default=str)))
+        return stored
+
+    def _maybe_prune(self, entry_size: int) -> None:
+        max_bytes = int(self.max_size_mb * 1024 * 1024)
+        with self._prune_lock:
+            if self._written_since_prune is not None:
+                self._written_since_prune += entry_size
+                if self._written_since_prune < max_bytes * PRUNE_FRACTION:
+                    return
+            self._written_since_prune = 0
+        self.cache.prune(RESPONSE_KEY_PREFIX, max_bytes)
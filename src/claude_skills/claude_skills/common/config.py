@@ -11,6 +11,8 @@ import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from claude_skills.common.config_snapshot import load_config_snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,8 +140,8 @@ def load_config(project_path: Optional[Path] = None) -> Dict[str, Any]:
         config = DEFAULT_CONFIG.copy()
     else:
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
+            snapshot = load_config_snapshot(config_path, json.loads, "json")
+            config_data = snapshot.to_dict() if snapshot else None
 
             if not isinstance(config_data, dict):
                 logger.warning(f"Invalid config at {config_path}, using defaults")
@@ -0,0 +1,132 @@
+"""
+Process-wide snapshot cache for configuration files.
+
+Configuration getters (`ai_config`, `sdd_config`, `config`) are called many times
+per CLI invocation. Rather than re-reading and re-parsing the backing file on every
+call, files are parsed once per process and cached by path. A cached snapshot is
+reused until the file's stat signature (mtime, size, inode) changes, at which point
+it is transparently re-read.
+
+Snapshot data is stored as an immutable view (read-only mappings and tuples) so a
+caller cannot corrupt the cache for everyone else. Use `ConfigSnapshot.to_dict()`
+when a mutable copy is required.
+"""
+
+import copy
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Parser receives the raw file text and returns the parsed configuration
+ConfigParser = Callable[[str], Any]
+
+# (st_mtime_ns, st_size, st_ino) - cheap to obtain with a single stat call
+StatSignature = Tuple[int, int, int]
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into read-only mappings and tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert a frozen view back into plain mutable dicts/lists."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return copy.copy(value)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable parsed view of a configuration file at a point in time."""
+
+    path: Path
+    signature: StatSignature
+    data: Any
+
+    def to_dict(self) -> Any:
+        """Return a mutable deep copy of the snapshot data."""
+        return thaw(self.data)
+
+
+_snapshots: Dict[Tuple[str, str], ConfigSnapshot] = {}
+_lock = threading.Lock()
+
+
+def _stat_signature(path: Path) -> Optional[StatSignature]:
+    """Return the stat signature for a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def load_config_snapshot(
+    path: Union[str, Path],
+    parser: ConfigParser,
+    parser_name: Optional[str] = None,
+) -> Optional[ConfigSnapshot]:
+    """
+    Load a configuration file through the process-wide snapshot cache.
+
+    The file is only re-read when its stat signature changes. Parser errors
+    (e.g. ``json.JSONDecodeError``, ``yaml.YAMLError``) and read errors propagate
+    to the caller and are never cached, so existing fallback handling still applies.
+
+    Args:
+        path: Path to the configuration file
+        parser: Callable that turns the file text into a Python value
+        parser_name: Cache namespace for the parser (defaults to its qualified name)
+
+    Returns:
+        ConfigSnapshot for the file, or None if the file does not exist
+    """
+    config_path = Path(path)
+    key = (str(config_path.absolute()), parser_name or getattr(parser, "__qualname__", repr(parser)))
+
+    signature = _stat_signature(config_path)
+    if signature is None:
+        with _lock:
+            _snapshots.pop(key, None)
+        return None
+
+    with _lock:
+        cached = _snapshots.get(key)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    text = config_path.read_text()
+    snapshot = ConfigSnapshot(path=config_path, signature=signature, data=freeze(parser(text)))
+
+    with _lock:
+        _snapshots[key] = snapshot
+    logger.debug(f"Parsed config snapshot for {config_path}")
+    return snapshot
+
+
+def clear_config_snapshots(path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Drop cached snapshots.
+
+    Args:
+        path: Only drop snapshots for this file (drops everything when omitted)
+    """
+    with _lock:
+        if path is None:
+            _snapshots.clear()
+            return
+        target = str(Path(path).absolute())
+        for key in [key for key in _snapshots if key[0] == target]:
+            del _snapshots[key]
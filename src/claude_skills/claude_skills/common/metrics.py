@@ -1,7 +1,8 @@
 """
 Metrics collection system for Claude Skills.
 
-Tracks skill and command usage, execution duration, and success/failure rates.
+Tracks skill and command usage, execution duration, and success/failure rates,
+plus a per-(provider, model) latency histogram for AI tool consultations.
 Automatically excludes metrics when running in test environments.
 """
 
@@ -10,16 +11,20 @@ import sys
 import json
 import time
 import shlex
+import bisect
 import functools
+import tempfile
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
 
 
 # Metrics storage location
 METRICS_DIR = Path.home() / ".claude" / "metrics"
 METRICS_FILE = METRICS_DIR / "skills.jsonl"
+LATENCY_FILE = METRICS_DIR / "provider_latency.json"
 
 # Maximum file size before rotation (10MB)
 MAX_METRICS_FILE_SIZE = 10 * 1024 * 1024
@@ -218,3 +223,188 @@ def get_metrics_file_path() -> Path:
 def is_metrics_enabled() -> bool:
     """Check if metrics collection is enabled (not in test environment)."""
     return not _is_test_environment()
+
+
+# =============================================================================
+# PROVIDER LATENCY HISTOGRAMS
+# =============================================================================
+
+# Bucket upper bounds in seconds (roughly logarithmic); the last bucket is open-ended
+LATENCY_BUCKETS = [1, 2, 3, 5, 8, 13, 20, 30, 45, 60, 90, 120, 180, 300, 450, 600, 900]
+
+# Counts are halved once a histogram holds this many samples, so old
+# observations decay and the file stays small
+MAX_LATENCY_SAMPLES = 500
+
+_latency_lock = threading.Lock()
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram for one (provider, model) pair.
+
+    Percentiles are reported as the upper bound of the bucket containing the
+    requested rank, which errs on the side of longer timeouts.
+    """
+
+    def __init__(self, counts: Optional[List[int]] = None, timeouts: int = 0):
+        self.counts = list(counts) if counts else [0] * (len(LATENCY_BUCKETS) + 1)
+        if len(self.counts) != len(LATENCY_BUCKETS) + 1:
+            self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.timeouts = timeouts
+
+    @property
+    def count(self) -> int:
+        """Number of recorded (successful) samples."""
+        return sum(self.counts)
+
+    def record(self, seconds: float) -> None:
+        """Record one observed latency."""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if self.count > MAX_LATENCY_SAMPLES:
+            self.counts = [value // 2 for value in self.counts]
+            self.timeouts //= 2
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            pct: Percentile in the range 0-100
+
+        Returns:
+            Bucket upper bound in seconds, or None without samples. Values in
+            the open-ended bucket report twice the largest bound.
+        """
+        total = self.count
+        if total == 0:
+            return None
+        rank = max(1, int(round(total * pct / 100.0)))
+        cumulative = 0
+        for index, value in enumerate(self.counts):
+            cumulative += value
+            if cumulative >= rank:
+                if index < len(LATENCY_BUCKETS):
+                    return float(LATENCY_BUCKETS[index])
+                return float(LATENCY_BUCKETS[-1] * 2)
+        return float(LATENCY_BUCKETS[-1] * 2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"counts": list(self.counts), "timeouts": self.timeouts}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        return cls(data.get("counts"), int(data.get("timeouts", 0)))
+
+
+def _latency_key(provider: str, model: Optional[str]) -> str:
+    return f"{provider}:{model or 'default'}"
+
+
+def _load_latency_data() -> Dict[str, Any]:
+    try:
+        with open(LATENCY_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def record_provider_latency(
+    provider: str,
+    model: Optional[str],
+    seconds: float,
+    timed_out: bool = False
+) -> None:
+    """
+    Record the latency of one AI tool consultation.
+
+    Successful calls are added to the histogram; timeouts are only counted
+    (their true latency is unknown). Failures should not be recorded.
+
+    Args:
+        provider: Tool/provider name (e.g., 'gemini')
+        model: Requested model (None for the provider default)
+        seconds: Wall-clock duration of the call
+        timed_out: Whether the call hit its timeout
+    """
+    if _is_test_environment():
+        return
+
+    try:
+        with _latency_lock:
+            data = _load_latency_data()
+            key = _latency_key(provider, model)
+            histogram = LatencyHistogram.from_dict(data.get(key, {}))
+            if timed_out:
+                histogram.timeouts += 1
+            else:
+                histogram.record(seconds)
+            data[key] = histogram.to_dict()
+
+            # Atomic replace so concurrent readers never see a partial file
+            _ensure_metrics_dir()
+            fd, tmp_path = tempfile.mkstemp(dir=METRICS_DIR, prefix='.latency-', suffix='.json')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, LATENCY_FILE)
+    except Exception:
+        # Silent fail - metrics should never break the actual command
+        pass
+
+
+def get_provider_latency(provider: str, model: Optional[str]) -> Optional[LatencyHistogram]:
+    """Return the latency histogram for a (provider, model) pair, if any."""
+    if _is_test_environment():
+        return None
+    entry = _load_latency_data().get(_latency_key(provider, model))
+    return LatencyHistogram.from_dict(entry) if isinstance(entry, dict) else None
+
+
+# Samples required before latency history influences timeouts or hedging
+MIN_LATENCY_SAMPLES = 20
+
+
+def get_adaptive_timeout(
+    provider: str,
+    model: Optional[str],
+    default_timeout: float,
+    headroom: float = 2.0,
+    minimum: float = 30.0
+) -> float:
+    """
+    Derive a consultation timeout from the provider's p95 latency.
+
+    Returns ``p95 * headroom`` clamped to ``[minimum, default_timeout]``; the
+    configured timeout is used until enough samples exist, and is never exceeded.
+
+    Args:
+        provider: Tool/provider name
+        model: Requested model
+        default_timeout: Configured (static) timeout in seconds
+        headroom: Multiplier applied to p95
+        minimum: Lower bound for the adaptive timeout
+
+    Returns:
+        Timeout in seconds
+    """
+    histogram = get_provider_latency(provider, model)
+    if histogram is None or histogram.count < MIN_LATENCY_SAMPLES:
+        return default_timeout
+    p95 = histogram.percentile(95)
+    if p95 is None:
+        return default_timeout
+    return min(default_timeout, max(minimum, p95 * headroom))
+
+
+def get_hedge_delay(provider: str, model: Optional[str]) -> Optional[float]:
+    """
+    Return the p90 latency after which a hedged request should be launched.
+
+    Returns:
+        Seconds, or None when there is not enough history to hedge
+    """
+    histogram = get_provider_latency(provider, model)
+    if histogram is None or histogram.count < MIN_LATENCY_SAMPLES:
+        return None
+    return histogram.percentile(90)
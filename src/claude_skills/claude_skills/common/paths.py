@@ -2,9 +2,11 @@
 Path discovery and validation utilities for SDD workflows.
 """
 
+import fnmatch
+import os
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator
 from claude_skills.common.git_metadata import find_git_root
 
 
@@ -399,6 +401,35 @@ def find_files_by_pattern(
     return [p for p in matches if p.is_file()]
 
 
+# Directories pruned by iter_matching_files (VCS metadata, virtualenvs, caches)
+SKIPPED_SEARCH_DIRS = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", ".pytest_cache", ".mypy_cache",
+    ".ruff_cache", ".tox", ".nox", ".venv", "venv", "node_modules",
+})
+
+
+def iter_matching_files(directory: Path, patterns: Iterable[str]) -> Iterator[Path]:
+    """
+    Yield files under a directory whose name matches any of several patterns.
+
+    Unlike one ``glob("**/...")`` per pattern, the tree is walked once, and
+    ``SKIPPED_SEARCH_DIRS`` are not descended into.
+
+    Args:
+        directory: Directory to search
+        patterns: File name patterns (e.g., "test_*.py", "*.spec.ts")
+
+    Yields:
+        Matching file paths
+    """
+    patterns = tuple(patterns)
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = [d for d in dirnames if d not in SKIPPED_SEARCH_DIRS]
+        for name in filenames:
+            if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+                yield Path(dirpath) / name
+
+
 def generate_reports_readme_content() -> str:
     """
     Generate README content for the specs/.reports/ directory.
@@ -0,0 +1,324 @@
+"""
+Token-budgeted prompt assembly.
+
+Generalizes the priority-based truncation used for analysis insights
+(`llm_doc_gen.analysis.analysis_insights._truncate_to_budget`) so any prompt can be
+assembled from sections against a token or character budget:
+
+- Required sections are always emitted in full.
+- Optional sections are granted budget in priority order (1 = highest). Sections
+  that share a priority split the remaining budget fairly, smallest first.
+- A section that does not fit is truncated with its truncator, or replaced with
+  its (short) fallback summary.
+- Sections are emitted in the order they were added, so the prompt keeps its
+  structure, and the output is fully deterministic for identical inputs, which
+  keeps downstream cache keys stable.
+
+Also provides helpers for summarizing and hunk-aware truncation of unified diffs.
+"""
+
+import codecs
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# Rough token estimation (1 token ≈ 4 characters), consistent with analysis_insights
+CHARS_PER_TOKEN = 4
+
+# Smallest truncated section worth emitting (anything shorter uses the fallback)
+MIN_TRUNCATED_CHARS = 200
+
+Truncator = Callable[[str, int], str]
+
+DIFF_HEADER_PREFIX = "diff --git "
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a string."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def truncate_lines(text: str, max_chars: int, marker: str = "... (truncated)") -> str:
+    """
+    Truncate text on line boundaries to fit within a character limit.
+
+    Args:
+        text: Text to truncate
+        max_chars: Maximum characters allowed
+        marker: Line appended when content is dropped
+
+    Returns:
+        Truncated text (unchanged if it already fits)
+    """
+    if len(text) <= max_chars:
+        return text
+
+    limit = max_chars - len(marker) - 1
+    result_lines: List[str] = []
+    current_len = 0
+    for line in text.split("\n"):
+        if current_len + len(line) + 1 > limit:
+            break
+        result_lines.append(line)
+        current_len += len(line) + 1
+
+    result_lines.append(marker)
+    return "\n".join(result_lines)
+
+
+@dataclass
+class PromptSection:
+    """A named block of prompt text with its budgeting policy."""
+
+    name: str
+    text: str
+    priority: int = 1
+    required: bool = False
+    truncator: Optional[Truncator] = None
+    fallback: str = ""
+
+
+class BudgetedPromptBuilder:
+    """
+    Assemble a prompt from sections without exceeding a size budget.
+
+    Usage:
+        builder = BudgetedPromptBuilder(max_tokens=8000)
+        builder.add("header", "# Review\\n", required=True)
+        builder.add("diff:src/a.py", diff_text, priority=2, truncator=truncate_diff_section,
+                    fallback="### src/a.py (+10/-2, omitted)\\n")
+        prompt = builder.build()
+    """
+
+    def __init__(self, max_tokens: Optional[int] = None, max_chars: Optional[int] = None):
+        """
+        Initialize the builder.
+
+        Args:
+            max_tokens: Token budget (converted with CHARS_PER_TOKEN)
+            max_chars: Character budget (takes precedence over max_tokens)
+
+        If neither is given the prompt is unbounded.
+        """
+        if max_chars is None and max_tokens is not None:
+            max_chars = max_tokens * CHARS_PER_TOKEN
+        self.max_chars = max_chars
+        self.sections: List[PromptSection] = []
+        self.omitted: List[str] = []
+        self.truncated: List[str] = []
+
+    def add(
+        self,
+        name: str,
+        text: str,
+        priority: int = 1,
+        required: bool = False,
+        truncator: Optional[Truncator] = None,
+        fallback: str = "",
+    ) -> None:
+        """
+        Add a section (sections are emitted in the order they are added).
+
+        Args:
+            name: Section identifier (used in omitted/truncated reports)
+            text: Full section text
+            priority: Budget priority for optional sections (1 = highest)
+            required: Always include the full text
+            truncator: Callable(text, max_chars) returning a shortened version
+            fallback: Short replacement used when the section does not fit
+        """
+        if text:
+            self.sections.append(PromptSection(name, text, priority, required, truncator, fallback))
+
+    def _allocate(self) -> List[str]:
+        """Decide the rendered text of every section within the budget."""
+        rendered = [section.text for section in self.sections]
+        self.omitted = []
+        self.truncated = []
+        if self.max_chars is None:
+            return rendered
+
+        # Required text and fallbacks are reserved up front
+        for index, section in enumerate(self.sections):
+            if not section.required:
+                rendered[index] = section.fallback
+        remaining = self.max_chars - sum(len(text) for text in rendered)
+
+        optional = [
+            (section.priority, index)
+            for index, section in enumerate(self.sections)
+            if not section.required
+        ]
+        for priority in sorted({priority for priority, _ in optional}):
+            level = [index for p, index in optional if p == priority]
+            # Smallest first so short sections are never starved by a large sibling
+            level.sort(key=lambda index: (len(self.sections[index].text), index))
+
+            for position, index in enumerate(level):
+                section = self.sections[index]
+                extra = len(section.text) - len(section.fallback)
+                share = max(remaining, 0) // (len(level) - position)
+
+                if extra <= share:
+                    rendered[index] = section.text
+                    remaining -= extra
+                    continue
+
+                allowed = share + len(section.fallback)
+                if section.truncator and allowed >= MIN_TRUNCATED_CHARS:
+                    truncated = section.truncator(section.text, allowed)
+                    if len(truncated) <= allowed:
+                        rendered[index] = truncated
+                        remaining -= len(truncated) - len(section.fallback)
+                        self.truncated.append(section.name)
+                        continue
+
+                self.omitted.append(section.name)
+
+        return rendered
+
+    def iter_sections(self) -> Iterator[str]:
+        """Yield the rendered sections in document order."""
+        for text in self._allocate():
+            if text:
+                yield text
+
+    def build(self) -> str:
+        """Return the assembled prompt."""
+        return "".join(self.iter_sections())
+
+
+# ---------------------------------------------------------------------------
+# Diff helpers
+# ---------------------------------------------------------------------------
+
+def _unquote_git_path(path: str) -> str:
+    """Decode a C-style quoted path emitted by git (e.g. ``"a/caf\\303\\251.py"``)."""
+    if len(path) >= 2 and path.startswith('"') and path.endswith('"'):
+        raw = codecs.escape_decode(path[1:-1].encode("utf-8"))[0]
+        return raw.decode("utf-8", errors="replace")
+    return path
+
+
+def parse_diff_header_path(header: str) -> Optional[str]:
+    """
+    Extract the repository-relative path from a ``diff --git a/X b/X`` header.
+
+    Rename detection is disabled when diffing, so both sides name the same path and
+    the header can be split in half even when the path contains spaces.
+    """
+    remainder = header[len(DIFF_HEADER_PREFIX):].rstrip("\n")
+    if remainder.startswith('"'):
+        # Quoted paths: `"a/x" "b/x"`
+        closing = remainder.find('" ', 1)
+        if closing == -1:
+            return None
+        return _unquote_git_path(remainder[:closing + 1])[2:]
+
+    # `a/` + path + ` b/` + path
+    if not remainder.startswith("a/") or (len(remainder) - 5) % 2:
+        return None
+    half = (len(remainder) - 5) // 2
+    path = remainder[2:2 + half]
+    if remainder[2 + half:] != f" b/{path}":
+        return None
+    return path
+
+
+def split_diff_hunks(diff: str) -> Tuple[str, List[str]]:
+    """
+    Split a single-file unified diff into its header and hunks.
+
+    Args:
+        diff: Unified diff text for one file
+
+    Returns:
+        Tuple of (header text, list of hunk texts starting with ``@@``)
+    """
+    header_lines: List[str] = []
+    hunks: List[List[str]] = []
+    for line in diff.splitlines(keepends=True):
+        if line.startswith("@@"):
+            hunks.append([line])
+        elif hunks:
+            hunks[-1].append(line)
+        else:
+            header_lines.append(line)
+    return "".join(header_lines), ["".join(hunk) for hunk in hunks]
+
+
+def count_diff_changes(diff: str) -> Tuple[int, int]:
+    """Count added and removed lines in a unified diff (headers excluded)."""
+    added = removed = 0
+    for line in diff.splitlines():
+        if line.startswith("+") and not line.startswith("+++"):
+            added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed += 1
+    return added, removed
+
+
+def summarize_diff(diff: str) -> str:
+    """
+    Produce a one-line summary of a unified diff.
+
+    Returns:
+        e.g. ``"+12/-3 lines in 2 hunks"``
+    """
+    _, hunks = split_diff_hunks(diff)
+    added, removed = count_diff_changes(diff)
+    hunk_label = "hunk" if len(hunks) == 1 else "hunks"
+    return f"+{added}/-{removed} lines in {len(hunks)} {hunk_label}"
+
+
+def truncate_diff(diff: str, max_chars: int) -> str:
+    """
+    Truncate a unified diff by dropping its least relevant hunks.
+
+    Hunks are ranked by the number of changed lines (ties keep diff order), kept
+    greedily while they fit, and emitted in their original order followed by a
+    note describing what was omitted. If not even one hunk fits, the largest
+    hunk is cut on a line boundary.
+
+    Args:
+        diff: Unified diff text for one file
+        max_chars: Maximum characters allowed
+
+    Returns:
+        Truncated diff (unchanged if it already fits)
+    """
+    if len(diff) <= max_chars:
+        return diff
+
+    header, hunks = split_diff_hunks(diff)
+    if not hunks:
+        return truncate_lines(diff, max_chars)
+
+    def relevance(index: int) -> Tuple[int, int]:
+        added, removed = count_diff_changes(hunks[index])
+        return (-(added + removed), index)
+
+    note_reserve = 80
+    available = max_chars - len(header) - note_reserve
+    selected: List[int] = []
+    used = 0
+    for index in sorted(range(len(hunks)), key=relevance):
+        if used + len(hunks[index]) <= available:
+            selected.append(index)
+            used += len(hunks[index])
+
+    if not selected:
+        best = sorted(range(len(hunks)), key=relevance)[0]
+        clipped = truncate_lines(hunks[best], max(available, 0))
+        omitted = [hunks[i] for i in range(len(hunks)) if i != best]
+        body = clipped if clipped.endswith("\n") else clipped + "\n"
+    else:
+        selected.sort()
+        omitted = [hunks[i] for i in range(len(hunks)) if i not in selected]
+        body = "".join(hunks[i] for i in selected)
+
+    if omitted:
+        added, removed = count_diff_changes("".join(omitted))
+        body += f"... ({len(omitted)} more hunks omitted: +{added}/-{removed} lines)\n"
+
+    result = header + body
+    return result if len(result) <= max_chars else truncate_lines(result, max_chars)
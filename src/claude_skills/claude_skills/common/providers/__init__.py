@@ -77,6 +77,14 @@ from .opencode import (
     is_opencode_available as opencode_is_available,
     OPENCODE_METADATA,
 )
+from .stub import (
+    StubProvider,
+    StubSettings,
+    create_provider as create_stub_provider,
+    is_stub_available as stub_is_available,
+    reset_stub_state,
+    STUB_METADATA,
+)
 
 __all__ = [
     "ProviderCapability",
@@ -134,4 +142,10 @@ __all__ = [
     "create_opencode_provider",
     "opencode_is_available",
     "OPENCODE_METADATA",
+    "StubProvider",
+    "StubSettings",
+    "create_stub_provider",
+    "stub_is_available",
+    "reset_stub_state",
+    "STUB_METADATA",
 ]
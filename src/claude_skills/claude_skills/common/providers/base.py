@@ -9,11 +9,36 @@ abstract base class invoked by higher-level registries.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Sequence, Set
 
+from .cancellation import CancellationToken, cancellation_scope, get_current_token
+from .scheduler import get_scheduler
+
+# Worker threads for agenerate(). Only calls holding a scheduler slot run here,
+# so the pool never fills with waiters; threads are started on demand.
+AGENERATE_MAX_WORKERS = 64
+
+_agenerate_executor: Optional[ThreadPoolExecutor] = None
+_agenerate_executor_lock = threading.Lock()
+
+
+def _get_agenerate_executor() -> ThreadPoolExecutor:
+    """Return the executor agenerate() runs providers on, creating it on first use."""
+    global _agenerate_executor
+    with _agenerate_executor_lock:
+        if _agenerate_executor is None:
+            _agenerate_executor = ThreadPoolExecutor(
+                max_workers=AGENERATE_MAX_WORKERS, thread_name_prefix="sdd-provider"
+            )
+        return _agenerate_executor
+
 
 class ProviderCapability(Enum):
     """
@@ -225,6 +250,10 @@ class ProviderContext(ABC):
           populated `GenerationResult`.
         * Emit streaming chunks via `self._hooks.emit_stream()` when `request.stream`
           is True and the provider supports streaming output.
+
+    Both `generate()` and `agenerate()` take a slot from the process-wide
+    provider scheduler (see scheduler.py) before executing, so concurrency and
+    rate limits apply to every caller.
     """
 
     def __init__(self, metadata: ProviderMetadata, hooks: Optional[ProviderHooks] = None):
@@ -246,14 +275,83 @@ class ProviderContext(ABC):
         """
         Execute the provider with the supplied request.
 
-        Applies lifecycle hooks, normalizes errors, and ensures ProviderStatus
-        is consistent across implementations.
+        Waits for a scheduler slot, applies lifecycle hooks, normalizes errors,
+        and ensures ProviderStatus is consistent across implementations. The
+        request timeout covers both the wait and the execution.
         """
         normalized_request = self._prepare_request(request)
-        self._hooks.emit_before(normalized_request, self._metadata)
+        waiting_since = time.monotonic()
+        try:
+            with get_scheduler().slot(self._metadata.provider_name, timeout=normalized_request.timeout):
+                token = get_current_token()
+                if token is not None and token.cancelled:
+                    # Abandoned while waiting for a slot (e.g. by a completion policy)
+                    raise ProviderExecutionError(
+                        "Provider call cancelled before it started",
+                        provider=self._metadata.provider_name,
+                    )
+                return self._generate_now(self._deduct_slot_wait(normalized_request, waiting_since))
+        except TimeoutError as exc:
+            # Raised by the scheduler when no slot frees up within the request timeout
+            raise ProviderTimeoutError(str(exc), provider=self._metadata.provider_name) from exc
+
+    async def agenerate(
+        self,
+        request: GenerationRequest,
+    ) -> GenerationResult:
+        """
+        Asynchronous counterpart of `generate()`.
+
+        Waits for a scheduler slot on the event loop, then runs the provider
+        in a thread of a dedicated executor (not the loop's default one, which
+        callers may saturate). Cancelling the awaiting task terminates the
+        provider's CLI process. As in `generate()`, the request timeout covers
+        both the wait and the execution.
+        """
+        normalized_request = self._prepare_request(request)
+        loop = asyncio.get_running_loop()
+        token = CancellationToken()
+        waiting_since = time.monotonic()
+
+        def _run(remaining_request: GenerationRequest) -> GenerationResult:
+            with cancellation_scope(token):
+                return self._generate_now(remaining_request)
+
+        try:
+            async with get_scheduler().aslot(self._metadata.provider_name, timeout=normalized_request.timeout):
+                remaining_request = self._deduct_slot_wait(normalized_request, waiting_since)
+                return await loop.run_in_executor(_get_agenerate_executor(), _run, remaining_request)
+        except asyncio.CancelledError:
+            token.cancel()
+            raise
+        except TimeoutError as exc:
+            # Raised by the scheduler when no slot frees up within the request timeout
+            raise ProviderTimeoutError(str(exc), provider=self._metadata.provider_name) from exc
+
+    def _deduct_slot_wait(self, request: GenerationRequest, waiting_since: float) -> GenerationRequest:
+        """
+        Shorten the request timeout by the time spent waiting for a slot.
+
+        Raises:
+            ProviderTimeoutError: If the wait used up the whole timeout
+        """
+        if request.timeout is None:
+            return request
+        # Milliseconds are plenty for CLI timeouts; an uncontended slot leaves it as is
+        remaining = round(request.timeout - (time.monotonic() - waiting_since), 3)
+        if remaining <= 0:
+            raise ProviderTimeoutError(
+                f"Timed out after {request.timeout}s waiting for a {self._metadata.provider_name} provider slot",
+                provider=self._metadata.provider_name,
+            )
+        return replace(request, timeout=remaining)
+
+    def _generate_now(self, request: GenerationRequest) -> GenerationResult:
+        """Run hooks and `_execute()` with normalized errors (no scheduling)."""
+        self._hooks.emit_before(request, self._metadata)
 
         try:
-            result = self._execute(normalized_request)
+            result = self._execute(request)
         except ProviderTimeoutError:
             raise
         except ProviderUnavailableError:
@@ -0,0 +1,163 @@
+"""
+Cooperative cancellation for provider subprocesses.
+
+Providers shell out to CLI tools through their default runners. When a caller
+no longer needs a result (e.g. ``execute_tools_parallel`` has already reached
+its completion policy), the CLI process should be stopped rather than left to
+run until its timeout.
+
+A ``CancellationToken`` is bound to the current thread with
+``cancellation_scope``; ``run_subprocess`` (used by every provider's default
+runner) registers the processes it starts with the bound token, and
+``CancellationToken.cancel()`` terminates them. Code running without a scope
+behaves exactly like ``subprocess.run``. ``cancel_all`` cancels several
+tokens at once, so their processes share a single grace period.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Seconds to wait after SIGTERM before escalating to SIGKILL
+TERMINATE_GRACE_SECONDS = 2.0
+
+_local = threading.local()
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag that owns the processes started under it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._processes: List[subprocess.Popen] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._cancelled
+
+    def register(self, process: subprocess.Popen) -> None:
+        """Track a running process (terminated immediately if already cancelled)."""
+        with self._lock:
+            if not self._cancelled:
+                self._processes.append(process)
+                return
+        _terminate_all([process])
+
+    def unregister(self, process: subprocess.Popen) -> None:
+        """Stop tracking a process that has exited."""
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+
+    def cancel(self) -> None:
+        """Mark the token cancelled and terminate every tracked process."""
+        _terminate_all(self._detach())
+
+    def _detach(self) -> List[subprocess.Popen]:
+        """Mark the token cancelled and hand over its tracked processes."""
+        with self._lock:
+            self._cancelled = True
+            processes = list(self._processes)
+            self._processes.clear()
+        return processes
+
+
+def cancel_all(tokens: Iterable[CancellationToken]) -> None:
+    """
+    Cancel several tokens at once.
+
+    Every process is sent SIGTERM before any is waited on, so cancelling N
+    tokens takes at most one grace period rather than N.
+    """
+    processes: List[subprocess.Popen] = []
+    for token in tokens:
+        processes.extend(token._detach())
+    _terminate_all(processes)
+
+
+def _terminate_all(processes: Sequence[subprocess.Popen]) -> None:
+    """Terminate processes, killing any that outlive a shared grace period."""
+    running = [process for process in processes if process.poll() is None]
+    for process in running:
+        try:
+            process.terminate()
+        except OSError:
+            pass
+
+    deadline = time.monotonic() + TERMINATE_GRACE_SECONDS
+    for process in running:
+        try:
+            process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+
+def get_current_token() -> Optional[CancellationToken]:
+    """Return the token bound to the current thread, if any."""
+    return getattr(_local, "token", None)
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Bind a token to the current thread for the duration of the block."""
+    previous = get_current_token()
+    _local.token = token
+    try:
+        yield token
+    finally:
+        _local.token = previous
+
+
+def run_subprocess(
+    command: Sequence[str],
+    *,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+    input_data: Optional[str] = None,
+) -> subprocess.CompletedProcess[str]:
+    """
+    Run a command like ``subprocess.run(capture_output=True, text=True)``.
+
+    The process is registered with the thread's cancellation token (if any) so
+    it can be terminated early. A cancelled run returns the (negative) exit
+    code of the terminated process instead of raising.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds ``timeout``
+        FileNotFoundError: If the executable does not exist
+    """
+    token = get_current_token()
+    process = subprocess.Popen(  # noqa: S603 - callers pass vetted CLI commands
+        list(command),
+        stdin=subprocess.PIPE if input_data is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    if token is not None:
+        token.register(process)
+    try:
+        stdout, stderr = process.communicate(input=input_data, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        stdout, stderr = process.communicate()
+        raise subprocess.TimeoutExpired(process.args, timeout, output=stdout, stderr=stderr)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        if token is not None:
+            token.unregister(process)
+
+    return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
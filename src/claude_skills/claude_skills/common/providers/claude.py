@@ -4,6 +4,8 @@ Claude CLI provider implementation.
 Bridges the `claude` command-line interface to the ProviderContext contract by
 handling availability checks, safe command construction, response parsing, and
 token usage normalization. Restricts to read-only operations for security.
+Streaming requests use the CLI's ``stream-json`` output so chunks are emitted
+while the model generates.
 """
 
 from __future__ import annotations
@@ -11,7 +13,8 @@ from __future__ import annotations
 import json
 import os
 import subprocess
-from typing import Any, Dict, List, Optional, Sequence, Protocol
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Protocol
 
 from .base import (
     GenerationRequest,
@@ -28,6 +31,8 @@ from .base import (
     StreamChunk,
     TokenUsage,
 )
+from .cancellation import run_subprocess
+from .streaming import StreamCollector, parse_json_line, stream_subprocess, streaming_unsupported
 from .registry import register_provider
 from .detectors import detect_provider_availability
 
@@ -176,21 +181,39 @@ class RunnerProtocol(Protocol):
         raise NotImplementedError
 
 
+class StreamRunnerProtocol(Protocol):
+    """Callable signature used for executing Claude CLI commands with incremental output."""
+
+    def __call__(
+        self,
+        command: Sequence[str],
+        *,
+        on_line: Callable[[str], None],
+        timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[str]:
+        raise NotImplementedError
+
+
 def _default_runner(
     command: Sequence[str],
     *,
     timeout: Optional[int] = None,
     env: Optional[Dict[str, str]] = None,
 ) -> subprocess.CompletedProcess[str]:
-    """Invoke the Claude CLI via subprocess."""
-    return subprocess.run(  # noqa: S603,S607 - intentional CLI invocation
-        list(command),
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        env=env,
-        check=False,
-    )
+    """Invoke the Claude CLI via subprocess (cancellable, see cancellation.py)."""
+    return run_subprocess(command, timeout=timeout, env=env)
+
+
+def _default_stream_runner(
+    command: Sequence[str],
+    *,
+    on_line: Callable[[str], None],
+    timeout: Optional[int] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess[str]:
+    """Invoke the Claude CLI, passing each stdout line to on_line as it arrives."""
+    return stream_subprocess(command, on_line=on_line, timeout=timeout, env=env)
 
 
 CLAUDE_MODELS: List[ModelDescriptor] = [
@@ -236,11 +259,15 @@ class ClaudeProvider(ProviderContext):
         model: Optional[str] = None,
         binary: Optional[str] = None,
         runner: Optional[RunnerProtocol] = None,
+        stream_runner: Optional[StreamRunnerProtocol] = None,
         env: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
     ):
         super().__init__(metadata, hooks)
         self._runner = runner or _default_runner
+        # A custom runner (e.g. a test double) without a stream runner keeps the
+        # single-chunk behaviour for streaming requests
+        self._stream_runner = stream_runner or (_default_stream_runner if runner is None else None)
         self._binary = binary or os.environ.get(CUSTOM_BINARY_ENV, DEFAULT_BINARY)
         self._env = env
         self._timeout = timeout or DEFAULT_TIMEOUT_SECONDS
@@ -280,14 +307,28 @@ class ClaudeProvider(ProviderContext):
                 provider=self.metadata.provider_name,
             )
 
-    def _build_command(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> List[str]:
+    def _build_command(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        *,
+        streaming: bool = False,
+    ) -> List[str]:
         """
         Build Claude CLI command with read-only tool restrictions.
 
         Command structure:
             claude --print [prompt] --output-format json --allowed-tools Read Grep ... --disallowed-tools Write Edit Bash
+
+        With ``streaming`` the output format is ``stream-json`` (one event per
+        line, including partial text deltas).
         """
-        command = [self._binary, "--print", prompt, "--output-format", "json"]
+        command = [self._binary, "--print", prompt]
+        if streaming:
+            command.extend(["--output-format", "stream-json", "--verbose", "--include-partial-messages"])
+        else:
+            command.extend(["--output-format", "json"])
 
         # Add read-only tool restrictions
         command.extend(["--allowed-tools"] + ALLOWED_TOOLS)
@@ -320,6 +361,22 @@ class ClaudeProvider(ProviderContext):
         except subprocess.TimeoutExpired as exc:
             raise ProviderTimeoutError(str(exc), provider=self.metadata.provider_name) from exc
 
+    def _run_streaming(
+        self,
+        command: Sequence[str],
+        timeout: Optional[int],
+        on_line: Callable[[str], None],
+    ) -> subprocess.CompletedProcess[str]:
+        try:
+            return self._stream_runner(command, on_line=on_line, timeout=timeout, env=self._env)
+        except FileNotFoundError as exc:
+            raise ProviderUnavailableError(
+                f"Claude CLI '{self._binary}' is not available on PATH.",
+                provider=self.metadata.provider_name,
+            ) from exc
+        except subprocess.TimeoutExpired as exc:
+            raise ProviderTimeoutError(str(exc), provider=self.metadata.provider_name) from exc
+
     def _parse_output(self, raw: str) -> Dict[str, Any]:
         text = raw.strip()
         if not text:
@@ -370,15 +427,100 @@ class ClaudeProvider(ProviderContext):
             return
         self._emit_stream_chunk(StreamChunk(content=content, index=0))
 
+    def _handle_stream_event(self, event: Dict[str, Any], collector: StreamCollector, state: Dict[str, Any]) -> None:
+        """Publish text from one stream-json event; remember the final result event."""
+        event_type = event.get("type")
+        if event_type == "stream_event":
+            inner = event.get("event") or {}
+            delta = inner.get("delta") or {}
+            if inner.get("type") == "content_block_delta" and delta.get("type") == "text_delta":
+                state["partial"] = True
+                collector.add(str(delta.get("text") or ""))
+        elif event_type == "assistant" and not state.get("partial"):
+            # CLIs without partial messages emit whole assistant turns instead
+            for block in (event.get("message") or {}).get("content") or []:
+                if isinstance(block, dict) and block.get("type") == "text":
+                    collector.add(str(block.get("text") or ""))
+        elif event_type == "result":
+            state["result"] = event
+
+    def _execute_streaming(
+        self,
+        request: GenerationRequest,
+        model: str,
+        timeout: Optional[int],
+    ) -> Optional[GenerationResult]:
+        """
+        Run the CLI in stream-json mode, emitting chunks while it generates.
+
+        Returns:
+            GenerationResult, or None when the CLI rejects the streaming flags
+            (the caller then falls back to a regular JSON run)
+        """
+        command = self._build_command(
+            model,
+            request.prompt,
+            system_prompt=request.system_prompt,
+            streaming=True,
+        )
+        collector = StreamCollector(self._emit_stream_chunk)
+        state: Dict[str, Any] = {}
+
+        def on_line(line: str) -> None:
+            event = parse_json_line(line)
+            if event is not None:
+                self._handle_stream_event(event, collector, state)
+
+        completed = self._run_streaming(command, timeout, on_line)
+        if streaming_unsupported(completed) and not collector.parts:
+            return None
+        if completed.returncode != 0:
+            stderr = (completed.stderr or "").strip()
+            raise ProviderExecutionError(
+                f"Claude CLI exited with code {completed.returncode}: {stderr or 'no stderr'}",
+                provider=self.metadata.provider_name,
+            )
+
+        payload = state.get("result")
+        if payload is None:
+            raise ProviderExecutionError(
+                "Claude CLI stream ended without a result event.",
+                provider=self.metadata.provider_name,
+            )
+
+        content = str(payload.get("result") or collector.text).strip()
+        model_usage = payload.get("modelUsage") or {}
+        reported_model = list(model_usage.keys())[0] if model_usage else model
+        usage = self._extract_usage(payload)
+        usage = replace(
+            usage,
+            metadata={**usage.metadata, "time_to_first_token_ms": collector.time_to_first_chunk_ms},
+        )
+
+        return GenerationResult(
+            content=content,
+            model_fqn=f"{self.metadata.provider_name}:{reported_model}",
+            status=ProviderStatus.SUCCESS,
+            usage=usage,
+            stderr=(completed.stderr or "").strip() or None,
+            raw_payload=payload,
+        )
+
     def _execute(self, request: GenerationRequest) -> GenerationResult:
         self._validate_request(request)
         model = self._resolve_model(request)
+        timeout = request.timeout or self._timeout
+
+        if request.stream and self._stream_runner is not None:
+            streamed = self._execute_streaming(request, model, timeout)
+            if streamed is not None:
+                return streamed
+
         command = self._build_command(
             model,
             request.prompt,
             system_prompt=request.system_prompt
         )
-        timeout = request.timeout or self._timeout
         completed = self._run(command, timeout=timeout)
 
         if completed.returncode != 0:
@@ -426,11 +568,12 @@ def create_provider(
     """
     Factory used by the provider registry.
 
-    dependencies/overrides allow callers (or tests) to inject runner/env/binary.
+    dependencies/overrides allow callers (or tests) to inject runner/stream_runner/env/binary.
     """
     dependencies = dependencies or {}
     overrides = overrides or {}
     runner = dependencies.get("runner")
+    stream_runner = dependencies.get("stream_runner")
     env = dependencies.get("env")
     binary = overrides.get("binary") or dependencies.get("binary")
     timeout = overrides.get("timeout")
@@ -442,6 +585,7 @@ def create_provider(
         model=selected_model,
         binary=binary,  # type: ignore[arg-type]
         runner=runner if runner is not None else None,  # type: ignore[arg-type]
+        stream_runner=stream_runner if stream_runner is not None else None,  # type: ignore[arg-type]
         env=env if env is not None else None,  # type: ignore[arg-type]
         timeout=timeout if timeout is not None else None,
     )
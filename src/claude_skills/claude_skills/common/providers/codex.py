@@ -29,6 +29,7 @@ from .base import (
     StreamChunk,
     TokenUsage,
 )
+from .cancellation import run_subprocess
 from .registry import register_provider
 from .detectors import detect_provider_availability
 
@@ -232,15 +233,8 @@ def _default_runner(
     timeout: Optional[int] = None,
     env: Optional[Dict[str, str]] = None,
 ) -> subprocess.CompletedProcess[str]:
-    """Invoke the Codex CLI via subprocess."""
-    return subprocess.run(  # noqa: S603,S607 - intentional CLI invocation
-        list(command),
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        env=env,
-        check=False,
-    )
+    """Invoke the Codex CLI via subprocess (cancellable, see cancellation.py)."""
+    return run_subprocess(command, timeout=timeout, env=env)
 
 
 CODEX_MODELS: List[ModelDescriptor] = [
@@ -4,6 +4,8 @@ Cursor Agent CLI provider implementation.
 Adapts the `cursor-agent` command-line tool to the ProviderContext contract,
 including availability checks, streaming normalization, and response parsing.
 Enforces read-only restrictions via Cursor's permission configuration system.
+Streaming requests use the CLI's ``stream-json`` output so chunks are emitted
+while the model generates.
 """
 
 from __future__ import annotations
@@ -13,8 +15,9 @@ import os
 import shutil
 import subprocess
 import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
 
 from .base import (
     GenerationRequest,
@@ -31,6 +34,8 @@ from .base import (
     StreamChunk,
     TokenUsage,
 )
+from .cancellation import run_subprocess
+from .streaming import StreamCollector, parse_json_line, stream_subprocess, streaming_unsupported
 from .detectors import detect_provider_availability
 from .registry import register_provider
 
@@ -189,15 +194,33 @@ def _default_runner(
     timeout: Optional[int] = None,
     env: Optional[Dict[str, str]] = None,
 ) -> subprocess.CompletedProcess[str]:
-    """Invoke the cursor-agent CLI via subprocess."""
-    return subprocess.run(  # noqa: S603,S607 - intentional CLI invocation
-        list(command),
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        env=env,
-        check=False,
-    )
+    """Invoke the cursor-agent CLI via subprocess (cancellable, see cancellation.py)."""
+    return run_subprocess(command, timeout=timeout, env=env)
+
+
+class StreamRunnerProtocol(Protocol):
+    """Callable signature used for executing cursor-agent CLI commands with incremental output."""
+
+    def __call__(
+        self,
+        command: Sequence[str],
+        *,
+        on_line: Callable[[str], None],
+        timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[str]:
+        raise NotImplementedError
+
+
+def _default_stream_runner(
+    command: Sequence[str],
+    *,
+    on_line: Callable[[str], None],
+    timeout: Optional[int] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess[str]:
+    """Invoke the cursor-agent CLI, passing each stdout line to on_line as it arrives."""
+    return stream_subprocess(command, on_line=on_line, timeout=timeout, env=env)
 
 
 CURSOR_MODELS: List[ModelDescriptor] = [
@@ -248,11 +271,15 @@ class CursorAgentProvider(ProviderContext):
         model: Optional[str] = None,
         binary: Optional[str] = None,
         runner: Optional[RunnerProtocol] = None,
+        stream_runner: Optional[StreamRunnerProtocol] = None,
         env: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
     ):
         super().__init__(metadata, hooks)
         self._runner = runner or _default_runner
+        # A custom runner (e.g. a test double) without a stream runner keeps the
+        # single-chunk behaviour for streaming requests
+        self._stream_runner = stream_runner or (_default_stream_runner if runner is None else None)
         self._binary = binary or os.environ.get(CUSTOM_BINARY_ENV, DEFAULT_BINARY)
         self._env = env
         self._timeout = timeout or DEFAULT_TIMEOUT_SECONDS
@@ -400,6 +427,8 @@ class CursorAgentProvider(ProviderContext):
         self,
         request: GenerationRequest,
         model: str,
+        *,
+        streaming: bool = False,
     ) -> List[str]:
         """
         Assemble the cursor-agent CLI invocation with read-only config.
@@ -407,13 +436,17 @@ class CursorAgentProvider(ProviderContext):
         Args:
             request: Generation request
             model: Model ID to use
+            streaming: Use stream-json output with partial text events
 
         Note:
             Config is read from ~/.cursor/cli-config.json (managed by _create_readonly_config).
             Uses --print mode for non-interactive execution with JSON output.
         """
         # cursor-agent in headless mode: --print --output-format json
-        command = [self._binary, "--print", "--output-format", "json"]
+        if streaming:
+            command = [self._binary, "--print", "--output-format", "stream-json", "--stream-partial-output"]
+        else:
+            command = [self._binary, "--print", "--output-format", "json"]
 
         if model:
             command.extend(["--model", model])
@@ -456,6 +489,24 @@ class CursorAgentProvider(ProviderContext):
                 str(exc), provider=self.metadata.provider_name
             ) from exc
 
+    def _run_streaming(
+        self,
+        command: Sequence[str],
+        timeout: Optional[int],
+        on_line: Callable[[str], None],
+    ) -> subprocess.CompletedProcess[str]:
+        try:
+            return self._stream_runner(command, on_line=on_line, timeout=timeout, env=self._env)
+        except FileNotFoundError as exc:
+            raise ProviderUnavailableError(
+                f"Cursor Agent CLI '{self._binary}' is not available on PATH.",
+                provider=self.metadata.provider_name,
+            ) from exc
+        except subprocess.TimeoutExpired as exc:
+            raise ProviderTimeoutError(
+                str(exc), provider=self.metadata.provider_name
+            ) from exc
+
     def _run_with_retry(
         self,
         command: Sequence[str],
@@ -542,6 +593,73 @@ class CursorAgentProvider(ProviderContext):
             return
         self._emit_stream_chunk(StreamChunk(content=content, index=0))
 
+    def _execute_streaming(
+        self,
+        request: GenerationRequest,
+        model: str,
+        timeout: Optional[int],
+    ) -> Optional[GenerationResult]:
+        """
+        Run the CLI in stream-json mode, emitting assistant text as it arrives.
+
+        Must be called while the read-only config is in place.
+
+        Returns:
+            GenerationResult, or None when the CLI rejects the streaming flags
+            (the caller then falls back to a regular JSON run)
+        """
+        command = self._build_command(request, model, streaming=True)
+        collector = StreamCollector(self._emit_stream_chunk)
+        state: Dict[str, Any] = {}
+
+        def on_line(line: str) -> None:
+            event = parse_json_line(line)
+            if event is None:
+                return
+            event_type = event.get("type")
+            if event_type == "assistant":
+                for block in (event.get("message") or {}).get("content") or []:
+                    if isinstance(block, dict) and block.get("type") == "text":
+                        collector.add(str(block.get("text") or ""))
+            elif event_type == "result":
+                state["result"] = event
+
+        completed = self._run_streaming(command, timeout, on_line)
+        if streaming_unsupported(completed) and not collector.parts:
+            return None
+        if completed.returncode != 0:
+            raise ProviderExecutionError(
+                f"Cursor Agent CLI exited with code {completed.returncode}: "
+                f"{(completed.stderr or '').strip() or 'no stderr'}",
+                provider=self.metadata.provider_name,
+            )
+
+        payload = state.get("result")
+        if payload is None:
+            raise ProviderExecutionError(
+                "Cursor Agent CLI stream ended without a result event.",
+                provider=self.metadata.provider_name,
+            )
+        if payload.get("is_error"):
+            raise ProviderExecutionError(
+                f"Cursor Agent CLI reported an error: {payload.get('result') or 'no details'}",
+                provider=self.metadata.provider_name,
+            )
+
+        usage = self._usage_from_payload(payload)
+        usage = replace(
+            usage,
+            metadata={**usage.metadata, "time_to_first_token_ms": collector.time_to_first_chunk_ms},
+        )
+        return GenerationResult(
+            content=str(payload.get("result") or collector.text).strip(),
+            model_fqn=f"{self.metadata.provider_name}:{payload.get('model') or model}",
+            status=ProviderStatus.SUCCESS,
+            usage=usage,
+            stderr=(completed.stderr or "").strip() or None,
+            raw_payload=payload,
+        )
+
     def _execute(self, request: GenerationRequest) -> GenerationResult:
         if request.attachments:
             raise ProviderExecutionError(
@@ -559,14 +677,21 @@ class CursorAgentProvider(ProviderContext):
         self._create_readonly_config()
 
         try:
-            # Build command (config is read from ~/.cursor/cli-config.json)
-            command = self._build_command(request, model)
             timeout = request.timeout or self._timeout
-            completed, json_mode = self._run_with_retry(command, timeout)
+            streamed = None
+            if request.stream and self._stream_runner is not None:
+                streamed = self._execute_streaming(request, model, timeout)
+            if streamed is None:
+                # Build command (config is read from ~/.cursor/cli-config.json)
+                command = self._build_command(request, model)
+                completed, json_mode = self._run_with_retry(command, timeout)
         finally:
             # Always restore original config, even if command fails
             self._cleanup_config_file()
 
+        if streamed is not None:
+            return streamed
+
         if json_mode:
             payload = self._parse_json_payload(completed.stdout)
             # cursor-agent returns content in "result" field
@@ -625,6 +750,7 @@ def create_provider(
     dependencies = dependencies or {}
     overrides = overrides or {}
     runner = dependencies.get("runner")
+    stream_runner = dependencies.get("stream_runner")
     env = dependencies.get("env")
     binary = overrides.get("binary") or dependencies.get("binary")
     timeout = overrides.get("timeout")
@@ -636,6 +762,7 @@ def create_provider(
         model=selected_model,
         binary=binary,  # type: ignore[arg-type]
         runner=runner if runner is not None else None,  # type: ignore[arg-type]
+        stream_runner=stream_runner if stream_runner is not None else None,  # type: ignore[arg-type]
         env=env if env is not None else None,  # type: ignore[arg-type]
         timeout=timeout if timeout is not None else None,
     )
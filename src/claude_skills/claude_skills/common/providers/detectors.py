@@ -55,6 +55,16 @@ class ProviderDetector:
             binary = os.environ[self.binary_env]  # explicit override path/name
         return _resolve_executable(binary)
 
+    def availability_override(self) -> Optional[bool]:
+        """Return the forced availability from ``override_env`` (None if unset)."""
+        if not self.override_env:
+            return None
+        return _coerce_bool(os.environ.get(self.override_env))
+
+    def resolve_executable(self) -> Optional[str]:
+        """Return the path of the CLI this detector would probe (None if not found)."""
+        return self._resolve_binary()
+
     def _run_probe(self, executable: str) -> bool:
         if not self.probe_args:
             return True
@@ -77,7 +87,7 @@ class ProviderDetector:
             return False
 
     def is_available(self, *, use_probe: bool = True) -> bool:
-        override = _coerce_bool(os.environ.get(self.override_env)) if self.override_env else None
+        override = self.availability_override()
         if override is not None:
             return override
 
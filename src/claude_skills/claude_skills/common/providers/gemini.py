@@ -3,7 +3,8 @@ Gemini CLI provider implementation.
 
 Bridges the `gemini` command-line interface to the ProviderContext contract by
 handling availability checks, safe command construction, response parsing, and
-token usage normalization.
+token usage normalization. Streaming requests use the CLI's ``stream-json``
+output so chunks are emitted while the model generates.
 """
 
 from __future__ import annotations
@@ -11,7 +12,7 @@ from __future__ import annotations
 import json
 import os
 import subprocess
-from typing import Any, Dict, List, Optional, Sequence, Protocol
+from typing import Any, Callable, Dict, List, Optional, Sequence, Protocol
 
 from .base import (
     GenerationRequest,
@@ -28,6 +29,8 @@ from .base import (
     StreamChunk,
     TokenUsage,
 )
+from .cancellation import run_subprocess
+from .streaming import StreamCollector, parse_json_line, stream_subprocess, streaming_unsupported
 from .registry import register_provider
 from .detectors import detect_provider_availability
 
@@ -131,15 +134,33 @@ def _default_runner(
     timeout: Optional[int] = None,
     env: Optional[Dict[str, str]] = None,
 ) -> subprocess.CompletedProcess[str]:
-    """Invoke the Gemini CLI via subprocess."""
-    return subprocess.run(  # noqa: S603,S607 - intentional CLI invocation
-        list(command),
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        env=env,
-        check=False,
-    )
+    """Invoke the Gemini CLI via subprocess (cancellable, see cancellation.py)."""
+    return run_subprocess(command, timeout=timeout, env=env)
+
+
+class StreamRunnerProtocol(Protocol):
+    """Callable signature used for executing Gemini CLI commands with incremental output."""
+
+    def __call__(
+        self,
+        command: Sequence[str],
+        *,
+        on_line: Callable[[str], None],
+        timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[str]:
+        raise NotImplementedError
+
+
+def _default_stream_runner(
+    command: Sequence[str],
+    *,
+    on_line: Callable[[str], None],
+    timeout: Optional[int] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess[str]:
+    """Invoke the Gemini CLI, passing each stdout line to on_line as it arrives."""
+    return stream_subprocess(command, on_line=on_line, timeout=timeout, env=env)
 
 
 GEMINI_MODELS: List[ModelDescriptor] = [
@@ -195,11 +216,15 @@ class GeminiProvider(ProviderContext):
         model: Optional[str] = None,
         binary: Optional[str] = None,
         runner: Optional[RunnerProtocol] = None,
+        stream_runner: Optional[StreamRunnerProtocol] = None,
         env: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
     ):
         super().__init__(metadata, hooks)
         self._runner = runner or _default_runner
+        # A custom runner (e.g. a test double) without a stream runner keeps the
+        # single-chunk behaviour for streaming requests
+        self._stream_runner = stream_runner or (_default_stream_runner if runner is None else None)
         self._binary = binary or os.environ.get(CUSTOM_BINARY_ENV, DEFAULT_BINARY)
         self._env = env
         self._timeout = timeout or DEFAULT_TIMEOUT_SECONDS
@@ -249,8 +274,8 @@ class GeminiProvider(ProviderContext):
             return f"{chr(10).join(system_parts)}\n\n{request.prompt}"
         return request.prompt
 
-    def _build_command(self, model: str, prompt: str) -> List[str]:
-        command = [self._binary, "--output-format", "json"]
+    def _build_command(self, model: str, prompt: str, *, streaming: bool = False) -> List[str]:
+        command = [self._binary, "--output-format", "stream-json" if streaming else "json"]
 
         # Add allowed tools for read-only enforcement
         for tool in ALLOWED_TOOLS:
@@ -276,6 +301,22 @@ class GeminiProvider(ProviderContext):
         except subprocess.TimeoutExpired as exc:
             raise ProviderTimeoutError(str(exc), provider=self.metadata.provider_name) from exc
 
+    def _run_streaming(
+        self,
+        command: Sequence[str],
+        timeout: Optional[int],
+        on_line: Callable[[str], None],
+    ) -> subprocess.CompletedProcess[str]:
+        try:
+            return self._stream_runner(command, on_line=on_line, timeout=timeout, env=self._env)
+        except FileNotFoundError as exc:
+            raise ProviderUnavailableError(
+                f"Gemini CLI '{self._binary}' is not available on PATH.",
+                provider=self.metadata.provider_name,
+            ) from exc
+        except subprocess.TimeoutExpired as exc:
+            raise ProviderTimeoutError(str(exc), provider=self.metadata.provider_name) from exc
+
     def _parse_output(self, raw: str) -> Dict[str, Any]:
         text = raw.strip()
         if not text:
@@ -303,6 +344,18 @@ class GeminiProvider(ProviderContext):
             metadata={"stats": stats} if stats else {},
         )
 
+    def _extract_stream_usage(self, stats: Dict[str, Any], time_to_first_token_ms: Optional[int]) -> TokenUsage:
+        """Token usage from the stats of a stream-json ``result`` event (flat counters)."""
+        metadata: Dict[str, Any] = {"time_to_first_token_ms": time_to_first_token_ms}
+        if stats:
+            metadata["stats"] = stats
+        return TokenUsage(
+            input_tokens=int(stats.get("input_tokens") or 0),
+            output_tokens=int(stats.get("output_tokens") or 0),
+            total_tokens=int(stats.get("total_tokens") or 0),
+            metadata=metadata,
+        )
+
     def _resolve_model(self, request: GenerationRequest) -> str:
         model_override = request.metadata.get("model") if request.metadata else None
         if model_override:
@@ -314,12 +367,76 @@ class GeminiProvider(ProviderContext):
             return
         self._emit_stream_chunk(StreamChunk(content=content, index=0))
 
+    def _execute_streaming(self, prompt: str, model: str, timeout: Optional[int]) -> Optional[GenerationResult]:
+        """
+        Run the CLI in stream-json mode, emitting assistant deltas as they arrive.
+
+        Returns:
+            GenerationResult, or None when the CLI rejects the streaming output
+            format (the caller then falls back to a regular JSON run)
+        """
+        command = self._build_command(model, prompt, streaming=True)
+        collector = StreamCollector(self._emit_stream_chunk)
+        state: Dict[str, Any] = {}
+
+        def on_line(line: str) -> None:
+            event = parse_json_line(line)
+            if event is None:
+                return
+            event_type = event.get("type")
+            if event_type == "init":
+                state["model"] = event.get("model")
+            elif event_type == "message" and event.get("role") == "assistant":
+                collector.add(str(event.get("content") or ""))
+            elif event_type == "result":
+                state["result"] = event
+
+        completed = self._run_streaming(command, timeout, on_line)
+        if streaming_unsupported(completed) and not collector.parts:
+            return None
+        if completed.returncode != 0:
+            stderr = (completed.stderr or "").strip()
+            raise ProviderExecutionError(
+                f"Gemini CLI exited with code {completed.returncode}: {stderr or 'no stderr'}",
+                provider=self.metadata.provider_name,
+            )
+
+        payload = state.get("result")
+        if payload is None:
+            raise ProviderExecutionError(
+                "Gemini CLI stream ended without a result event.",
+                provider=self.metadata.provider_name,
+            )
+        if payload.get("status") not in (None, "success"):
+            error = payload.get("error") or {}
+            message = error.get("message") if isinstance(error, dict) else error
+            raise ProviderExecutionError(
+                f"Gemini CLI reported status '{payload.get('status')}': {message or 'no details'}",
+                provider=self.metadata.provider_name,
+            )
+
+        usage = self._extract_stream_usage(payload.get("stats") or {}, collector.time_to_first_chunk_ms)
+        return GenerationResult(
+            content=collector.text.strip(),
+            model_fqn=f"{self.metadata.provider_name}:{state.get('model') or model}",
+            status=ProviderStatus.SUCCESS,
+            usage=usage,
+            stderr=(completed.stderr or "").strip() or None,
+            raw_payload=payload,
+        )
+
     def _execute(self, request: GenerationRequest) -> GenerationResult:
         self._validate_request(request)
         model = self._resolve_model(request)
         prompt = self._build_prompt(request)
-        command = self._build_command(model, prompt)
         timeout = request.timeout or self._timeout
+
+        if request.stream and self._stream_runner is not None:
+            streamed = self._execute_streaming(prompt, model, timeout)
+            if streamed is not None:
+                return streamed
+
+        command = self._build_command(model, prompt)
         completed = self._run(command, timeout=timeout)
 
         if completed.returncode != 0:
@@ -361,11 +478,12 @@ def create_provider(
     """
     Factory used by the provider registry.
 
-    dependencies/overrides allow callers (or tests) to inject runner/env/binary.
+    dependencies/overrides allow callers (or tests) to inject runner/stream_runner/env/binary.
     """
     dependencies = dependencies or {}
     overrides = overrides or {}
     runner = dependencies.get("runner")
+    stream_runner = dependencies.get("stream_runner")
     env = dependencies.get("env")
     binary = overrides.get("binary") or dependencies.get("binary")
     timeout = overrides.get("timeout")
@@ -377,6 +495,7 @@ def create_provider(
         model=selected_model,
         binary=binary,  # type: ignore[arg-type]
         runner=runner if runner is not None else None,  # type: ignore[arg-type]
+        stream_runner=stream_runner if stream_runner is not None else None,  # type: ignore[arg-type]
         env=env if env is not None else None,  # type: ignore[arg-type]
         timeout=timeout if timeout is not None else None,
     )
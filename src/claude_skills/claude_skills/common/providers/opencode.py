@@ -8,14 +8,18 @@ response parsing, and token usage normalization.
 
 from __future__ import annotations
 
+import itertools
 import json
+import logging
 import os
+import queue
 import socket
 import subprocess
 import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Protocol
+from typing import Any, Callable, Dict, List, Optional, Sequence, Protocol
 
 from .base import (
     GenerationRequest,
@@ -32,8 +36,18 @@ from .base import (
     StreamChunk,
     TokenUsage,
 )
+from .cancellation import get_current_token, run_subprocess
 from .registry import register_provider
 from .detectors import detect_provider_availability
+from .opencode_server import (
+    ServerState,
+    discover_server,
+    spawn_idle_watchdog,
+    touch_server_state,
+    write_server_state,
+)
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_BINARY = "node"
 DEFAULT_WRAPPER_SCRIPT = Path(__file__).parent / "opencode_wrapper.js"
@@ -43,6 +57,9 @@ SERVER_STARTUP_TIMEOUT = 30
 AVAILABILITY_OVERRIDE_ENV = "OPENCODE_AVAILABLE_OVERRIDE"
 CUSTOM_BINARY_ENV = "OPENCODE_BINARY"
 CUSTOM_WRAPPER_ENV = "OPENCODE_WRAPPER_SCRIPT"
+PERSISTENT_WRAPPER_ENV = "OPENCODE_PERSISTENT_WRAPPER"
+# Seconds without requests after which the long-lived wrapper exits on its own
+WRAPPER_IDLE_TIMEOUT = 600
 
 # Read-only tools configuration for OpenCode server
 # Uses dual-layer protection: tool disabling + permission denial
@@ -140,16 +157,175 @@ def _default_runner(
     env: Optional[Dict[str, str]] = None,
     input_data: Optional[str] = None,
 ) -> subprocess.CompletedProcess[str]:
-    """Invoke the OpenCode wrapper via subprocess."""
-    return subprocess.run(  # noqa: S603,S607 - intentional wrapper invocation
-        list(command),
-        capture_output=True,
-        text=True,
-        input=input_data,
-        timeout=timeout,
-        env=env,
-        check=False,
-    )
+    """Invoke the OpenCode wrapper via subprocess (cancellable, see cancellation.py)."""
+    return run_subprocess(command, timeout=timeout, env=env, input_data=input_data)
+
+
+class WrapperSessionError(RuntimeError):
+    """The long-lived wrapper process could not be started or exited mid-request."""
+
+
+class WrapperSession:
+    """
+    A long-lived ``opencode_wrapper.js --serve`` process.
+
+    Requests are written to the wrapper's stdin as one JSON object per line,
+    each tagged with an ``id``; a reader thread routes output lines back to the
+    waiting caller by that id, so several requests can be in flight at once.
+    The process is (re)started on demand and exits by itself when idle. A
+    request the caller gives up on (timeout or cancellation) is followed by an
+    ``{"type": "abort", "id": ...}`` line so the wrapper aborts its server
+    session instead of letting it run to completion.
+    """
+
+    def __init__(self, command: Sequence[str], env: Optional[Dict[str, str]] = None):
+        self._command = list(command)
+        self._env = env
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, "queue.Queue[Dict[str, Any]]"] = {}
+        self._ids = itertools.count(1)
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        try:
+            process = subprocess.Popen(  # noqa: S603 - wrapper command is built by the provider
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                env=self._env,
+            )
+        except OSError as exc:
+            raise WrapperSessionError(f"Failed to start OpenCode wrapper: {exc}") from exc
+        threading.Thread(target=self._read_output, args=(process,), daemon=True).start()
+        self._process = process
+        return process
+
+    def _read_output(self, process: subprocess.Popen) -> None:
+        for line in process.stdout:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(message, dict):
+                continue
+            with self._lock:
+                pending = self._pending.get(str(message.get("id")))
+            if pending is not None:
+                pending.put(message)
+        # The wrapper exited: fail every request still waiting on it
+        with self._lock:
+            if self._process is process:
+                self._process = None
+            waiting = list(self._pending.values())
+        for pending in waiting:
+            pending.put({"type": "exit"})
+
+    def request(
+        self,
+        payload: Dict[str, Any],
+        *,
+        timeout: float,
+        on_message: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send one request and wait for its ``done``/``error`` message.
+
+        Returns:
+            Every message emitted for the request, in order
+
+        Raises:
+            subprocess.TimeoutExpired: If no final message arrived within timeout
+            WrapperSessionError: If the wrapper could not run or exited
+            ProviderExecutionError: If the calling thread's cancellation token fired
+        """
+        request_id = str(next(self._ids))
+        pending: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        token = get_current_token()
+        deadline = time.monotonic() + timeout
+        messages: List[Dict[str, Any]] = []
+
+        with self._lock:
+            process = self._ensure_started()
+            self._pending[request_id] = pending
+            try:
+                process.stdin.write(json.dumps({**payload, "id": request_id}) + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError) as exc:
+                self._pending.pop(request_id, None)
+                raise WrapperSessionError(f"OpenCode wrapper is not accepting requests: {exc}") from exc
+
+        try:
+            while True:
+                if token is not None and token.cancelled:
+                    raise ProviderExecutionError("OpenCode request cancelled", provider="opencode")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(self._command, timeout)
+                try:
+                    message = pending.get(timeout=min(remaining, 0.25))
+                except queue.Empty:
+                    continue
+                if message.get("type") == "exit":
+                    raise WrapperSessionError("OpenCode wrapper exited before completing the request")
+                messages.append(message)
+                if on_message is not None:
+                    on_message(message)
+                if message.get("type") in ("done", "error"):
+                    return messages
+        except (subprocess.TimeoutExpired, ProviderExecutionError):
+            self._abort(request_id)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+
+    def _abort(self, request_id: str) -> None:
+        """Ask the wrapper to abort a request nobody is waiting for anymore."""
+        with self._lock:
+            process = self._process
+            if process is None or process.poll() is not None:
+                return
+            try:
+                process.stdin.write(json.dumps({"type": "abort", "id": request_id}) + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError) as exc:
+                logger.debug(f"Failed to abort OpenCode wrapper request {request_id}: {exc}")
+
+    def close(self) -> None:
+        """Stop the wrapper process."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+
+
+_wrapper_sessions: Dict[tuple, WrapperSession] = {}
+_wrapper_sessions_lock = threading.Lock()
+
+
+def get_wrapper_session(binary: str, wrapper_path: Path, env: Dict[str, str]) -> WrapperSession:
+    """Return the process-wide wrapper session for this binary/script/environment."""
+    key = (binary, str(wrapper_path), tuple(sorted(env.items())))
+    with _wrapper_sessions_lock:
+        session = _wrapper_sessions.get(key)
+        if session is None:
+            command = [binary, str(wrapper_path), "--serve", "--idle-timeout", str(WRAPPER_IDLE_TIMEOUT)]
+            session = WrapperSession(command, env)
+            _wrapper_sessions[key] = session
+        return session
+
+
+def _persistent_wrapper_enabled() -> bool:
+    return os.environ.get(PERSISTENT_WRAPPER_ENV, "1").strip().lower() not in {"0", "false", "no", "off"}
 
 
 class OpenCodeProvider(ProviderContext):
@@ -166,9 +342,15 @@ class OpenCodeProvider(ProviderContext):
         runner: Optional[RunnerProtocol] = None,
         env: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
+        wrapper_session: Optional[WrapperSession] = None,
     ):
         super().__init__(metadata, hooks)
         self._runner = runner or _default_runner
+        # Default to the shared long-lived wrapper unless a custom runner is injected
+        self._wrapper_session = wrapper_session
+        self._use_persistent_wrapper = wrapper_session is not None or (
+            runner is None and _persistent_wrapper_enabled()
+        )
         self._binary = binary or os.environ.get(CUSTOM_BINARY_ENV, DEFAULT_BINARY)
         self._wrapper_path = wrapper_path or Path(
             os.environ.get(CUSTOM_WRAPPER_ENV, str(DEFAULT_WRAPPER_SCRIPT))
@@ -180,10 +362,16 @@ class OpenCodeProvider(ProviderContext):
         self._timeout = timeout or DEFAULT_TIMEOUT_SECONDS
         self._model = self._ensure_model(model or metadata.default_model or self._first_model_id())
         self._server_process: Optional[subprocess.Popen] = None
+        self._server_shared = False
         self._config_file_path: Optional[Path] = None
 
     def __del__(self) -> None:
         """Clean up server process and config file on provider destruction."""
+        # A shared server (and its config) outlives this provider; the idle
+        # watchdog stops it (see opencode_server.py)
+        if getattr(self, '_server_shared', False):
+            return
+
         # Clean up server process
         if hasattr(self, '_server_process') and self._server_process is not None:
             try:
@@ -306,6 +494,12 @@ class OpenCodeProvider(ProviderContext):
         except (ValueError, IndexError):
             port = 4096
 
+        # Reuse a healthy server started by an earlier invocation
+        shared = discover_server(port)
+        if shared is not None:
+            touch_server_state(shared)
+            return
+
         # Check if server is already running
         if self._is_port_open(port):
             return
@@ -350,8 +544,9 @@ class OpenCodeProvider(ProviderContext):
         try:
             self._server_process = subprocess.Popen(
                 [opencode_binary, "serve", f"--hostname=127.0.0.1", f"--port={port}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                # The server may outlive this process, so it must not write to our pipes
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 env=server_env,  # Pass environment variables to server
                 start_new_session=True,  # Detach from parent
             )
@@ -365,6 +560,7 @@ class OpenCodeProvider(ProviderContext):
         start_time = time.time()
         while time.time() - start_time < SERVER_STARTUP_TIMEOUT:
             if self._is_port_open(port):
+                self._share_server(port)
                 return
             time.sleep(0.5)
 
@@ -378,6 +574,23 @@ class OpenCodeProvider(ProviderContext):
             provider=self.metadata.provider_name,
         )
 
+    def _share_server(self, port: int) -> None:
+        """Record the server this provider started so later invocations reuse it."""
+        process = self._server_process
+        if process is None or not isinstance(process.pid, int) or process.poll() is not None:
+            return
+        now = time.time()
+        state = ServerState(
+            pid=process.pid,
+            port=port,
+            started_at=now,
+            last_used=now,
+            config_path=str(self._config_file_path) if self._config_file_path else None,
+        )
+        if write_server_state(state):
+            spawn_idle_watchdog(process.pid)
+            self._server_shared = True
+
     def _execute(self, request: GenerationRequest) -> GenerationResult:
         """Execute generation request via OpenCode wrapper."""
         # Ensure server is running before making request
@@ -394,13 +607,19 @@ class OpenCodeProvider(ProviderContext):
             },
         }
 
+        timeout = request.timeout or self._timeout
+
+        if self._use_persistent_wrapper:
+            result = self._execute_persistent(request, payload, timeout)
+            if result is not None:
+                return result
+
         # Build command to invoke wrapper
         command = [self._binary, str(self._wrapper_path)]
         if request.stream:
             command.append("--stream")
 
         # Execute wrapper with JSON payload via stdin
-        timeout = request.timeout or self._timeout
         try:
             completed = self._runner(
                 command,
@@ -427,29 +646,81 @@ class OpenCodeProvider(ProviderContext):
             )
 
         # Parse line-delimited JSON output
-        content_parts = []
-        final_usage: Optional[TokenUsage] = None
-        raw_payload: Dict[str, Any] = {}
-
+        messages = []
         for line in completed.stdout.strip().split("\n"):
             if not line.strip():
                 continue
 
             try:
-                msg = json.loads(line)
+                messages.append(json.loads(line))
             except json.JSONDecodeError as exc:
                 raise ProviderExecutionError(
                     f"Invalid JSON from wrapper: {line[:100]}",
                     provider=self.metadata.provider_name,
                 ) from exc
 
+        return self._build_result(
+            messages,
+            emit_chunks=request.stream,
+            stderr=(completed.stderr or "").strip() or None,
+        )
+
+    def _execute_persistent(
+        self,
+        request: GenerationRequest,
+        payload: Dict[str, Any],
+        timeout: int,
+    ) -> Optional[GenerationResult]:
+        """
+        Run the request through the shared long-lived wrapper process.
+
+        Returns None when the wrapper cannot serve requests, so the caller
+        falls back to spawning the wrapper for this call.
+        """
+        session = self._wrapper_session or get_wrapper_session(
+            self._binary, self._wrapper_path, self._env
+        )
+        chunk_count = 0
+
+        def on_message(message: Dict[str, Any]) -> None:
+            nonlocal chunk_count
+            if request.stream and message.get("type") == "chunk":
+                self._emit_stream_chunk(StreamChunk(content=message.get("content", ""), index=chunk_count))
+                chunk_count += 1
+
+        try:
+            messages = session.request(payload, timeout=timeout, on_message=on_message)
+        except subprocess.TimeoutExpired as exc:
+            raise ProviderTimeoutError(
+                f"OpenCode wrapper timed out after {timeout}s",
+                provider=self.metadata.provider_name,
+            ) from exc
+        except WrapperSessionError as exc:
+            logger.debug("Persistent OpenCode wrapper unavailable, running per call: %s", exc)
+            return None
+
+        return self._build_result(messages, emit_chunks=False)
+
+    def _build_result(
+        self,
+        messages: List[Dict[str, Any]],
+        *,
+        emit_chunks: bool,
+        stderr: Optional[str] = None,
+    ) -> GenerationResult:
+        """Assemble a GenerationResult from the wrapper's output messages."""
+        content_parts = []
+        final_usage: Optional[TokenUsage] = None
+        raw_payload: Dict[str, Any] = {}
+
+        for msg in messages:
             msg_type = msg.get("type")
 
             if msg_type == "chunk":
                 # Streaming chunk
                 chunk_content = msg.get("content", "")
                 content_parts.append(chunk_content)
-                if request.stream:
+                if emit_chunks:
                     self._emit_stream_chunk(StreamChunk(content=chunk_content, index=len(content_parts) - 1))
 
             elif msg_type == "done":
@@ -489,7 +760,7 @@ class OpenCodeProvider(ProviderContext):
             model_fqn=f"{self.metadata.provider_name}:{self._model}",
             status=ProviderStatus.SUCCESS,
             usage=final_usage,
-            stderr=(completed.stderr or "").strip() or None,
+            stderr=stderr,
             raw_payload=raw_payload,
         )
 
@@ -560,7 +831,7 @@ def create_provider(
     Args:
         hooks: Provider hooks for callbacks
         model: Optional model ID override
-        dependencies: Optional dependencies (runner, env, binary)
+        dependencies: Optional dependencies (runner, wrapper_session, env, binary)
         overrides: Optional parameter overrides
 
     Returns:
@@ -570,6 +841,7 @@ def create_provider(
     overrides = overrides or {}
 
     runner = dependencies.get("runner")
+    wrapper_session = dependencies.get("wrapper_session")
     env = dependencies.get("env")
     binary = overrides.get("binary") or dependencies.get("binary")
     wrapper_path = overrides.get("wrapper_path") or dependencies.get("wrapper_path")
@@ -584,6 +856,7 @@ def create_provider(
         runner=runner,
         env=env,
         timeout=timeout,
+        wrapper_session=wrapper_session,
     )
 
 
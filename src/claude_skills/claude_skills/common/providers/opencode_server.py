@@ -0,0 +1,262 @@
+"""
+Shared OpenCode server lifecycle.
+
+Starting ``opencode serve`` takes several seconds, so a server started by the
+OpenCode provider is kept running and reused by later invocations (including
+other ``sdd`` processes). The server is tracked in a small state file in the
+user cache directory recording its pid, port and read-only config path, plus
+the time it was last used.
+
+A detached watchdog process (see ``spawn_idle_watchdog``) stops the server
+once it has been idle for ``OPENCODE_SERVER_IDLE_SECONDS`` (default 900) and
+removes the state file and config.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SERVER_STATE_FILE = Path.home() / ".cache" / "sdd-toolkit" / "opencode_server.json"
+IDLE_SECONDS_ENV = "OPENCODE_SERVER_IDLE_SECONDS"
+DEFAULT_IDLE_SHUTDOWN_SECONDS = 900
+WATCHDOG_POLL_SECONDS = 15
+HEALTH_CHECK_TIMEOUT = 2.0
+
+
+@dataclass
+class ServerState:
+    """A running OpenCode server started by the provider."""
+
+    pid: int
+    port: int
+    started_at: float
+    last_used: float
+    config_path: Optional[str] = None
+
+
+def get_idle_shutdown_seconds() -> float:
+    """Idle time after which a shared server is stopped (from the environment)."""
+    value = os.environ.get(IDLE_SECONDS_ENV)
+    try:
+        seconds = float(value) if value else DEFAULT_IDLE_SHUTDOWN_SECONDS
+    except ValueError:
+        seconds = DEFAULT_IDLE_SHUTDOWN_SECONDS
+    return seconds if seconds > 0 else DEFAULT_IDLE_SHUTDOWN_SECONDS
+
+
+def read_server_state(path: Optional[Path] = None) -> Optional[ServerState]:
+    """Load the recorded server, or None if there is no (valid) state file."""
+    path = path or SERVER_STATE_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return ServerState(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def write_server_state(state: ServerState, path: Optional[Path] = None) -> bool:
+    """Atomically record a server; returns False if the file could not be written."""
+    path = path or SERVER_STATE_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".opencode-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(asdict(state), f)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as exc:
+        logger.debug("Failed to write OpenCode server state %s: %s", path, exc)
+        return False
+
+
+def touch_server_state(state: ServerState, path: Optional[Path] = None) -> None:
+    """Mark the server as used now, postponing its idle shutdown."""
+    state.last_used = time.time()
+    write_server_state(state, path)
+
+
+def clear_server_state(path: Optional[Path] = None) -> None:
+    """Remove the state file (if any)."""
+    path = path or SERVER_STATE_FILE
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def is_process_alive(pid: int) -> bool:
+    """Whether a process with this pid exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def is_server_healthy(port: int, host: str = "127.0.0.1", timeout: float = HEALTH_CHECK_TIMEOUT) -> bool:
+    """
+    Whether an OpenCode server answers HTTP on the port.
+
+    Any HTTP response below 500 counts as healthy; connection failures and
+    server errors do not.
+    """
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/config", timeout=timeout) as response:
+            return response.status < 500
+    except urllib.error.HTTPError as exc:
+        return exc.code < 500
+    except (urllib.error.URLError, OSError, ValueError):
+        return False
+
+
+def discover_server(port: int, path: Optional[Path] = None) -> Optional[ServerState]:
+    """
+    Return the recorded server for ``port`` if it is alive and healthy.
+
+    State left behind by a server that is no longer running is cleared.
+    """
+    state = read_server_state(path)
+    if state is None:
+        return None
+    if state.port == port and is_process_alive(state.pid) and is_server_healthy(port):
+        return state
+    if not is_process_alive(state.pid):
+        clear_server_state(path)
+        remove_config_dir(state.config_path)
+    return None
+
+
+def remove_config_dir(config_path: Optional[str]) -> None:
+    """Delete a server's temporary read-only config directory."""
+    if config_path:
+        shutil.rmtree(Path(config_path).parent, ignore_errors=True)
+
+
+def stop_server(state: ServerState, path: Optional[Path] = None) -> None:
+    """Terminate a recorded server and remove its state and config."""
+    if is_process_alive(state.pid):
+        try:
+            # The server was started in its own session; stop the whole group
+            os.killpg(state.pid, signal.SIGTERM)
+        except OSError:
+            try:
+                os.kill(state.pid, signal.SIGTERM)
+            except OSError:
+                pass
+    clear_server_state(path)
+    remove_config_dir(state.config_path)
+
+
+_WATCHDOG_ENTRYPOINT = (
+    "import sys; "
+    "from claude_skills.common.providers.opencode_server import main; "
+    "sys.exit(main(sys.argv[1:]))"
+)
+
+
+def spawn_idle_watchdog(
+    pid: int,
+    idle_seconds: Optional[float] = None,
+    path: Optional[Path] = None,
+) -> Optional[subprocess.Popen]:
+    """Start a detached watchdog that stops server ``pid`` once it is idle."""
+    command: List[str] = [
+        sys.executable,
+        "-c",
+        _WATCHDOG_ENTRYPOINT,
+        "--watch",
+        str(pid),
+        "--idle-seconds",
+        str(idle_seconds or get_idle_shutdown_seconds()),
+        "--state-file",
+        str(path or SERVER_STATE_FILE),
+    ]
+    try:
+        return subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as exc:
+        logger.debug("Failed to start OpenCode server watchdog: %s", exc)
+        return None
+
+
+def run_idle_watchdog(
+    pid: int,
+    idle_seconds: float,
+    path: Optional[Path] = None,
+    poll_seconds: float = WATCHDOG_POLL_SECONDS,
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+) -> None:
+    """
+    Wait until server ``pid`` has been idle for ``idle_seconds``, then stop it.
+
+    Returns early if the state file stops referring to the server (e.g. it was
+    replaced); cleans up after it if the server exited on its own.
+    """
+    while True:
+        state = read_server_state(path)
+        if state is None or state.pid != pid:
+            return
+        if not is_process_alive(pid):
+            clear_server_state(path)
+            remove_config_dir(state.config_path)
+            return
+        if clock() - state.last_used >= idle_seconds:
+            stop_server(state, path)
+            return
+        sleep(min(poll_seconds, max(1.0, idle_seconds - (clock() - state.last_used))))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Watchdog entry point used by spawn_idle_watchdog."""
+    parser = argparse.ArgumentParser(description="Stop an idle shared OpenCode server")
+    parser.add_argument("--watch", type=int, required=True, metavar="PID")
+    parser.add_argument("--idle-seconds", type=float, default=DEFAULT_IDLE_SHUTDOWN_SECONDS)
+    parser.add_argument("--state-file", type=Path, default=SERVER_STATE_FILE)
+    args = parser.parse_args(argv)
+    run_idle_watchdog(args.watch, args.idle_seconds, args.state_file)
+    return 0
+
+
+__all__ = [
+    "DEFAULT_IDLE_SHUTDOWN_SECONDS",
+    "SERVER_STATE_FILE",
+    "ServerState",
+    "clear_server_state",
+    "discover_server",
+    "get_idle_shutdown_seconds",
+    "is_process_alive",
+    "is_server_healthy",
+    "read_server_state",
+    "run_idle_watchdog",
+    "spawn_idle_watchdog",
+    "stop_server",
+    "touch_server_state",
+    "write_server_state",
+]
@@ -22,7 +22,13 @@ function parseArgs(args) {
     help: args.includes('--help') || args.includes('-h'),
     version: args.includes('--version') || args.includes('-v'),
     test: args.includes('--test'),
+    serve: args.includes('--serve'),
+    idleTimeout: 0,
   };
+  const idleIndex = args.indexOf('--idle-timeout');
+  if (idleIndex !== -1 && idleIndex + 1 < args.length) {
+    flags.idleTimeout = Number(args[idleIndex + 1]) || 0;
+  }
   return flags;
 }
 
@@ -34,6 +40,7 @@ function showHelp() {
 OpenCode AI Wrapper
 
 Usage: node opencode_wrapper.js < input.json
+       node opencode_wrapper.js --serve [--idle-timeout SECONDS]
 
 Input Format (JSON via stdin):
 {
@@ -52,10 +59,17 @@ Output Format (line-delimited JSON to stdout):
 {"type": "done", "response": {...}}
 {"type": "error", "code": "category", "message": "details"}
 
+Serve mode reads one JSON request per line (same format plus an "id" field)
+and keeps running until stdin closes. Every output line carries the "id" of
+the request it belongs to; requests are processed concurrently. A line
+{"type": "abort", "id": ...} aborts the server session of that request.
+
 Options:
-  -h, --help     Show this help message
-  -v, --version  Show version information
-  --test         Run in test mode (returns mock responses without API key)
+  -h, --help            Show this help message
+  -v, --version         Show version information
+  --test                Run in test mode (returns mock responses without API key)
+  --serve               Handle newline-delimited requests until stdin closes
+  --idle-timeout SECS   In serve mode, exit after SECS without requests
 `);
 }
 
@@ -129,29 +143,37 @@ async function readStdin() {
 }
 
 /**
- * Main execution function
+ * Parse a model specification into provider and model IDs
  */
-async function main() {
-  // Setup signal handlers for graceful shutdown
-  setupSignalHandlers();
-
-  // Parse CLI arguments
-  const flags = parseArgs(process.argv.slice(2));
-
-  // Handle simple flags
-  if (flags.help) {
-    showHelp();
-    process.exit(0);
+function parseModel(modelConfig) {
+  // Parse model format: "provider/model" or just "model"
+  if (typeof modelConfig === 'string' && modelConfig.includes('/')) {
+    const [providerID, modelID] = modelConfig.split('/', 2);
+    return { providerID, modelID };
   }
-
-  if (flags.version) {
-    showVersion();
-    process.exit(0);
+  if (typeof modelConfig === 'object') {
+    return { providerID: modelConfig.providerID, modelID: modelConfig.modelID };
   }
+  return { providerID: 'opencode', modelID: modelConfig };
+}
 
-  // Read input from stdin
-  const payload = await readStdin();
+/**
+ * Lazily create the OpenCode client that connects to the local server
+ */
+function getClient() {
+  if (!opcodeClient) {
+    // Python provider ensures server is running via _ensure_server_running()
+    opcodeClient = createOpencodeClient({
+      baseUrl: 'http://localhost:4096'
+    });
+  }
+  return opcodeClient;
+}
 
+/**
+ * Execute one request, reporting output through emit(message)
+ */
+async function handleRequest(payload, emit, flags, control = {}) {
   // Validate required fields
   if (!payload.prompt) {
     throw new Error('Missing required field: prompt');
@@ -162,14 +184,14 @@ async function main() {
     // Simulate streaming chunks
     const mockChunks = ['Mock ', 'response ', 'from ', 'OpenCode ', 'test ', 'mode'];
     for (const chunk of mockChunks) {
-      console.log(JSON.stringify({
+      emit({
         type: 'chunk',
         content: chunk
-      }));
+      });
     }
 
     // Return mock successful response
-    const mockResponse = {
+    emit({
       type: 'done',
       response: {
         text: 'Mock response from OpenCode test mode',
@@ -181,15 +203,10 @@ async function main() {
         model: 'mock-model',
         sessionId: 'test-session-123'
       }
-    };
-    console.log(JSON.stringify(mockResponse));
-    process.exit(0);
+    });
+    return;
   }
 
-  // Get server configuration from environment variables
-  const serverUrl = process.env.OPENCODE_SERVER_URL || 'https://api.opencode.ai';
-  const apiKey = process.env.OPENCODE_API_KEY;
-
   // Note: OPENCODE_API_KEY is only required for Zen models
   // For non-Zen models (openai/*, anthropic/*, etc.), the SDK uses ~/.local/share/opencode/auth.json
 
@@ -198,29 +215,16 @@ async function main() {
     throw new Error('config must be an object');
   }
 
-  // Create OpenCode client that connects to server
-  // Python provider ensures server is running via _ensure_server_running()
-  opcodeClient = createOpencodeClient({
-    baseUrl: 'http://localhost:4096'
-  });
-
-  // Parse model specification
-  const modelConfig = payload.config?.model || 'default-model';
-  let providerID, modelID;
-
-  // Parse model format: "provider/model" or just "model"
-  if (typeof modelConfig === 'string' && modelConfig.includes('/')) {
-    [providerID, modelID] = modelConfig.split('/', 2);
-  } else if (typeof modelConfig === 'object') {
-    providerID = modelConfig.providerID;
-    modelID = modelConfig.modelID;
-  } else {
-    providerID = 'opencode';
-    modelID = modelConfig;
-  }
+  const client = getClient();
+  const { providerID, modelID } = parseModel(payload.config?.model || 'default-model');
 
   // Create session
-  const session = await opcodeClient.session.create();
+  const session = await client.session.create();
+  control.sessionId = session.data.id;
+  if (control.aborted) {
+    await abortSession(session.data.id);
+    throw new Error('Request aborted');
+  }
 
   try {
     // Build request body, filtering out null/undefined values
@@ -243,7 +247,7 @@ async function main() {
     }
 
     // Execute prompt using the session API with correct structure
-    const response = await opcodeClient.session.prompt({
+    const response = await client.session.prompt({
       path: {
         id: session.data.id
       },
@@ -258,7 +262,7 @@ async function main() {
       .join('');
 
     // Emit response as line-delimited JSON
-    const finalResponse = {
+    emit({
       type: 'done',
       response: {
         text: textParts,
@@ -266,12 +270,146 @@ async function main() {
         model: `${providerID}/${modelID}`,
         sessionId: session.data.id
       }
-    };
-    console.log(JSON.stringify(finalResponse));
+    });
 
   } catch (error) {
     throw new Error(`Prompt execution failed: ${error.message}`);
   }
+}
+
+/**
+ * Abort a server session, ignoring failures (the session may have finished)
+ */
+async function abortSession(id) {
+  try {
+    await getClient().session.abort({ path: { id } });
+  } catch (error) {
+    // Nothing left to abort
+  }
+}
+
+/**
+ * Serve mode: handle newline-delimited requests until stdin closes
+ */
+function serve(flags) {
+  let inFlight = 0;
+  let closed = false;
+  let idleTimer = null;
+  // Request id -> { aborted, sessionId } for requests still running
+  const active = new Map();
+
+  const armIdleTimer = () => {
+    if (flags.idleTimeout > 0) {
+      idleTimer = setTimeout(async () => {
+        await cleanup();
+        process.exit(0);
+      }, flags.idleTimeout * 1000);
+    }
+  };
+
+  const finish = async () => {
+    if (closed && inFlight === 0) {
+      await cleanup();
+      process.exit(0);
+    }
+  };
+
+  const rl = createInterface({
+    input: process.stdin,
+    terminal: false
+  });
+
+  rl.on('line', (line) => {
+    if (!line.trim()) {
+      return;
+    }
+
+    let payload;
+    try {
+      payload = JSON.parse(line);
+    } catch (error) {
+      console.log(JSON.stringify({
+        type: 'error',
+        code: 'INVALID_REQUEST',
+        message: `Invalid JSON input: ${error.message}`
+      }));
+      return;
+    }
+
+    const id = payload.id ?? null;
+
+    if (payload.type === 'abort') {
+      // The caller stopped waiting: stop the server from generating the answer
+      const control = active.get(id);
+      if (control && !control.aborted) {
+        control.aborted = true;
+        if (control.sessionId) {
+          abortSession(control.sessionId);
+        }
+      }
+      return;
+    }
+
+    const control = { aborted: false, sessionId: null };
+    const emit = (message) => console.log(JSON.stringify({ id, ...message }));
+
+    clearTimeout(idleTimer);
+    inFlight += 1;
+    active.set(id, control);
+    handleRequest(payload, emit, flags, control)
+      .catch((error) => emit({
+        type: 'error',
+        code: 'WRAPPER_ERROR',
+        message: error.message
+      }))
+      .finally(() => {
+        active.delete(id);
+        inFlight -= 1;
+        if (inFlight === 0) {
+          armIdleTimer();
+        }
+        finish();
+      });
+  });
+
+  rl.on('close', () => {
+    closed = true;
+    finish();
+  });
+
+  armIdleTimer();
+}
+
+/**
+ * Main execution function
+ */
+async function main() {
+  // Setup signal handlers for graceful shutdown
+  setupSignalHandlers();
+
+  // Parse CLI arguments
+  const flags = parseArgs(process.argv.slice(2));
+
+  // Handle simple flags
+  if (flags.help) {
+    showHelp();
+    process.exit(0);
+  }
+
+  if (flags.version) {
+    showVersion();
+    process.exit(0);
+  }
+
+  if (flags.serve) {
+    serve(flags);
+    return;
+  }
+
+  // Read input from stdin
+  const payload = await readStdin();
+
+  await handleRequest(payload, (message) => console.log(JSON.stringify(message)), flags);
 
   // Cleanup before exit
   await cleanup();
@@ -294,4 +432,4 @@ if (import.meta.url === `file://${process.argv[1]}`) {
   });
 }
 
-export { readStdin, parseArgs };
+export { readStdin, parseArgs, parseModel, handleRequest };
@@ -0,0 +1,313 @@
+"""
+Process-wide scheduling for provider invocations.
+
+Every fan-out in the toolkit (parallel tool consultations, sharded fidelity
+reviews, batched doc generation, ...) eventually calls
+``ProviderContext.generate()`` / ``agenerate()``. Those entry points take a slot
+from the shared ``ProviderScheduler`` before launching a CLI process, so the
+number of provider processes is bounded no matter how many thread pools or
+event loops are issuing requests:
+
+* a global concurrency cap across all providers,
+* a per-provider concurrency cap (``default`` applies to unlisted providers),
+* an optional token-bucket rate limit on how often new calls may start.
+
+Slots are counted under a lock shared by synchronous and asyncio callers, so
+both share the same limits. Threads wait on a condition variable; coroutines
+wait on an ``asyncio.Event`` that release() sets through
+``call_soon_threadsafe``, so a queued coroutine never occupies a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Set, Tuple
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_PROVIDER_CONCURRENCY = 4
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds up to ``capacity`` tokens and refills at ``rate`` tokens per second;
+    each acquire() consumes one token.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("TokenBucket requires rate > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Consume a token if available; otherwise return the seconds until one is."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a token; returns False if none became available within timeout."""
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            wait_seconds = self._take()
+            if wait_seconds == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return False
+                wait_seconds = min(wait_seconds, remaining)
+            self._sleep(wait_seconds)
+
+    async def aacquire(self, timeout: Optional[float] = None) -> bool:
+        """Async variant of acquire(); waits with asyncio.sleep instead of blocking."""
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            wait_seconds = self._take()
+            if wait_seconds == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return False
+                wait_seconds = min(wait_seconds, remaining)
+            await asyncio.sleep(wait_seconds)
+
+
+class ProviderScheduler:
+    """
+    Bounds concurrent (and optionally rate-limits) provider invocations.
+
+    Attributes:
+        max_concurrency: Maximum provider calls running at once (all providers)
+        provider_limits: Per-provider caps; the "default" key applies to
+                         providers without their own entry
+        bucket: Optional TokenBucket gating how often calls may start
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        provider_limits: Optional[Dict[str, int]] = None,
+        rate_per_minute: Optional[float] = None,
+        burst: Optional[int] = None,
+    ) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.provider_limits = {"default": DEFAULT_PROVIDER_CONCURRENCY}
+        self.provider_limits.update(provider_limits or {})
+        self.bucket: Optional[TokenBucket] = None
+        if rate_per_minute:
+            self.bucket = TokenBucket(rate_per_minute / 60.0, float(burst or 1))
+
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._active: Dict[str, int] = {}
+        self._total = 0
+        # Coroutines waiting in aacquire(), woken through their event loop
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    def limit_for(self, provider: str) -> int:
+        """Concurrency cap for a provider."""
+        return max(1, int(self.provider_limits.get(provider, self.provider_limits["default"])))
+
+    def active(self, provider: Optional[str] = None) -> int:
+        """Number of calls currently holding a slot (for one provider or in total)."""
+        with self._lock:
+            if provider is not None:
+                return self._active.get(provider, 0)
+            return self._total
+
+    def _try_take(self, provider: str) -> bool:
+        """
+        Take a provider slot and a global slot if both are free (lock held).
+
+        Both are taken together, so a provider at its own cap never holds
+        global capacity while it waits.
+        """
+        if self._total >= self.max_concurrency or self._active.get(provider, 0) >= self.limit_for(provider):
+            return False
+        self._active[provider] = self._active.get(provider, 0) + 1
+        self._total += 1
+        return True
+
+    def acquire(self, provider: str, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the provider may start a call.
+
+        Returns:
+            True when a slot was acquired, False if timeout elapsed first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+        with self._slot_freed:
+            while not self._try_take(provider):
+                wait_seconds = remaining()
+                if wait_seconds == 0:
+                    return False
+                self._slot_freed.wait(wait_seconds)
+        if self.bucket is not None and not self.bucket.acquire(timeout=remaining()):
+            self.release(provider)
+            return False
+        return True
+
+    async def aacquire(self, provider: str, timeout: Optional[float] = None) -> bool:
+        """
+        Async variant of acquire(); waits on the event loop, not in a thread.
+
+        Returns:
+            True when a slot was acquired, False if timeout elapsed first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._async_waiters.add(waiter)
+        try:
+            while True:
+                # Cleared before checking, so a release() in between still wakes us
+                waiter[1].clear()
+                with self._lock:
+                    if self._try_take(provider):
+                        break
+                wait_seconds = remaining()
+                if wait_seconds == 0:
+                    return False
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), wait_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                self._async_waiters.discard(waiter)
+
+        try:
+            if self.bucket is not None and not await self.bucket.aacquire(timeout=remaining()):
+                self.release(provider)
+                return False
+        except asyncio.CancelledError:
+            self.release(provider)
+            raise
+        return True
+
+    def release(self, provider: str) -> None:
+        """Return a slot taken with acquire() or aacquire()."""
+        with self._slot_freed:
+            count = self._active.get(provider, 0)
+            if count <= 0:
+                raise ValueError(f"No {provider} provider slot is held")
+            self._active[provider] = count - 1
+            self._total -= 1
+            self._slot_freed.notify_all()
+            waiters = list(self._async_waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's event loop has been closed
+                pass
+
+    @contextmanager
+    def slot(self, provider: str, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        Hold a slot for the duration of the block.
+
+        Raises:
+            TimeoutError: If no slot became available within timeout
+        """
+        if not self.acquire(provider, timeout=timeout):
+            raise TimeoutError(f"Timed out after {timeout}s waiting for a {provider} provider slot")
+        try:
+            yield
+        finally:
+            self.release(provider)
+
+    @asynccontextmanager
+    async def aslot(self, provider: str, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Async variant of slot(); waits for the slot without blocking the event
+        loop or occupying a worker thread.
+
+        Raises:
+            TimeoutError: If no slot became available within timeout
+        """
+        if not await self.aacquire(provider, timeout=timeout):
+            raise TimeoutError(f"Timed out after {timeout}s waiting for a {provider} provider slot")
+        try:
+            yield
+        finally:
+            self.release(provider)
+
+
+_scheduler: Optional[ProviderScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> ProviderScheduler:
+    """Return the process-wide scheduler, creating it with defaults on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = ProviderScheduler()
+        return _scheduler
+
+
+def configure_scheduler(
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    provider_limits: Optional[Dict[str, int]] = None,
+    rate_per_minute: Optional[float] = None,
+    burst: Optional[int] = None,
+) -> ProviderScheduler:
+    """
+    Replace the process-wide scheduler.
+
+    Calls already holding a slot release it on the scheduler they acquired it
+    from; new calls use the new limits.
+    """
+    global _scheduler
+    scheduler = ProviderScheduler(
+        max_concurrency=max_concurrency,
+        provider_limits=provider_limits,
+        rate_per_minute=rate_per_minute,
+        burst=burst,
+    )
+    with _scheduler_lock:
+        _scheduler = scheduler
+    return scheduler
+
+
+__all__ = [
+    "DEFAULT_MAX_CONCURRENCY",
+    "DEFAULT_PROVIDER_CONCURRENCY",
+    "ProviderScheduler",
+    "TokenBucket",
+    "configure_scheduler",
+    "get_scheduler",
+]
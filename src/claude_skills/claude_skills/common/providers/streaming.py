@@ -0,0 +1,166 @@
+"""
+Incremental output reading for provider CLIs.
+
+Providers whose CLI offers a streaming JSON output mode (one JSON event per
+line) run it through ``stream_subprocess``, which hands each stdout line to a
+callback while the process is still running. This lets providers publish real
+``StreamChunk`` objects as text is generated instead of one chunk after the
+process exits.
+
+Processes are registered with the thread's cancellation token exactly like
+``run_subprocess`` (see cancellation.py).
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .base import StreamChunk
+from .cancellation import get_current_token
+
+LineCallback = Callable[[str], None]
+
+# stderr fragments CLIs print when they do not recognise a streaming flag/value
+UNSUPPORTED_FLAG_PHRASES = (
+    "unknown option",
+    "unrecognized option",
+    "unknown argument",
+    "invalid values",
+    "is invalid",
+)
+
+
+def stream_subprocess(
+    command: Sequence[str],
+    *,
+    on_line: LineCallback,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess[str]:
+    """
+    Run a command, invoking ``on_line`` for every stdout line as it arrives.
+
+    stderr is drained on a background thread so a chatty CLI cannot block on a
+    full pipe. The returned CompletedProcess carries the full stdout/stderr.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds ``timeout``
+        FileNotFoundError: If the executable does not exist
+    """
+    token = get_current_token()
+    process = subprocess.Popen(  # noqa: S603 - callers pass vetted CLI commands
+        list(command),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        env=env,
+    )
+    if token is not None:
+        token.register(process)
+
+    stderr_parts: List[str] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_parts.append(process.stderr.read()),
+        daemon=True,
+    )
+    stderr_reader.start()
+
+    expired = threading.Event()
+
+    def _expire() -> None:
+        expired.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, _expire) if timeout else None
+    if timer is not None:
+        timer.daemon = True
+        timer.start()
+
+    stdout_lines: List[str] = []
+    try:
+        for line in process.stdout:
+            stdout_lines.append(line)
+            on_line(line)
+        process.wait()
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        if timer is not None:
+            timer.cancel()
+        stderr_reader.join()
+        if token is not None:
+            token.unregister(process)
+
+    stdout = "".join(stdout_lines)
+    stderr = "".join(stderr_parts)
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(process.args, timeout, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+
+
+class StreamCollector:
+    """Accumulates streamed text and publishes each fragment as an indexed StreamChunk."""
+
+    def __init__(self, emit: Callable[[StreamChunk], None]) -> None:
+        self._emit = emit
+        self._started = time.monotonic()
+        self._first_chunk_at: Optional[float] = None
+        self.parts: List[str] = []
+
+    def add(self, text: str) -> None:
+        """Publish a text fragment (empty fragments are ignored)."""
+        if not text:
+            return
+        if self._first_chunk_at is None:
+            self._first_chunk_at = time.monotonic()
+        self._emit(StreamChunk(content=text, index=len(self.parts)))
+        self.parts.append(text)
+
+    @property
+    def text(self) -> str:
+        """All fragments published so far."""
+        return "".join(self.parts)
+
+    @property
+    def time_to_first_chunk_ms(self) -> Optional[int]:
+        """Milliseconds from collector creation to the first fragment."""
+        if self._first_chunk_at is None:
+            return None
+        return int((self._first_chunk_at - self._started) * 1000)
+
+
+def parse_json_line(line: str) -> Optional[Dict[str, Any]]:
+    """Parse one line of JSONL output, ignoring blank or non-JSON lines."""
+    text = line.strip()
+    if not text:
+        return None
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def streaming_unsupported(completed: subprocess.CompletedProcess[str]) -> bool:
+    """Whether a failed run looks like the CLI rejected its streaming flags."""
+    if completed.returncode == 0:
+        return False
+    stderr = (completed.stderr or "").lower()
+    return any(phrase in stderr for phrase in UNSUPPORTED_FLAG_PHRASES)
+
+
+__all__ = [
+    "LineCallback",
+    "StreamCollector",
+    "UNSUPPORTED_FLAG_PHRASES",
+    "parse_json_line",
+    "stream_subprocess",
+    "streaming_unsupported",
+]
@@ -0,0 +1,390 @@
+"""
+Deterministic in-process stub provider.
+
+The ``stub`` provider never launches a CLI. It answers every request after a
+simulated latency drawn from a configurable distribution, optionally fails or
+times out at a configured rate, streams its answer in evenly spaced chunks, and
+returns either the prompt itself (echo) or a canned response. This makes the
+consultation pipelines (``execute_tools_parallel``, fidelity and plan reviews,
+``sdd render --mode full``, llm-doc-gen) runnable offline for load testing and
+regression benchmarks.
+
+Behaviour is configured in the global ``stub_provider`` section of
+ai_config.yaml and the provider is selected like any other tool
+(``tools: stub: enabled: true`` plus an entry in ``tool_priority``).
+
+Random draws are seeded from the configured seed, the prompt and the number of
+times that prompt has been sent in this process, so a run is reproducible no
+matter how concurrent requests interleave.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from .base import (
+    GenerationRequest,
+    GenerationResult,
+    ModelDescriptor,
+    ProviderCapability,
+    ProviderContext,
+    ProviderExecutionError,
+    ProviderHooks,
+    ProviderMetadata,
+    ProviderStatus,
+    ProviderTimeoutError,
+    StreamChunk,
+    TokenUsage,
+)
+from .cancellation import get_current_token
+from .registry import register_provider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 90
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+RESPONSE_MODES = ("echo", "canned")
+CANCEL_POLL_SECONDS = 0.05
+# Rough characters-per-token ratio used for simulated token usage
+CHARS_PER_TOKEN = 4
+
+STUB_MODELS: List[ModelDescriptor] = [
+    ModelDescriptor(
+        id="stub",
+        display_name="Stub (offline benchmark provider)",
+        capabilities={ProviderCapability.TEXT, ProviderCapability.STREAMING},
+        routing_hints={"tier": "local"},
+    ),
+]
+
+STUB_METADATA = ProviderMetadata(
+    provider_name="stub",
+    models=tuple(STUB_MODELS),
+    default_model="stub",
+    security_flags={"writes_allowed": False, "read_only": True},
+    extra={"in_process": True},
+)
+
+
+def _as_float(value: Any, default: float, *, minimum: float = 0.0) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    return max(minimum, float(value))
+
+
+@dataclass(frozen=True)
+class StubSettings:
+    """
+    Simulated behaviour of the stub provider.
+
+    Attributes:
+        latency_distribution: "fixed", "uniform", "normal" or "lognormal"
+        latency_ms: Fixed latency, or the mean (uniform/normal) or median
+                    (lognormal) of the distribution
+        latency_jitter_ms: Half-width (uniform), standard deviation (normal) or
+                           spread relative to latency_ms (lognormal sigma =
+                           jitter / latency)
+        failure_rate: Probability (0-1) that a request fails with an error
+        timeout_rate: Probability (0-1) that a request runs into its timeout
+        chunk_count: Number of chunks the response is split into
+        chunk_interval_ms: Delay between consecutive chunks
+        response_mode: "echo" (return the prompt) or "canned"
+        canned_response: Response text used in canned mode
+        seed: Base seed for the random draws
+    """
+
+    latency_distribution: str = "fixed"
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    failure_rate: float = 0.0
+    timeout_rate: float = 0.0
+    chunk_count: int = 1
+    chunk_interval_ms: float = 0.0
+    response_mode: str = "echo"
+    canned_response: str = ""
+    seed: int = 0
+
+    @classmethod
+    def from_mapping(cls, data: Optional[Mapping[str, Any]]) -> "StubSettings":
+        """
+        Build settings from an ai_config ``stub_provider`` section.
+
+        Invalid values fall back to their defaults. ``response_file`` is read
+        into ``canned_response`` (and implies canned mode); an unreadable file
+        falls back to echo mode with a warning.
+        """
+        data = data or {}
+        distribution = str(data.get("latency_distribution") or "fixed").lower()
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            logger.warning("Unknown stub latency distribution %r; using 'fixed'", distribution)
+            distribution = "fixed"
+
+        response_mode = str(data.get("response") or data.get("response_mode") or "echo").lower()
+        canned = data.get("canned_response")
+        canned_response = canned if isinstance(canned, str) else ""
+        response_file = data.get("response_file")
+        if response_file:
+            try:
+                canned_response = Path(str(response_file)).expanduser().read_text(encoding="utf-8")
+                response_mode = "canned"
+            except OSError as exc:
+                logger.warning("Cannot read stub response file %s: %s; echoing prompts", response_file, exc)
+                response_mode = "echo"
+        if response_mode not in RESPONSE_MODES:
+            response_mode = "echo"
+
+        chunk_count = data.get("chunk_count")
+        seed = data.get("seed")
+        return cls(
+            latency_distribution=distribution,
+            latency_ms=_as_float(data.get("latency_ms"), 0.0),
+            latency_jitter_ms=_as_float(data.get("latency_jitter_ms"), 0.0),
+            failure_rate=min(1.0, _as_float(data.get("failure_rate"), 0.0)),
+            timeout_rate=min(1.0, _as_float(data.get("timeout_rate"), 0.0)),
+            chunk_count=chunk_count if isinstance(chunk_count, int) and chunk_count > 0 else 1,
+            chunk_interval_ms=_as_float(data.get("chunk_interval_ms"), 0.0),
+            response_mode=response_mode,
+            canned_response=canned_response,
+            seed=seed if isinstance(seed, int) and not isinstance(seed, bool) else 0,
+        )
+
+    def sample_latency_ms(self, rng: random.Random) -> float:
+        """Draw a time-to-first-chunk latency in milliseconds."""
+        base, jitter = self.latency_ms, self.latency_jitter_ms
+        if self.latency_distribution == "uniform":
+            value = rng.uniform(base - jitter, base + jitter)
+        elif self.latency_distribution == "normal":
+            value = rng.gauss(base, jitter)
+        elif self.latency_distribution == "lognormal" and base > 0:
+            value = rng.lognormvariate(math.log(base), jitter / base)
+        else:
+            value = base
+        return max(0.0, value)
+
+
+@dataclass
+class _AttemptCounter:
+    """Per-prompt attempt numbers shared by all stub provider instances."""
+
+    counts: Dict[str, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def next(self, key: str) -> int:
+        with self.lock:
+            attempt = self.counts.get(key, 0)
+            self.counts[key] = attempt + 1
+            return attempt
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counts.clear()
+
+
+_ATTEMPTS = _AttemptCounter()
+
+
+def reset_stub_state() -> None:
+    """Forget per-prompt attempt counts so a benchmark run starts from scratch."""
+    _ATTEMPTS.reset()
+
+
+def _cancellable_sleep(seconds: float) -> None:
+    """Sleep, returning early with an error if the thread's request is cancelled."""
+    token = get_current_token()
+    deadline = time.monotonic() + seconds
+    while True:
+        if token is not None and token.cancelled:
+            raise ProviderExecutionError("Stub request cancelled", provider="stub")
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, CANCEL_POLL_SECONDS))
+
+
+def _split_chunks(text: str, count: int) -> List[str]:
+    """Split text into at most ``count`` contiguous, non-empty pieces."""
+    if count <= 1 or len(text) <= 1:
+        return [text] if text else []
+    size = math.ceil(len(text) / min(count, len(text)))
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+class StubProvider(ProviderContext):
+    """ProviderContext that simulates a provider without running anything."""
+
+    def __init__(
+        self,
+        metadata: ProviderMetadata,
+        hooks: ProviderHooks,
+        *,
+        settings: Optional[StubSettings] = None,
+        model: Optional[str] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+        timeout: Optional[float] = None,
+    ):
+        super().__init__(metadata, hooks)
+        self._settings = settings or StubSettings()
+        self._model = model or metadata.default_model or "stub"
+        self._sleep = sleep or _cancellable_sleep
+        self._timeout = timeout or DEFAULT_TIMEOUT_SECONDS
+
+    @property
+    def settings(self) -> StubSettings:
+        return self._settings
+
+    def _rng(self, prompt: str) -> tuple[random.Random, int]:
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        attempt = _ATTEMPTS.next(digest)
+        return random.Random(f"{self._settings.seed}:{digest}:{attempt}"), attempt
+
+    def _response_text(self, request: GenerationRequest) -> str:
+        if self._settings.response_mode == "canned":
+            return self._settings.canned_response
+        return request.prompt
+
+    def _execute(self, request: GenerationRequest) -> GenerationResult:
+        settings = self._settings
+        model = str((request.metadata or {}).get("model") or self._model)
+        timeout = request.timeout or self._timeout
+        rng, attempt = self._rng(request.prompt)
+
+        # Draw every value up front so the sequence does not depend on the outcome
+        latency = settings.sample_latency_ms(rng) / 1000.0
+        times_out = rng.random() < settings.timeout_rate
+        fails = rng.random() < settings.failure_rate
+
+        chunks = _split_chunks(self._response_text(request), settings.chunk_count)
+        interval = settings.chunk_interval_ms / 1000.0
+        duration = latency + interval * max(0, len(chunks) - 1)
+
+        if times_out or duration > timeout:
+            self._sleep(timeout)
+            raise ProviderTimeoutError(
+                f"Stub provider timed out after {timeout}s",
+                provider=self.metadata.provider_name,
+            )
+
+        self._sleep(latency)
+        if fails:
+            raise ProviderExecutionError(
+                "Stub provider injected failure",
+                provider=self.metadata.provider_name,
+            )
+
+        for index, chunk in enumerate(chunks):
+            if index:
+                self._sleep(interval)
+            if request.stream:
+                self._emit_stream_chunk(StreamChunk(content=chunk, index=index))
+
+        content = "".join(chunks)
+        input_tokens = _estimate_tokens((request.system_prompt or "") + request.prompt)
+        output_tokens = _estimate_tokens(content)
+        return GenerationResult(
+            content=content,
+            model_fqn=f"{self.metadata.provider_name}:{model}",
+            status=ProviderStatus.SUCCESS,
+            usage=TokenUsage(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
+                metadata={"simulated": True},
+            ),
+            raw_payload={
+                "latency_ms": round(latency * 1000, 3),
+                "duration_ms": round(duration * 1000, 3),
+                "chunks": len(chunks),
+                "attempt": attempt,
+            },
+        )
+
+
+def is_stub_available() -> bool:
+    """The stub runs in-process, so it is always available."""
+    return True
+
+
+def _configured_settings() -> StubSettings:
+    # Imported lazily: ai_config imports ai_tools, which imports this package
+    from claude_skills.common import ai_config
+
+    return StubSettings.from_mapping(ai_config.get_stub_provider_config())
+
+
+def create_provider(
+    *,
+    hooks: ProviderHooks,
+    model: Optional[str] = None,
+    dependencies: Optional[Dict[str, object]] = None,
+    overrides: Optional[Dict[str, object]] = None,
+) -> StubProvider:
+    """
+    Factory used by the provider registry.
+
+    Settings come from ``dependencies["settings"]`` (a StubSettings or a
+    mapping), otherwise from the ai_config ``stub_provider`` section;
+    ``overrides`` may replace individual settings. ``dependencies["sleep"]``
+    replaces the sleep function (e.g. in tests).
+    """
+    dependencies = dependencies or {}
+    overrides = overrides or {}
+
+    settings = dependencies.get("settings")
+    if isinstance(settings, Mapping):
+        settings = StubSettings.from_mapping(settings)
+    if not isinstance(settings, StubSettings):
+        settings = _configured_settings()
+
+    setting_overrides = {
+        key: value for key, value in overrides.items()
+        if key not in ("model", "timeout") and key in StubSettings.__dataclass_fields__
+    }
+    if setting_overrides:
+        merged = {**settings.__dict__, **setting_overrides}
+        merged["response"] = merged.pop("response_mode")
+        settings = StubSettings.from_mapping(merged)
+
+    timeout = overrides.get("timeout")
+    return StubProvider(
+        metadata=STUB_METADATA,
+        hooks=hooks,
+        settings=settings,
+        model=overrides.get("model") or model,  # type: ignore[arg-type]
+        sleep=dependencies.get("sleep"),  # type: ignore[arg-type]
+        timeout=timeout if timeout is not None else None,  # type: ignore[arg-type]
+    )
+
+
+# Register the provider immediately so consumers can resolve it by id.
+register_provider(
+    "stub",
+    factory=create_provider,
+    metadata=STUB_METADATA,
+    availability_check=is_stub_available,
+    priority=-100,
+    description="Deterministic in-process stub for offline load testing",
+    tags=("local", "benchmark", "text"),
+    replace=True,
+)
+
+
+__all__ = [
+    "StubProvider",
+    "StubSettings",
+    "create_provider",
+    "is_stub_available",
+    "reset_stub_state",
+    "STUB_METADATA",
+]
@@ -16,6 +16,8 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional, Any
 
+from claude_skills.common.config_snapshot import load_config_snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -280,8 +282,8 @@ def load_sdd_config(project_path: Optional[Path] = None) -> Dict[str, Any]:
         return DEFAULT_SDD_CONFIG.copy()
 
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        snapshot = load_config_snapshot(config_path, json.loads, "json")
+        config_data = snapshot.to_dict() if snapshot else None
 
         if not config_data or not isinstance(config_data, dict):
             # Empty or invalid config, use defaults
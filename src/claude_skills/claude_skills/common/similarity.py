@@ -0,0 +1,397 @@
+"""
+Offline text similarity and claim agreement across AI responses.
+
+Multi-agent features (test-failure consensus, plan review synthesis, fidelity
+review consensus) need to know which points several agents make, even when
+they phrase them differently. This module does that without any model
+downloads:
+
+- Text is tokenized into lowercased, lightly stemmed content words.
+- Claims (bullet items and sentences) become TF-IDF vectors, with IDF computed
+  over all claims being compared, so words every response uses count little.
+- Cosine similarities are accumulated through an inverted index, so only
+  claims that share a term are ever compared, and only across sources.
+- Claims are clustered greedily, most similar pair first; a cluster holds at
+  most one claim per source, so its size is the number of agreeing sources.
+
+Everything is deterministic for identical inputs.
+"""
+
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Claims at or above this cosine similarity are treated as the same point
+DEFAULT_CLAIM_THRESHOLD = 0.45
+
+# Claims shorter than this many content words are not split out of prose
+MIN_CLAIM_TOKENS = 3
+
+# Per-source cap on claims, which keeps very long responses fast
+MAX_CLAIMS_PER_SOURCE = 300
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+(?:\.[a-z0-9_]+)*")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z`*\"'(\[])")
+_BULLET_RE = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+")
+_MARKDOWN_RE = re.compile(r"\*+|`+|^[#>|\s]+|\|")
+
+_STOPWORDS = frozenset(
+    """
+    a about above after again all also am an and any are as at be because been
+    before being below between both but by can could did do does doing done down
+    during each either few for from further had has have having he her here hers
+    him his how i if in into is it its itself just let may me might more most
+    must my no nor not now of off on once only or other our ours out over own
+    same she should so some such than that the their theirs them then there these
+    they this those through to too under until up upon us very was we were what
+    when where which while who whom why will with would you your yours
+    """.split()
+)
+
+_SUFFIXES = ("ations", "ation", "ings", "ing", "ies", "ied", "ed", "es", "ly", "s")
+
+
+def _stem(token: str) -> str:
+    """Strip a common English suffix (and a final "e") so inflections of a word match."""
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[: -len(suffix)] + ("y" if suffix in ("ies", "ied") else "")
+            break
+    if token.endswith("e") and len(token) > 3:
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercased, stemmed content words.
+
+    Dotted names and file paths (``config.py``, ``pkg.module``) are kept as
+    single tokens; stopwords and single characters are dropped.
+    """
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in _STOPWORDS or len(token) < 2:
+            continue
+        tokens.append(token if "." in token or token.isdigit() else _stem(token))
+    return tokens
+
+
+def split_claims(text: str, min_tokens: int = MIN_CLAIM_TOKENS) -> List[str]:
+    """
+    Split a response into claims: list items and prose sentences.
+
+    Markdown emphasis and code fences are removed; headings, fence lines and
+    claims with fewer than ``min_tokens`` content words are skipped.
+    """
+    claims: List[str] = []
+    in_fence = False
+    paragraph: List[str] = []
+
+    def flush() -> None:
+        if paragraph:
+            for sentence in _SENTENCE_RE.split(" ".join(paragraph)):
+                _add(sentence)
+            paragraph.clear()
+
+    def _add(candidate: str) -> None:
+        cleaned = re.sub(r"\s+", " ", _MARKDOWN_RE.sub("", candidate)).strip()
+        if cleaned and len(tokenize(cleaned)) >= min_tokens:
+            claims.append(cleaned)
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            flush()
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        if not stripped or stripped.startswith("#"):
+            flush()
+            continue
+        if _BULLET_RE.match(line):
+            flush()
+            paragraph.append(_BULLET_RE.sub("", line).strip())
+            continue
+        paragraph.append(stripped)
+    flush()
+    return claims
+
+
+def _vectorize(token_lists: Sequence[List[str]]) -> List[Dict[str, float]]:
+    """L2-normalized TF-IDF vectors (smoothed IDF, so no weight is ever zero)."""
+    doc_freq: Dict[str, int] = defaultdict(int)
+    for tokens in token_lists:
+        for token in set(tokens):
+            doc_freq[token] += 1
+
+    n_docs = len(token_lists)
+    vectors = []
+    for tokens in token_lists:
+        counts: Dict[str, int] = defaultdict(int)
+        for token in tokens:
+            counts[token] += 1
+        vector = {
+            token: (1.0 + math.log(count)) * (math.log((1 + n_docs) / (1 + doc_freq[token])) + 1.0)
+            for token, count in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        vectors.append({token: w / norm for token, w in vector.items()} if norm else {})
+    return vectors
+
+
+def _same_text(a: str, b: str) -> bool:
+    return re.sub(r"\s+", " ", a).strip().lower() == re.sub(r"\s+", " ", b).strip().lower()
+
+
+def text_similarity(text_a: str, text_b: str) -> float:
+    """TF-IDF cosine similarity of two texts (0.0 to 1.0)."""
+    vec_a, vec_b = _vectorize([tokenize(text_a), tokenize(text_b)])
+    if not vec_a or not vec_b:
+        return 1.0 if _same_text(text_a, text_b) and text_a.strip() else 0.0
+    if len(vec_a) > len(vec_b):
+        vec_a, vec_b = vec_b, vec_a
+    return min(1.0, sum(w * vec_b.get(token, 0.0) for token, w in vec_a.items()))
+
+
+def best_match(text: str, candidates: Sequence[str], threshold: float = 0.1) -> Optional[int]:
+    """
+    Index of the candidate most similar to ``text``, if any reaches ``threshold``.
+
+    IDF is computed over the candidates, so terms that every candidate shares
+    (boilerplate, field names) carry little weight.
+    """
+    if not candidates:
+        return None
+    vectors = _vectorize([tokenize(c) for c in candidates] + [tokenize(text)])
+    query = vectors.pop()
+    best, best_score = None, threshold
+    for index, vector in enumerate(vectors):
+        score = sum(w * vector.get(token, 0.0) for token, w in query.items())
+        if score >= best_score and (best is None or score > best_score):
+            best, best_score = index, score
+    return best
+
+
+@dataclass
+class Claim:
+    """One point made by one source."""
+    source: str
+    text: str
+    index: int
+
+
+@dataclass
+class ClaimCluster:
+    """Claims from different sources that make the same point.
+
+    Attributes:
+        claims: Member claims, at most one per source, in input order
+        similarity: Lowest pairwise similarity that joined the cluster (1.0 for singletons)
+        agreement: Share of all sources that made this point (0.0-1.0)
+    """
+    claims: List[Claim] = field(default_factory=list)
+    similarity: float = 1.0
+    agreement: float = 0.0
+
+    @property
+    def sources(self) -> List[str]:
+        return [claim.source for claim in self.claims]
+
+    @property
+    def representative(self) -> str:
+        """Text of the earliest claim in the cluster."""
+        return self.claims[0].text
+
+
+@dataclass
+class AgreementReport:
+    """Claim clusters across sources with agreement scores.
+
+    Attributes:
+        sources: Source names, in input order
+        clusters: Clusters, most widely shared first (ties keep input order)
+        source_agreement: Per source, the share of its claims another source also made
+        overall_agreement: Mean of source_agreement over sources with claims
+    """
+    sources: List[str]
+    clusters: List[ClaimCluster] = field(default_factory=list)
+    source_agreement: Dict[str, float] = field(default_factory=dict)
+    overall_agreement: float = 0.0
+
+    def consensus(self, min_sources: int = 2) -> List[ClaimCluster]:
+        """Clusters made by at least ``min_sources`` sources."""
+        return [c for c in self.clusters if len(c.claims) >= min_sources]
+
+    def unique_to(self, source: str) -> List[ClaimCluster]:
+        """Points only ``source`` made."""
+        return [c for c in self.clusters if c.sources == [source]]
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to dictionary for serialization."""
+        return {
+            "sources": self.sources,
+            "overall_agreement": round(self.overall_agreement, 3),
+            "source_agreement": {s: round(v, 3) for s, v in self.source_agreement.items()},
+            "clusters": [
+                {
+                    "claim": c.representative,
+                    "sources": c.sources,
+                    "agreement": round(c.agreement, 3),
+                    "similarity": round(c.similarity, 3),
+                }
+                for c in self.clusters
+            ],
+        }
+
+
+def _candidate_pairs(
+    claims: List[Claim],
+    vectors: List[Dict[str, float]],
+    threshold: float,
+) -> List[Tuple[float, int, int]]:
+    """Cross-source claim pairs at or above ``threshold``, via an inverted index."""
+    postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+    for i, vector in enumerate(vectors):
+        for token, weight in vector.items():
+            postings[token].append((i, weight))
+
+    scores: Dict[Tuple[int, int], float] = defaultdict(float)
+    for entries in postings.values():
+        for pos, (i, w_i) in enumerate(entries):
+            source_i = claims[i].source
+            for j, w_j in entries[pos + 1:]:
+                if claims[j].source != source_i:
+                    scores[(i, j)] += w_i * w_j
+
+    pairs = [(min(1.0, score), i, j) for (i, j), score in scores.items() if score >= threshold]
+
+    # Claims without content words (e.g. "N/A") only match identical text
+    empty = [i for i, vector in enumerate(vectors) if not vector]
+    for pos, i in enumerate(empty):
+        for j in empty[pos + 1:]:
+            if claims[i].source != claims[j].source and _same_text(claims[i].text, claims[j].text):
+                pairs.append((1.0, i, j))
+
+    pairs.sort(key=lambda p: (-p[0], p[1], p[2]))
+    return pairs
+
+
+def cluster_items(
+    items: Mapping[str, Iterable[str]],
+    threshold: float = DEFAULT_CLAIM_THRESHOLD,
+) -> AgreementReport:
+    """
+    Cluster already-split claims (e.g. parsed issue lists) across sources.
+
+    Args:
+        items: Claims per source name
+        threshold: Minimum cosine similarity for two claims to be the same point
+
+    Returns:
+        AgreementReport over all sources
+    """
+    sources = list(items)
+    claims: List[Claim] = []
+    for source in sources:
+        for text in list(items[source])[:MAX_CLAIMS_PER_SOURCE]:
+            if text and text.strip():
+                claims.append(Claim(source=source, text=text.strip(), index=len(claims)))
+
+    vectors = _vectorize([tokenize(claim.text) for claim in claims])
+
+    # Greedy agglomeration, most similar pair first, one claim per source per cluster
+    cluster_of = list(range(len(claims)))
+    members: Dict[int, List[int]] = {i: [i] for i in range(len(claims))}
+    link: Dict[int, float] = {i: 1.0 for i in range(len(claims))}
+    for score, i, j in _candidate_pairs(claims, vectors, threshold):
+        a, b = cluster_of[i], cluster_of[j]
+        if a == b:
+            continue
+        if {claims[k].source for k in members[a]} & {claims[k].source for k in members[b]}:
+            continue
+        if len(members[a]) < len(members[b]):
+            a, b = b, a
+        for k in members[b]:
+            cluster_of[k] = a
+        members[a].extend(members.pop(b))
+        link[a] = min(link[a], link.pop(b), score)
+
+    n_sources = len(sources) or 1
+    clusters = [
+        ClaimCluster(
+            claims=[claims[k] for k in sorted(indices)],
+            similarity=link[root],
+            agreement=len(indices) / n_sources,
+        )
+        for root, indices in members.items()
+    ]
+    clusters.sort(key=lambda c: (-len(c.claims), c.claims[0].index))
+
+    report = AgreementReport(sources=sources, clusters=clusters)
+    shared: Dict[str, List[bool]] = defaultdict(list)
+    for cluster in clusters:
+        for claim in cluster.claims:
+            shared[claim.source].append(len(cluster.claims) > 1)
+    report.source_agreement = {
+        source: sum(flags) / len(flags) for source in sources if (flags := shared.get(source))
+    }
+    if report.source_agreement:
+        report.overall_agreement = sum(report.source_agreement.values()) / len(report.source_agreement)
+    return report
+
+
+def cluster_claims(
+    responses: Mapping[str, str],
+    threshold: float = DEFAULT_CLAIM_THRESHOLD,
+    min_tokens: int = MIN_CLAIM_TOKENS,
+) -> AgreementReport:
+    """
+    Split free-text responses into claims and cluster them across sources.
+
+    Args:
+        responses: Response text per source name (e.g. tool name)
+        threshold: Minimum cosine similarity for two claims to be the same point
+        min_tokens: Shortest claim, in content words, that is considered
+
+    Returns:
+        AgreementReport over all sources
+
+    Example:
+        >>> report = cluster_claims({"gemini": text_a, "codex": text_b})
+        >>> for cluster in report.consensus():
+        ...     print(cluster.representative, cluster.sources)
+    """
+    return cluster_items(
+        {source: split_claims(text, min_tokens=min_tokens) for source, text in responses.items()},
+        threshold=threshold,
+    )
+
+
+def agreement_label(score: float) -> str:
+    """Describe an overall agreement score as Strong/Moderate/Weak/Conflicted."""
+    if score >= 0.6:
+        return "Strong"
+    if score >= 0.35:
+        return "Moderate"
+    if score >= 0.15:
+        return "Weak"
+    return "Conflicted"
+
+
+__all__ = [
+    "DEFAULT_CLAIM_THRESHOLD",
+    "AgreementReport",
+    "Claim",
+    "ClaimCluster",
+    "agreement_label",
+    "best_match",
+    "cluster_claims",
+    "cluster_items",
+    "split_claims",
+    "text_similarity",
+    "tokenize",
+]
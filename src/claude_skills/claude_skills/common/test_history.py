@@ -0,0 +1,248 @@
+"""
+Local history of test outcomes and flakiness scores.
+
+Every ``sdd test run`` and every fidelity review test run records its test
+outcomes (test id, outcome, duration, commit, timestamp) in a SQLite
+database under ``~/.cache/sdd-toolkit/``. From the most recent outcomes of a
+test, ``TestHistory.flakiness`` computes how often it flips between passing
+and failing, and whether it both passed and failed on the same commit, so
+callers such as test-failure consultation can recognize known flakes before
+spending AI calls on them. Only the outcomes a score can read are kept: the
+latest RETAINED_OUTCOMES per test, none older than MAX_OUTCOME_AGE_DAYS.
+
+Test ids are stored in the JUnit form ``dotted.module.Class::test_name``;
+pytest node ids (``tests/test_a.py::Class::test_name``) are converted with
+``canonical_test_id``.
+"""
+
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_DB = Path.home() / ".cache" / "sdd-toolkit" / "test_history.db"
+
+# Outcomes at or above this flakiness score mark a test as flaky
+DEFAULT_FLAKY_THRESHOLD = 0.3
+# Number of most recent outcomes a score is computed from
+FLAKINESS_WINDOW = 20
+# Fewer pass/fail outcomes than this never count as flaky
+MIN_RUNS_FOR_FLAKINESS = 3
+# Outcomes kept per test (skips don't count towards the window, so keep slack)
+RETAINED_OUTCOMES = FLAKINESS_WINDOW * 2
+# Outcomes older than this are dropped (e.g. tests that no longer exist)
+MAX_OUTCOME_AGE_DAYS = 90
+
+PASSING_OUTCOMES = frozenset({"passed"})
+FAILING_OUTCOMES = frozenset({"failed", "error"})
+
+
+def canonical_test_id(test_id: str) -> str:
+    """
+    Normalize a pytest node id to the JUnit ``classname::name`` form.
+
+    ``tests/unit/test_a.py::TestX::test_y[1]`` becomes
+    ``tests.unit.test_a.TestX::test_y[1]``; ids already in that form are
+    returned unchanged.
+    """
+    parts = test_id.split("::")
+    if len(parts) < 2 or not parts[0].endswith(".py"):
+        return test_id
+    module = parts[0][:-3].replace("\\", "/").strip("/").replace("/", ".")
+    return "::".join([".".join([module] + parts[1:-1]), parts[-1]])
+
+
+@dataclass
+class FlakinessScore:
+    """Flakiness of one test over its recent outcomes.
+
+    Attributes:
+        test_id: Canonical test id
+        runs: Pass/fail outcomes considered (most recent FLAKINESS_WINDOW)
+        failures: How many of them failed or errored
+        flips: Changes between passing and failing, in order
+        mixed_commits: Commits on which the test both passed and failed
+        score: 0.0 (stable) to 1.0 (flips every run)
+    """
+    test_id: str
+    runs: int = 0
+    failures: int = 0
+    flips: int = 0
+    mixed_commits: int = 0
+    score: float = 0.0
+
+    def is_flaky(self, threshold: float = DEFAULT_FLAKY_THRESHOLD) -> bool:
+        """Whether the score reaches ``threshold`` with enough runs behind it."""
+        return self.runs >= MIN_RUNS_FOR_FLAKINESS and self.score >= threshold
+
+
+def score_outcomes(test_id: str, outcomes: List[Tuple[str, Optional[str]]]) -> FlakinessScore:
+    """
+    Compute a flakiness score from (outcome, commit) pairs, oldest first.
+
+    The score is the larger of the flip rate (changes between passing and
+    failing per consecutive pair) and the share of commits on which the test
+    both passed and failed; outcomes other than pass/fail are ignored.
+    """
+    relevant = [(o in FAILING_OUTCOMES, c) for o, c in outcomes if o in PASSING_OUTCOMES | FAILING_OUTCOMES]
+    relevant = relevant[-FLAKINESS_WINDOW:]
+    result = FlakinessScore(test_id=test_id, runs=len(relevant))
+    if not relevant:
+        return result
+
+    result.failures = sum(1 for failed, _ in relevant if failed)
+    result.flips = sum(1 for a, b in zip(relevant, relevant[1:]) if a[0] != b[0])
+
+    by_commit = {}
+    for failed, commit in relevant:
+        if commit:
+            by_commit.setdefault(commit, set()).add(failed)
+    result.mixed_commits = sum(1 for seen in by_commit.values() if len(seen) == 2)
+
+    flip_rate = result.flips / (len(relevant) - 1) if len(relevant) > 1 else 0.0
+    mixed_rate = result.mixed_commits / len(by_commit) if by_commit else 0.0
+    result.score = round(max(flip_rate, mixed_rate), 3)
+    return result
+
+
+class TestHistory:
+    """
+    SQLite-backed store of test outcomes.
+
+    The database is created on first write, so constructing a TestHistory is
+    free. Write failures are logged and ignored: history is an optimization
+    and must never break a test run.
+
+    Schema:
+        outcomes: test_id (TEXT), outcome (TEXT), duration (REAL),
+            commit_sha (TEXT), recorded_at (REAL), source (TEXT)
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: Database file (default: ~/.cache/sdd-toolkit/test_history.db)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_HISTORY_DB
+        self._initialized = False
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection as context manager (creating the schema once)."""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            if not self._initialized:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS outcomes (
+                        test_id TEXT NOT NULL,
+                        outcome TEXT NOT NULL,
+                        duration REAL,
+                        commit_sha TEXT,
+                        recorded_at REAL NOT NULL,
+                        source TEXT
+                    )
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_outcomes_test
+                    ON outcomes(test_id, recorded_at)
+                """)
+                conn.commit()
+                self._initialized = True
+            yield conn
+        finally:
+            conn.close()
+
+    def record(
+        self,
+        outcomes: Iterable[Tuple[str, str, Optional[float]]],
+        commit: Optional[str] = None,
+        source: str = "run-tests",
+    ) -> int:
+        """
+        Record test outcomes, dropping outcomes that fall out of the retained
+        window of each recorded test or exceed MAX_OUTCOME_AGE_DAYS.
+
+        Args:
+            outcomes: (test id, outcome, duration in seconds or None) tuples;
+                ids are normalized with canonical_test_id and outcomes are
+                lowercased ("passed", "failed", "error", "skipped", ...)
+            commit: Commit the tests ran against
+            source: What produced the outcomes (e.g. "run-tests", "fidelity-review")
+
+        Returns:
+            Number of outcomes recorded
+        """
+        now = time.time()
+        rows = [
+            (canonical_test_id(test_id), outcome.lower(), duration, commit, now, source)
+            for test_id, outcome, duration in outcomes
+        ]
+        if not rows:
+            return 0
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    "INSERT INTO outcomes (test_id, outcome, duration, commit_sha, recorded_at, source) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.executemany(
+                    "DELETE FROM outcomes WHERE test_id = ? AND rowid NOT IN ("
+                    "SELECT rowid FROM outcomes WHERE test_id = ? "
+                    "ORDER BY recorded_at DESC, rowid DESC LIMIT ?)",
+                    [(test_id, test_id, RETAINED_OUTCOMES) for test_id in {row[0] for row in rows}],
+                )
+                conn.execute(
+                    "DELETE FROM outcomes WHERE recorded_at < ?",
+                    (now - MAX_OUTCOME_AGE_DAYS * 86400,),
+                )
+                conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Failed to record test history in {self.db_path}: {e}")
+            return 0
+        return len(rows)
+
+    def flakiness(self, test_id: str) -> FlakinessScore:
+        """Flakiness score of a test (node id or canonical id) from its recent outcomes."""
+        test_id = canonical_test_id(test_id)
+        if not self.db_path.exists():
+            return FlakinessScore(test_id=test_id)
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT outcome, commit_sha FROM outcomes WHERE test_id = ? "
+                    "ORDER BY recorded_at DESC, rowid DESC LIMIT ?",
+                    (test_id, RETAINED_OUTCOMES),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to read test history from {self.db_path}: {e}")
+            return FlakinessScore(test_id=test_id)
+        return score_outcomes(test_id, list(reversed(rows)))
+
+    def flaky_tests(self, threshold: float = DEFAULT_FLAKY_THRESHOLD) -> List[FlakinessScore]:
+        """Tests whose flakiness reaches ``threshold``, most flaky first."""
+        if not self.db_path.exists():
+            return []
+        try:
+            with self._get_connection() as conn:
+                test_ids = [
+                    row[0] for row in conn.execute(
+                        "SELECT test_id FROM outcomes WHERE outcome IN ('failed', 'error') GROUP BY test_id"
+                    )
+                ]
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to read test history from {self.db_path}: {e}")
+            return []
+        scores = [self.flakiness(test_id) for test_id in test_ids]
+        return sorted((s for s in scores if s.is_flaky(threshold)), key=lambda s: (-s.score, s.test_id))
@@ -1,5 +1,5 @@
 """Context tracker for Claude Code sessions."""
 
-from .parser import TokenMetrics, parse_transcript
+from .parser import TokenMetrics, TranscriptCheckpoint, parse_transcript
 
-__all__ = ["TokenMetrics", "parse_transcript"]
+__all__ = ["TokenMetrics", "TranscriptCheckpoint", "parse_transcript"]
@@ -34,6 +34,12 @@ from claude_skills.cli.sdd.output_utils import (
 from claude_skills.common import PrettyPrinter
 from claude_skills.common.json_output import output_json
 from claude_skills.context_tracker.parser import parse_transcript
+from claude_skills.context_tracker.transcript_search import (
+    DEFAULT_TAIL_WINDOW_BYTES,
+    MarkerIndex,
+    find_marker_in_tail,
+    wait_for_transcript_change,
+)
 
 
 def generate_session_marker() -> str:
@@ -51,18 +57,27 @@ def generate_session_marker() -> str:
 
 
 def find_transcript_by_specific_marker(
-    cwd: Path, marker: str, max_retries: int = 10, verbosity_level=None
+    cwd: Path,
+    marker: str,
+    max_retries: int = 10,
+    verbosity_level=None,
+    marker_index: MarkerIndex | None = None,
 ) -> str | None:
     """
     Search transcripts for a specific SESSION_MARKER to identify current session.
 
     This function searches all .jsonl transcript files in the project directory
     for a specific marker string. The transcript containing that exact marker
-    is the current session's transcript.
+    is the current session's transcript. Markers found before are looked up in
+    a marker index instead of searching again.
+
+    A freshly written marker sits near the end of its transcript, so each
+    transcript is searched backwards from EOF within a bounded window; only
+    the final attempt searches whole files.
 
     To handle race conditions where the marker may not be flushed to disk yet,
-    this function will retry with exponential backoff if the marker is not found
-    on the first attempt.
+    this function retries, waiting between attempts until a transcript grows
+    or is touched (up to an exponentially increasing timeout).
 
     Transcripts are searched in reverse chronological order (most recently modified
     first) to prioritize active sessions over historical ones.
@@ -74,11 +89,19 @@ def find_transcript_by_specific_marker(
     Args:
         cwd: Current working directory (used to find project-specific transcripts)
         marker: Specific marker to search for (e.g., "SESSION_MARKER_abc12345")
-        max_retries: Maximum number of retry attempts (default: 10)
+        max_retries: Maximum number of search attempts (default: 10)
         verbosity_level: Verbosity level to control output (optional)
+        marker_index: Index of previously found markers (default: the
+            shared on-disk index)
     Returns:
         Path to transcript containing the marker, or None if not found
     """
+    if marker_index is None:
+        marker_index = MarkerIndex()
+    indexed_path = marker_index.get(marker)
+    if indexed_path:
+        return indexed_path
+
     # Build list of candidate transcript directories to search
     # Start with the exact CWD, then try parent directories
     candidate_dirs = []
@@ -98,46 +121,44 @@ def find_transcript_by_specific_marker(
     if not candidate_dirs:
         return None
 
-    # Extended retry with exponential backoff, capped at 30 seconds total
-    # Delays: 100ms, 200ms, 400ms, 800ms, 1.6s, 3.2s, 6.4s, 12.8s, ...
-    delays = [min(0.1 * (2**i), 10.0) for i in range(max_retries)]
-    for attempt in range(max_retries):
+    def recent_transcripts() -> list[Path]:
+        """Transcripts modified in the last 24 hours, most recent first per directory."""
         current_time = time.time()
-
+        ordered = []
         # Search all candidate directories (prioritizing exact CWD match first)
         for transcript_dir in candidate_dirs:
+            transcript_files = []
             try:
-                # Get all recent transcript files
-                transcript_files = []
                 for transcript_path in transcript_dir.glob("*.jsonl"):
                     try:
                         mtime = transcript_path.stat().st_mtime
-                        # Only check recent transcripts (modified in last 24 hours)
-                        if (current_time - mtime) > 86400:
-                            continue
-                        transcript_files.append((transcript_path, mtime))
-                    except (OSError, IOError):
+                    except OSError:
+                        continue
+                    if (current_time - mtime) > 86400:
                         continue
+                    transcript_files.append((transcript_path, mtime))
+            except OSError:
+                continue
+            transcript_files.sort(key=lambda x: x[1], reverse=True)
+            ordered.extend(path for path, _ in transcript_files)
+        return ordered
 
-                # Sort by modification time (most recent first)
-                # This prioritizes the active session over historical transcripts
-                transcript_files.sort(key=lambda x: x[1], reverse=True)
+    # Wait at most 100ms, 200ms, 400ms, ... (capped at 10s, ~30s in total)
+    # between attempts, returning early once a transcript changes
+    delays = [min(0.1 * (2**i), 10.0) for i in range(max_retries)]
+    for attempt in range(max_retries):
+        final_attempt = attempt == max_retries - 1
+        window = None if final_attempt else DEFAULT_TAIL_WINDOW_BYTES
 
-                # Search through transcripts in order of recency
-                for transcript_path, _ in transcript_files:
-                    try:
-                        # Search for the specific marker in the transcript
-                        with open(transcript_path, "r", encoding="utf-8") as f:
-                            for line in f:
-                                if marker in line:
-                                    return str(transcript_path)
-                    except (OSError, IOError, UnicodeDecodeError):
-                        continue
-            except (OSError, IOError):
+        for transcript_path in recent_transcripts():
+            try:
+                if find_marker_in_tail(transcript_path, marker, window):
+                    marker_index.set(marker, str(transcript_path))
+                    return str(transcript_path)
+            except OSError:
                 continue
 
-        # If not found and we have retries left, wait before next attempt
-        if attempt < max_retries - 1:
+        if not final_attempt:
             # Show progress on stderr so it doesn't interfere with JSON output
             # Only show if not in quiet mode
             if (
@@ -148,7 +169,7 @@ def find_transcript_by_specific_marker(
                     f"(attempt {attempt + 1}/{max_retries})",
                     file=sys.stderr,
                 )
-            time.sleep(delays[attempt])
+            wait_for_transcript_change(recent_transcripts, delays[attempt])
     return None
 
 
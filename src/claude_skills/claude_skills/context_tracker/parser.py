@@ -1,10 +1,30 @@
-"""Parse Claude Code transcript files to extract token usage metrics."""
+"""
+Parse Claude Code transcript files to extract token usage metrics.
 
+Transcripts are append-only JSONL files that grow to tens of megabytes over a
+session, and ``sdd context`` is called after nearly every step. To keep each
+call cheap, ``parse_transcript`` stores a small checkpoint per transcript
+(byte offset, inode, running token metrics and the offset of the last
+``/clear``) and only parses lines appended since the previous call. A file
+that shrank, was replaced or was rewritten in place is parsed from scratch.
+"""
+
+import hashlib
 import json
-from dataclasses import dataclass
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = Path.home() / ".cache" / "sdd-toolkit" / "transcript_checkpoints"
+CHECKPOINT_VERSION = 1
+# Bytes before the checkpoint offset that must be unchanged to resume from it
+_TAIL_SAMPLE_BYTES = 256
+
 
 @dataclass
 class TokenMetrics:
@@ -53,12 +73,143 @@ def is_clear_command(entry: dict) -> bool:
     return False
 
 
-def parse_transcript(transcript_path: str | Path) -> Optional[TokenMetrics]:
+@dataclass
+class TranscriptCheckpoint:
+    """Parse state of a transcript up to a byte offset."""
+
+    offset: int = 0
+    inode: int = 0
+    tail_hash: str = ""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    context_length: int = 0
+    last_clear_offset: Optional[int] = None
+    version: int = CHECKPOINT_VERSION
+
+    def apply(self, entry: dict, offset: int) -> None:
+        """Fold one transcript entry, starting at byte ``offset``, into the totals."""
+        # Check for /clear command - reset all counters
+        if is_clear_command(entry):
+            self.input_tokens = 0
+            self.output_tokens = 0
+            self.cached_tokens = 0
+            self.context_length = 0
+            self.last_clear_offset = offset
+            return  # Don't process /clear entry itself
+
+        # Skip sidechain and error messages
+        if entry.get("isSidechain") or entry.get("isApiErrorMessage"):
+            return
+
+        # Extract usage data
+        message = entry.get("message", {})
+        usage = message.get("usage", {})
+
+        if usage:
+            # Accumulate token counts
+            self.input_tokens += usage.get("input_tokens", 0)
+            self.output_tokens += usage.get("output_tokens", 0)
+
+            # Cached tokens come from both read and creation
+            cache_read = usage.get("cache_read_input_tokens", 0)
+            cache_creation = usage.get("cache_creation_input_tokens", 0)
+            self.cached_tokens += cache_read + cache_creation
+
+            # Context length is from the most recent valid entry
+            # (input tokens + cached tokens, excluding output)
+            self.context_length = (
+                usage.get("input_tokens", 0)
+                + usage.get("cache_read_input_tokens", 0)
+                + usage.get("cache_creation_input_tokens", 0)
+            )
+
+    def to_metrics(self) -> TokenMetrics:
+        """Token metrics for everything parsed so far."""
+        return TokenMetrics(
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            cached_tokens=self.cached_tokens,
+            total_tokens=self.input_tokens + self.output_tokens + self.cached_tokens,
+            context_length=self.context_length,
+        )
+
+
+def _checkpoint_path(transcript_path: Path, checkpoint_dir: Path) -> Path:
+    key = hashlib.sha256(str(transcript_path.resolve()).encode("utf-8")).hexdigest()
+    return checkpoint_dir / f"{key[:32]}.json"
+
+
+def load_checkpoint(transcript_path: Path, checkpoint_dir: Path) -> Optional[TranscriptCheckpoint]:
+    """Load the stored checkpoint for a transcript, or None if missing or invalid."""
+    try:
+        with open(_checkpoint_path(transcript_path, checkpoint_dir), "r", encoding="utf-8") as f:
+            checkpoint = TranscriptCheckpoint(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+    return checkpoint if checkpoint.version == CHECKPOINT_VERSION else None
+
+
+def save_checkpoint(transcript_path: Path, checkpoint_dir: Path, checkpoint: TranscriptCheckpoint) -> None:
+    """Atomically store a transcript checkpoint (failures are ignored)."""
+    path = _checkpoint_path(transcript_path, checkpoint_dir)
+    try:
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=checkpoint_dir, prefix=".checkpoint-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(asdict(checkpoint), f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Failed to write transcript checkpoint {path}: {e}")
+
+
+def _tail_hash(f, offset: int) -> str:
+    """Hash of the bytes just before ``offset`` (detects in-place rewrites)."""
+    start = max(0, offset - _TAIL_SAMPLE_BYTES)
+    f.seek(start)
+    return hashlib.sha256(f.read(offset - start)).hexdigest()
+
+
+def _resume_point(f, stat: os.stat_result, checkpoint: Optional[TranscriptCheckpoint]) -> TranscriptCheckpoint:
+    """The checkpoint to continue from, or a fresh state if it no longer applies."""
+    if (
+        checkpoint is not None
+        and checkpoint.inode == stat.st_ino
+        and checkpoint.offset <= stat.st_size
+        and checkpoint.tail_hash == _tail_hash(f, checkpoint.offset)
+    ):
+        return checkpoint
+    return TranscriptCheckpoint(inode=stat.st_ino)
+
+
+def _parse_line(raw: bytes) -> Optional[dict]:
+    line = raw.strip()
+    if not line:
+        return None
+    try:
+        entry = json.loads(line.decode("utf-8"))
+    except json.JSONDecodeError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def parse_transcript(
+    transcript_path: str | Path,
+    *,
+    checkpoint_dir: Optional[Path] = None,
+    use_checkpoint: bool = True,
+) -> Optional[TokenMetrics]:
     """
     Parse a Claude Code transcript JSONL file and extract token metrics.
 
+    Only lines appended since the last call are parsed; see the module
+    docstring for how checkpoints are stored and invalidated.
+
     Args:
         transcript_path: Path to the transcript JSONL file
+        checkpoint_dir: Directory holding checkpoints (default:
+            ~/.cache/sdd-toolkit/transcript_checkpoints)
+        use_checkpoint: Set False to always parse the whole file
 
     Returns:
         TokenMetrics object with aggregated token data, or None if parsing fails
@@ -68,66 +219,43 @@ def parse_transcript(transcript_path: str | Path) -> Optional[TokenMetrics]:
     if not transcript_path.exists():
         return None
 
-    input_tokens = 0
-    output_tokens = 0
-    cached_tokens = 0
-    context_length = 0
+    checkpoint_dir = checkpoint_dir or DEFAULT_CHECKPOINT_DIR
+    stored = load_checkpoint(transcript_path, checkpoint_dir) if use_checkpoint else None
 
     try:
-        with open(transcript_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                # Check for /clear command - reset all counters
-                if is_clear_command(entry):
-                    input_tokens = 0
-                    output_tokens = 0
-                    cached_tokens = 0
-                    context_length = 0
-                    continue  # Don't process /clear entry itself
-
-                # Skip sidechain and error messages
-                if entry.get("isSidechain") or entry.get("isApiErrorMessage"):
-                    continue
-
-                # Extract usage data
-                message = entry.get("message", {})
-                usage = message.get("usage", {})
-
-                if usage:
-                    # Accumulate token counts
-                    input_tokens += usage.get("input_tokens", 0)
-                    output_tokens += usage.get("output_tokens", 0)
-
-                    # Cached tokens come from both read and creation
-                    cache_read = usage.get("cache_read_input_tokens", 0)
-                    cache_creation = usage.get("cache_creation_input_tokens", 0)
-                    cached_tokens += cache_read + cache_creation
-
-                    # Context length is from the most recent valid entry
-                    # (input tokens + cached tokens, excluding output)
-                    context_length = (
-                        usage.get("input_tokens", 0)
-                        + usage.get("cache_read_input_tokens", 0)
-                        + usage.get("cache_creation_input_tokens", 0)
-                    )
+        with open(transcript_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            state = _resume_point(f, stat, stored)
+            resumed_from = state.offset
 
+            f.seek(state.offset)
+            offset = state.offset
+            partial_line = b""
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # Possibly still being written: count it, but re-read it next time
+                    partial_line = raw
+                    break
+                entry = _parse_line(raw)
+                if entry is not None:
+                    state.apply(entry, offset)
+                offset += len(raw)
+
+            state.offset = offset
+            state.tail_hash = _tail_hash(f, offset)
     except Exception:
         return None
 
-    total_tokens = input_tokens + output_tokens + cached_tokens
+    if use_checkpoint and (state is not stored or state.offset != resumed_from):
+        save_checkpoint(transcript_path, checkpoint_dir, state)
+
+    if partial_line:
+        try:
+            entry = _parse_line(partial_line)
+        except Exception:
+            return None
+        if entry is not None:
+            state = replace(state)
+            state.apply(entry, offset)
 
-    return TokenMetrics(
-        input_tokens=input_tokens,
-        output_tokens=output_tokens,
-        cached_tokens=cached_tokens,
-        total_tokens=total_tokens,
-        context_length=context_length,
-    )
+    return state.to_metrics()
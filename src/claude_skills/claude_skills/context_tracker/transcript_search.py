@@ -0,0 +1,170 @@
+"""
+Locate the transcript containing a session marker.
+
+``sdd session-marker`` writes a fresh marker that ends up near the end of the
+current session's transcript, so transcripts are searched backwards from EOF
+in fixed-size blocks, within a bounded window. Markers that were found are
+recorded in a small index (marker -> transcript path) so later ``sdd context``
+calls with the same marker skip the search entirely.
+
+While waiting for a marker to be flushed, ``wait_for_transcript_change``
+watches the transcripts' size and mtime and returns as soon as one changes
+instead of sleeping for a fixed time.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MARKER_INDEX_FILE = Path.home() / ".cache" / "sdd-toolkit" / "session_markers.json"
+MAX_INDEXED_MARKERS = 500
+SEARCH_BLOCK_BYTES = 64 * 1024
+DEFAULT_TAIL_WINDOW_BYTES = 4 * 1024 * 1024
+CHANGE_POLL_SECONDS = 0.05
+
+# path -> (size, mtime_ns)
+FileSnapshot = Dict[Path, Tuple[int, int]]
+
+
+def find_marker_in_tail(path: Path, marker: str, window_bytes: Optional[int] = DEFAULT_TAIL_WINDOW_BYTES) -> bool:
+    """
+    Whether ``marker`` occurs in the last ``window_bytes`` of a file.
+
+    The file is read backwards in ``SEARCH_BLOCK_BYTES`` blocks; consecutive
+    blocks overlap so a marker straddling a block boundary is still found.
+
+    Args:
+        path: File to search
+        marker: Marker string (matched as UTF-8 bytes)
+        window_bytes: How far back from EOF to search (None: whole file)
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    needle = marker.encode("utf-8")
+    if not needle:
+        return False
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        stop = 0 if window_bytes is None else max(0, end - window_bytes)
+        carry = b""
+
+        while end > stop:
+            start = max(stop, end - SEARCH_BLOCK_BYTES)
+            f.seek(start)
+            block = f.read(end - start) + carry
+            if needle in block:
+                return True
+            carry = block[:len(needle) - 1]
+            end = start
+
+    return False
+
+
+def snapshot_files(paths: Iterable[Path]) -> FileSnapshot:
+    """Record (size, mtime) of every readable file in ``paths``."""
+    snapshot: FileSnapshot = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def wait_for_transcript_change(
+    list_files: Callable[[], List[Path]],
+    timeout: float,
+    poll_seconds: float = CHANGE_POLL_SECONDS,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> bool:
+    """
+    Wait until a transcript grows, is touched or appears, or ``timeout`` passes.
+
+    Args:
+        list_files: Returns the transcripts currently being watched
+        timeout: Maximum seconds to wait
+        poll_seconds: Interval between checks
+
+    Returns:
+        True if a change was seen, False on timeout
+    """
+    deadline = clock() + timeout
+    baseline = snapshot_files(list_files())
+
+    while True:
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return False
+        sleep(min(poll_seconds, remaining))
+        if snapshot_files(list_files()) != baseline:
+            return True
+
+
+class MarkerIndex:
+    """
+    Persistent map of session markers to the transcripts they were found in.
+
+    Transcripts are append-only, so a marker stays in the transcript it was
+    found in; entries are dropped once that file disappears. The oldest
+    entries are pruned beyond ``max_entries``.
+
+    Attributes:
+        path: JSON file holding the index
+        max_entries: Maximum number of markers remembered
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = MAX_INDEXED_MARKERS):
+        self.path = path or DEFAULT_MARKER_INDEX_FILE
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, object]]:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, entries: Dict[str, Dict[str, object]]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".markers-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"Failed to write session marker index {self.path}: {e}")
+
+    def get(self, marker: str) -> Optional[str]:
+        """Transcript path recorded for ``marker``, if it still exists."""
+        entry = self._load().get(marker)
+        if not isinstance(entry, dict):
+            return None
+        path = entry.get("transcript_path")
+        if isinstance(path, str) and os.path.isfile(path):
+            return path
+        return None
+
+    def set(self, marker: str, transcript_path: str) -> None:
+        """Remember which transcript contains ``marker``."""
+        with self._lock:
+            entries = self._load()
+            entries.pop(marker, None)
+            entries[marker] = {"transcript_path": transcript_path, "found_at": time.time()}
+            if len(entries) > self.max_entries:
+                for stale in list(entries)[: len(entries) - self.max_entries]:
+                    del entries[stale]
+            self._save(entries)
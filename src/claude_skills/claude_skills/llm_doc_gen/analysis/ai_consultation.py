@@ -27,7 +27,7 @@ from claude_skills.common.ai_tools import (
     ToolStatus,
 )
 from claude_skills.common import ai_config
-from claude_skills.common.ai_config import ALL_SUPPORTED_TOOLS
+from claude_skills.common.ai_config import ALL_SUPPORTED_TOOLS, is_supported_tool
 from claude_skills.common import consultation_limits
 
 # =============================================================================
@@ -423,7 +423,7 @@ def run_consultation(
     resolved_model = get_model_for_tool(tool, doc_type=doc_type, override=model_override)
     timeout = ai_config.get_timeout("code-doc", "consultation")
 
-    if tool not in ALL_SUPPORTED_TOOLS:
+    if not is_supported_tool(tool):
         return False, f"Unknown tool '{tool}'. Available tools: {', '.join(ALL_SUPPORTED_TOOLS)}"
 
     if dry_run:
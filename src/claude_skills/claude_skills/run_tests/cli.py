@@ -8,8 +8,10 @@ import json
 import sys
 from typing import Any, Dict, List, Optional
 
-from claude_skills.common import PrettyPrinter
+from claude_skills.common import PrettyPrinter, find_specs_directory, load_json_spec
 from claude_skills.common.metrics import track_metrics
+from claude_skills.common.doc_helper import get_current_git_commit
+from claude_skills.common.test_history import TestHistory
 from claude_skills.common.ai_tools import get_enabled_and_available_tools
 from claude_skills.common import ai_config
 from claude_skills.common.ai_config import ALL_SUPPORTED_TOOLS
@@ -31,7 +33,15 @@ from claude_skills.run_tests.consultation import (
     FAILURE_TYPES as CONSULT_FAILURE_TYPES,
 )
 from claude_skills.run_tests.test_discovery import print_discovery_report
+from claude_skills.run_tests.impact_selection import (
+    ImpactSelection,
+    get_changed_files,
+    get_task_files,
+    select_impacted_tests,
+)
+from claude_skills.run_tests.sharding import run_sharded
 from claude_skills.run_tests.pytest_runner import (
+    PytestRunResult,
     run_pytest,
     list_presets,
     get_presets,
@@ -211,6 +221,7 @@ def cmd_consult(args: argparse.Namespace, printer: PrettyPrinter) -> int:
             dry_run=args.dry_run,
             printer=printer,
             model_override=model_override,
+            test_id=getattr(args, "test_id", None),
         )
 
     return consult_with_auto_routing(
@@ -225,6 +236,7 @@ def cmd_consult(args: argparse.Namespace, printer: PrettyPrinter) -> int:
         dry_run=args.dry_run,
         printer=printer,
         model_override=model_override,
+        test_id=getattr(args, "test_id", None),
     )
 
 
@@ -240,6 +252,40 @@ def cmd_discover(args: argparse.Namespace, printer: PrettyPrinter) -> int:
     )
 
 
+def _select_impacted_tests(args: argparse.Namespace, printer: PrettyPrinter) -> Optional[ImpactSelection]:
+    """Resolve --changed/--impacted-by/--task into an impact selection (None on error)."""
+    changed: List[str] = []
+    if args.changed:
+        changed.extend(get_changed_files())
+    if args.impacted_by:
+        changed.extend(args.impacted_by)
+    if args.task:
+        spec_id, task_id = args.task
+        spec_data = load_json_spec(spec_id, find_specs_directory(getattr(args, "specs_dir", None)))
+        if spec_data is None:
+            return None
+        if task_id not in spec_data.get("hierarchy", {}):
+            printer.error(f"Task not found in {spec_id}: {task_id}")
+            return None
+        changed.extend(get_task_files(spec_data, task_id))
+
+    changed = list(dict.fromkeys(changed))
+    if not changed:
+        return ImpactSelection(changed_files=[], reason="no changed files")
+    return select_impacted_tests(changed, docs_path=getattr(args, "docs_path", None))
+
+
+def _record_history(result: PytestRunResult) -> None:
+    """Add a run's outcomes to the local test history (used to spot flaky tests)."""
+    if not result.results:
+        return
+    TestHistory().record(
+        [(f"{r.file_path}::{r.test_name}", r.status.value.lower(), None) for r in result.results],
+        commit=get_current_git_commit(),
+        source="run-tests",
+    )
+
+
 def cmd_run(args: argparse.Namespace, printer: PrettyPrinter) -> int:
     if args.list:
         list_presets(printer)
@@ -254,13 +300,44 @@ def cmd_run(args: argparse.Namespace, printer: PrettyPrinter) -> int:
         printer.info("Use --list to see available presets")
         return 1
 
-    return run_pytest(
-        preset=args.preset,
-        path=args.path,
-        pattern=args.pattern,
-        extra_args=args.extra_args,
-        printer=printer,
-    )
+    extra_args = args.extra_args
+    if args.changed or args.impacted_by or args.task:
+        if args.path:
+            printer.error("A test path cannot be combined with --changed, --impacted-by or --task")
+            return 1
+        selection = _select_impacted_tests(args, printer)
+        if selection is None:
+            return 1
+        if selection.full_suite:
+            printer.warning(f"Running the full suite: {selection.reason}")
+        elif not selection.test_files:
+            printer.success(f"No impacted tests to run ({selection.reason})")
+            return 0
+        else:
+            printer.info(f"Impact selection: {selection.reason}")
+            extra_args = selection.test_files + list(extra_args or [])
+
+    if args.shards and args.shards > 1:
+        result = run_sharded(
+            args.shards,
+            preset=args.preset,
+            path=args.path,
+            pattern=args.pattern,
+            extra_args=extra_args,
+            printer=printer,
+            max_failures=args.max_failures,
+        )
+    else:
+        result = run_pytest(
+            preset=args.preset,
+            path=args.path,
+            pattern=args.pattern,
+            extra_args=extra_args,
+            printer=printer,
+            max_failures=args.max_failures,
+        )
+    _record_history(result)
+    return result.exit_code
 
 
 # ---------------------------------------------------------------------------
@@ -308,6 +385,11 @@ Failure types:
     consult_parser.add_argument("--impl-code", help="Path to file containing implementation code, or inline code")
     consult_parser.add_argument("--context", help="Additional context about the issue")
     consult_parser.add_argument("--question", help="Specific question to ask (overrides defaults)")
+    consult_parser.add_argument(
+        "--test-id",
+        metavar="NODE_ID",
+        help="pytest node id of the failing test; known flaky tests are retried locally before consulting",
+    )
     consult_parser.add_argument("--tool", "-t", choices=ALL_SUPPORTED_TOOLS + ["auto"], default="auto")
     consult_parser.add_argument(
         "--model",
@@ -363,6 +445,40 @@ Failure types:
 
     run_parser.add_argument("--list", action="store_true", help="List all available presets")
     run_parser.add_argument("--pattern", "-k", help="Pattern to match test names")
+    run_parser.add_argument(
+        "--max-failures",
+        type=int,
+        metavar="N",
+        help="Stop the run as soon as N tests have failed or errored (per shard with --shards)",
+    )
+    run_parser.add_argument(
+        "--shards",
+        type=int,
+        metavar="N",
+        help="Run the tests as N concurrent pytest processes balanced by recorded file durations",
+    )
+    impact_group = run_parser.add_argument_group(
+        "impact selection",
+        "Run only the tests that reach the changed files through the documented call graph "
+        "(falls back to the full suite without documentation)",
+    )
+    impact_group.add_argument(
+        "--changed",
+        action="store_true",
+        help="Select tests impacted by uncommitted changes (git status)",
+    )
+    impact_group.add_argument(
+        "--impacted-by",
+        nargs="+",
+        metavar="FILE",
+        help="Select tests impacted by the given files",
+    )
+    impact_group.add_argument(
+        "--task",
+        nargs=2,
+        metavar=("SPEC_ID", "TASK_ID"),
+        help="Select tests impacted by the files of a spec task (metadata.file_path)",
+    )
     run_parser.add_argument("path", nargs="?", help="Test file, directory, or specific test to run")
     run_parser.add_argument("extra_args", nargs="*", help="Additional arguments to pass to pytest")
     run_parser.set_defaults(func=cmd_run)
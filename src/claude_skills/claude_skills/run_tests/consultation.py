@@ -7,6 +7,8 @@ debugging. Provides auto-routing based on failure type and prompt formatting.
 
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, NamedTuple, Sequence
+import re
+import subprocess
 import time
 
 # Add parent directory to path to import sdd_common
@@ -20,6 +22,8 @@ from claude_skills.common.ai_tools import (
 from claude_skills.common import ai_config
 from claude_skills.common.ai_config import ALL_SUPPORTED_TOOLS
 from claude_skills.common import consultation_limits
+from claude_skills.common.similarity import cluster_claims
+from claude_skills.common.test_history import DEFAULT_FLAKY_THRESHOLD, TestHistory
 
 
 # =============================================================================
@@ -570,6 +574,106 @@ def print_routing_matrix(printer: Optional[PrettyPrinter] = None) -> None:
         print(f"  {failure:15} → {primary:13} (fallback: {fallback})")
 
 
+# =============================================================================
+# KNOWN FLAKY TESTS
+# =============================================================================
+
+# Local re-runs of a known flaky test before any AI tool is consulted
+FLAKY_RETRY_ATTEMPTS = 2
+
+
+def retry_test_locally(
+    node_id: str,
+    attempts: int = FLAKY_RETRY_ATTEMPTS,
+    history: Optional[TestHistory] = None,
+) -> bool:
+    """
+    Re-run a single test with pytest until it passes or attempts run out.
+
+    Args:
+        node_id: pytest node id (e.g. ``tests/test_a.py::test_login``)
+        attempts: Maximum number of runs
+        history: Store to record the retry outcomes in (optional)
+
+    Returns:
+        True if any attempt passed
+    """
+    for _ in range(attempts):
+        start = time.monotonic()
+        try:
+            completed = subprocess.run(
+                ["pytest", node_id, "-q", "-p", "no:cacheprovider"],
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=get_consultation_timeout(),
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        passed = completed.returncode == 0
+        if history is not None:
+            history.record(
+                [(node_id, "passed" if passed else "failed", time.monotonic() - start)],
+                source="flaky-retry",
+            )
+        if passed:
+            return True
+    return False
+
+
+def _check_known_flake(
+    test_id: Optional[str],
+    history: Optional[TestHistory],
+    printer: PrettyPrinter,
+    dry_run: bool,
+    threshold: float = DEFAULT_FLAKY_THRESHOLD,
+) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Look up a failing test in the outcome history before consulting.
+
+    A known flaky test is first re-run locally; if it passes, there is nothing
+    to consult about.
+
+    Returns:
+        (note for the prompt context if the test is known to be flaky,
+        exit code if the consultation should be skipped)
+    """
+    if not test_id:
+        return None, None
+
+    if history is None:
+        history = TestHistory()
+    score = history.flakiness(test_id)
+    if not score.is_flaky(threshold):
+        return None, None
+
+    note = (
+        f"This test is known to be flaky: it flipped between passing and failing "
+        f"{score.flips} times in its last {score.runs} runs ({score.failures} failures)."
+    )
+    printer.warning(f"{test_id} is a known flaky test (flakiness {score.score:.2f})")
+
+    file_part = test_id.split("::", 1)[0]
+    if "::" not in test_id or not file_part.endswith(".py") or not Path(file_part).exists():
+        return note, None
+    if dry_run:
+        printer.info(f"Would retry it locally up to {FLAKY_RETRY_ATTEMPTS} times before consulting")
+        return note, None
+
+    printer.action(f"Retrying {test_id} locally before consulting...")
+    if retry_test_locally(test_id, history=history):
+        printer.success("Passed on a local retry; treating the failure as a flake and skipping AI consultation")
+        return note, 0
+    printer.info(f"Still failing after {FLAKY_RETRY_ATTEMPTS} local retries; consulting")
+    return note, None
+
+
+def _with_note(context: Optional[str], note: Optional[str]) -> Optional[str]:
+    if not note:
+        return context
+    return f"{context}\n\n{note}" if context else note
+
+
 def consult_with_auto_routing(
     failure_type: str,
     error_message: str,
@@ -582,10 +686,15 @@ def consult_with_auto_routing(
     dry_run: bool = False,
     printer: Optional[PrettyPrinter] = None,
     model_override: Any = None,
+    test_id: Optional[str] = None,
+    history: Optional[TestHistory] = None,
 ) -> int:
     """
     High-level consultation function with auto-routing.
 
+    When ``test_id`` names a test the outcome history knows to be flaky, it is
+    re-run locally first and the consultation is skipped if it passes.
+
     Args:
         failure_type: Type of test failure
         error_message: Error message from pytest
@@ -598,6 +707,8 @@ def consult_with_auto_routing(
         dry_run: If True, show command without running
         printer: PrettyPrinter instance (creates default if None)
         model_override: Optional explicit model override (string or mapping)
+        test_id: pytest node id of the failing test (optional)
+        history: Test outcome history (default: the local store)
 
     Returns:
         Exit code from consultation
@@ -605,6 +716,11 @@ def consult_with_auto_routing(
     if printer is None:
         printer = PrettyPrinter()
 
+    flaky_note, skip_code = _check_known_flake(test_id, history, printer, dry_run)
+    if skip_code is not None:
+        return skip_code
+    context = _with_note(context, flaky_note)
+
     routing_plan = _routing_plan_for_failure(failure_type)
 
     # Check tool availability
@@ -750,52 +866,28 @@ def run_tool_parallel(
 
 def analyze_response_similarity(response1: str, response2: str) -> List[str]:
     """
-    Simple heuristic to find consensus points between two responses.
+    Find consensus points between two responses.
+
+    Claims are matched by TF-IDF cosine similarity (see
+    ``claude_skills.common.similarity``), so paraphrased agreement counts.
 
     Args:
         response1: First response text
         response2: Second response text
 
     Returns:
-        List of consensus points (simplified)
+        List of consensus points
     """
-    # This is a simple implementation. In a more sophisticated version,
-    # we could use NLP techniques to identify semantic similarity.
-
-    consensus = []
-
-    # Common keywords that indicate agreement
-    agreement_indicators = [
-        "root cause",
-        "missing return",
-        "undefined variable",
-        "type error",
-        "fixture scope",
-        "import error",
-        "circular import",
-        "async",
-        "await",
-        "timeout",
-        "race condition",
-    ]
-
-    # Check for common indicators in both responses
-    r1_lower = response1.lower()
-    r2_lower = response2.lower()
-
-    for indicator in agreement_indicators:
-        if indicator in r1_lower and indicator in r2_lower:
-            consensus.append(f"Both identify: {indicator}")
+    report = cluster_claims({"first": response1, "second": response2})
+    consensus = [f"Both identify: {cluster.representative}" for cluster in report.consensus()]
 
     # Check for common file references
-    # Simple pattern: looks for .py files
-    import re
     files1 = set(re.findall(r'[\w/]+\.py', response1))
     files2 = set(re.findall(r'[\w/]+\.py', response2))
-    common_files = files1.intersection(files2)
+    common_files = sorted(files1.intersection(files2))
 
     if common_files:
-        consensus.append(f"Both reference files: {', '.join(list(common_files)[:3])}")
+        consensus.append(f"Both reference files: {', '.join(common_files[:3])}")
 
     return consensus if consensus else ["Responses require manual comparison"]
 
@@ -804,17 +896,23 @@ def synthesize_responses(responses: List[ConsultationResponse]) -> Dict[str, any
     """
     Synthesize multiple consultation responses into unified insights.
 
+    All successful responses are split into claims and clustered across
+    agents; points made by two or more agents become the consensus, and each
+    agent's remaining points become its unique insights.
+
     Args:
         responses: List of ConsultationResponse objects
 
     Returns:
-        Dictionary with synthesis including consensus, unique insights, etc.
+        Dictionary with synthesis including consensus, unique insights,
+        agreement scores, etc.
     """
     synthesis = {
         "successful_consultations": [],
         "failed_consultations": [],
         "consensus": [],
         "unique_insights": {},
+        "agreement": None,
         "synthesis_text": "",
         "recommendations": []
     }
@@ -837,34 +935,38 @@ def synthesize_responses(responses: List[ConsultationResponse]) -> Dict[str, any
         synthesis["recommendations"].append(f"Review {single.tool}'s analysis below")
         return synthesis
 
-    # Multiple successful consultations - find consensus
-    if len(successful) >= 2:
-        # Compare first two responses for consensus
-        consensus_points = analyze_response_similarity(
-            successful[0].output,
-            successful[1].output
-        )
-        synthesis["consensus"] = consensus_points
-
-        # Extract unique insights (simplified)
-        for resp in successful:
-            # Get first few sentences as "unique insight"
-            lines = resp.output.split('\n')
-            insight = ' '.join(lines[:3])  # First 3 lines as summary
-            synthesis["unique_insights"][resp.tool] = insight[:200] + "..."  # Truncate
-
-        # Generate synthesis text
-        tool_names = [r.tool for r in successful]
-        synthesis["synthesis_text"] = f"Consulted {len(successful)} agents: {', '.join(tool_names)}"
-
-        if consensus_points:
-            synthesis["recommendations"].append(
-                f"High confidence: {len(consensus_points)} consensus point(s) found"
-            )
+    # Multiple successful consultations - cluster claims across all agents
+    report = cluster_claims({r.tool: r.output for r in successful})
+    consensus_clusters = report.consensus()
+    synthesis["agreement"] = report.to_dict()
+    synthesis["consensus"] = [
+        f"{cluster.representative} ({', '.join(cluster.sources)})"
+        for cluster in consensus_clusters
+    ]
+
+    for resp in successful:
+        unique = [cluster.representative for cluster in report.unique_to(resp.tool)]
+        if unique:
+            insight = ' '.join(unique[:3])
         else:
-            synthesis["recommendations"].append(
-                "Review individual responses for different perspectives"
-            )
+            insight = ' '.join(resp.output.split('\n')[:3])  # First 3 lines as summary
+        synthesis["unique_insights"][resp.tool] = insight[:200] + ("..." if len(insight) > 200 else "")
+
+    # Generate synthesis text
+    tool_names = [r.tool for r in successful]
+    synthesis["synthesis_text"] = (
+        f"Consulted {len(successful)} agents: {', '.join(tool_names)} "
+        f"(agreement: {report.overall_agreement:.0%})"
+    )
+
+    if consensus_clusters:
+        synthesis["recommendations"].append(
+            f"High confidence: {len(consensus_clusters)} consensus point(s) found"
+        )
+    else:
+        synthesis["recommendations"].append(
+            "Review individual responses for different perspectives"
+        )
 
     return synthesis
 
@@ -971,10 +1073,15 @@ def consult_multi_agent(
     dry_run: bool = False,
     printer: Optional[PrettyPrinter] = None,
     model_override: Any = None,
+    test_id: Optional[str] = None,
+    history: Optional[TestHistory] = None,
 ) -> int:
     """
     Consult multiple agents in parallel and synthesize their responses.
 
+    Known flaky tests (see ``test_id``) are retried locally first and, if
+    they keep failing, get a single-agent consultation instead of consensus.
+
     Args:
         failure_type: Type of test failure.
         error_message: Error message from pytest.
@@ -989,6 +1096,8 @@ def consult_multi_agent(
         dry_run: If True, show what would be run without executing.
         printer: PrettyPrinter instance (creates default if None).
         model_override: Optional explicit model override (string or mapping).
+        test_id: pytest node id of the failing test (optional).
+        history: Test outcome history (default: the local store).
 
     Returns:
         Exit code (0 if at least one consultation succeeded).
@@ -996,6 +1105,24 @@ def consult_multi_agent(
     if printer is None:
         printer = PrettyPrinter()
 
+    flaky_note, skip_code = _check_known_flake(test_id, history, printer, dry_run)
+    if skip_code is not None:
+        return skip_code
+    if flaky_note:
+        printer.info("Known flaky test: using a single-agent consultation instead of consensus")
+        return consult_with_auto_routing(
+            failure_type=failure_type,
+            error_message=error_message,
+            hypothesis=hypothesis,
+            test_code_path=test_code_path,
+            impl_code_path=impl_code_path,
+            context=_with_note(context, flaky_note),
+            question=question,
+            dry_run=dry_run,
+            printer=printer,
+            model_override=model_override,
+        )
+
     configured_agents = _resolve_consensus_agents(agents)
     available_tools = get_enabled_and_available_tools("run-tests")
 
@@ -0,0 +1,284 @@
+"""
+Persistent, mtime-indexed test discovery.
+
+Test discovery used to walk the tree once per glob pattern and regex-scan
+every test file on each call. ``TestDiscoveryIndex`` walks the tree once,
+stores each test and conftest file's path, mtime, size and AST analysis
+(test functions, classes, fixtures, markers, ...) in a JSON index under
+``~/.cache/sdd-toolkit/test_discovery/``, and on later runs only re-analyzes
+files whose mtime or size changed.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from claude_skills.common.paths import iter_matching_files
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISCOVERY_CACHE_DIR = Path.home() / ".cache" / "sdd-toolkit" / "test_discovery"
+INDEX_VERSION = 1
+
+TEST_FILE_PATTERNS = ("test_*.py", "*_test.py")
+CONFTEST_FILE = "conftest.py"
+
+MAX_IMPORTS = 10
+
+
+def _dotted_name(node: ast.AST) -> str:
+    """``pytest.mark.slow`` for an Attribute/Name chain ('' otherwise)."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return ""
+
+
+def _decorator_name(decorator: ast.AST) -> str:
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    return _dotted_name(decorator)
+
+
+def _marker_name(expr: ast.AST) -> Optional[str]:
+    """Marker name of a ``pytest.mark.<name>`` (or ``mark.<name>``) expression."""
+    parts = _decorator_name(expr).split(".")
+    if len(parts) >= 2 and parts[-2] == "mark":
+        return parts[-1]
+    return None
+
+
+def _fixture_name(func: ast.AST) -> Optional[str]:
+    """Fixture name if ``func`` is decorated with ``@pytest.fixture``/``@fixture``."""
+    for decorator in func.decorator_list:
+        if _decorator_name(decorator).split(".")[-1] != "fixture":
+            continue
+        if isinstance(decorator, ast.Call):
+            for keyword in decorator.keywords:
+                if keyword.arg == "name" and isinstance(keyword.value, ast.Constant):
+                    return str(keyword.value.value)
+        return func.name
+    return None
+
+
+def _string_list(node: ast.AST) -> List[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [e.value for e in node.elts if isinstance(e, ast.Constant) and isinstance(e.value, str)]
+    return []
+
+
+def analyze_source(content: str) -> Dict[str, Any]:
+    """
+    Analyze a test or conftest module with ``ast``.
+
+    Unlike a text scan, this ignores commented-out code and strings, finds
+    test methods inside ``Test*`` classes, and sees module-level
+    ``pytestmark`` markers.
+
+    Args:
+        content: Python source
+
+    Returns:
+        Dictionary with test_functions, test_classes, test_methods
+        (``Class::method``), fixtures, imports (first 10), markers (a set),
+        parametrize (decorator count), hooks and plugins
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    tree = ast.parse(content)
+    info: Dict[str, Any] = {
+        "test_functions": [],
+        "test_classes": [],
+        "test_methods": [],
+        "fixtures": [],
+        "imports": [],
+        "markers": set(),
+        "parametrize": 0,
+        "hooks": [],
+        "plugins": [],
+    }
+    functions = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+    for node in tree.body:
+        if isinstance(node, functions) and node.name.startswith("test_"):
+            info["test_functions"].append(node.name)
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            info["test_classes"].append(node.name)
+            info["test_methods"].extend(
+                f"{node.name}::{item.name}"
+                for item in node.body
+                if isinstance(item, functions) and item.name.startswith("test_")
+            )
+        elif isinstance(node, ast.Import):
+            info["imports"].extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            info["imports"].append("." * node.level + (node.module or ""))
+        elif isinstance(node, ast.Assign):
+            targets = [t.id for t in node.targets if isinstance(t, ast.Name)]
+            if "pytestmark" in targets:
+                values = node.value.elts if isinstance(node.value, (ast.List, ast.Tuple)) else [node.value]
+                info["markers"].update(m for m in map(_marker_name, values) if m)
+            if "pytest_plugins" in targets:
+                info["plugins"] = _string_list(node.value)
+    info["imports"] = info["imports"][:MAX_IMPORTS]
+
+    for node in ast.walk(tree):
+        if not isinstance(node, functions + (ast.ClassDef,)):
+            continue
+        for decorator in node.decorator_list:
+            marker = _marker_name(decorator)
+            if marker:
+                info["markers"].add(marker)
+                if marker == "parametrize":
+                    info["parametrize"] += 1
+        if isinstance(node, functions):
+            fixture = _fixture_name(node)
+            if fixture:
+                info["fixtures"].append(fixture)
+            elif node.name.startswith("pytest_"):
+                info["hooks"].append(node.name)
+
+    return info
+
+
+def analyze_path(file_path: Path) -> Dict[str, Any]:
+    """
+    Analyze a file on disk (see ``analyze_source``).
+
+    Read and parse problems are reported in an ``error`` key instead of
+    being raised.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        return analyze_source(content)
+    except UnicodeDecodeError:
+        error = "File encoding error (not UTF-8)"
+    except PermissionError:
+        error = "Permission denied"
+    except SyntaxError as e:
+        error = f"Syntax error at line {e.lineno}: {e.msg}"
+    except Exception as e:
+        error = f"Error analyzing file: {str(e)}"
+
+    info = analyze_source("")
+    info["error"] = error
+    return info
+
+
+class TestDiscoveryIndex:
+    """
+    Test and conftest files under a root with their cached analyses.
+
+    Call ``refresh()`` to bring the index up to date: the tree is walked
+    once, unchanged files (same mtime and size) keep their stored analysis,
+    and the index is saved back only if something changed.
+
+    Attributes:
+        root: Resolved project root
+        cache_dir: Directory holding index files (one per root)
+        use_cache: Load/save the persisted index (False: analyze everything)
+        reanalyzed: Number of files analyzed by the last refresh
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, root: Path, cache_dir: Optional[Path] = None, use_cache: bool = True):
+        self.root = Path(root).resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_DISCOVERY_CACHE_DIR
+        self.use_cache = use_cache
+        self.reanalyzed = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def index_path(self) -> Path:
+        digest = hashlib.sha1(str(self.root).encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{digest}.json"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with self.index_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION or data.get("root") != str(self.root):
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _save(self) -> None:
+        data = {"version": INDEX_VERSION, "root": str(self.root), "files": self._entries}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".index-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.debug(f"Failed to write test discovery index {self.index_path}: {e}")
+
+    def refresh(self) -> "TestDiscoveryIndex":
+        """Rescan the tree and re-analyze new or modified files."""
+        previous = self._load() if self.use_cache else {}
+        entries: Dict[str, Dict[str, Any]] = {}
+        self.reanalyzed = 0
+
+        for path in iter_matching_files(self.root, TEST_FILE_PATTERNS + (CONFTEST_FILE,)):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            rel_path = path.relative_to(self.root).as_posix()
+            cached = previous.get(rel_path)
+            if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+                entries[rel_path] = cached
+                continue
+            analysis = analyze_path(path)
+            analysis["markers"] = sorted(analysis["markers"])
+            entries[rel_path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "conftest": path.name == CONFTEST_FILE,
+                "analysis": analysis,
+            }
+            self.reanalyzed += 1
+
+        changed = self.reanalyzed > 0 or entries.keys() != previous.keys()
+        self._entries = entries
+        if self.use_cache and changed:
+            self._save()
+        logger.debug(f"Test discovery index: {len(entries)} file(s), {self.reanalyzed} re-analyzed")
+        return self
+
+    def test_files(self) -> List[Path]:
+        """Indexed test files, sorted."""
+        return sorted(self.root / p for p, e in self._entries.items() if not e.get("conftest"))
+
+    def conftest_files(self) -> List[Path]:
+        """Indexed conftest.py files, sorted."""
+        return sorted(self.root / p for p, e in self._entries.items() if e.get("conftest"))
+
+    def analysis(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Stored analysis of an indexed file (markers as a set), or None."""
+        try:
+            rel_path = Path(file_path).resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        entry = self._entries.get(rel_path)
+        if entry is None:
+            return None
+        info = dict(entry["analysis"])
+        info["markers"] = set(info.get("markers", ()))
+        return info
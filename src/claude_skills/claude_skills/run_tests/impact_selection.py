@@ -0,0 +1,341 @@
+"""
+Test impact selection from the documentation call graph.
+
+Maps changed source files to the test modules that reach them, so
+``sdd test run --changed`` (or ``--impacted-by FILE ...``) only runs those
+tests. Reachability is computed over the documented codebase
+(``codebase.json``, see doc_query) as a file-level graph with an edge from A
+to B when a function in A calls a function in B or A imports B; every file
+with a path back to a changed file is impacted, and impacted test files are
+selected. Test files are modules under a ``test``/``tests`` directory whose
+name matches pytest's ``python_files`` setting, so source modules such as
+``common/test_history.py`` are followed like any other source file.
+
+Selection falls back to the full suite whenever the answer could be
+incomplete: no documentation, a changed source file that the
+documentation does not know about (e.g. a new module), or a changed file
+that can affect any test without being imported by it (non-Python files
+such as pytest.ini or JSON fixtures, ``conftest.py``, and test helpers).
+"""
+
+import configparser
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: pyproject.toml settings are not read
+    tomllib = None
+
+from claude_skills.common.git_metadata import find_git_root, parse_git_status
+
+logger = logging.getLogger(__name__)
+
+# pytest's default ``python_files``
+DEFAULT_PYTHON_FILES = ('test_*.py', '*_test.py')
+TEST_DIRECTORY_NAMES = frozenset({'test', 'tests'})
+
+
+@dataclass
+class ImpactSelection:
+    """Tests selected for a set of changed files.
+
+    Attributes:
+        changed_files: Files the selection was computed for
+        test_files: Impacted test files (runnable paths), sorted
+        full_suite: True if the whole suite should run instead
+        reason: Why the full suite is needed, or a summary of the selection
+        unknown_files: Changed source files missing from the documentation
+        global_files: Changed files that can affect any test (non-Python
+            files, conftest.py, non-test modules under test directories)
+    """
+    changed_files: List[str]
+    test_files: List[str] = field(default_factory=list)
+    full_suite: bool = False
+    reason: str = ""
+    unknown_files: List[str] = field(default_factory=list)
+    global_files: List[str] = field(default_factory=list)
+
+
+def get_changed_files(start_path: Optional[Path] = None) -> List[str]:
+    """Uncommitted changes (staged, unstaged and untracked) from git status."""
+    repo_root = find_git_root(start_path)
+    if repo_root is None:
+        return []
+    changed = []
+    for entry in parse_git_status(repo_root):
+        path = entry['path']
+        if ' -> ' in path:
+            # Renames are reported as "old -> new"
+            path = path.split(' -> ', 1)[1]
+        changed.append(path)
+    return changed
+
+
+def get_task_files(spec_data: Dict[str, Any], task_id: str) -> List[str]:
+    """file_path metadata of a task and everything nested under it."""
+    hierarchy = spec_data.get('hierarchy', {})
+    files: List[str] = []
+    queue = deque([task_id])
+    seen: Set[str] = set()
+    while queue:
+        node_id = queue.popleft()
+        if node_id in seen or node_id not in hierarchy:
+            continue
+        seen.add(node_id)
+        node = hierarchy[node_id]
+        file_path = (node.get('metadata') or {}).get('file_path')
+        if file_path and file_path not in files:
+            files.append(file_path)
+        queue.extend(node.get('children', []) or [])
+    return files
+
+
+def _parts(path: str) -> tuple:
+    return tuple(p for p in PurePosixPath(path.replace('\\', '/')).parts if p not in ('.', '/'))
+
+
+def _module_names(file_path: str) -> List[str]:
+    """Dotted names an import could use for a file (every package suffix)."""
+    parts = list(_parts(file_path))
+    if not parts:
+        return []
+    stem = PurePosixPath(parts[-1]).stem
+    parts = parts[:-1] if stem == '__init__' else parts[:-1] + [stem]
+    return ['.'.join(parts[i:]) for i in range(len(parts)) if parts[i:]]
+
+
+class _FileGraph:
+    """Reverse dependency graph between documented files."""
+
+    def __init__(self, data: Dict[str, Any]):
+        functions = data.get('functions', []) or []
+        files: Set[str] = {f.get('file', '') for f in functions}
+        files.update(c.get('file', '') for c in data.get('classes', []) or [])
+        files.update(m.get('file', '') for m in data.get('modules', []) or [])
+        files.update((data.get('dependencies') or {}).keys())
+        files.discard('')
+        self.files = files
+
+        # Index for matching paths from git (relative to the repo root) to
+        # documentation paths (often relative to a source directory)
+        self._by_suffix: Dict[tuple, Set[str]] = {}
+        for file_path in files:
+            parts = _parts(file_path)
+            for i in range(len(parts)):
+                self._by_suffix.setdefault(parts[i:], set()).add(file_path)
+
+        self.dependents: Dict[str, Set[str]] = {}
+
+        # Call edges (schema v2.0 cross-references)
+        for func in functions:
+            func_file = func.get('file', '')
+            for caller in func.get('callers', []) or []:
+                if isinstance(caller, dict) and caller.get('file'):
+                    self._add_edge(caller['file'], func_file)
+            for call in func.get('calls', []) or []:
+                if isinstance(call, dict) and call.get('file'):
+                    self._add_edge(func_file, call['file'])
+
+        module_files: Dict[str, Set[str]] = {}
+        for file_path in files:
+            for name in _module_names(file_path):
+                module_files.setdefault(name, set()).add(file_path)
+
+        imports: Dict[str, Set[str]] = {}
+        for module_path, deps in (data.get('dependencies') or {}).items():
+            imports.setdefault(module_path, set()).update(deps)
+        for module in data.get('modules', []) or []:
+            if module.get('file'):
+                imports.setdefault(module['file'], set()).update(module.get('imports', []) or [])
+
+        # Import edges
+        for importer, names in imports.items():
+            for name in names:
+                for target in self.resolve(name) or module_files.get(str(name).lstrip('.'), set()):
+                    self._add_edge(importer, target)
+
+    def _add_edge(self, source: str, target: str) -> None:
+        if source and target and source != target:
+            self.dependents.setdefault(target, set()).add(source)
+
+    def resolve(self, path: str) -> Set[str]:
+        """Documented files matching a path (either may be a suffix of the other)."""
+        parts = _parts(str(path))
+        if not parts:
+            return set()
+        matches = set(self._by_suffix.get(parts, set()))
+        for i in range(1, len(parts)):
+            matches.update(f for f in self._by_suffix.get(parts[i:], ()) if _parts(f) == parts[i:])
+        return matches
+
+    def reachable_from(self, start: Iterable[str]) -> Set[str]:
+        """Every file with a dependency path to one of ``start``."""
+        seen = set(start)
+        queue = deque(seen)
+        while queue:
+            current = queue.popleft()
+            for dependent in self.dependents.get(current, ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+        return seen
+
+
+def _python_files_patterns(roots: Sequence[Path]) -> Sequence[str]:
+    """
+    pytest's ``python_files`` setting from the first pytest configuration in ``roots``.
+
+    Files are checked in pytest's order (pytest.ini, pyproject.toml, tox.ini,
+    setup.cfg); DEFAULT_PYTHON_FILES is returned when none sets it.
+    """
+    for root in roots:
+        for name, section in (('pytest.ini', 'pytest'), ('pyproject.toml', None),
+                              ('tox.ini', 'pytest'), ('setup.cfg', 'tool:pytest')):
+            config_path = Path(root) / name
+            if not config_path.is_file():
+                continue
+            try:
+                if section is None:
+                    if tomllib is None:
+                        continue
+                    with open(config_path, 'rb') as f:
+                        options = tomllib.load(f).get('tool', {}).get('pytest', {}).get('ini_options')
+                    if options is None:
+                        continue
+                    value = options.get('python_files')
+                else:
+                    parser = configparser.ConfigParser(interpolation=None)
+                    parser.read(config_path, encoding='utf-8')
+                    if not parser.has_section(section):
+                        continue
+                    value = parser.get(section, 'python_files', fallback=None)
+            except (OSError, ValueError, configparser.Error) as e:
+                logger.debug(f"Could not read pytest settings from {config_path}: {e}")
+                continue
+            if isinstance(value, str):
+                value = value.split()
+            return tuple(value) if value else DEFAULT_PYTHON_FILES
+    return DEFAULT_PYTHON_FILES
+
+
+def _in_test_directory(file_path: str) -> bool:
+    return any(part.lower() in TEST_DIRECTORY_NAMES for part in _parts(file_path)[:-1])
+
+
+def _is_test_module(file_path: str, patterns: Sequence[str] = DEFAULT_PYTHON_FILES) -> bool:
+    """Whether ``file_path`` is a test module: under a test directory and named like one."""
+    name = PurePosixPath(file_path.replace('\\', '/')).name
+    return _in_test_directory(file_path) and any(fnmatch(name, pattern) for pattern in patterns)
+
+
+def _affects_all_tests(file_path: str, patterns: Sequence[str] = DEFAULT_PYTHON_FILES) -> bool:
+    """Changed files whose effect on tests the call graph cannot see."""
+    name = PurePosixPath(file_path.replace('\\', '/')).name
+    if not name.endswith('.py') or name == 'conftest.py':
+        return True
+    # Fixtures and helpers living next to the tests
+    return _in_test_directory(file_path) and not _is_test_module(file_path, patterns)
+
+
+def _runnable_path(file_path: str, roots: List[Path]) -> Optional[str]:
+    """A path to ``file_path`` that pytest can use from the current directory."""
+    for root in roots:
+        candidate = root / file_path
+        if candidate.exists():
+            try:
+                return str(candidate.relative_to(Path.cwd()))
+            except ValueError:
+                return str(candidate)
+    return None
+
+
+def select_impacted_tests(
+    changed_files: List[str],
+    docs_path: Optional[str] = None,
+    query: Optional[Any] = None,
+    roots: Optional[List[Path]] = None,
+) -> ImpactSelection:
+    """
+    Select the test files impacted by ``changed_files``.
+
+    Args:
+        changed_files: Changed source or test files
+        docs_path: Documentation location (auto-detected if None)
+        query: Loaded DocumentationQuery (loaded from docs_path if None)
+        roots: Directories documentation paths may be relative to (default:
+            the current directory and the git root)
+
+    Returns:
+        ImpactSelection; ``full_suite`` is set when the selection cannot be
+        trusted and every test should run
+    """
+    selection = ImpactSelection(changed_files=list(changed_files))
+
+    if query is None:
+        from claude_skills.doc_query.doc_query_lib import DocumentationQuery
+
+        query = DocumentationQuery(docs_path)
+        if not query.docs_path.exists() or not query.load():
+            selection.full_suite = True
+            selection.reason = "no codebase documentation found (run `sdd doc generate` to enable test selection)"
+            return selection
+
+    if roots is None:
+        roots = [Path.cwd()]
+        git_root = find_git_root()
+        if git_root is not None and git_root.resolve() != Path.cwd().resolve():
+            roots.append(git_root)
+
+    graph = _FileGraph(query.data or {})
+    patterns = _python_files_patterns(roots)
+
+    start: Set[str] = set()
+    direct_tests: Set[str] = set()
+    for changed in changed_files:
+        if _affects_all_tests(changed, patterns):
+            selection.global_files.append(changed)
+            continue
+        matches = graph.resolve(changed)
+        # Dependents are followed from every changed file, test modules included
+        start.update(matches)
+        if _is_test_module(changed, patterns):
+            direct_tests.update(matches or {changed})
+        elif not matches:
+            selection.unknown_files.append(changed)
+
+    if selection.global_files:
+        selection.full_suite = True
+        selection.reason = (
+            f"{len(selection.global_files)} changed file(s) can affect any test "
+            f"(e.g. {selection.global_files[0]})"
+        )
+        return selection
+
+    if selection.unknown_files:
+        selection.full_suite = True
+        selection.reason = (
+            f"{len(selection.unknown_files)} changed file(s) not in the documentation "
+            f"(e.g. {selection.unknown_files[0]})"
+        )
+        return selection
+
+    impacted = graph.reachable_from(start)
+    tests = {f for f in impacted if _is_test_module(f, patterns)} | direct_tests
+    runnable = {_runnable_path(f, roots) for f in tests}
+    runnable.discard(None)
+    if tests and not runnable:
+        selection.full_suite = True
+        selection.reason = "impacted test files could not be located from the current directory"
+        return selection
+
+    selection.test_files = sorted(runnable)
+    selection.reason = (
+        f"{len(selection.test_files)} test file(s) reach {len(changed_files)} changed file(s)"
+    )
+    logger.debug(f"Impact selection: {len(impacted)} impacted file(s), {len(tests)} test file(s)")
+    return selection
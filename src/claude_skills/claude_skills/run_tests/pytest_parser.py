@@ -43,8 +43,9 @@ class ProgressInfo(NamedTuple):
 # Regex patterns for pytest output
 # Matches: tests/test_file.py::test_name PASSED   [ 50%]
 # Matches: tests/test_file.py::TestClass::test_method FAILED  [100%]
+# Matches: tests/test_file.py::test_x[tests/conftest.py-a b] PASSED
 TEST_RESULT_PATTERN = re.compile(
-    r'^(.+?)::([\w\[\]\-:,\.]+)\s+'  # file::test_name (with parametrize support)
+    r'^(.+?)::([\w\-:,\.]+(?:\[.*\])?)\s+'  # file::test_name (any parametrize id)
     r'(PASSED|FAILED|SKIPPED|ERROR|XFAIL|XPASS)'  # status
     r'(?:\s+\[\s*(\d+)%\])?'  # optional percentage
 )
@@ -130,6 +131,15 @@ class PytestOutputParser:
 
         return result
 
+    def add_result(self, result: TestResult) -> None:
+        """
+        Count a result parsed elsewhere (e.g. to merge several pytest runs).
+
+        Args:
+            result: Test result to count
+        """
+        self._update_counts(result)
+
     def _update_counts(self, result: TestResult) -> None:
         """
         Update running counts based on test result.
@@ -0,0 +1 @@
+"""Standalone pytest plugins loaded into test runs started by run-tests."""
@@ -0,0 +1,75 @@
+"""
+pytest plugin used by ``sdd test run --shards``.
+
+Loaded with ``-p sdd_shard`` (its directory is put on PYTHONPATH), so it only
+depends on the standard library and pytest and works in whatever
+environment runs the tests.
+
+- ``SDD_SHARD_COLLECT_FILE``: after collection, write the rootdir and the
+  number of selected tests per file (absolute paths) to this JSON file.
+- ``SDD_SHARD_EXCLUDE_FILE``: JSON list of absolute test file paths that
+  belong to other shards; they are not collected.
+- ``SDD_SHARD_DURATIONS_FILE``: at the end of the session, write the total
+  time (setup, call and teardown) per test file, keyed by the file's
+  rootdir-relative path, to this JSON file.
+"""
+
+import json
+import os
+
+COLLECT_ENV = "SDD_SHARD_COLLECT_FILE"
+EXCLUDE_ENV = "SDD_SHARD_EXCLUDE_FILE"
+DURATIONS_ENV = "SDD_SHARD_DURATIONS_FILE"
+
+_excluded = set()
+_durations = {}
+
+
+def _normalize(path):
+    return os.path.normcase(os.path.abspath(str(path)))
+
+
+def pytest_configure(config):
+    exclude_file = os.environ.get(EXCLUDE_ENV)
+    if exclude_file:
+        with open(exclude_file, "r", encoding="utf-8") as f:
+            _excluded.update(_normalize(p) for p in json.load(f))
+
+
+def pytest_ignore_collect(collection_path, config):
+    if _excluded and _normalize(collection_path) in _excluded:
+        return True
+    return None
+
+
+def pytest_collection_modifyitems(session, config, items):
+    if _excluded:
+        # Explicit file arguments are not always routed through
+        # pytest_ignore_collect, so deselect what slipped through
+        deselected = [item for item in items if _normalize(item.path) in _excluded]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if _normalize(item.path) not in _excluded]
+
+    collect_file = os.environ.get(COLLECT_ENV)
+    if collect_file:
+        counts = {}
+        for item in items:
+            path = _normalize(item.path)
+            counts[path] = counts.get(path, 0) + 1
+        with open(collect_file, "w", encoding="utf-8") as f:
+            json.dump({"rootdir": str(config.rootpath), "files": counts}, f)
+
+
+def pytest_runtest_logreport(report):
+    if os.environ.get(DURATIONS_ENV):
+        # Node ids start with the rootdir-relative file path
+        path = report.nodeid.split("::", 1)[0]
+        _durations[path] = _durations.get(path, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session, exitstatus):
+    durations_file = os.environ.get(DURATIONS_ENV)
+    if durations_file:
+        with open(durations_file, "w", encoding="utf-8") as f:
+            json.dump(_durations, f)
@@ -6,12 +6,21 @@ Simplifies running pytest with appropriate flags for different debugging and tes
 """
 
 import subprocess
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 # Add parent directory to path to import sdd_common
 
 from claude_skills.common import PrettyPrinter
+from claude_skills.run_tests.pytest_parser import (
+    ProgressInfo,
+    PytestOutputParser,
+    PytestProgressDisplay,
+    TestResult,
+    TestStatus,
+)
 
 
 def _detect_source_directory() -> Optional[str]:
@@ -165,25 +174,166 @@ def build_pytest_command(
     return cmd
 
 
+@dataclass
+class PytestRunResult:
+    """Outcome of a streamed pytest run.
+
+    Attributes:
+        exit_code: Exit code to report (pytest's, or 1 if stopped early)
+        results: Per-test results in the order pytest reported them
+        progress: Final counts
+        stopped_early: Whether the run was stopped after max_failures
+    """
+    exit_code: int
+    results: List[TestResult] = field(default_factory=list)
+    progress: ProgressInfo = field(default_factory=lambda: PytestOutputParser().get_progress())
+    stopped_early: bool = False
+
+    @property
+    def failures(self) -> List[TestResult]:
+        """Failed and errored tests."""
+        return [r for r in self.results if r.status in (TestStatus.FAILED, TestStatus.ERROR)]
+
+
+# Flags whose output must reach the terminal untouched (interactive or not test runs)
+_PASSTHROUGH_FLAGS = {"--pdb", "--trace", "--markers", "--fixtures", "--collect-only", "--co"}
+_VERBOSITY_FLAGS = ("-v", "-q", "--verbose", "--quiet")
+
+
+def _needs_passthrough(cmd: List[str]) -> bool:
+    return any(arg in _PASSTHROUGH_FLAGS for arg in cmd)
+
+
+def _ensure_verbose(cmd: List[str]) -> List[str]:
+    """Add -v so pytest reports one line per test, unless verbosity is set."""
+    if any(arg.startswith(_VERBOSITY_FLAGS) for arg in cmd[1:]):
+        return cmd
+    return cmd[:1] + ["-v"] + cmd[1:]
+
+
+def _stop_process(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def stream_pytest(
+    cmd: List[str],
+    max_failures: Optional[int] = None,
+    display: Optional[PytestProgressDisplay] = None,
+    on_result: Optional[Callable[[TestResult], None]] = None,
+    echo: bool = True,
+    on_line: Optional[Callable[[str], None]] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> PytestRunResult:
+    """
+    Run a pytest command, parsing its output as it is produced.
+
+    Args:
+        cmd: pytest command line
+        max_failures: Stop pytest once this many tests failed or errored
+        display: Progress display updated after every test result
+        on_result: Called with each test result as soon as it is reported
+        echo: Write pytest's output through to stdout
+        on_line: Called with every raw output line (e.g. to keep the output)
+        env: Environment for the pytest process (default: inherited)
+
+    Returns:
+        PytestRunResult with per-test results and final counts
+
+    Raises:
+        FileNotFoundError: If pytest cannot be started
+    """
+    parser = PytestOutputParser()
+    results: List[TestResult] = []
+    stopped_early = False
+
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        errors="replace",
+        env=env,
+    )
+    try:
+        assert process.stdout is not None
+        for line in process.stdout:
+            if echo:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+            if on_line is not None:
+                on_line(line)
+
+            result = parser.parse_line(line)
+            if result is None:
+                continue
+
+            results.append(result)
+            progress = parser.get_progress()
+            if display is not None:
+                display.update(progress, current_file=result.file_path)
+            if on_result is not None:
+                on_result(result)
+
+            if max_failures and progress.failed + progress.errors >= max_failures:
+                stopped_early = True
+                _stop_process(process)
+                break
+        exit_code = process.wait()
+    except BaseException:
+        _stop_process(process)
+        raise
+    finally:
+        if process.stdout is not None:
+            process.stdout.close()
+
+    progress = parser.get_progress()
+    if display is not None:
+        display.finish(progress)
+
+    return PytestRunResult(
+        exit_code=1 if stopped_early else exit_code,
+        results=results,
+        progress=progress,
+        stopped_early=stopped_early,
+    )
+
+
 def run_pytest(
     preset: Optional[str] = None,
     path: Optional[str] = None,
     pattern: Optional[str] = None,
     extra_args: Optional[List[str]] = None,
-    printer: Optional[PrettyPrinter] = None
-) -> int:
+    printer: Optional[PrettyPrinter] = None,
+    max_failures: Optional[int] = None,
+    show_progress: Optional[bool] = None,
+    on_result: Optional[Callable[[TestResult], None]] = None,
+) -> PytestRunResult:
     """
     Run pytest with the specified configuration.
 
+    Output is streamed through PytestOutputParser while pytest runs, so
+    results are available (and failures can stop the run) before it ends.
+    Interactive or listing runs (--pdb, --markers, ...) are passed through
+    unparsed.
+
     Args:
         preset: Name of the preset to use
         path: Specific test file or directory to run
         pattern: Pattern to match test names (used with -k)
         extra_args: Additional arguments to pass to pytest
         printer: PrettyPrinter instance (creates default if None)
+        max_failures: Stop the run once this many tests failed or errored
+        show_progress: Show a live progress bar (default: when stdout is a TTY)
+        on_result: Called with each test result as soon as it is reported
 
     Returns:
-        Exit code from pytest
+        PytestRunResult with the exit code, per-test results and final counts
     """
     if printer is None:
         printer = PrettyPrinter()
@@ -194,9 +344,12 @@ def run_pytest(
         # Check if it's a specific test (contains ::)
         if "::" not in path and not path_obj.exists():
             printer.error(f"Path not found: {path}")
-            return 1
+            return PytestRunResult(exit_code=1)
 
     cmd = build_pytest_command(preset, path, pattern, extra_args)
+    passthrough = _needs_passthrough(cmd)
+    if not passthrough:
+        cmd = _ensure_verbose(cmd)
 
     # Print the command being run
     printer.action(f"Running: {' '.join(cmd)}")
@@ -204,18 +357,38 @@ def run_pytest(
 
     # Run pytest
     try:
-        result = subprocess.run(cmd, check=False)
-        return result.returncode
+        if passthrough:
+            result = subprocess.run(cmd, check=False)
+            return PytestRunResult(exit_code=result.returncode)
+
+        if show_progress is None:
+            show_progress = sys.stdout.isatty()
+        if not show_progress:
+            run_result = stream_pytest(cmd, max_failures=max_failures, on_result=on_result)
+        else:
+            from rich.progress import Progress
+
+            with Progress(transient=False) as progress:
+                display = PytestProgressDisplay(progress)
+                run_result = stream_pytest(
+                    cmd, max_failures=max_failures, display=display, on_result=on_result
+                )
+
+        if run_result.stopped_early:
+            printer.warning(
+                f"Stopped after {len(run_result.failures)} failure(s) (--max-failures {max_failures})"
+            )
+        return run_result
     except FileNotFoundError:
         printer.error("pytest not found. Is it installed?")
         printer.info("Install with: pip install pytest")
-        return 1
+        return PytestRunResult(exit_code=1)
     except KeyboardInterrupt:
         printer.warning("\nTest run interrupted by user")
-        return 130
+        return PytestRunResult(exit_code=130)
     except Exception as e:
         printer.error(f"Unexpected error running pytest: {e}")
-        return 1
+        return PytestRunResult(exit_code=1)
 
 
 def get_presets() -> Dict[str, Dict[str, str]]:
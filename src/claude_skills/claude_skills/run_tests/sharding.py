@@ -0,0 +1,451 @@
+"""
+Duration-balanced sharded pytest runs.
+
+``sdd test run --shards N`` runs the selected tests as N concurrent pytest
+processes, without needing pytest-xdist:
+
+1. The tests are collected once (``--collect-only``) with the same options,
+   giving the test files and how many tests each contributes.
+2. Files are packed into shards longest-processing-time first: from the
+   slowest to the fastest, each file goes to the shard with the smallest
+   total so far. File durations come from previous runs (recorded by the
+   ``sdd_shard`` plugin); files without history are estimated from their
+   test count.
+3. Each shard runs the original pytest command while the ``sdd_shard``
+   plugin (see ``pytest_plugins/``) skips the files of the other shards, so
+   paths, node ids, ``-k`` and ``-m`` keep working unchanged.
+4. Results are parsed as they stream in and merged into one progress
+   summary; per-file durations are recorded for the next run and, if
+   ``--junitxml`` was given, the shards' junit reports are merged into it.
+"""
+
+import heapq
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from claude_skills.common import PrettyPrinter
+from claude_skills.run_tests.pytest_parser import (
+    PytestOutputParser,
+    PytestProgressDisplay,
+    TestResult,
+    format_progress_summary,
+)
+from claude_skills.run_tests.pytest_plugins import sdd_shard
+from claude_skills.run_tests.pytest_runner import (
+    PytestRunResult,
+    _ensure_verbose,
+    _needs_passthrough,
+    build_pytest_command,
+    stream_pytest,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DURATIONS_FILE = Path.home() / ".cache" / "sdd-toolkit" / "test_durations.json"
+DURATIONS_VERSION = 1
+
+# Estimated seconds per test for files with no recorded duration
+DEFAULT_SECONDS_PER_TEST = 0.05
+
+_PLUGIN_DIR = str(Path(sdd_shard.__file__).parent)
+_JUNIT_FLAGS = ("--junitxml", "--junit-xml")
+_VERBOSITY_ARGS = ("-v", "-q", "--verbose", "--quiet")
+
+
+class DurationHistory:
+    """
+    Per-file test durations from earlier runs, keyed by pytest rootdir.
+
+    Attributes:
+        path: JSON file holding the durations
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or DEFAULT_DURATIONS_FILE
+        self._lock = threading.Lock()
+
+    def _load_all(self) -> Dict[str, Dict[str, float]]:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != DURATIONS_VERSION:
+            return {}
+        projects = data.get("projects")
+        return projects if isinstance(projects, dict) else {}
+
+    def load(self, rootdir: str) -> Dict[str, float]:
+        """Recorded durations (seconds) by file path relative to ``rootdir``."""
+        durations = self._load_all().get(rootdir, {})
+        return durations if isinstance(durations, dict) else {}
+
+    def update(self, rootdir: str, durations: Dict[str, float]) -> None:
+        """Record the latest durations of the given files (failures are ignored)."""
+        if not durations:
+            return
+        with self._lock:
+            projects = self._load_all()
+            projects.setdefault(rootdir, {}).update(durations)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".durations-", suffix=".json")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": DURATIONS_VERSION, "projects": projects}, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.debug(f"Failed to write test durations {self.path}: {e}")
+
+
+def partition_files(durations: Dict[str, float], shards: int) -> List[List[str]]:
+    """
+    Split files into at most ``shards`` groups with balanced total duration.
+
+    Longest-processing-time first: files are taken from the slowest to the
+    fastest and each is added to the currently lightest shard. Ties are
+    broken by file name, so the split is deterministic.
+
+    Args:
+        durations: Expected seconds per file
+        shards: Number of shards
+
+    Returns:
+        Non-empty shards, each a sorted list of files
+    """
+    count = max(1, min(shards, len(durations)))
+    heap: List[Tuple[float, int]] = [(0.0, i) for i in range(count)]
+    groups: List[List[str]] = [[] for _ in range(count)]
+
+    for file_path in sorted(durations, key=lambda f: (-durations[f], f)):
+        load, index = heapq.heappop(heap)
+        groups[index].append(file_path)
+        heapq.heappush(heap, (load + durations[file_path], index))
+
+    return [sorted(group) for group in groups if group]
+
+
+def estimate_durations(test_counts: Dict[str, int], history: Dict[str, float]) -> Dict[str, float]:
+    """
+    Expected duration of each file.
+
+    Files with history use it; the rest are estimated from their test count
+    at the average per-test time of the files with history (or
+    ``DEFAULT_SECONDS_PER_TEST``).
+    """
+    known = {f: history[f] for f in test_counts if isinstance(history.get(f), (int, float))}
+    known_tests = sum(test_counts[f] for f in known)
+    per_test = sum(known.values()) / known_tests if known_tests else DEFAULT_SECONDS_PER_TEST
+    return {f: known.get(f, test_counts[f] * per_test) for f in test_counts}
+
+
+def _split_junit_args(cmd: List[str]) -> Tuple[List[str], Optional[str]]:
+    """Remove --junitxml options from a command, returning the requested path."""
+    stripped: List[str] = []
+    junit_path = None
+    skip_next = False
+    for i, arg in enumerate(cmd):
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in _JUNIT_FLAGS:
+            junit_path = cmd[i + 1] if i + 1 < len(cmd) else None
+            skip_next = True
+        elif arg.startswith(tuple(f"{flag}=" for flag in _JUNIT_FLAGS)):
+            junit_path = arg.split("=", 1)[1]
+        else:
+            stripped.append(arg)
+    return stripped, junit_path
+
+
+def _plugin_env(**variables: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (_PLUGIN_DIR, env.get("PYTHONPATH")) if p)
+    env.update(variables)
+    return env
+
+
+def collect_test_files(cmd: List[str], work_dir: Path) -> Tuple[Optional[dict], str]:
+    """
+    Collect the tests ``cmd`` would run.
+
+    Returns:
+        ({"rootdir": ..., "files": {absolute path: test count}} or None on
+        failure, collection output)
+    """
+    collect_file = work_dir / "collected.json"
+    collect_cmd = [arg for arg in cmd if not arg.startswith(_VERBOSITY_ARGS)]
+    collect_cmd += ["-p", "sdd_shard", "--collect-only", "-q"]
+    completed = subprocess.run(
+        collect_cmd,
+        capture_output=True,
+        text=True,
+        errors="replace",
+        env=_plugin_env(**{sdd_shard.COLLECT_ENV: str(collect_file)}),
+        check=False,
+    )
+    output = completed.stdout + completed.stderr
+    try:
+        with collect_file.open("r", encoding="utf-8") as f:
+            return json.load(f), output
+    except (OSError, ValueError):
+        return None, output
+
+
+def read_shard_durations(durations_file: Path) -> Dict[str, float]:
+    """Per-file durations written by the ``sdd_shard`` plugin (empty if missing)."""
+    try:
+        with durations_file.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not read shard durations {durations_file}: {e}")
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        Path(path).as_posix(): float(seconds)
+        for path, seconds in data.items()
+        if isinstance(seconds, (int, float))
+    }
+
+
+def merge_junit_reports(reports: List[Path], output: Path) -> None:
+    """Combine the test suites of several junit reports into one file."""
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    total_time = 0.0
+    for report in reports:
+        try:
+            root = ET.parse(report).getroot()
+        except (OSError, ET.ParseError) as e:
+            logger.debug(f"Skipping unreadable junit report {report}: {e}")
+            continue
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            for key in totals:
+                totals[key] += int(suite.get(key, 0) or 0)
+            total_time += float(suite.get("time", 0) or 0)
+            merged.append(suite)
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    merged.set("time", f"{total_time:.3f}")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(merged).write(output, encoding="utf-8", xml_declaration=True)
+
+
+def merge_exit_codes(codes: List[int]) -> int:
+    """Exit code for a sharded run (5, "no tests collected", only if no shard ran tests)."""
+    ran = [code for code in codes if code != 5]
+    if not ran:
+        return 5 if codes else 0
+    return max(ran)
+
+
+@dataclass
+class ShardRun:
+    """One shard of a sharded run.
+
+    Attributes:
+        files: Test files (absolute paths) in the shard
+        expected_seconds: Estimated duration from history
+        result: Parsed outcome (set when the shard finished)
+        elapsed: Wall-clock seconds the shard took
+        output: Raw pytest output
+    """
+    files: List[str]
+    expected_seconds: float
+    result: Optional[PytestRunResult] = None
+    elapsed: float = 0.0
+    output: List[str] = field(default_factory=list)
+
+
+def _failure_report(output: List[str]) -> List[str]:
+    """The FAILURES/ERRORS sections and short summary of a pytest run's output."""
+    for i, line in enumerate(output):
+        stripped = line.strip()
+        if stripped.startswith("=") and (" FAILURES " in stripped or " ERRORS " in stripped):
+            return output[i:]
+    return []
+
+
+def run_sharded(
+    shards: int,
+    preset: Optional[str] = None,
+    path: Optional[str] = None,
+    pattern: Optional[str] = None,
+    extra_args: Optional[List[str]] = None,
+    printer: Optional[PrettyPrinter] = None,
+    max_failures: Optional[int] = None,
+    show_progress: Optional[bool] = None,
+    history: Optional[DurationHistory] = None,
+) -> PytestRunResult:
+    """
+    Run pytest as ``shards`` concurrent, duration-balanced processes.
+
+    Args:
+        shards: Number of concurrent pytest processes
+        preset, path, pattern, extra_args: As for ``run_pytest``; a
+            ``--junitxml`` option receives the merged report
+        printer: PrettyPrinter instance (creates default if None)
+        max_failures: Stop each shard once this many of its tests failed
+        show_progress: Show a live progress bar (default: when stdout is a TTY)
+        history: Duration store (default: ~/.cache/sdd-toolkit/test_durations.json)
+
+    Returns:
+        PytestRunResult merging all shards
+    """
+    if printer is None:
+        printer = PrettyPrinter()
+    if history is None:
+        history = DurationHistory()
+
+    if path and "::" not in path and not Path(path).exists():
+        printer.error(f"Path not found: {path}")
+        return PytestRunResult(exit_code=1)
+
+    cmd, junit_output = _split_junit_args(build_pytest_command(preset, path, pattern, extra_args))
+    if _needs_passthrough(cmd):
+        printer.error("Interactive and listing runs (--pdb, --markers, ...) cannot be sharded")
+        return PytestRunResult(exit_code=1)
+
+    with tempfile.TemporaryDirectory(prefix="sdd-shards-") as tmp:
+        work_dir = Path(tmp)
+        try:
+            collected, collect_output = collect_test_files(cmd, work_dir)
+        except FileNotFoundError:
+            printer.error("pytest not found. Is it installed?")
+            return PytestRunResult(exit_code=1)
+        if collected is None:
+            sys.stdout.write(collect_output)
+            printer.error("Test collection failed; cannot split the run into shards")
+            return PytestRunResult(exit_code=1)
+
+        rootdir = collected["rootdir"]
+        counts: Dict[str, int] = collected["files"]
+        if not counts:
+            printer.warning("No tests collected")
+            return PytestRunResult(exit_code=5)
+
+        relative = {f: Path(os.path.relpath(f, rootdir)).as_posix() for f in counts}
+        recorded = history.load(rootdir)
+        expected = estimate_durations(counts, {f: recorded[r] for f, r in relative.items() if r in recorded})
+        runs = [
+            ShardRun(files=group, expected_seconds=sum(expected[f] for f in group))
+            for group in partition_files(expected, shards)
+        ]
+        total_tests = sum(counts.values())
+        printer.action(
+            f"Running {total_tests} tests from {len(counts)} files in {len(runs)} shards: {' '.join(cmd)}"
+        )
+        printer.blank()
+
+        merged_parser = PytestOutputParser()
+        merged_lock = threading.Lock()
+        results: List[TestResult] = []
+        display: Optional[PytestProgressDisplay] = None
+
+        def on_result(result: TestResult) -> None:
+            with merged_lock:
+                merged_parser.add_result(result)
+                results.append(result)
+                if display is not None:
+                    display.update(merged_parser.get_progress(), current_file=result.file_path)
+
+        def run_shard(index: int) -> None:
+            shard = runs[index]
+            others = [f for other in runs if other is not shard for f in other.files]
+            exclude_file = work_dir / f"shard-{index}-exclude.json"
+            exclude_file.write_text(json.dumps(others), encoding="utf-8")
+            shard_cmd = _ensure_verbose(cmd) + ["-p", "sdd_shard"]
+            if junit_output:
+                shard_cmd.append(f"--junitxml={work_dir / f'shard-{index}.xml'}")
+            start = time.monotonic()
+            shard.result = stream_pytest(
+                shard_cmd,
+                max_failures=max_failures,
+                on_result=on_result,
+                echo=False,
+                on_line=shard.output.append,
+                env=_plugin_env(**{
+                    sdd_shard.EXCLUDE_ENV: str(exclude_file),
+                    sdd_shard.DURATIONS_ENV: str(work_dir / f"shard-{index}-durations.json"),
+                }),
+            )
+            shard.elapsed = time.monotonic() - start
+
+        if show_progress is None:
+            show_progress = sys.stdout.isatty()
+        start = time.monotonic()
+        try:
+            if show_progress:
+                from rich.progress import Progress
+
+                with Progress(transient=False) as progress:
+                    display = PytestProgressDisplay(progress, total_tests=total_tests)
+                    with ThreadPoolExecutor(max_workers=len(runs)) as executor:
+                        list(executor.map(run_shard, range(len(runs))))
+                    display.finish(merged_parser.get_progress())
+            else:
+                with ThreadPoolExecutor(max_workers=len(runs)) as executor:
+                    list(executor.map(run_shard, range(len(runs))))
+        except FileNotFoundError:
+            printer.error("pytest not found. Is it installed?")
+            return PytestRunResult(exit_code=1)
+        except KeyboardInterrupt:
+            printer.warning("\nTest run interrupted by user")
+            return PytestRunResult(exit_code=130)
+        wall_seconds = time.monotonic() - start
+
+        durations: Dict[str, float] = {}
+        for index in range(len(runs)):
+            durations.update(read_shard_durations(work_dir / f"shard-{index}-durations.json"))
+        history.update(rootdir, durations)
+        if junit_output:
+            merge_junit_reports([work_dir / f"shard-{i}.xml" for i in range(len(runs))], Path(junit_output))
+
+    for index, shard in enumerate(runs, start=1):
+        summary = format_progress_summary(shard.result.progress) if shard.result else "did not run"
+        printer.detail(
+            f"Shard {index}/{len(runs)}: {len(shard.files)} files, {shard.elapsed:.1f}s "
+            f"(expected {shard.expected_seconds:.1f}s) - {summary}",
+            indent=0,
+        )
+        if shard.result and shard.result.exit_code not in (0, 5):
+            report = _failure_report(shard.output) or shard.output[-20:]
+            sys.stdout.write("".join(report))
+
+    # The percentage is measured against what was collected, not what was parsed
+    progress = merged_parser.get_progress()
+    progress = progress._replace(percentage=min(100, progress.total_run * 100 // total_tests))
+    shard_seconds = sum(shard.elapsed for shard in runs)
+    exit_code = merge_exit_codes([shard.result.exit_code for shard in runs if shard.result])
+    summary = f"{format_progress_summary(progress)} in {wall_seconds:.1f}s ({shard_seconds:.1f}s across shards)"
+    printer.blank()
+    if exit_code == 0:
+        printer.success(summary)
+    else:
+        printer.error(summary)
+
+    stopped_early = any(shard.result and shard.result.stopped_early for shard in runs)
+    if progress.total_run < total_tests and not stopped_early:
+        printer.warning(
+            f"{total_tests - progress.total_run} of {total_tests} collected tests reported no result"
+        )
+    if stopped_early:
+        printer.warning(f"Shards stopped after {max_failures} failure(s) (--max-failures {max_failures})")
+    return PytestRunResult(
+        exit_code=exit_code,
+        results=results,
+        progress=progress,
+        stopped_early=stopped_early,
+    )
@@ -5,14 +5,18 @@ Discovers and analyzes test structure in a project, including test files,
 fixtures, markers, configuration, and organization.
 """
 
-import re
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
-# Add parent directory to path to import sdd_common
-
 from claude_skills.common import PrettyPrinter
+from claude_skills.common.paths import iter_matching_files
+from claude_skills.run_tests.discovery_index import (
+    CONFTEST_FILE,
+    TEST_FILE_PATTERNS,
+    TestDiscoveryIndex,
+    analyze_path,
+)
 
 
 def find_test_files(root_dir: str = ".") -> List[Path]:
@@ -26,16 +30,7 @@ def find_test_files(root_dir: str = ".") -> List[Path]:
         List of Path objects for test files
     """
     root = Path(root_dir).resolve()
-    test_files = []
-
-    # Common test file patterns
-    patterns = ["test_*.py", "*_test.py"]
-
-    for pattern in patterns:
-        test_files.extend(root.rglob(pattern))
-
-    # Remove duplicates and sort
-    return sorted(set(test_files))
+    return sorted(set(iter_matching_files(root, TEST_FILE_PATTERNS)))
 
 
 def find_conftest_files(root_dir: str = ".") -> List[Path]:
@@ -49,12 +44,12 @@ def find_conftest_files(root_dir: str = ".") -> List[Path]:
         List of Path objects for conftest.py files
     """
     root = Path(root_dir).resolve()
-    return sorted(root.rglob("conftest.py"))
+    return sorted(iter_matching_files(root, [CONFTEST_FILE]))
 
 
 def analyze_test_file(file_path: Path) -> Dict:
     """
-    Analyze a test file for its structure.
+    Analyze a test file for its structure (parsed with ``ast``).
 
     Args:
         file_path: Path to the test file
@@ -65,56 +60,27 @@ def analyze_test_file(file_path: Path) -> Dict:
     info = {
         "test_functions": [],
         "test_classes": [],
+        "test_methods": [],
         "fixtures": [],
         "imports": [],
         "markers": set(),
         "parametrize": 0,
     }
 
-    try:
-        # Validate file exists and is readable
-        if not file_path.exists():
-            info["error"] = "File not found"
-            return info
-
-        if not file_path.is_file():
-            info["error"] = "Not a file"
-            return info
-
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Find test functions
-        test_funcs = re.findall(r'^def (test_\w+)\(', content, re.MULTILINE)
-        info["test_functions"] = test_funcs
-
-        # Find test classes
-        test_classes = re.findall(r'^class (Test\w+)', content, re.MULTILINE)
-        info["test_classes"] = test_classes
+    # Validate file exists and is readable
+    if not file_path.exists():
+        info["error"] = "File not found"
+        return info
 
-        # Find fixtures
-        fixtures = re.findall(r'@pytest\.fixture.*?\ndef (\w+)\(', content, re.DOTALL)
-        info["fixtures"] = fixtures
-
-        # Find imports
-        imports = re.findall(r'^(?:from|import)\s+(\S+)', content, re.MULTILINE)
-        info["imports"] = imports[:10]  # Limit to first 10
-
-        # Find markers
-        markers = re.findall(r'@pytest\.mark\.(\w+)', content)
-        info["markers"] = set(markers)
-
-        # Count parametrize decorators
-        info["parametrize"] = len(re.findall(r'@pytest\.mark\.parametrize', content))
-
-    except UnicodeDecodeError:
-        info["error"] = "File encoding error (not UTF-8)"
-    except PermissionError:
-        info["error"] = "Permission denied"
-    except Exception as e:
-        info["error"] = f"Error analyzing file: {str(e)}"
+    if not file_path.is_file():
+        info["error"] = "Not a file"
+        return info
 
+    analysis = analyze_path(file_path)
+    for key in ("test_functions", "test_classes", "test_methods", "fixtures", "imports", "markers", "parametrize"):
+        info[key] = analysis[key]
+    if "error" in analysis:
+        info["error"] = analysis["error"]
     return info
 
 
@@ -134,45 +100,20 @@ def analyze_conftest(file_path: Path) -> Dict:
         "plugins": [],
     }
 
-    try:
-        # Validate file exists and is readable
-        if not file_path.exists():
-            info["error"] = "File not found"
-            return info
-
-        if not file_path.is_file():
-            info["error"] = "Not a file"
-            return info
-
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Find fixtures
-        fixtures = re.findall(
-            r'@pytest\.fixture(?:\([^)]*\))?\s*\ndef (\w+)\(',
-            content,
-            re.DOTALL
-        )
-        info["fixtures"] = fixtures
-
-        # Find pytest hooks
-        hooks = re.findall(r'def (pytest_\w+)\(', content)
-        info["hooks"] = hooks
-
-        # Find pytest plugins
-        plugins = re.findall(r'pytest_plugins\s*=\s*\[(.*?)\]', content, re.DOTALL)
-        if plugins:
-            plugin_list = re.findall(r'["\']([^"\']+)["\']', plugins[0])
-            info["plugins"] = plugin_list
-
-    except UnicodeDecodeError:
-        info["error"] = "File encoding error (not UTF-8)"
-    except PermissionError:
-        info["error"] = "Permission denied"
-    except Exception as e:
-        info["error"] = f"Error analyzing file: {str(e)}"
+    # Validate file exists and is readable
+    if not file_path.exists():
+        info["error"] = "File not found"
+        return info
 
+    if not file_path.is_file():
+        info["error"] = "Not a file"
+        return info
+
+    analysis = analyze_path(file_path)
+    for key in ("fixtures", "hooks", "plugins"):
+        info[key] = analysis[key]
+    if "error" in analysis:
+        info["error"] = analysis["error"]
     return info
 
 
@@ -222,13 +163,24 @@ def print_tree_structure(structure: Dict, indent: int = 0):
             print(f"{'  ' * (indent + 1)}{file}")
 
 
-def get_summary_stats(test_files: List[Path], conftest_files: List[Path]) -> Dict:
+def _analyze(file_path: Path, index: Optional[TestDiscoveryIndex], analyze) -> Dict:
+    """Cached analysis from ``index`` when available, else analyze the file."""
+    analysis = index.analysis(file_path) if index is not None else None
+    return analysis if analysis is not None else analyze(file_path)
+
+
+def get_summary_stats(
+    test_files: List[Path],
+    conftest_files: List[Path],
+    index: Optional[TestDiscoveryIndex] = None,
+) -> Dict:
     """
     Get summary statistics for all test files.
 
     Args:
         test_files: List of test file paths
         conftest_files: List of conftest file paths
+        index: Refreshed discovery index to take analyses from (optional)
 
     Returns:
         Dictionary with summary statistics
@@ -238,13 +190,13 @@ def get_summary_stats(test_files: List[Path], conftest_files: List[Path]) -> Dic
     all_markers = set()
 
     for test_file in test_files:
-        analysis = analyze_test_file(test_file)
+        analysis = _analyze(test_file, index, analyze_test_file)
         total_tests += len(analysis["test_functions"])
-        total_tests += sum(1 for _ in analysis["test_classes"])  # Approximate
+        total_tests += len(analysis.get("test_methods", []))
         all_markers.update(analysis["markers"])
 
     for conftest in conftest_files:
-        analysis = analyze_conftest(conftest)
+        analysis = _analyze(conftest, index, analyze_conftest)
         total_fixtures += len(analysis["fixtures"])
 
     return {
@@ -254,13 +206,18 @@ def get_summary_stats(test_files: List[Path], conftest_files: List[Path]) -> Dic
     }
 
 
-def collect_all_fixtures(conftest_files: List[Path], root: Path) -> Dict[str, List[str]]:
+def collect_all_fixtures(
+    conftest_files: List[Path],
+    root: Path,
+    index: Optional[TestDiscoveryIndex] = None,
+) -> Dict[str, List[str]]:
     """
     Collect all fixtures from conftest files.
 
     Args:
         conftest_files: List of conftest file paths
         root: Root directory path
+        index: Refreshed discovery index to take analyses from (optional)
 
     Returns:
         Dictionary mapping fixture names to their locations
@@ -273,19 +230,23 @@ def collect_all_fixtures(conftest_files: List[Path], root: Path) -> Dict[str, Li
         except ValueError:
             rel_path = conftest
 
-        analysis = analyze_conftest(conftest)
+        analysis = _analyze(conftest, index, analyze_conftest)
         for fixture in analysis["fixtures"]:
             all_fixtures[fixture].append(str(rel_path))
 
     return dict(all_fixtures)
 
 
-def collect_all_markers(test_files: List[Path]) -> Dict[str, int]:
+def collect_all_markers(
+    test_files: List[Path],
+    index: Optional[TestDiscoveryIndex] = None,
+) -> Dict[str, int]:
     """
     Collect all markers from test files with usage counts.
 
     Args:
         test_files: List of test file paths
+        index: Refreshed discovery index to take analyses from (optional)
 
     Returns:
         Dictionary mapping marker names to usage counts
@@ -293,7 +254,7 @@ def collect_all_markers(test_files: List[Path]) -> Dict[str, int]:
     all_markers = defaultdict(int)
 
     for test_file in test_files:
-        analysis = analyze_test_file(test_file)
+        analysis = _analyze(test_file, index, analyze_test_file)
         for marker in analysis["markers"]:
             all_markers[marker] += 1
 
@@ -307,7 +268,8 @@ def print_discovery_report(
     show_fixtures: bool = False,
     show_markers: bool = False,
     show_detailed: bool = False,
-    printer: Optional[PrettyPrinter] = None
+    printer: Optional[PrettyPrinter] = None,
+    use_cache: bool = True,
 ) -> int:
     """
     Print a comprehensive discovery report.
@@ -320,6 +282,7 @@ def print_discovery_report(
         show_markers: Show all markers
         show_detailed: Show detailed analysis of each file
         printer: PrettyPrinter instance (creates default if None)
+        use_cache: Reuse the persisted discovery index for unchanged files
 
     Returns:
         Exit code (0 for success, 1 for error)
@@ -333,9 +296,10 @@ def print_discovery_report(
         printer.error(f"Directory '{root_dir}' not found")
         return 1
 
-    # Find all test files and conftest files
-    test_files = find_test_files(root)
-    conftest_files = find_conftest_files(root)
+    # Find all test files and conftest files (analyses are cached by mtime)
+    index = TestDiscoveryIndex(root, use_cache=use_cache).refresh()
+    test_files = index.test_files()
+    conftest_files = index.conftest_files()
 
     if not test_files and not conftest_files:
         printer.warning("No test files or conftest.py files found")
@@ -350,7 +314,7 @@ def print_discovery_report(
 
     # Summary
     if show_summary:
-        stats = get_summary_stats(test_files, conftest_files)
+        stats = get_summary_stats(test_files, conftest_files, index)
         print(f"Total test functions: ~{stats['total_tests']}")
         print(f"Total fixtures: {stats['total_fixtures']}")
         markers_str = ', '.join(stats['markers']) if stats['markers'] else 'None'
@@ -375,7 +339,7 @@ def print_discovery_report(
             except ValueError:
                 rel_path = conftest
 
-            analysis = analyze_conftest(conftest)
+            analysis = _analyze(conftest, index, analyze_conftest)
             print(f"\n{rel_path}")
 
             if analysis["fixtures"]:
@@ -393,7 +357,7 @@ def print_discovery_report(
 
     # Show all fixtures if requested
     if show_fixtures:
-        all_fixtures = collect_all_fixtures(conftest_files, root)
+        all_fixtures = collect_all_fixtures(conftest_files, root, index)
 
         print("All Fixtures:")
         print("-" * 60)
@@ -408,7 +372,7 @@ def print_discovery_report(
 
     # Show all markers if requested
     if show_markers:
-        all_markers = collect_all_markers(test_files)
+        all_markers = collect_all_markers(test_files, index)
 
         print("Markers Found:")
         print("-" * 60)
@@ -430,7 +394,7 @@ def print_discovery_report(
             except ValueError:
                 rel_path = test_file
 
-            analysis = analyze_test_file(test_file)
+            analysis = _analyze(test_file, index, analyze_test_file)
 
             print(f"\n{rel_path}")
             print(f"  Test functions: {len(analysis['test_functions'])}")
@@ -442,6 +406,7 @@ def print_discovery_report(
 
             if analysis["test_classes"]:
                 print(f"  Test classes: {', '.join(analysis['test_classes'])}")
+                print(f"  Test methods: {len(analysis.get('test_methods', []))}")
 
             if analysis["fixtures"]:
                 print(f"  Defines fixtures: {', '.join(analysis['fixtures'])}")
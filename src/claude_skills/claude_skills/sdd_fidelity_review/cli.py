@@ -13,8 +13,15 @@ from collections import OrderedDict
 from typing import Optional, List, Callable, Dict, Any
 from pathlib import Path
 
-from .review import FidelityReviewer
+from .review import DEFAULT_PROMPT_TOKEN_BUDGET, FidelityReviewer
 from .report import FidelityReport
+from .sharding import (
+    SHARD_MODES,
+    build_shard_prompts,
+    merge_shard_responses,
+    plan_review_shards,
+    run_sharded_review,
+)
 from .consultation import (
     consult_multiple_ai_on_fidelity,
     parse_multiple_responses,
@@ -28,7 +35,7 @@ from claude_skills.common.ai_tools import (
     get_enabled_and_available_tools,
     check_tool_available
 )
-from claude_skills.common.ai_config import ALL_SUPPORTED_TOOLS
+from claude_skills.common.ai_config import ALL_SUPPORTED_TOOLS, STUB_TOOL
 from claude_skills.common.progress import ProgressEmitter
 from claude_skills.common.sdd_config import get_default_format, get_json_compact
 from claude_skills.common.json_output import output_json
@@ -101,6 +108,7 @@ def _create_fidelity_report(
     consensus,
     categorized_issues,
     models_metadata: Dict[str, Any],
+    shards: Optional[List[Dict[str, Any]]] = None,
 ) -> FidelityReport:
     review_results = {
         "spec_id": reviewer.spec_id,
@@ -109,6 +117,8 @@ def _create_fidelity_report(
         "categorized_issues": categorized_issues,
         "parsed_responses": parsed_responses,
     }
+    if shards:
+        review_results["shards"] = shards
     return FidelityReport(review_results)
 
 
@@ -164,7 +174,11 @@ def _handle_fidelity_review(args: argparse.Namespace, printer=None) -> int:
 
         # Check if incremental mode is requested
         incremental = args.incremental if hasattr(args, 'incremental') else False
-        reviewer = FidelityReviewer(args.spec_id, spec_path=base_specs_dir, incremental=incremental)
+        reviewer_kwargs: Dict[str, Any] = {"spec_path": base_specs_dir, "incremental": incremental}
+        test_workers = getattr(args, 'test_workers', None)
+        if test_workers:
+            reviewer_kwargs["test_workers"] = test_workers
+        reviewer = FidelityReviewer(args.spec_id, **reviewer_kwargs)
 
         if reviewer.spec_data is None:
             print(f"Error: Failed to load specification {args.spec_id}", file=sys.stderr)
@@ -177,23 +191,56 @@ def _handle_fidelity_review(args: argparse.Namespace, printer=None) -> int:
         task_id = args.task if hasattr(args, 'task') and args.task else None
         phase_id = args.phase if hasattr(args, 'phase') and args.phase else None
         file_paths = args.files if hasattr(args, 'files') and args.files else None
+        shard_mode = getattr(args, 'shard', None)
+        max_prompt_tokens = getattr(args, 'max_prompt_tokens', None) or DEFAULT_PROMPT_TOKEN_BUDGET
 
-        prompt = reviewer.generate_review_prompt(
-            task_id=task_id,
-            phase_id=phase_id,
-            file_paths=file_paths,
-            include_tests=not args.no_tests,
-            base_branch=args.base_branch
-        )
+        if shard_mode and (task_id or phase_id or file_paths):
+            print("Error: --shard only applies to full-spec reviews (omit --task/--phase/--files)", file=sys.stderr)
+            return 1
+
+        shards = []
+        if shard_mode:
+            # Sharded full-spec review: one prompt (and cache entry) per shard
+            shards = plan_review_shards(reviewer, shard_mode)
+            if not shards:
+                print(f"Error: No tasks found to shard in {args.spec_id}", file=sys.stderr)
+                return 1
+            if hasattr(args, 'verbose') and args.verbose:
+                print(f"Split review into {len(shards)} {shard_mode} shard(s)", file=sys.stderr)
+            prompt = None
+        else:
+            prompt = reviewer.generate_review_prompt(
+                task_id=task_id,
+                phase_id=phase_id,
+                file_paths=file_paths,
+                include_tests=not args.no_tests,
+                base_branch=args.base_branch,
+                max_prompt_tokens=max_prompt_tokens
+            )
 
         scope_info = {
             "task": task_id,
             "phase": phase_id,
             "files": file_paths,
         }
+        if shard_mode:
+            scope_info["shard"] = shard_mode
+            scope_info["shards"] = [shard.shard_id for shard in shards]
 
         # If no-ai flag, just show prompt and exit
         if args.no_ai:
+            if shard_mode:
+                shard_prompts = build_shard_prompts(
+                    reviewer,
+                    shards,
+                    include_tests=not args.no_tests,
+                    base_branch=args.base_branch,
+                    max_prompt_tokens=max_prompt_tokens,
+                )
+                prompt = "\n\n".join(
+                    f"<!-- shard: {shard_id} -->\n{shard_prompt}"
+                    for shard_id, shard_prompt in shard_prompts.items()
+                )
             summary_payload = {
                 "spec_id": args.spec_id,
                 "mode": "no-ai",
@@ -239,14 +286,31 @@ def _handle_fidelity_review(args: argparse.Namespace, printer=None) -> int:
                 auto_detect_tty=False
             )
 
+        shard_summaries: List[Dict[str, Any]] = []
         try:
-            responses = consult_multiple_ai_on_fidelity(
-                prompt=prompt,
-                tools=args.ai_tools if hasattr(args, 'ai_tools') else None,
-                model=args.model if hasattr(args, 'model') else None,
-                timeout=args.timeout,
-                progress_emitter=progress_emitter
-            )
+            if shard_mode:
+                shard_results = run_sharded_review(
+                    reviewer,
+                    shards,
+                    tools=args.ai_tools if hasattr(args, 'ai_tools') else None,
+                    model=args.model if hasattr(args, 'model') else None,
+                    timeout=args.timeout,
+                    max_concurrency=getattr(args, 'max_concurrency', None),
+                    include_tests=not args.no_tests,
+                    base_branch=args.base_branch,
+                    max_prompt_tokens=max_prompt_tokens,
+                    progress_emitter=progress_emitter
+                )
+                responses = [resp for result in shard_results for resp in result.responses]
+                shard_summaries = [result.to_dict() for result in shard_results]
+            else:
+                responses = consult_multiple_ai_on_fidelity(
+                    prompt=prompt,
+                    tools=args.ai_tools if hasattr(args, 'ai_tools') else None,
+                    model=args.model if hasattr(args, 'model') else None,
+                    timeout=args.timeout,
+                    progress_emitter=progress_emitter
+                )
         except NoToolsAvailableError as e:
             print(f"Error: {e}", file=sys.stderr)
             print(f"Tip: Install AI consultation tools ({', '.join(ALL_SUPPORTED_TOOLS)})", file=sys.stderr)
@@ -265,7 +329,11 @@ def _handle_fidelity_review(args: argparse.Namespace, printer=None) -> int:
         if hasattr(args, 'verbose') and args.verbose:
             print(f"Parsing {len(response_list)} AI responses...", file=sys.stderr)
 
-        parsed_responses = parse_multiple_responses(response_list)
+        if shard_mode:
+            # One merged response per tool keeps consensus detection per model
+            parsed_responses = merge_shard_responses(shard_results)
+        else:
+            parsed_responses = parse_multiple_responses(response_list)
 
         # Step 5: Detect consensus
         consensus_threshold = args.consensus_threshold if hasattr(args, 'consensus_threshold') else 2
@@ -297,6 +365,7 @@ def _handle_fidelity_review(args: argparse.Namespace, printer=None) -> int:
             consensus,
             categorized_issues,
             models_metadata,
+            shards=shard_summaries,
         )
 
         compact = getattr(args, "compact", None)
@@ -584,7 +653,7 @@ def register_fidelity_review_command(subparsers: argparse._SubParsersAction, par
     parser.add_argument(
         "--ai-tools",
         nargs="+",
-        choices=ALL_SUPPORTED_TOOLS,
+        choices=ALL_SUPPORTED_TOOLS + [STUB_TOOL],
         metavar="TOOL",
         help="AI tools to consult (default: all available)"
     )
@@ -617,6 +686,32 @@ def register_fidelity_review_command(subparsers: argparse._SubParsersAction, par
         action="store_true",
         help="Skip test results in review"
     )
+    parser.add_argument(
+        "--test-workers",
+        type=int,
+        metavar="N",
+        help="Run review tests with N pytest-xdist workers (requires pytest-xdist)"
+    )
+    parser.add_argument(
+        "--max-prompt-tokens",
+        type=int,
+        metavar="N",
+        help=f"Approximate token budget for the review prompt (default: {DEFAULT_PROMPT_TOKEN_BUDGET}); "
+             "journals, test details and diffs are summarized or truncated to fit"
+    )
+    parser.add_argument(
+        "--shard",
+        choices=SHARD_MODES,
+        help="Split a full-spec review into per-phase or per-task-group shards that are "
+             "consulted concurrently and cached separately"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        metavar="N",
+        help="Maximum shards consulted at once with --shard "
+             "(default: sharding.max_concurrency from config, or 2)"
+    )
     parser.add_argument(
         "--base-branch",
         default="main",
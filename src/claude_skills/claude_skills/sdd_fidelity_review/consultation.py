@@ -20,6 +20,7 @@ from claude_skills.common.progress import ProgressEmitter
 from claude_skills.common import ai_config
 from claude_skills.common.ai_config import ALL_SUPPORTED_TOOLS
 from claude_skills.common import consultation_limits
+from claude_skills.common.similarity import cluster_items
 
 # Import cache modules with fallback
 try:
@@ -64,6 +65,24 @@ def get_enabled_fidelity_tools() -> Dict[str, Dict]:
     return ai_config.get_enabled_tools(FIDELITY_SKILL_NAME)
 
 
+DEFAULT_SHARD_CONCURRENCY = 2
+
+
+def get_fidelity_shard_concurrency() -> int:
+    """
+    Get the maximum number of review shards consulted at once from config.
+
+    Reads ``sharding.max_concurrency`` for sdd-fidelity-review (defaults to 2).
+    Each shard still consults its tools in parallel.
+    """
+    sharding = ai_config.load_skill_config(FIDELITY_SKILL_NAME).get("sharding", {})
+    if isinstance(sharding, dict):
+        value = sharding.get("max_concurrency")
+        if isinstance(value, int) and value > 0:
+            return value
+    return DEFAULT_SHARD_CONCURRENCY
+
+
 class FidelityVerdict(Enum):
     """Overall fidelity verdict from AI review."""
     PASS = "pass"
@@ -757,7 +776,8 @@ def consult_multiple_ai_on_fidelity(
         model: Model to request (optional, tool-specific)
         timeout: Timeout in seconds per tool (default: 120)
         require_all_success: If True, raise exception if any tool fails
-        cache_key_params: Parameters for cache key generation (spec_id, scope, target, file_paths)
+        cache_key_params: Parameters for cache key generation (spec_id, scope, target, file_paths,
+                          and optionally content_hash)
         use_cache: Enable caching (overrides config, defaults to config setting)
         progress_emitter: Optional ProgressEmitter for emitting structured events (cache_check,
                           ai_consultation, model_response, cache_save, complete)
@@ -862,6 +882,7 @@ def consult_multiple_ai_on_fidelity(
                     file_paths=cache_key_params.get("file_paths"),
                     models=resolved_models_map,
                     model=model,
+                    content_hash=cache_key_params.get("content_hash"),
                 )
 
                 cached_data = cache.get(cache_key)
@@ -921,12 +942,22 @@ def consult_multiple_ai_on_fidelity(
             if resolved_model
         }
         models_dict = models_dict_raw if models_dict_raw else None
+        parallel_kwargs: Dict[str, Any] = {}
+        completion_policy = ai_config.get_completion_policy(FIDELITY_SKILL_NAME)
+        if completion_policy != "all":
+            parallel_kwargs["policy"] = completion_policy
         multi_response = ai_tools.execute_tools_parallel(
             tools=final_tools_to_consult,
             prompt=prompt,
             models=models_dict,
-            timeout=timeout
+            timeout=timeout,
+            **parallel_kwargs
         )
+        if multi_response.abandoned:
+            logger.info(
+                f"Completion policy {multi_response.policy} met; "
+                f"abandoned: {', '.join(multi_response.abandoned)}"
+            )
         # Extract list of responses from MultiToolResponse dataclass
         responses = list(multi_response.responses.values())
 
@@ -1374,6 +1405,40 @@ class ConsensusResult:
         }
 
 
+def _consensus_items(
+    item_lists: List[List[str]],
+    min_agreement: int,
+    similarity_threshold: float,
+) -> Tuple[List[str], List[str]]:
+    """
+    Match items (issues or recommendations) across models.
+
+    Returns:
+        (items raised by >= min_agreement models, all distinct items), each in
+        order of first appearance and using the first model's wording
+    """
+    report = cluster_items(
+        {str(i): [item.strip() for item in items] for i, items in enumerate(item_lists)},
+        threshold=similarity_threshold,
+    )
+    consensus = sorted(
+        (cluster for cluster in report.clusters if len(cluster.claims) >= min_agreement),
+        key=lambda cluster: cluster.claims[0].index,
+    )
+
+    all_items: List[str] = []
+    seen: Set[str] = set()
+    for items in item_lists:
+        for item in items:
+            cleaned = item.strip()
+            normalized = _normalize_for_matching(cleaned)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                all_items.append(cleaned)
+
+    return _dedupe_preserve_order([cluster.representative for cluster in consensus]), all_items
+
+
 def detect_consensus(
     parsed_responses: List[ParsedReviewResponse],
     min_agreement: int = 2,
@@ -1388,16 +1453,16 @@ def detect_consensus(
     Args:
         parsed_responses: List of ParsedReviewResponse objects
         min_agreement: Minimum number of models that must agree (default: 2)
-        similarity_threshold: Similarity threshold for fuzzy matching (0.0-1.0)
-                            Not implemented in v1, uses exact matching
+        similarity_threshold: Similarity threshold for fuzzy matching (0.0-1.0);
+                            items are compared by TF-IDF cosine similarity
 
     Returns:
         ConsensusResult with consensus analysis
 
     Algorithm:
         1. Count verdict distribution and find majority verdict
-        2. Collect all issues/recommendations across models
-        3. Identify items mentioned by >= min_agreement models
+        2. Cluster similar issues/recommendations across models
+        3. Identify clusters raised by >= min_agreement models
         4. Calculate agreement rate for verdict
 
     Example:
@@ -1435,53 +1500,15 @@ def detect_consensus(
     # Convert to string keys for JSON serialization
     verdict_distribution = {v.value: c for v, c in verdict_counts.items()}
 
-    # 2. Collect all issues and count occurrences
-    issue_counts: Dict[str, int] = {}
-    issue_order: List[str] = []
-    issue_originals: Dict[str, str] = {}
-    for response in parsed_responses:
-        for issue in response.issues:
-            cleaned_issue = issue.strip()
-            normalized_issue = _normalize_for_matching(cleaned_issue)
-            if not normalized_issue:
-                continue
-            if normalized_issue not in issue_counts:
-                issue_counts[normalized_issue] = 0
-                issue_originals[normalized_issue] = cleaned_issue
-                issue_order.append(normalized_issue)
-            issue_counts[normalized_issue] += 1
-
-    # 3. Identify consensus issues (mentioned by >= min_agreement models)
-    consensus_issues = _dedupe_preserve_order([
-        issue_originals[norm]
-        for norm in issue_order
-        if issue_counts.get(norm, 0) >= min_agreement
-    ])
-    all_issues = _dedupe_preserve_order([issue_originals[norm] for norm in issue_order])
-
-    # 4. Collect all recommendations and count occurrences
-    rec_counts: Dict[str, int] = {}
-    rec_order: List[str] = []
-    rec_originals: Dict[str, str] = {}
-    for response in parsed_responses:
-        for rec in response.recommendations:
-            cleaned_rec = rec.strip()
-            normalized_rec = _normalize_for_matching(cleaned_rec)
-            if not normalized_rec:
-                continue
-            if normalized_rec not in rec_counts:
-                rec_counts[normalized_rec] = 0
-                rec_originals[normalized_rec] = cleaned_rec
-                rec_order.append(normalized_rec)
-            rec_counts[normalized_rec] += 1
-
-    # 5. Identify consensus recommendations (mentioned by >= min_agreement models)
-    consensus_recommendations = _dedupe_preserve_order([
-        rec_originals[norm]
-        for norm in rec_order
-        if rec_counts.get(norm, 0) >= min_agreement
-    ])
-    all_recommendations = _dedupe_preserve_order([rec_originals[norm] for norm in rec_order])
+    # 2-3. Cluster issues across models and keep those enough models raised
+    consensus_issues, all_issues = _consensus_items(
+        [response.issues for response in parsed_responses], min_agreement, similarity_threshold
+    )
+
+    # 4-5. Same for recommendations
+    consensus_recommendations, all_recommendations = _consensus_items(
+        [response.recommendations for response in parsed_responses], min_agreement, similarity_threshold
+    )
 
     return ConsensusResult(
         consensus_verdict=consensus_verdict,
@@ -0,0 +1,204 @@
+"""
+Batched git diff collection for fidelity reviews.
+
+Fidelity reviews need a diff for every file touched by every task in scope. Running
+one `git diff` per file per task spawns hundreds of processes on large specs, so this
+module collects diffs for many files with a single `git diff` invocation, splits the
+output back into per-file sections, and memoizes the result by
+``(base_ref, compare_ref, path)`` for the lifetime of a review.
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from claude_skills.common.prompt_budget import DIFF_HEADER_PREFIX, parse_diff_header_path
+
+logger = logging.getLogger(__name__)
+
+# Keep individual command lines comfortably below OS argument limits
+MAX_PATHS_PER_COMMAND = 200
+
+CacheKey = Tuple[str, Optional[str], str]
+
+
+def split_diff_by_file(diff_output: str) -> Dict[str, str]:
+    """
+    Split combined ``git diff`` output into per-file sections.
+
+    Args:
+        diff_output: Raw output of a multi-file ``git diff`` command
+
+    Returns:
+        Dictionary mapping repository-relative paths to their diff section
+    """
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+
+    for line in diff_output.splitlines(keepends=True):
+        if line.startswith(DIFF_HEADER_PREFIX):
+            path = parse_diff_header_path(line)
+            current = sections.setdefault(path, []) if path else None
+        if current is not None:
+            current.append(line)
+
+    return {path: "".join(lines) for path, lines in sections.items()}
+
+
+class GitDiffCollector:
+    """
+    Collect and cache git diffs for many files with as few subprocesses as possible.
+
+    One collector should be shared across a whole review so files referenced by
+    several tasks are diffed once.
+    """
+
+    def __init__(self, repo_root: Optional[Path], timeout: int = 30):
+        """
+        Initialize the collector.
+
+        Args:
+            repo_root: Git repository root (None when not in a repository)
+            timeout: Timeout in seconds for each git invocation
+        """
+        self.repo_root = Path(repo_root) if repo_root is not None else None
+        self.timeout = timeout
+        self._cache: Dict[CacheKey, Optional[str]] = {}
+        self.commands_run = 0
+
+    def _relative_path(self, file_path: str) -> str:
+        """Normalize a requested path to the repository-relative form git prints."""
+        path = Path(file_path)
+        if path.is_absolute() and self.repo_root is not None:
+            try:
+                return path.resolve().relative_to(self.repo_root.resolve()).as_posix()
+            except ValueError:
+                return path.as_posix()
+        normalized = path.as_posix()
+        return normalized[2:] if normalized.startswith("./") else normalized
+
+    def _build_command(self, base_ref: str, compare_ref: Optional[str], paths: List[str]) -> List[str]:
+        cmd = ["git", "-c", "core.quotePath=false", "diff", "--no-color", "--no-renames", base_ref]
+        if compare_ref:
+            cmd.append(compare_ref)
+        return cmd + ["--"] + paths
+
+    def _run_diff(
+        self,
+        base_ref: str,
+        compare_ref: Optional[str],
+        paths: List[str],
+    ) -> Optional[str]:
+        """Run a single git diff command, returning stdout or None on failure."""
+        self.commands_run += 1
+        try:
+            result = subprocess.run(
+                self._build_command(base_ref, compare_ref, paths),
+                cwd=self.repo_root,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Git diff timed out for {len(paths)} file(s)")
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to get git diff for {len(paths)} file(s): {e}")
+            return None
+
+        if result.returncode != 0:
+            logger.warning(f"Git diff failed for {', '.join(paths)}: {result.stderr}")
+            return None
+        return result.stdout
+
+    def _collect_batch(self, base_ref: str, compare_ref: Optional[str], paths: List[str]) -> None:
+        """Diff a batch of uncached paths and store the per-file results."""
+        output = self._run_diff(base_ref, compare_ref, paths)
+
+        if output is None:
+            if len(paths) == 1:
+                self._cache[(base_ref, compare_ref, paths[0])] = None
+                return
+            # One bad path (e.g. outside the repo) fails the whole batch;
+            # isolate it so the other files still get their diffs.
+            for path in paths:
+                self._collect_batch(base_ref, compare_ref, [path])
+            return
+
+        sections = split_diff_by_file(output)
+        for path in paths:
+            relative = self._relative_path(path).rstrip("/")
+            prefix = f"{relative}/"
+            parts = [
+                section
+                for section_path, section in sections.items()
+                if section_path == relative or section_path.startswith(prefix) or relative in ("", ".")
+            ]
+            self._cache[(base_ref, compare_ref, path)] = "".join(parts)
+
+    def prefetch(
+        self,
+        file_paths: Iterable[str],
+        base_ref: str = "HEAD",
+        compare_ref: Optional[str] = None,
+    ) -> None:
+        """
+        Populate the cache for all given files using batched git invocations.
+
+        Args:
+            file_paths: Files to diff (duplicates are ignored)
+            base_ref: Base git reference to compare from
+            compare_ref: Git reference to compare to (default: working tree)
+        """
+        pending = [
+            path
+            for path in dict.fromkeys(file_paths)
+            if path and (base_ref, compare_ref, path) not in self._cache
+        ]
+        if not pending:
+            return
+
+        if self.repo_root is None:
+            for path in pending:
+                self._cache[(base_ref, compare_ref, path)] = None
+            return
+
+        for start in range(0, len(pending), MAX_PATHS_PER_COMMAND):
+            self._collect_batch(base_ref, compare_ref, pending[start:start + MAX_PATHS_PER_COMMAND])
+
+    def get_diffs(
+        self,
+        file_paths: Iterable[str],
+        base_ref: str = "HEAD",
+        compare_ref: Optional[str] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get diffs for several files, running git only for files not yet cached.
+
+        Args:
+            file_paths: Files to diff
+            base_ref: Base git reference to compare from
+            compare_ref: Git reference to compare to (default: working tree)
+
+        Returns:
+            Dictionary mapping each requested path to its diff ("" when unchanged,
+            None when the diff could not be produced)
+        """
+        file_paths = [path for path in file_paths if path]
+        self.prefetch(file_paths, base_ref, compare_ref)
+        return {path: self._cache.get((base_ref, compare_ref, path)) for path in file_paths}
+
+    def get_diff(
+        self,
+        file_path: str,
+        base_ref: str = "HEAD",
+        compare_ref: Optional[str] = None,
+    ) -> Optional[str]:
+        """Get the (cached) diff for a single file."""
+        return self.get_diffs([file_path], base_ref, compare_ref).get(file_path)
+
+    def clear(self) -> None:
+        """Drop all cached diffs."""
+        self._cache.clear()
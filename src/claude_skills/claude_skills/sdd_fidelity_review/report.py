@@ -150,6 +150,7 @@ class FidelityReport:
                 - categorized_issues: List of CategorizedIssue objects or dicts
                 - parsed_responses: List of ParsedReviewResponse objects or dicts
                 - models_consulted: Number of models consulted (optional)
+                - shards: Per-shard verdicts from a sharded review (optional)
         """
         self.results = review_results
 
@@ -158,6 +159,7 @@ class FidelityReport:
         self.consensus = review_results.get("consensus", {})
         self.categorized_issues = review_results.get("categorized_issues", [])
         self.parsed_responses = review_results.get("parsed_responses", [])
+        self.shards = review_results.get("shards", [])
 
         default_model_count = len(self.parsed_responses)
         raw_models = review_results.get("models_consulted", None)
@@ -269,6 +271,7 @@ class FidelityReport:
             - consensus: Consensus analysis results
             - categorized_issues: Issues organized by severity
             - individual_responses: Raw responses from each model
+            - shards: Per-shard verdicts (sharded reviews only)
 
         Example:
             >>> report = FidelityReport(review_results)
@@ -281,7 +284,7 @@ class FidelityReport:
         categorized_issues_list = self._convert_to_dict(self.categorized_issues)
         individual_responses_list = self._convert_to_dict(self.parsed_responses)
 
-        return {
+        report = {
             "metadata": self._get_report_metadata(),
             "spec_id": self.spec_id,
             "models_consulted": self.models_metadata,
@@ -289,6 +292,9 @@ class FidelityReport:
             "categorized_issues": categorized_issues_list,
             "individual_responses": individual_responses_list
         }
+        if self.shards:
+            report["shards"] = self._convert_to_dict(self.shards)
+        return report
 
     def print_console(self, use_colors: bool = True, verbose: bool = False) -> None:
         """
@@ -480,6 +486,9 @@ class FidelityReport:
             print(f"Agreement Rate: {agreement_rate:.1%}")
             print()
 
+        if self.shards:
+            self._print_shard_verdicts(console, is_rich_ui)
+
         # Group issues by severity
         categorized_issues_list = self._convert_to_dict(self.categorized_issues)
         
@@ -603,6 +612,50 @@ class FidelityReport:
         if is_rich_ui and verbose:
             self._print_model_comparison_table(console)
 
+    def _print_shard_verdicts(self, console: Optional[Console], is_rich_ui: bool) -> None:
+        """
+        Print the verdict each model gave for every shard of a sharded review.
+
+        Args:
+            console: Rich Console instance for output (None for plain output)
+            is_rich_ui: Whether to render a Rich table
+        """
+        shards = self._convert_to_dict(self.shards)
+        tools: List[str] = []
+        for shard in shards:
+            for tool in shard.get("verdicts", {}):
+                if tool not in tools:
+                    tools.append(tool)
+
+        if is_rich_ui:
+            console.print("[bold]SHARD VERDICTS[/bold]")
+            table = Table(show_header=True, box=None, padding=(0, 1))
+            table.add_column("Shard", style="bold")
+            for tool in tools:
+                table.add_column(tool, justify="left")
+            styles = {"PASS": "green", "FAIL": "red", "PARTIAL": "yellow"}
+            for shard in shards:
+                cells = []
+                for tool in tools:
+                    verdict = str(shard.get("verdicts", {}).get(tool, "-")).upper()
+                    style = styles.get(verdict)
+                    cells.append(f"[{style}]{verdict}[/{style}]" if style else verdict)
+                label = shard.get("shard_id", "")
+                if shard.get("error"):
+                    label += " [red](failed)[/red]"
+                table.add_row(label, *cells)
+            console.print(table)
+            console.print()
+        else:
+            print("SHARD VERDICTS")
+            for shard in shards:
+                verdicts = shard.get("verdicts", {})
+                detail = ", ".join(f"{tool}: {str(verdict).upper()}" for tool, verdict in verdicts.items())
+                if shard.get("error"):
+                    detail = f"failed ({shard['error']})"
+                print(f"  {shard.get('shard_id', '')}: {detail}")
+            print()
+
     def _print_consensus_matrix(
         self,
         console: Console,
@@ -9,16 +9,28 @@ from typing import Dict, List, Optional, Any
 import sys
 import subprocess
 import logging
-import xml.etree.ElementTree as ET
 import hashlib
 
 from claude_skills.common.spec import load_json_spec, get_node
 from claude_skills.common.paths import find_specs_directory
 from claude_skills.common.git_metadata import find_git_root
 from claude_skills.common.cache import CacheManager
+from claude_skills.common.prompt_budget import (
+    BudgetedPromptBuilder,
+    estimate_tokens,
+    summarize_diff,
+    truncate_diff,
+    truncate_lines,
+)
+from claude_skills.sdd_fidelity_review.git_diffs import GitDiffCollector, split_diff_by_file
+from claude_skills.common.test_history import TestHistory
+from claude_skills.sdd_fidelity_review.test_results import ReviewTestResultProvider, parse_junit_xml
 
 logger = logging.getLogger(__name__)
 
+# Default prompt budget (~240KB of text), comfortably inside provider context limits
+DEFAULT_PROMPT_TOKEN_BUDGET = 60000
+
 
 class FidelityReviewer:
     """
@@ -27,7 +39,13 @@ class FidelityReviewer:
     This class will be implemented in Phase 3 (Core Review Logic).
     """
 
-    def __init__(self, spec_id: str, spec_path: Optional[Path] = None, incremental: bool = False):
+    def __init__(
+        self,
+        spec_id: str,
+        spec_path: Optional[Path] = None,
+        incremental: bool = False,
+        test_workers: Optional[int] = None
+    ):
         """
         Initialize the fidelity reviewer.
 
@@ -35,12 +53,16 @@ class FidelityReviewer:
             spec_id: Specification ID to review against
             spec_path: Optional path to specs directory
             incremental: Enable incremental mode (only review changed files)
+            test_workers: Optional pytest-xdist worker count for test collection
         """
         self.spec_id = spec_id
         self.spec_path = spec_path
         self.spec_data: Optional[Dict[str, Any]] = None
         self.incremental = incremental
         self.cache = CacheManager() if incremental else None
+        self._diff_collector: Optional[GitDiffCollector] = None
+        self.test_results = ReviewTestResultProvider(workers=test_workers, history=TestHistory())
+        self.last_prompt_stats: Dict[str, Any] = {}
         self._load_spec()
 
     def review_task(self, task_id: str) -> Dict[str, Any]:
@@ -476,6 +498,51 @@ class FidelityReviewer:
             logger.warning(f"Failed to get git diff for {file_path}: {e}")
             return None
 
+    @property
+    def diff_collector(self) -> GitDiffCollector:
+        """
+        Batched git diff collector shared by all diff lookups in this review.
+
+        The repository root is resolved once and diffs are cached by
+        (base_ref, compare_ref, path) for the lifetime of the reviewer.
+        """
+        if self._diff_collector is None:
+            repo_root = find_git_root()
+            if repo_root is None:
+                print("Error: Not in a git repository", file=sys.stderr)
+            self._diff_collector = GitDiffCollector(repo_root)
+        return self._diff_collector
+
+    def _get_task_file_paths(self, task_reqs: Dict[str, Any]) -> List[str]:
+        """
+        Collect file paths referenced by a task (primary, additional and verification files).
+
+        Args:
+            task_reqs: Task requirements from get_task_requirements()
+
+        Returns:
+            List of file paths in declaration order
+        """
+        file_paths = []
+
+        # Get primary file path
+        primary_file = task_reqs.get("file_path")
+        if primary_file:
+            file_paths.append(primary_file)
+
+        # Get additional files from metadata
+        metadata = task_reqs.get("metadata", {})
+        additional_files = metadata.get("files", [])
+        if additional_files:
+            file_paths.extend(additional_files)
+
+        # Get verification files
+        verification_files = metadata.get("verification_files", [])
+        if verification_files:
+            file_paths.extend(verification_files)
+
+        return file_paths
+
     def get_task_diffs(
         self,
         task_id: str,
@@ -485,7 +552,8 @@ class FidelityReviewer:
         """
         Get git diffs for all files associated with a task.
 
-        Extracts file paths from task metadata and collects diffs for each file.
+        Extracts file paths from task metadata and collects their diffs with a
+        single batched git invocation (see diff_collector).
 
         Args:
             task_id: Task ID to get diffs for
@@ -507,32 +575,8 @@ class FidelityReviewer:
         if task_reqs is None:
             return {}
 
-        # Collect file paths from task metadata
-        file_paths = []
-
-        # Get primary file path
-        primary_file = task_reqs.get("file_path")
-        if primary_file:
-            file_paths.append(primary_file)
-
-        # Get additional files from metadata
-        metadata = task_reqs.get("metadata", {})
-        additional_files = metadata.get("files", [])
-        if additional_files:
-            file_paths.extend(additional_files)
-
-        # Get verification files
-        verification_files = metadata.get("verification_files", [])
-        if verification_files:
-            file_paths.extend(verification_files)
-
-        # Collect diffs for all files
-        diffs = {}
-        for file_path in file_paths:
-            diff_output = self.get_file_diff(file_path, base_ref, compare_ref)
-            diffs[file_path] = diff_output
-
-        return diffs
+        file_paths = self._get_task_file_paths(task_reqs)
+        return self.diff_collector.get_diffs(file_paths, base_ref, compare_ref)
 
     def get_phase_diffs(
         self,
@@ -543,6 +587,9 @@ class FidelityReviewer:
         """
         Get git diffs for all tasks in a phase.
 
+        Files from every task in the phase are deduplicated and diffed in one
+        batched git invocation before being split back out per task.
+
         Args:
             phase_id: Phase ID to get diffs for
             base_ref: Base git reference to compare from (default: HEAD)
@@ -566,6 +613,12 @@ class FidelityReviewer:
         if phase_tasks is None:
             return {}
 
+        # Warm the cache for the whole phase with one git invocation
+        all_paths = []
+        for task in phase_tasks:
+            all_paths.extend(self._get_task_file_paths(task))
+        self.diff_collector.prefetch(all_paths, base_ref, compare_ref)
+
         phase_diffs = {}
         for task in phase_tasks:
             task_id = task["task_id"]
@@ -699,40 +752,7 @@ class FidelityReviewer:
         Returns:
             Test results dictionary or None if execution fails
         """
-        # Create temporary XML file for results
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as tmp:
-            xml_path = tmp.name
-
-        try:
-            # Run pytest with JUnit XML output
-            result = subprocess.run(
-                ['pytest', test_file, f'--junit-xml={xml_path}', '-v'],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=300  # 5 minute timeout
-            )
-
-            # Parse the generated XML
-            if Path(xml_path).exists():
-                test_results = self._parse_junit_xml(xml_path)
-                Path(xml_path).unlink()  # Clean up temp file
-                return test_results
-            else:
-                logger.warning(f"JUnit XML file not created for {test_file}")
-                return None
-
-        except subprocess.TimeoutExpired:
-            logger.warning(f"Test execution timed out for {test_file}")
-            return None
-        except Exception as e:
-            logger.warning(f"Failed to run tests for {test_file}: {e}")
-            return None
-        finally:
-            # Ensure temp file is cleaned up
-            if Path(xml_path).exists():
-                Path(xml_path).unlink()
+        return self.test_results.run_tests([test_file])
 
     def _parse_junit_xml(self, xml_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -744,78 +764,61 @@ class FidelityReviewer:
         Returns:
             Test results dictionary or None if parsing fails
         """
-        try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-
-            # Initialize results structure
-            results = {
-                "total": 0,
-                "passed": 0,
-                "failed": 0,
-                "errors": 0,
-                "skipped": 0,
-                "duration": 0.0,
-                "tests": {}
-            }
+        return parse_junit_xml(xml_path)
 
-            # Parse testsuite attributes
-            testsuite = root.find('testsuite')
-            if testsuite is None:
-                testsuite = root  # Root might be testsuite itself
-
-            results["total"] = int(testsuite.get('tests', 0))
-            results["failed"] = int(testsuite.get('failures', 0))
-            results["errors"] = int(testsuite.get('errors', 0))
-            results["skipped"] = int(testsuite.get('skipped', 0))
-            results["passed"] = results["total"] - results["failed"] - results["errors"] - results["skipped"]
-            results["duration"] = float(testsuite.get('time', 0))
-
-            # Parse individual test cases
-            for testcase in root.iter('testcase'):
-                test_name = testcase.get('name', 'unknown')
-                classname = testcase.get('classname', '')
-                duration = float(testcase.get('time', 0))
-
-                # Determine test status
-                failure = testcase.find('failure')
-                error = testcase.find('error')
-                skipped = testcase.find('skipped')
-
-                if failure is not None:
-                    status = "failed"
-                    message = failure.get('message', '')
-                    traceback = failure.text or ''
-                elif error is not None:
-                    status = "error"
-                    message = error.get('message', '')
-                    traceback = error.text or ''
-                elif skipped is not None:
-                    status = "skipped"
-                    message = skipped.get('message', '')
-                    traceback = None
-                else:
-                    status = "passed"
-                    message = ''
-                    traceback = None
-
-                # Store test result
-                full_test_name = f"{classname}::{test_name}" if classname else test_name
-                results["tests"][full_test_name] = {
-                    "status": status,
-                    "message": message,
-                    "duration": duration,
-                    "traceback": traceback
-                }
+    def _get_task_test_files(self, task_reqs: Dict[str, Any]) -> List[str]:
+        """
+        Determine the test files associated with a task.
 
-            return results
+        Uses `verification_files` from task metadata, falling back to inferring a
+        test path from the task's `file_path`.
 
-        except ET.ParseError as e:
-            logger.warning(f"Failed to parse JUnit XML {xml_path}: {e}")
-            return None
-        except Exception as e:
-            logger.warning(f"Error parsing test results from {xml_path}: {e}")
-            return None
+        Args:
+            task_reqs: Task requirements from get_task_requirements()
+
+        Returns:
+            List of candidate test file paths (may not exist)
+        """
+        metadata = task_reqs.get("metadata", {})
+        test_files = list(metadata.get("verification_files", []))
+
+        if not test_files:
+            # Try to infer test file from main file path
+            file_path = task_reqs.get("file_path")
+            if file_path and file_path.startswith("src/"):
+                # Convert src/module/file.py to tests/test_module/test_file.py
+                test_path = file_path.replace("src/", "tests/test_", 1)
+                test_path = test_path.replace(".py", ".py").replace("/", "/test_", 1)
+                test_files = [test_path]
+
+        return test_files
+
+    def get_scope_test_results(self, tasks: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Get test results for every task in a review scope.
+
+        Test files from all tasks are collected and run in a single pytest
+        invocation. Results are cached by the contents of the test files and the
+        source files under review, so re-reviewing unchanged code does not
+        re-run its tests.
+
+        Args:
+            tasks: Task requirement dictionaries in scope
+
+        Returns:
+            Test results dictionary or None if no test results available
+        """
+        test_files: List[str] = []
+        source_files: List[str] = []
+        for task_reqs in tasks:
+            task_tests = self._get_task_test_files(task_reqs)
+            test_files.extend(task_tests)
+            source_files.extend(
+                path for path in self._get_task_file_paths(task_reqs)
+                if path not in task_tests
+            )
+
+        return self.test_results.get_results(test_files, source_files)
 
     def get_task_test_results(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -833,38 +836,7 @@ class FidelityReviewer:
         if task_reqs is None:
             return None
 
-        # Look for test files in task metadata
-        metadata = task_reqs.get("metadata", {})
-        test_files = metadata.get("verification_files", [])
-
-        if not test_files:
-            # Try to infer test file from main file path
-            file_path = task_reqs.get("file_path")
-            if file_path and file_path.startswith("src/"):
-                # Convert src/module/file.py to tests/test_module/test_file.py
-                test_path = file_path.replace("src/", "tests/test_", 1)
-                test_path = test_path.replace(".py", ".py").replace("/", "/test_", 1)
-                test_files = [test_path]
-
-        # Try to get results from each test file
-        all_results = None
-        for test_file in test_files:
-            if Path(test_file).exists():
-                results = self._run_and_parse_tests(test_file)
-                if results:
-                    if all_results is None:
-                        all_results = results
-                    else:
-                        # Merge results from multiple test files
-                        all_results["total"] += results["total"]
-                        all_results["passed"] += results["passed"]
-                        all_results["failed"] += results["failed"]
-                        all_results["errors"] += results["errors"]
-                        all_results["skipped"] += results["skipped"]
-                        all_results["duration"] += results["duration"]
-                        all_results["tests"].update(results["tests"])
-
-        return all_results
+        return self.get_scope_test_results([task_reqs])
 
     def get_journal_entries(
         self,
@@ -935,7 +907,8 @@ class FidelityReviewer:
         phase_id: Optional[str] = None,
         file_paths: Optional[List[str]] = None,
         include_tests: bool = True,
-        base_branch: str = "main"
+        base_branch: str = "main",
+        max_prompt_tokens: Optional[int] = DEFAULT_PROMPT_TOKEN_BUDGET
     ) -> str:
         """
         Generate AI review prompt comparing implementation against specification.
@@ -949,6 +922,9 @@ class FidelityReviewer:
             file_paths: Optional list of specific files to review
             include_tests: Include test results in prompt (default: True)
             base_branch: Base branch for git diff (default: "main")
+            max_prompt_tokens: Approximate token budget for the prompt (None = unbounded).
+                Lower-priority content (journals, test failure details, then diffs)
+                is truncated or summarized first. See common.prompt_budget.
 
         Returns:
             Formatted prompt string ready for AI reviewer
@@ -1069,7 +1045,9 @@ class FidelityReviewer:
             requirements_list = phase_tasks
             phase_node = get_node(self.spec_data, phase_id)
             phase_title = phase_node.get("title", "") if phase_node else ""
-            scope_description = f"Phase {phase_id} - {phase_title}"
+            # Task groups are reviewed through the same path (sharded reviews)
+            node_label = "Group" if phase_node and phase_node.get("type") == "group" else "Phase"
+            scope_description = f"{node_label} {phase_id} - {phase_title}"
         elif file_paths:
             # File-based review
             scope_description = f"Files: {', '.join(file_paths)}"
@@ -1079,116 +1057,122 @@ class FidelityReviewer:
             requirements_list = self.get_all_tasks() or []
             scope_description = "Full Specification"
 
-        # Build prompt sections
-        prompt_parts = []
+        # Sections are granted budget by priority: requirements (1), diffs (2),
+        # test failure details (3), journals (4). Required sections always fit.
+        builder = BudgetedPromptBuilder(max_tokens=max_prompt_tokens)
 
         # 1. CONTEXT SECTION
-        prompt_parts.append("# Implementation Fidelity Review\n")
-        prompt_parts.append("## Context\n")
-        prompt_parts.append(f"**Spec ID:** {self.spec_id}\n")
+        context_parts = []
+        context_parts.append("# Implementation Fidelity Review\n")
+        context_parts.append("## Context\n")
+        context_parts.append(f"**Spec ID:** {self.spec_id}\n")
 
         spec_title = self.spec_data.get("title", "Untitled")
-        prompt_parts.append(f"**Spec Title:** {spec_title}\n")
+        context_parts.append(f"**Spec Title:** {spec_title}\n")
 
         spec_description = self.spec_data.get("description", "")
         if spec_description:
-            prompt_parts.append(f"**Description:** {spec_description}\n")
+            context_parts.append(f"**Description:** {spec_description}\n")
 
-        prompt_parts.append(f"**Review Scope:** {scope_description}\n\n")
+        context_parts.append(f"**Review Scope:** {scope_description}\n\n")
+        builder.add("context", "".join(context_parts), required=True)
 
         # 2. SPECIFICATION REQUIREMENTS
         if requirements_list:
-            prompt_parts.append("## Specification Requirements\n\n")
+            builder.add("requirements-header", "## Specification Requirements\n\n", required=True)
 
             for req in requirements_list:
-                prompt_parts.append(f"### {req['task_id']}: {req['title']}\n\n")
+                heading = f"### {req['task_id']}: {req['title']}\n\n"
+                req_parts = [heading]
 
                 if req.get('description'):
-                    prompt_parts.append(f"**Objective:** {req['description']}\n\n")
+                    req_parts.append(f"**Objective:** {req['description']}\n\n")
 
                 if req.get('file_path'):
-                    prompt_parts.append(f"**File:** `{req['file_path']}`\n\n")
+                    req_parts.append(f"**File:** `{req['file_path']}`\n\n")
 
                 verification_steps = req.get('verification_steps', [])
                 if verification_steps:
-                    prompt_parts.append("**Success Criteria:**\n")
+                    req_parts.append("**Success Criteria:**\n")
                     for step in verification_steps:
-                        prompt_parts.append(f"- {step}\n")
-                    prompt_parts.append("\n")
+                        req_parts.append(f"- {step}\n")
+                    req_parts.append("\n")
 
                 dependencies = req.get('dependencies', {})
                 blocked_by = dependencies.get('blocked_by', [])
                 if blocked_by:
-                    prompt_parts.append(f"**Dependencies:** {', '.join(blocked_by)}\n\n")
+                    req_parts.append(f"**Dependencies:** {', '.join(blocked_by)}\n\n")
+
+                builder.add(
+                    f"requirement:{req['task_id']}",
+                    "".join(req_parts),
+                    priority=1,
+                    truncator=_truncate_block,
+                    fallback=heading,
+                )
 
         # 3. IMPLEMENTATION ARTIFACTS
-        prompt_parts.append("## Implementation Artifacts\n\n")
+        builder.add("artifacts-header", "## Implementation Artifacts\n\n", required=True)
 
         if task_id:
             # Get diffs for specific task
             task_diffs = self.get_task_diffs(task_id)
             if task_diffs:
                 for file_path, diff_content in task_diffs.items():
-                    if diff_content:
-                        prompt_parts.append(f"### File: `{file_path}`\n\n")
-                        prompt_parts.append("```diff\n")
-                        prompt_parts.append(diff_content)
-                        prompt_parts.append("\n```\n\n")
-                    else:
-                        prompt_parts.append(f"### File: `{file_path}`\n\n")
-                        prompt_parts.append("*No changes detected*\n\n")
+                    heading = f"### File: `{file_path}`\n\n"
+                    _add_diff_section(builder, file_path, heading, diff_content)
             else:
-                prompt_parts.append("*No git diff available*\n\n")
+                builder.add("artifacts-empty", "*No git diff available*\n\n", required=True)
         elif phase_id:
             # Get diffs for entire phase
             phase_diffs = self.get_phase_diffs(phase_id)
             if phase_diffs:
                 for tid, file_diffs in phase_diffs.items():
-                    prompt_parts.append(f"### Task: {tid}\n\n")
+                    builder.add(f"task-header:{tid}", f"### Task: {tid}\n\n", required=True)
                     for file_path, diff_content in file_diffs.items():
                         if diff_content:
-                            prompt_parts.append(f"**File:** `{file_path}`\n\n")
-                            prompt_parts.append("```diff\n")
-                            # Truncate large diffs
-                            if len(diff_content) > 5000:
-                                prompt_parts.append(diff_content[:5000])
-                                prompt_parts.append("\n... (truncated)\n")
-                            else:
-                                prompt_parts.append(diff_content)
-                            prompt_parts.append("\n```\n\n")
+                            heading = f"**File:** `{file_path}`\n\n"
+                            _add_diff_section(builder, f"{tid}:{file_path}", heading, diff_content)
             else:
-                prompt_parts.append("*No git diffs available*\n\n")
+                builder.add("artifacts-empty", "*No git diffs available*\n\n", required=True)
         elif file_paths:
             # Get diffs for specific files
+            file_diffs = self.diff_collector.get_diffs(file_paths)
             for file_path in file_paths:
-                diff_content = self.get_file_diff(file_path)
-                if diff_content:
-                    prompt_parts.append(f"### File: `{file_path}`\n\n")
-                    prompt_parts.append("```diff\n")
-                    prompt_parts.append(diff_content)
-                    prompt_parts.append("\n```\n\n")
-                else:
-                    prompt_parts.append(f"### File: `{file_path}`\n\n")
-                    prompt_parts.append("*No changes detected*\n\n")
+                heading = f"### File: `{file_path}`\n\n"
+                _add_diff_section(builder, file_path, heading, file_diffs.get(file_path))
         else:
             # Full spec - get branch diff
             branch_diff = self.get_branch_diff(base_branch)
             if branch_diff:
-                prompt_parts.append("### Full Branch Diff\n\n")
-                prompt_parts.append("```diff\n")
-                prompt_parts.append(branch_diff)
-                prompt_parts.append("\n```\n\n")
+                builder.add("branch-diff-header", "### Full Branch Diff\n\n", required=True)
+                branch_sections = split_diff_by_file(branch_diff)
+                if branch_sections:
+                    for file_path, diff_content in branch_sections.items():
+                        heading = f"**File:** `{file_path}`\n\n"
+                        _add_diff_section(builder, file_path, heading, diff_content)
+                else:
+                    # Summary-only output (e.g. diff too large)
+                    builder.add(
+                        "branch-diff",
+                        f"```diff\n{branch_diff}\n```\n\n",
+                        priority=2,
+                        truncator=_truncate_block,
+                    )
             else:
-                prompt_parts.append("*No git diff available*\n\n")
+                builder.add("artifacts-empty", "*No git diff available*\n\n", required=True)
 
         # 4. TEST RESULTS
         if include_tests:
-            prompt_parts.append("## Test Results\n\n")
+            test_parts = ["## Test Results\n\n"]
 
             test_results = None
             if task_id:
                 test_results = self.get_task_test_results(task_id)
+            elif requirements_list:
+                test_results = self.get_scope_test_results(requirements_list)
 
+            failure_parts = []
             if test_results:
                 total = test_results.get('total', 0)
                 passed = test_results.get('passed', 0)
@@ -1197,36 +1181,47 @@ class FidelityReviewer:
                 skipped = test_results.get('skipped', 0)
                 duration = test_results.get('duration', 0.0)
 
-                prompt_parts.append(f"**Status:** {passed}/{total} tests passed\n")
-                prompt_parts.append(f"**Duration:** {duration:.2f}s\n")
+                test_parts.append(f"**Status:** {passed}/{total} tests passed\n")
+                test_parts.append(f"**Duration:** {duration:.2f}s\n")
 
                 if failed > 0 or errors > 0:
-                    prompt_parts.append(f"**Failed:** {failed}, **Errors:** {errors}\n\n")
+                    test_parts.append(f"**Failed:** {failed}, **Errors:** {errors}\n\n")
 
                     # Show failed test details
-                    prompt_parts.append("**Failed Tests:**\n")
+                    failure_parts.append("**Failed Tests:**\n")
                     tests = test_results.get('tests', {})
                     for test_name, test_data in tests.items():
                         if test_data['status'] in ['failed', 'error']:
-                            prompt_parts.append(f"\n- **{test_name}**\n")
+                            failure_parts.append(f"\n- **{test_name}**\n")
                             message = test_data.get('message', '')
                             if message:
-                                prompt_parts.append(f"  - Message: {message}\n")
+                                failure_parts.append(f"  - Message: {message}\n")
                             traceback = test_data.get('traceback')
                             if traceback:
-                                prompt_parts.append(f"  - Traceback:\n```\n{traceback}\n```\n")
+                                failure_parts.append(f"  - Traceback:\n```\n{traceback}\n```\n")
                 else:
-                    prompt_parts.append("\n*All tests passed!*\n")
-
-                if skipped > 0:
-                    prompt_parts.append(f"\n**Skipped:** {skipped} tests\n")
-
-                prompt_parts.append("\n")
+                    test_parts.append("\n*All tests passed!*\n")
             else:
-                prompt_parts.append("*No test results available*\n\n")
+                test_parts.append("*No test results available*\n\n")
+
+            builder.add("test-summary", "".join(test_parts), required=True)
+            if failure_parts:
+                builder.add(
+                    "test-failures",
+                    "".join(failure_parts),
+                    priority=3,
+                    truncator=_truncate_block,
+                    fallback="*Failed test details omitted to fit prompt budget*\n",
+                )
+            if test_results:
+                test_footer = []
+                if test_results.get('skipped', 0) > 0:
+                    test_footer.append(f"\n**Skipped:** {test_results['skipped']} tests\n")
+                test_footer.append("\n")
+                builder.add("test-footer", "".join(test_footer), required=True)
 
         # 5. JOURNAL ENTRIES
-        prompt_parts.append("## Journal Entries\n\n")
+        builder.add("journals-header", "## Journal Entries\n\n", required=True)
 
         journal_entries = []
         if task_id:
@@ -1238,96 +1233,156 @@ class FidelityReviewer:
             journal_entries = self.get_journal_entries()
 
         if journal_entries:
-            for entry in journal_entries:
+            for index, entry in enumerate(journal_entries):
                 timestamp = entry.get('timestamp', '')
                 title = entry.get('title', '')
                 content = entry.get('content', '')
                 entry_task_id = entry.get('task_id', '')
 
                 if entry_task_id:
-                    prompt_parts.append(f"**[{timestamp}] {title}** (Task: {entry_task_id})\n")
+                    entry_text = f"**[{timestamp}] {title}** (Task: {entry_task_id})\n"
                 else:
-                    prompt_parts.append(f"**[{timestamp}] {title}**\n")
+                    entry_text = f"**[{timestamp}] {title}**\n"
 
                 if content:
-                    prompt_parts.append(f"{content}\n\n")
+                    entry_text += f"{content}\n\n"
+
+                builder.add(f"journal:{index}", entry_text, priority=4, truncator=_truncate_block)
         else:
-            prompt_parts.append("*No journal entries found*\n\n")
+            builder.add("journals-empty", "*No journal entries found*\n\n", required=True)
 
         # 6. REVIEW QUESTIONS
-        prompt_parts.append("## Review Questions\n\n")
-        prompt_parts.append("Please evaluate the implementation against the specification:\n\n")
-        prompt_parts.append("1. **Requirement Alignment:** Does the implementation match the spec requirements?\n")
-        prompt_parts.append("2. **Success Criteria:** Are all verification steps satisfied?\n")
-        prompt_parts.append("3. **Deviations:** Are there any deviations from the spec? If so, are they justified?\n")
+        builder.add("instructions", _build_review_instructions(include_tests), required=True)
+
+        prompt = builder.build()
+        self.last_prompt_stats = {
+            "estimated_tokens": estimate_tokens(prompt),
+            "max_tokens": max_prompt_tokens,
+            "truncated_sections": list(builder.truncated),
+            "omitted_sections": list(builder.omitted),
+        }
+        if builder.truncated or builder.omitted:
+            logger.info(
+                f"Review prompt fit to budget: {len(builder.truncated)} section(s) truncated, "
+                f"{len(builder.omitted)} omitted"
+            )
+        return prompt
 
-        if include_tests:
-            prompt_parts.append("4. **Test Coverage:** Are tests comprehensive and passing?\n")
 
-        prompt_parts.append("5. **Code Quality:** Are there any quality, maintainability, or security concerns?\n")
-        prompt_parts.append("6. **Documentation:** Is the implementation properly documented?\n\n")
+def _truncate_block(text: str, max_chars: int) -> str:
+    """Truncate a prompt block on line boundaries, keeping its trailing blank line."""
+    return truncate_lines(text.rstrip("\n"), max_chars - 2) + "\n\n"
 
-        prompt_parts.append("### Required Response Format\n\n")
-        prompt_parts.append(
-            "Respond **only** with valid JSON matching the schema below. Do not include Markdown, prose, or additional commentary outside the JSON object.\n\n"
-        )
-        prompt_parts.append("```json\n")
-        prompt_parts.append(
-            '{\n'
-            '  "verdict": "pass|fail|partial|unknown",\n'
-            '  "summary": "Overall findings (any length).",\n'
-            '  "requirement_alignment": {\n'
-            '    "answer": "yes|no|partial",\n'
-            '    "details": "Explain how implementation aligns or diverges."\n'
-            '  },\n'
-            '  "success_criteria": {\n'
-            '    "met": "yes|no|partial",\n'
-            '    "details": "Call out verification steps passed or missing."\n'
-            '  },\n'
-            '  "deviations": [\n'
-            '    {\n'
-            '      "description": "Describe deviation from the spec.",\n'
-            '      "justification": "Optional rationale or evidence.",\n'
-            '      "severity": "blocking|major|minor"\n'
-            '    }\n'
-            '  ],\n'
-            '  "test_coverage": {\n'
-            '    "status": "sufficient|insufficient|not_applicable",\n'
-            '    "details": "Summarise test evidence or gaps."\n'
-            '  },\n'
-            '  "code_quality": {\n'
-            '    "issues": ["Describe each notable quality concern."],\n'
-            '    "details": "Optional supporting commentary."\n'
-            '  },\n'
-            '  "documentation": {\n'
-            '    "status": "adequate|inadequate|not_applicable",\n'
-            '    "details": "Note doc updates or omissions."\n'
-            '  },\n'
-            '  "issues": ["Concise list of primary issues for consensus logic."],\n'
-          '  "recommendations": ["Actionable next steps to resolve findings."]\n'
-            '}\n'
-        )
-        prompt_parts.append("```\n\n")
-        prompt_parts.append(
-            "Rules:\n"
-            "- Use lowercase values shown for enumerated fields (e.g., `verdict`, status flags).\n"
-            "- Keep arrays as arrays (use `[]` when a section has nothing to report).\n"
-            "- Populate `issues` and `recommendations` with the key takeaways you want surfaced downstream.\n"
-            "- Feel free to include additional keys if needed, but never omit the ones above.\n\n"
-        )
 
-        prompt_parts.append("## IMPORTANT CONSTRAINTS\n\n")
-        prompt_parts.append("**CRITICAL: This is a READ-ONLY review. You MUST NOT:**\n")
-        prompt_parts.append("- Write, create, or modify ANY files on disk\n")
-        prompt_parts.append("- Execute code or commands\n")
-        prompt_parts.append("- Make changes to the codebase\n\n")
-        prompt_parts.append("**Your role is ANALYSIS ONLY:**\n")
-        prompt_parts.append("- Review the specification and implementation\n")
-        prompt_parts.append("- Identify deviations and issues\n")
-        prompt_parts.append("- Provide your findings as TEXT in your response\n")
-        prompt_parts.append("- Do not reference external files you create or write\n\n")
-
-        prompt_parts.append("---\n")
-        prompt_parts.append("\n*Please provide a detailed review addressing each question above.*\n")
-
-        return "".join(prompt_parts)
+def _add_diff_section(
+    builder: BudgetedPromptBuilder,
+    name: str,
+    heading: str,
+    diff_content: Optional[str],
+) -> None:
+    """
+    Add one file's diff to the prompt builder.
+
+    The section carries a change summary; when the budget is tight the diff is
+    cut down to its most relevant hunks, or replaced by the summary alone.
+    """
+    if not diff_content:
+        builder.add(f"diff:{name}", f"{heading}*No changes detected*\n\n", required=True)
+        return
+
+    summary = f"*Changes: {summarize_diff(diff_content)}*\n\n"
+    fence_open = "```diff\n"
+    fence_close = "\n```\n\n"
+
+    def truncator(_text: str, max_chars: int) -> str:
+        overhead = len(heading) + len(summary) + len(fence_open) + len(fence_close)
+        return heading + summary + fence_open + truncate_diff(diff_content, max_chars - overhead) + fence_close
+
+    builder.add(
+        f"diff:{name}",
+        heading + summary + fence_open + diff_content + fence_close,
+        priority=2,
+        truncator=truncator,
+        fallback=f"{heading}{summary}*Diff omitted to fit prompt budget*\n\n",
+    )
+
+
+def _build_review_instructions(include_tests: bool) -> str:
+    """Build the fixed review questions, response schema and constraints."""
+    prompt_parts = []
+    prompt_parts.append("## Review Questions\n\n")
+    prompt_parts.append("Please evaluate the implementation against the specification:\n\n")
+    prompt_parts.append("1. **Requirement Alignment:** Does the implementation match the spec requirements?\n")
+    prompt_parts.append("2. **Success Criteria:** Are all verification steps satisfied?\n")
+    prompt_parts.append("3. **Deviations:** Are there any deviations from the spec? If so, are they justified?\n")
+
+    if include_tests:
+        prompt_parts.append("4. **Test Coverage:** Are tests comprehensive and passing?\n")
+
+    prompt_parts.append("5. **Code Quality:** Are there any quality, maintainability, or security concerns?\n")
+    prompt_parts.append("6. **Documentation:** Is the implementation properly documented?\n\n")
+
+    prompt_parts.append("### Required Response Format\n\n")
+    prompt_parts.append(
+        "Respond **only** with valid JSON matching the schema below. Do not include Markdown, prose, or additional commentary outside the JSON object.\n\n"
+    )
+    prompt_parts.append("```json\n")
+    prompt_parts.append(
+        '{\n'
+        '  "verdict": "pass|fail|partial|unknown",\n'
+        '  "summary": "Overall findings (any length).",\n'
+        '  "requirement_alignment": {\n'
+        '    "answer": "yes|no|partial",\n'
+        '    "details": "Explain how implementation aligns or diverges."\n'
+        '  },\n'
+        '  "success_criteria": {\n'
+        '    "met": "yes|no|partial",\n'
+        '    "details": "Call out verification steps passed or missing."\n'
+        '  },\n'
+        '  "deviations": [\n'
+        '    {\n'
+        '      "description": "Describe deviation from the spec.",\n'
+        '      "justification": "Optional rationale or evidence.",\n'
+        '      "severity": "blocking|major|minor"\n'
+        '    }\n'
+        '  ],\n'
+        '  "test_coverage": {\n'
+        '    "status": "sufficient|insufficient|not_applicable",\n'
+        '    "details": "Summarise test evidence or gaps."\n'
+        '  },\n'
+        '  "code_quality": {\n'
+        '    "issues": ["Describe each notable quality concern."],\n'
+        '    "details": "Optional supporting commentary."\n'
+        '  },\n'
+        '  "documentation": {\n'
+        '    "status": "adequate|inadequate|not_applicable",\n'
+        '    "details": "Note doc updates or omissions."\n'
+        '  },\n'
+        '  "issues": ["Concise list of primary issues for consensus logic."],\n'
+        '  "recommendations": ["Actionable next steps to resolve findings."]\n'
+        '}\n'
+    )
+    prompt_parts.append("```\n\n")
+    prompt_parts.append(
+        "Rules:\n"
+        "- Use lowercase values shown for enumerated fields (e.g., `verdict`, status flags).\n"
+        "- Keep arrays as arrays (use `[]` when a section has nothing to report).\n"
+        "- Populate `issues` and `recommendations` with the key takeaways you want surfaced downstream.\n"
+        "- Feel free to include additional keys if needed, but never omit the ones above.\n\n"
+    )
+
+    prompt_parts.append("## IMPORTANT CONSTRAINTS\n\n")
+    prompt_parts.append("**CRITICAL: This is a READ-ONLY review. You MUST NOT:**\n")
+    prompt_parts.append("- Write, create, or modify ANY files on disk\n")
+    prompt_parts.append("- Execute code or commands\n")
+    prompt_parts.append("- Make changes to the codebase\n\n")
+    prompt_parts.append("**Your role is ANALYSIS ONLY:**\n")
+    prompt_parts.append("- Review the specification and implementation\n")
+    prompt_parts.append("- Identify deviations and issues\n")
+    prompt_parts.append("- Provide your findings as TEXT in your response\n")
+    prompt_parts.append("- Do not reference external files you create or write\n\n")
+
+    prompt_parts.append("---\n")
+    prompt_parts.append("\n*Please provide a detailed review addressing each question above.*\n")
+
+    return "".join(prompt_parts)
@@ -0,0 +1,347 @@
+"""
+Sharded fidelity review for full-spec scope.
+
+A full-spec review normally sends one prompt containing every task to each tool.
+On large specs that prompt is slow, prone to timeouts and can only be cached as
+a whole. Sharded mode instead:
+
+1. Splits the spec into shards, one per phase or one per task group (tasks that
+   sit directly under a phase become their own shard).
+2. Builds a regular phase/group/task review prompt for each shard.
+3. Consults the tools for several shards concurrently (bounded by a
+   configurable cap), caching each shard under ``generate_fidelity_review_key``
+   with the shard's files and requirements, so an unchanged shard is served
+   from cache and only the shards touched by a change are re-consulted.
+4. Merges the per-shard verdicts into one response per tool, so the usual
+   consensus detection and FidelityReport output work unchanged.
+"""
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from claude_skills.common.ai_tools import ToolResponse
+from claude_skills.common.progress import ProgressEmitter
+from claude_skills.sdd_fidelity_review.consultation import (
+    ConsultationError,
+    FidelityVerdict,
+    ParsedReviewResponse,
+    consult_multiple_ai_on_fidelity,
+    get_fidelity_shard_concurrency,
+    parse_multiple_responses,
+)
+
+logger = logging.getLogger(__name__)
+
+SHARD_MODES = ("phase", "group")
+
+# Worst verdict wins when merging shards: one failing phase fails the spec
+VERDICT_SEVERITY = {
+    FidelityVerdict.PASS: 0,
+    FidelityVerdict.UNKNOWN: 1,
+    FidelityVerdict.PARTIAL: 2,
+    FidelityVerdict.FAIL: 3,
+}
+
+
+@dataclass
+class ReviewShard:
+    """
+    A slice of the spec reviewed with its own prompt and cache entry.
+
+    Attributes:
+        shard_id: Node ID the shard is reviewed through (phase, group or task)
+        scope: Cache scope ("phase", "group" or "task")
+        title: Node title for display
+        task_ids: Tasks covered by the shard
+        file_paths: Files referenced by those tasks (hashed into the cache key)
+        content_hash: Hash of the shard's spec requirements
+    """
+    shard_id: str
+    scope: str
+    title: str = ""
+    task_ids: List[str] = field(default_factory=list)
+    file_paths: List[str] = field(default_factory=list)
+    content_hash: str = ""
+
+
+@dataclass
+class ShardResult:
+    """Outcome of consulting the tools for one shard."""
+    shard: ReviewShard
+    responses: List[ToolResponse] = field(default_factory=list)
+    parsed_responses: List[ParsedReviewResponse] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        data: Dict[str, Any] = {
+            "shard_id": self.shard.shard_id,
+            "scope": self.shard.scope,
+            "title": self.shard.title,
+            "task_ids": list(self.shard.task_ids),
+            "verdicts": {
+                parsed.provider or response.tool: parsed.verdict.value
+                for response, parsed in zip(self.responses, self.parsed_responses)
+            },
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+def _hash_requirements(tasks: List[Dict[str, Any]]) -> str:
+    """Hash the parts of task requirements that end up in a review prompt."""
+    payload = [
+        {
+            "task_id": task.get("task_id"),
+            "title": task.get("title"),
+            "description": task.get("description"),
+            "file_path": task.get("file_path"),
+            "verification_steps": task.get("verification_steps", []),
+            "blocked_by": (task.get("dependencies") or {}).get("blocked_by", []),
+        }
+        for task in tasks
+    ]
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _make_shard(reviewer, node_id: str, scope: str, tasks: List[Dict[str, Any]]) -> ReviewShard:
+    """Build a shard for a node from its task requirements."""
+    node = reviewer.spec_data.get("hierarchy", {}).get(node_id, {})
+    file_paths: List[str] = []
+    for task in tasks:
+        file_paths.extend(reviewer._get_task_file_paths(task))
+    return ReviewShard(
+        shard_id=node_id,
+        scope=scope,
+        title=node.get("title", ""),
+        task_ids=[task["task_id"] for task in tasks],
+        file_paths=list(dict.fromkeys(file_paths)),
+        content_hash=_hash_requirements(tasks),
+    )
+
+
+def plan_review_shards(reviewer, mode: str = "phase") -> List[ReviewShard]:
+    """
+    Split a spec into review shards.
+
+    Args:
+        reviewer: FidelityReviewer with a loaded spec
+        mode: "phase" for one shard per phase, or "group" for one shard per task
+              group (tasks directly under a phase become single-task shards)
+
+    Returns:
+        Shards in spec order (phases without tasks are skipped)
+
+    Raises:
+        ValueError: If mode is not one of SHARD_MODES
+    """
+    if mode not in SHARD_MODES:
+        raise ValueError(f"Unknown shard mode '{mode}' (expected one of: {', '.join(SHARD_MODES)})")
+    if reviewer.spec_data is None:
+        return []
+
+    hierarchy = reviewer.spec_data.get("hierarchy", {})
+    phase_ids = [node_id for node_id, node in hierarchy.items() if node.get("type") == "phase"]
+
+    shards: List[ReviewShard] = []
+    for phase_id in phase_ids:
+        if mode == "phase":
+            tasks = reviewer.get_phase_tasks(phase_id) or []
+            if tasks:
+                shards.append(_make_shard(reviewer, phase_id, "phase", tasks))
+            continue
+
+        for node_id, node in hierarchy.items():
+            if node.get("parent") != phase_id:
+                continue
+            node_type = node.get("type", "")
+            if node_type == "group":
+                tasks = reviewer.get_phase_tasks(node_id) or []
+                if tasks:
+                    shards.append(_make_shard(reviewer, node_id, "group", tasks))
+            elif node_type in ("task", "verify"):
+                task = reviewer.get_task_requirements(node_id)
+                if task:
+                    shards.append(_make_shard(reviewer, node_id, "task", [task]))
+
+    return shards
+
+
+def merge_shard_responses(results: List[ShardResult]) -> List[ParsedReviewResponse]:
+    """
+    Merge per-shard parsed responses into one response per tool.
+
+    The merged verdict is the worst verdict the tool gave across shards, and
+    issues, recommendations and summaries are prefixed with the shard ID.
+
+    Args:
+        results: Shard results in spec order
+
+    Returns:
+        One ParsedReviewResponse per tool, in first-seen order
+    """
+    merged: Dict[str, ParsedReviewResponse] = {}
+    for result in results:
+        shard_id = result.shard.shard_id
+        for parsed in result.parsed_responses:
+            tool = parsed.provider or "unknown"
+            combined = merged.get(tool)
+            if combined is None:
+                combined = ParsedReviewResponse(
+                    verdict=parsed.verdict,
+                    provider=parsed.provider,
+                    model=parsed.model,
+                    structured_response={"shards": {}},
+                )
+                merged[tool] = combined
+            elif VERDICT_SEVERITY[parsed.verdict] > VERDICT_SEVERITY[combined.verdict]:
+                combined.verdict = parsed.verdict
+
+            combined.structured_response["shards"][shard_id] = parsed.verdict.value
+            combined.issues.extend(f"[{shard_id}] {issue}" for issue in parsed.issues)
+            combined.recommendations.extend(f"[{shard_id}] {rec}" for rec in parsed.recommendations)
+            if parsed.summary:
+                summary_line = f"{shard_id}: {parsed.summary}"
+                combined.summary = f"{combined.summary}\n{summary_line}" if combined.summary else summary_line
+
+    return list(merged.values())
+
+
+def build_shard_prompts(
+    reviewer,
+    shards: List[ReviewShard],
+    include_tests: bool = True,
+    base_branch: str = "main",
+    max_prompt_tokens: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Build the review prompt for every shard.
+
+    Diffs for all shard files are prefetched with one batched git invocation
+    before any prompt is generated.
+
+    Args:
+        reviewer: FidelityReviewer with a loaded spec
+        shards: Shards from plan_review_shards()
+        include_tests: Include test results in shard prompts
+        base_branch: Base branch for git diff
+        max_prompt_tokens: Token budget for each shard prompt (None = reviewer default)
+
+    Returns:
+        Dictionary mapping shard IDs to prompts, in shard order
+    """
+    all_paths: List[str] = []
+    for shard in shards:
+        all_paths.extend(shard.file_paths)
+    reviewer.diff_collector.prefetch(all_paths)
+
+    prompt_kwargs: Dict[str, Any] = {"include_tests": include_tests, "base_branch": base_branch}
+    if max_prompt_tokens is not None:
+        prompt_kwargs["max_prompt_tokens"] = max_prompt_tokens
+
+    prompts: Dict[str, str] = {}
+    for shard in shards:
+        if shard.scope == "task":
+            prompts[shard.shard_id] = reviewer.generate_review_prompt(task_id=shard.shard_id, **prompt_kwargs)
+        else:
+            prompts[shard.shard_id] = reviewer.generate_review_prompt(phase_id=shard.shard_id, **prompt_kwargs)
+    return prompts
+
+
+def run_sharded_review(
+    reviewer,
+    shards: List[ReviewShard],
+    tools: Optional[List[str]] = None,
+    model: Optional[str] = None,
+    timeout: int = 600,
+    max_concurrency: Optional[int] = None,
+    include_tests: bool = True,
+    base_branch: str = "main",
+    max_prompt_tokens: Optional[int] = None,
+    progress_emitter: Optional[ProgressEmitter] = None,
+) -> List[ShardResult]:
+    """
+    Review shards concurrently, consulting all tools for each shard.
+
+    Prompts are built up front (see build_shard_prompts), then at most ``max_concurrency`` shards are consulted at a
+    time. Each shard is cached separately, so re-running after changing one
+    task only re-consults that task's shard.
+
+    Args:
+        reviewer: FidelityReviewer with a loaded spec
+        shards: Shards from plan_review_shards()
+        tools: Tools to consult (default: all available)
+        model: Model override passed to every consultation
+        timeout: Timeout in seconds per tool
+        max_concurrency: Shards consulted at once (default: config, see
+                         get_fidelity_shard_concurrency)
+        include_tests: Include test results in shard prompts
+        base_branch: Base branch for git diff
+        max_prompt_tokens: Token budget for each shard prompt
+        progress_emitter: Optional ProgressEmitter for structured events
+
+    Returns:
+        One ShardResult per shard, in shard order
+
+    Raises:
+        ConsultationError: If every shard failed (the first error is re-raised)
+    """
+    if not shards:
+        return []
+
+    max_concurrency = max_concurrency or get_fidelity_shard_concurrency()
+    prompts = build_shard_prompts(
+        reviewer,
+        shards,
+        include_tests=include_tests,
+        base_branch=base_branch,
+        max_prompt_tokens=max_prompt_tokens,
+    )
+
+    errors: Dict[str, ConsultationError] = {}
+
+    def consult(shard: ReviewShard) -> ShardResult:
+        if progress_emitter:
+            progress_emitter.emit("shard_started", {"shard_id": shard.shard_id, "scope": shard.scope})
+        try:
+            responses = consult_multiple_ai_on_fidelity(
+                prompt=prompts[shard.shard_id],
+                tools=tools,
+                model=model,
+                timeout=timeout,
+                cache_key_params={
+                    "spec_id": reviewer.spec_id,
+                    "scope": shard.scope,
+                    "target": shard.shard_id,
+                    "file_paths": shard.file_paths,
+                    "content_hash": shard.content_hash,
+                },
+                progress_emitter=progress_emitter,
+            )
+        except ConsultationError as e:
+            logger.warning(f"Fidelity review shard {shard.shard_id} failed: {e}")
+            errors[shard.shard_id] = e
+            return ShardResult(shard=shard, error=str(e))
+
+        result = ShardResult(
+            shard=shard,
+            responses=responses,
+            parsed_responses=parse_multiple_responses(responses),
+        )
+        if progress_emitter:
+            progress_emitter.emit("shard_complete", result.to_dict())
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(shards))) as executor:
+        results = list(executor.map(consult, shards))
+
+    if len(errors) == len(shards):
+        raise errors[shards[0].shard_id]
+
+    return results
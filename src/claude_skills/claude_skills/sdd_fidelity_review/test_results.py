@@ -0,0 +1,274 @@
+"""
+Test result collection for fidelity reviews.
+
+Runs every test file relevant to a review scope in a single pytest invocation
+(optionally distributed with pytest-xdist), parses one JUnit XML report, and caches
+the parsed results keyed by the contents of the test files and the source files
+under review. Re-reviewing unchanged code reuses the previous results instead of
+re-running the tests.
+"""
+
+import copy
+import importlib.util
+import logging
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Import cache modules with fallback
+try:
+    from claude_skills.common.cache import CacheManager, generate_test_results_key
+    from claude_skills.common.config import is_cache_enabled
+    _CACHE_AVAILABLE = True
+except ImportError:
+    _CACHE_AVAILABLE = False
+
+from claude_skills.common.doc_helper import get_current_git_commit
+from claude_skills.common.test_history import TestHistory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEST_TIMEOUT = 300  # 5 minutes for the whole scope
+
+
+def parse_junit_xml(xml_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse JUnit XML test results.
+
+    Args:
+        xml_path: Path to JUnit XML file
+
+    Returns:
+        Test results dictionary or None if parsing fails
+    """
+    try:
+        tree = ET.parse(xml_path)
+        root = tree.getroot()
+
+        # Initialize results structure
+        results = {
+            "total": 0,
+            "passed": 0,
+            "failed": 0,
+            "errors": 0,
+            "skipped": 0,
+            "duration": 0.0,
+            "tests": {}
+        }
+
+        # Aggregate suite attributes (pytest-xdist and some runners emit several suites)
+        testsuites = list(root.iter('testsuite'))
+        if not testsuites:
+            testsuites = [root]  # Root might be testsuite itself
+
+        for testsuite in testsuites:
+            results["total"] += int(testsuite.get('tests', 0))
+            results["failed"] += int(testsuite.get('failures', 0))
+            results["errors"] += int(testsuite.get('errors', 0))
+            results["skipped"] += int(testsuite.get('skipped', 0))
+            results["duration"] += float(testsuite.get('time', 0))
+        results["passed"] = results["total"] - results["failed"] - results["errors"] - results["skipped"]
+
+        # Parse individual test cases
+        for testcase in root.iter('testcase'):
+            test_name = testcase.get('name', 'unknown')
+            classname = testcase.get('classname', '')
+            duration = float(testcase.get('time', 0))
+
+            # Determine test status
+            failure = testcase.find('failure')
+            error = testcase.find('error')
+            skipped = testcase.find('skipped')
+
+            if failure is not None:
+                status = "failed"
+                message = failure.get('message', '')
+                traceback = failure.text or ''
+            elif error is not None:
+                status = "error"
+                message = error.get('message', '')
+                traceback = error.text or ''
+            elif skipped is not None:
+                status = "skipped"
+                message = skipped.get('message', '')
+                traceback = None
+            else:
+                status = "passed"
+                message = ''
+                traceback = None
+
+            # Store test result
+            full_test_name = f"{classname}::{test_name}" if classname else test_name
+            results["tests"][full_test_name] = {
+                "status": status,
+                "message": message,
+                "duration": duration,
+                "traceback": traceback
+            }
+
+        return results
+
+    except ET.ParseError as e:
+        logger.warning(f"Failed to parse JUnit XML {xml_path}: {e}")
+        return None
+    except Exception as e:
+        logger.warning(f"Error parsing test results from {xml_path}: {e}")
+        return None
+
+
+def is_xdist_available() -> bool:
+    """Check whether pytest-xdist is installed."""
+    return importlib.util.find_spec("xdist") is not None
+
+
+class ReviewTestResultProvider:
+    """
+    Run and cache the tests relevant to a fidelity review scope.
+
+    All test files for the scope are executed in one pytest process, and parsed
+    results are cached (in memory and, when caching is enabled, on disk via
+    CacheManager) under a key derived from the test and source file contents.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        cache: Optional["CacheManager"] = None,
+        timeout: int = DEFAULT_TEST_TIMEOUT,
+        history: Optional[TestHistory] = None,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            workers: Number of pytest-xdist workers (ignored when xdist is not installed)
+            use_cache: Enable persistent caching (overrides config, defaults to config setting)
+            cache: Optional CacheManager instance to use
+            timeout: Timeout in seconds for the pytest invocation
+            history: Test outcome history that fresh runs are recorded in (optional)
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.history = history
+        if use_cache is None:
+            use_cache = _CACHE_AVAILABLE and is_cache_enabled()
+        self.use_cache = use_cache and _CACHE_AVAILABLE
+        self._cache = cache
+        self._memo: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def cache(self) -> Optional["CacheManager"]:
+        """Lazily created CacheManager (None when caching is disabled)."""
+        if not self.use_cache:
+            return None
+        if self._cache is None:
+            self._cache = CacheManager()
+        return self._cache
+
+    def build_command(self, test_files: List[str], xml_path: str) -> List[str]:
+        """
+        Build the pytest command for a set of test files.
+
+        Args:
+            test_files: Test files to run
+            xml_path: Path where the JUnit XML report should be written
+
+        Returns:
+            Command list for subprocess
+        """
+        cmd = ['pytest', *test_files, f'--junit-xml={xml_path}', '-v']
+        if self.workers and self.workers > 1 and is_xdist_available():
+            cmd.extend(['-n', str(self.workers)])
+        return cmd
+
+    def run_tests(self, test_files: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Run pytest once for all test files and parse the JUnit report.
+
+        Args:
+            test_files: Test files to run
+
+        Returns:
+            Test results dictionary or None if execution fails
+        """
+        # Create temporary XML file for results
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as tmp:
+            xml_path = tmp.name
+
+        try:
+            subprocess.run(
+                self.build_command(test_files, xml_path),
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=self.timeout
+            )
+
+            if Path(xml_path).exists() and Path(xml_path).stat().st_size > 0:
+                results = parse_junit_xml(xml_path)
+                if results and self.history is not None:
+                    self.history.record(
+                        [(name, test["status"], test["duration"]) for name, test in results["tests"].items()],
+                        commit=get_current_git_commit(),
+                        source="fidelity-review",
+                    )
+                return results
+
+            logger.warning(f"JUnit XML file not created for {', '.join(test_files)}")
+            return None
+
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Test execution timed out for {', '.join(test_files)}")
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to run tests for {', '.join(test_files)}: {e}")
+            return None
+        finally:
+            # Ensure temp file is cleaned up
+            if Path(xml_path).exists():
+                Path(xml_path).unlink()
+
+    def get_results(
+        self,
+        test_files: Iterable[str],
+        source_files: Iterable[str] = (),
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get test results for a review scope, running tests only on a cache miss.
+
+        Args:
+            test_files: Test files relevant to the scope (missing files are skipped)
+            source_files: Source files under review (part of the cache key)
+
+        Returns:
+            Test results dictionary, or None if there are no runnable test files
+        """
+        existing = sorted(path for path in dict.fromkeys(test_files) if path and Path(path).exists())
+        if not existing:
+            return None
+
+        sources = sorted(path for path in dict.fromkeys(source_files) if path and path not in existing)
+        key = generate_test_results_key(existing, sources) if _CACHE_AVAILABLE else "|".join(existing)
+
+        if key in self._memo:
+            return copy.deepcopy(self._memo[key])
+
+        cache = self.cache
+        if cache is not None:
+            cached = cache.get(key)
+            if cached:
+                logger.info("Cache hit: Using cached fidelity test results")
+                self._memo[key] = cached
+                return copy.deepcopy(cached)
+
+        results = self.run_tests(existing)
+        if results is None:
+            return None
+
+        self._memo[key] = results
+        if cache is not None:
+            cache.set(key, results, metadata={"review_type": "fidelity-tests"})
+        return copy.deepcopy(results)
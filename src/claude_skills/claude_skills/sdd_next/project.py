@@ -9,6 +9,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from claude_skills.common.paths import iter_matching_files
+
 
 def detect_project(directory: Optional[Path] = None) -> Dict:
     """
@@ -140,21 +142,19 @@ def find_tests(directory: Optional[Path] = None, source_file: Optional[str] = No
 
     # Common test file patterns
     patterns = [
-        "**/*.test.js",
-        "**/*.spec.js",
-        "**/*.test.ts",
-        "**/*.spec.ts",
-        "**/*_test.py",
-        "**/*_test.go",
-        "**/test_*.py",
-        "**/*_spec.rb",
-        "**/*Test.java"
+        "*.test.js",
+        "*.spec.js",
+        "*.test.ts",
+        "*.spec.ts",
+        "*_test.py",
+        "*_test.go",
+        "test_*.py",
+        "*_spec.rb",
+        "*Test.java"
     ]
 
-    test_files = []
-    for pattern in patterns:
-        matches = list(directory.glob(pattern))
-        test_files.extend([str(m.resolve()) for m in matches if m.is_file()])
+    # One walk for all patterns (skips .git, node_modules, virtualenvs, ...)
+    test_files = [str(m.resolve()) for m in iter_matching_files(directory, patterns)]
 
     result["test_files"] = sorted(list(set(test_files)))
 
@@ -12,6 +12,7 @@ from claude_skills.sdd_plan_review.prompts import (
 from claude_skills.sdd_plan_review.synthesis import (
     parse_response,
     build_consensus,
+    compute_claim_agreement,
 )
 from claude_skills.sdd_plan_review.reporting import (
     generate_markdown_report,
@@ -24,6 +25,7 @@ __all__ = [
     "generate_review_prompt",
     "parse_response",
     "build_consensus",
+    "compute_claim_agreement",
     "generate_markdown_report",
     "generate_json_report",
 ]
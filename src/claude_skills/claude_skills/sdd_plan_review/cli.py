@@ -197,6 +197,7 @@ def cmd_review(args, printer):
         parallel=True,
         model_override=model_override,
         silent=json_requested,
+        use_cache=args.cache,
     )
 
     # Display execution summary
@@ -478,7 +479,7 @@ def register_plan_review(subparsers, parent_parser):
     parser_review.add_argument(
         '--cache',
         action='store_true',
-        help='Use cached results if available'
+        help='Reuse cached findings for spec sections unchanged since the last review'
     )
     parser_review.add_argument(
         '--dry-run',
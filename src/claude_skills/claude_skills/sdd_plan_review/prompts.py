@@ -6,7 +6,10 @@ Generates prompts that actively fight LLM sycophancy by assuming problems exist
 and demanding critical analysis.
 """
 
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Optional
+
+from claude_skills.sdd_plan_review.sections import SpecSection
 
 
 # Response schema that models must follow
@@ -88,6 +91,89 @@ def generate_review_prompt(
         return _generate_full_review_prompt(spec_content, spec_id, title)
 
 
+@dataclass
+class ReviewPrompt:
+    """A review prompt split for prefix reuse.
+
+    Attributes:
+        prefix: Instructions, output format and the unchanged spec sections;
+            byte-identical across tools and across re-reviews that leave
+            those sections alone, so provider-side prompt caching can reuse it
+        suffix: Per-run part: changed sections and re-review instructions
+    """
+    prefix: str
+    suffix: str = ""
+
+    @property
+    def text(self) -> str:
+        return self.prefix + self.suffix
+
+
+_SPEC_PLACEHOLDER = "\x00SPEC\x00"
+_SPEC_LABEL = "**SPECIFICATION TO REVIEW:**"
+
+RE_REVIEW_NOTE = """**This is a re-review.** The sections above changed since the last review; findings for the \
+other sections are kept from that review. Review only the changed sections, using the rest of the \
+specification as context, but do flag issues the changes introduce elsewhere.
+"""
+
+
+def _render_sections(sections: Iterable[SpecSection]) -> str:
+    parts = []
+    for section in sections:
+        if section.id == "spec":
+            parts.append(section.text.rstrip() + "\n\n")
+        else:
+            parts.append(f"### Section: {section.title} (`{section.id}`)\n\n```json\n{section.text}\n```\n\n")
+    return "".join(parts)
+
+
+def build_review_prompt(
+    sections: List[SpecSection],
+    review_type: str,
+    spec_id: str = "unknown",
+    title: str = "Specification",
+    changed_ids: Optional[Iterable[str]] = None,
+) -> ReviewPrompt:
+    """
+    Build a review prompt with a stable prefix and a per-run suffix.
+
+    Uses the same instructions as generate_review_prompt, but puts the
+    specification last so everything before the changed sections can be
+    shared between runs.
+
+    Args:
+        sections: Spec sections (see sections.split_spec_sections)
+        review_type: Type of review (quick, full, security, feasibility)
+        spec_id: Specification ID
+        title: Specification title
+        changed_ids: Sections to re-review; None reviews everything
+
+    Returns:
+        ReviewPrompt
+    """
+    framed = generate_review_prompt(_SPEC_PLACEHOLDER, review_type, spec_id, title)
+    head, tail = framed.split(_SPEC_PLACEHOLDER)
+    instructions = head.replace(_SPEC_LABEL, "").rstrip()
+    output_format = tail.strip().lstrip("-").strip()
+
+    changed = set(changed_ids) if changed_ids is not None else set()
+    prefix = (
+        f"{instructions}\n\n{output_format}\n\n---\n\n{_SPEC_LABEL}\n\n"
+        + _render_sections(s for s in sections if s.id not in changed)
+    )
+    if not changed:
+        return ReviewPrompt(prefix=prefix)
+
+    suffix = (
+        "**CHANGED SECTIONS (review these):**\n\n"
+        + _render_sections(s for s in sections if s.id in changed)
+        + "---\n\n"
+        + RE_REVIEW_NOTE
+    )
+    return ReviewPrompt(prefix=prefix, suffix=suffix)
+
+
 def _generate_full_review_prompt(spec_content: str, spec_id: str, title: str) -> str:
     """Generate full comprehensive review prompt."""
     return f"""You are conducting a comprehensive technical review of a software specification.
@@ -8,6 +8,9 @@ Generates markdown and JSON reports from multi-model consensus data.
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
+# Most shared points listed in the markdown report
+MAX_SHARED_CLAIMS = 15
+
 
 def generate_markdown_report(
     consensus: Dict[str, Any],
@@ -56,6 +59,19 @@ def generate_markdown_report(
         lines.append("")
 
     lines.append("")
+
+    # Offline claim clustering: points several models made, however phrased
+    claim_agreement = consensus.get("claim_agreement") or {}
+    shared_claims = [c for c in claim_agreement.get("clusters", []) if len(c.get("sources", [])) > 1]
+    if shared_claims:
+        lines.append("## Shared Points (Claim Clustering)")
+        lines.append("")
+        lines.append(f"**Overall Agreement**: {claim_agreement.get('overall_agreement', 0.0):.0%}")
+        lines.append("")
+        for cluster in shared_claims[:MAX_SHARED_CLAIMS]:
+            lines.append(f"- {cluster['claim']} — {', '.join(cluster['sources'])}")
+        lines.append("")
+
     lines.append("---")
     lines.append("")
 
@@ -115,4 +131,5 @@ def generate_json_report(
         "agreements": consensus.get("agreements", []),
         "disagreements": consensus.get("disagreements", []),
         "synthesis_notes": consensus.get("synthesis_notes", []),
+        "claim_agreement": consensus.get("claim_agreement"),
     }
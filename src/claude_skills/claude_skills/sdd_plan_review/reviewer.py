@@ -7,19 +7,64 @@ Uses shared implementations from common.ai_tools for tool detection and
 execution, with response synthesis and consensus building.
 """
 
+import hashlib
 import subprocess
 import json
+import re
 import time
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from claude_skills.sdd_plan_review.prompts import generate_review_prompt
+from claude_skills.sdd_plan_review.prompts import build_review_prompt
+from claude_skills.sdd_plan_review.sections import (
+    GENERAL_FINDINGS,
+    SectionReviewCache,
+    SpecSection,
+    attribute_findings,
+    extract_findings,
+    render_findings,
+    split_spec_sections,
+)
 from claude_skills.sdd_plan_review.synthesis import parse_response, build_consensus
 from claude_skills.common.ai_tools import check_tool_available, execute_tools_parallel
+from claude_skills.common.cache import is_response_cache_bypassed
+from claude_skills.common.config import is_cache_enabled
 from claude_skills.common import ai_config
 
 
+def _changed_sections(sections: List[SpecSection], cached: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+    """Ids of sections whose content has no cached findings (None means review everything)."""
+    if not cached:
+        return None
+    return tuple(s.id for s in sections if s.content_hash not in cached["sections"])
+
+
+def _merge_findings(
+    output: str,
+    sections: List[SpecSection],
+    changed: Tuple[str, ...],
+    cached: Dict[str, Any],
+) -> Tuple[Dict[str, List[Dict[str, str]]], Dict[str, List[Dict[str, str]]]]:
+    """
+    Combine a (re-)review response with cached findings.
+
+    Returns:
+        (findings for every current section plus GENERAL_FINDINGS,
+         the reused findings of unchanged sections)
+    """
+    fresh = attribute_findings(extract_findings(output), sections)
+    merged: Dict[str, List[Dict[str, str]]] = {GENERAL_FINDINGS: fresh.get(GENERAL_FINDINGS, [])}
+    reused: Dict[str, List[Dict[str, str]]] = {}
+    for section in sections:
+        if cached and section.id not in changed:
+            reused[section.id] = cached["sections"].get(section.content_hash, [])
+            merged[section.id] = reused[section.id]
+        else:
+            merged[section.id] = fresh.get(section.id, [])
+    return merged, reused
+
+
 def review_with_tools(
     spec_content: str,
     tools: List[str],
@@ -29,6 +74,8 @@ def review_with_tools(
     parallel: bool = True,
     model_override: Any = None,
     silent: bool = False,
+    use_cache: bool = False,
+    section_cache: Optional[SectionReviewCache] = None,
 ) -> Dict[str, Any]:
     """
     Review a spec using multiple AI tools with full synthesis.
@@ -42,6 +89,14 @@ def review_with_tools(
         spec_id: Specification ID
         spec_title: Specification title
         parallel: Deprecated - tools always run in parallel (kept for compatibility)
+        model_override: Model override passed to the model resolver
+        silent: Suppress progress output
+        use_cache: Reuse each tool's findings for sections unchanged since its
+            last review; only changed sections are sent for review
+        section_cache: Cache to use (defaults to the shared cache directory)
+
+    The prompt puts instructions and unchanged sections in a prefix that is
+    identical across tools and re-reviews, followed by the changed sections.
 
     Returns:
         Review results with parsed responses and consensus
@@ -60,8 +115,7 @@ def review_with_tools(
 
     start_time = time.time()
 
-    # Generate review prompt using new prompts module
-    prompt = generate_review_prompt(spec_content, review_type, spec_id, spec_title)
+    sections = split_spec_sections(spec_content)
 
     # Show what we're asking the external AI models to evaluate
     review_dimensions = {
@@ -88,32 +142,95 @@ def review_with_tools(
         context={"review_type": review_type} if review_type else None,
     )
 
-    # Execute tools in parallel using shared implementation
-    multi_response = execute_tools_parallel(
-        tools=enabled_tools,
-        prompt=prompt,
-        models=dict(resolved_models),
-        timeout=600
-    )
+    # Look up each tool's findings from earlier reviews of this spec
+    caching = use_cache and is_cache_enabled() and not is_response_cache_bypassed()
+    if caching and section_cache is None:
+        section_cache = SectionReviewCache()
+    cached_by_tool: Dict[str, Dict[str, Any]] = {}
+    groups: Dict[Optional[Tuple[str, ...]], List[str]] = {}
+    for tool in enabled_tools:
+        cached = section_cache.load(spec_id, review_type, tool, resolved_models.get(tool)) if caching else {}
+        cached_by_tool[tool] = cached
+        changed = _changed_sections(sections, cached)
+        if changed == ():
+            # Nothing changed: replay the cached findings without calling the tool
+            results["raw_responses"].append({
+                "success": True,
+                "tool": tool,
+                "output": render_findings(
+                    {**{s.id: cached["sections"][s.content_hash] for s in sections},
+                     GENERAL_FINDINGS: cached.get("general", [])},
+                    sections,
+                ),
+                "error": None,
+                "duration": 0.0,
+                "cached": True,
+            })
+            results.setdefault("reused_sections", {})[tool] = [s.id for s in sections]
+            if not silent:
+                print(f"   ✓ {tool} reused cached findings (spec unchanged)")
+            continue
+        groups.setdefault(changed, []).append(tool)
 
-    # Process responses - convert to dict format for backward compatibility
-    for tool, response in multi_response.responses.items():
-        result = {
-            "success": response.success,
-            "tool": response.tool,
-            "output": response.output if response.success else None,
-            "error": response.error if not response.success else None,
-            "duration": response.duration,
-        }
+    # Execute tools in parallel using shared implementation; tools with the
+    # same changed sections share one prompt (and one parallel run)
+    parallel_kwargs: Dict[str, Any] = {}
+    completion_policy = ai_config.get_completion_policy("sdd-plan-review")
+    if completion_policy != "all":
+        parallel_kwargs["policy"] = completion_policy
+    for changed, group in groups.items():
+        prompt = build_review_prompt(sections, review_type, spec_id, spec_title, changed_ids=changed)
+        results.setdefault("prompt", {
+            "prefix_chars": len(prompt.prefix),
+            "suffix_chars": len(prompt.suffix),
+            "prefix_hash": hashlib.sha256(prompt.prefix.encode("utf-8")).hexdigest()[:16],
+        })
+        if changed and not silent:
+            print(f"   Re-reviewing {len(changed)}/{len(sections)} changed section(s) with {', '.join(group)}")
+        multi_response = execute_tools_parallel(
+            tools=group,
+            prompt=prompt.text,
+            models={tool: resolved_models.get(tool) for tool in group},
+            timeout=600,
+            **parallel_kwargs
+        )
+        if multi_response.abandoned and not silent:
+            print(
+                f"   ⏭ Stopped waiting for {', '.join(multi_response.abandoned)} "
+                f"(completion policy: {multi_response.policy})"
+            )
 
-        if response.success:
-            results["raw_responses"].append(result)
-            if not silent:
-                print(f"   ✓ {tool} completed ({response.duration:.1f}s)")
-        else:
-            results["failures"].append(result)
-            if not silent:
-                print(f"   ✗ {tool} failed: {response.error or 'unknown error'}")
+        # Process responses - convert to dict format for backward compatibility
+        for tool, response in multi_response.responses.items():
+            result = {
+                "success": response.success,
+                "tool": response.tool,
+                "output": response.output if response.success else None,
+                "error": response.error if not response.success else None,
+                "duration": response.duration,
+            }
+
+            if response.success:
+                if caching:
+                    review_text = parse_response(response.output, tool)["raw_output"]
+                    merged, reused = _merge_findings(review_text, sections, changed or (), cached_by_tool[tool])
+                    section_cache.store(spec_id, review_type, tool, resolved_models.get(tool), sections, merged)
+                    if reused:
+                        results.setdefault("reused_sections", {})[tool] = list(reused)
+                        earlier = render_findings(reused, sections)
+                        if earlier:
+                            result["output"] = (
+                                review_text.rstrip()
+                                + "\n\n## Earlier Findings (unchanged sections)\n\n"
+                                + re.sub(r"^## ", "### ", earlier, flags=re.MULTILINE)
+                            )
+                results["raw_responses"].append(result)
+                if not silent:
+                    print(f"   ✓ {tool} completed ({response.duration:.1f}s)")
+            else:
+                results["failures"].append(result)
+                if not silent:
+                    print(f"   ✗ {tool} failed: {response.error or 'unknown error'}")
 
     # Parse responses using synthesis module
     for raw_response in results["raw_responses"]:
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Section-level reuse for plan reviews.
+
+A spec is split into sections (an overview plus one per phase) whose content
+hashes ignore progress fields, so marking tasks done does not count as a
+change. Each tool's findings are attributed to sections and cached by
+section hash; a re-review then only asks about sections whose hash changed
+and reuses earlier findings for the rest.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from claude_skills.common.cache import CacheManager, generate_plan_review_section_key
+from claude_skills.common.similarity import best_match
+
+logger = logging.getLogger(__name__)
+
+# Progress bookkeeping that doesn't change what is being reviewed
+VOLATILE_SPEC_KEYS = frozenset({"generated", "last_updated", "journal"})
+VOLATILE_NODE_KEYS = frozenset({"status", "completed_tasks", "started_at", "completed_at", "actual_hours"})
+
+OVERVIEW_SECTION_ID = "overview"
+
+# Findings that don't belong to one section (cross-cutting concerns)
+GENERAL_FINDINGS = "general"
+
+# Cached findings expire after this long (hours)
+SECTION_CACHE_TTL_HOURS = 24 * 30
+
+_HEADING_RE = re.compile(r"^#{2,3}\s+(.+?)\s*$")
+_ITEM_RE = re.compile(r"^(?:[-*+]|\d+[.)])\s+")
+
+
+@dataclass
+class SpecSection:
+    """A reviewable part of a spec.
+
+    Attributes:
+        id: "overview", a phase node id, or "spec" for non-JSON specs
+        title: Human-readable title
+        text: Content shown to the models
+        node_ids: Hierarchy node ids in the section
+    """
+    id: str
+    title: str
+    text: str
+    node_ids: List[str] = field(default_factory=list)
+
+    @property
+    def content_hash(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()[:16]
+
+
+def _strip_progress(node: Dict[str, Any]) -> Dict[str, Any]:
+    stripped = {k: v for k, v in node.items() if k not in VOLATILE_NODE_KEYS}
+    if isinstance(stripped.get("metadata"), dict):
+        stripped["metadata"] = {
+            k: v for k, v in stripped["metadata"].items() if k not in VOLATILE_NODE_KEYS
+        }
+    return stripped
+
+
+def _render(data: Any) -> str:
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def split_spec_sections(spec_content: str) -> List[SpecSection]:
+    """
+    Split spec content into review sections.
+
+    JSON specs yield an overview section (top-level fields, the spec root and
+    nodes outside any phase) followed by one section per child of the spec
+    root, in hierarchy order. Anything else is a single section.
+
+    Args:
+        spec_content: Raw spec file content
+
+    Returns:
+        List of SpecSection
+    """
+    try:
+        spec = json.loads(spec_content)
+    except (json.JSONDecodeError, TypeError):
+        spec = None
+    hierarchy = spec.get("hierarchy") if isinstance(spec, dict) else None
+    if not isinstance(hierarchy, dict):
+        return [SpecSection(id="spec", title="Specification", text=spec_content)]
+
+    root_id = next(
+        (node_id for node_id, node in hierarchy.items() if isinstance(node, dict) and not node.get("parent")),
+        None,
+    )
+    root = hierarchy.get(root_id) or {}
+
+    sections: List[SpecSection] = []
+    claimed = {root_id} if root_id else set()
+    for child_id in root.get("children", []):
+        node = hierarchy.get(child_id)
+        if not isinstance(node, dict):
+            continue
+        node_ids: List[str] = []
+        stack = [child_id]
+        while stack:
+            node_id = stack.pop()
+            if node_id in claimed or not isinstance(hierarchy.get(node_id), dict):
+                continue
+            claimed.add(node_id)
+            node_ids.append(node_id)
+            stack.extend(reversed(hierarchy[node_id].get("children", [])))
+        sections.append(SpecSection(
+            id=child_id,
+            title=node.get("title", child_id),
+            text=_render({node_id: _strip_progress(hierarchy[node_id]) for node_id in node_ids}),
+            node_ids=node_ids,
+        ))
+
+    overview_nodes = [node_id for node_id in hierarchy if node_id not in claimed or node_id == root_id]
+    overview = {k: v for k, v in spec.items() if k != "hierarchy" and k not in VOLATILE_SPEC_KEYS}
+    overview["hierarchy"] = {
+        node_id: _strip_progress(hierarchy[node_id])
+        for node_id in overview_nodes if isinstance(hierarchy[node_id], dict)
+    }
+    sections.insert(0, SpecSection(
+        id=OVERVIEW_SECTION_ID,
+        title=spec.get("title") or "Overview",
+        text=_render(overview),
+        node_ids=overview_nodes,
+    ))
+    return sections
+
+
+def extract_findings(review_text: str) -> List[Dict[str, str]]:
+    """
+    Split a review (in the RESPONSE_SCHEMA format) into findings.
+
+    Returns:
+        List of {"category": <section heading>, "text": <top-level list item
+        with its nested lines>}; "None identified" placeholders are skipped
+    """
+    findings: List[Dict[str, str]] = []
+    category = "Findings"
+    current: Optional[List[str]] = None
+
+    def flush() -> None:
+        if current:
+            text = "\n".join(current).rstrip()
+            if not re.match(r"^[-*+\d.)\s]*none identified\.?$", text, re.IGNORECASE):
+                findings.append({"category": category, "text": text})
+
+    for line in review_text.splitlines():
+        heading = _HEADING_RE.match(line)
+        if heading:
+            flush()
+            current = None
+            category = heading.group(1).strip()
+        elif _ITEM_RE.match(line):
+            flush()
+            current = [line]
+        elif current is not None and (line.startswith((" ", "\t")) or not line.strip()):
+            current.append(line)
+        else:
+            flush()
+            current = None
+    flush()
+    return findings
+
+
+def _mentions(text: str, node_id: str) -> bool:
+    """Whether ``text`` names ``node_id`` (``task-1`` is not named by ``task-1-2``)."""
+    return re.search(rf"(?<![\w-]){re.escape(node_id)}(?![\w-])", text) is not None
+
+
+def attribute_findings(
+    findings: List[Dict[str, str]],
+    sections: List[SpecSection],
+) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Assign findings to the sections they are about.
+
+    A finding that names node ids of exactly one section belongs to it;
+    otherwise it goes to the most similar section by TF-IDF cosine, or to
+    GENERAL_FINDINGS if none is similar enough.
+
+    Returns:
+        Findings per section id (plus GENERAL_FINDINGS)
+    """
+    by_section: Dict[str, List[Dict[str, str]]] = {}
+    texts = [section.text for section in sections]
+    for finding in findings:
+        mentioned = {
+            section.id for section in sections
+            if any(_mentions(finding["text"], node_id) for node_id in section.node_ids)
+        }
+        if len(mentioned) == 1:
+            section_id = mentioned.pop()
+        else:
+            index = best_match(finding["text"], texts)
+            section_id = sections[index].id if index is not None else GENERAL_FINDINGS
+        by_section.setdefault(section_id, []).append(finding)
+    return by_section
+
+
+def render_findings(
+    findings_by_section: Dict[str, List[Dict[str, str]]],
+    sections: List[SpecSection],
+) -> str:
+    """Render cached findings as review markdown, grouped by category."""
+    titles = {section.id: section.title for section in sections}
+    by_category: Dict[str, List[str]] = {}
+    for section_id, findings in findings_by_section.items():
+        for finding in findings:
+            label = f" _(section: {titles[section_id]})_" if section_id in titles else ""
+            by_category.setdefault(finding["category"], []).append(finding["text"] + label)
+
+    lines: List[str] = []
+    for category, items in by_category.items():
+        lines.append(f"## {category}")
+        lines.append("")
+        lines.extend(items)
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n" if lines else ""
+
+
+class SectionReviewCache:
+    """
+    Per-tool findings keyed by section content hash.
+
+    One cache entry per (spec, review type, tool, model) maps section hashes
+    to the findings the tool raised about that exact section content.
+    """
+
+    def __init__(self, cache_manager: Optional[CacheManager] = None):
+        self.cache = cache_manager or CacheManager()
+
+    def load(self, spec_id: str, review_type: str, tool: str, model: Optional[str]) -> Dict[str, Any]:
+        """
+        Load a tool's cached findings.
+
+        Returns:
+            {"sections": {hash: [finding, ...]}, "general": [finding, ...]}
+            (empty dict on a miss)
+        """
+        entry = self.cache.get(generate_plan_review_section_key(spec_id, review_type, tool, model))
+        return entry if isinstance(entry, dict) and isinstance(entry.get("sections"), dict) else {}
+
+    def store(
+        self,
+        spec_id: str,
+        review_type: str,
+        tool: str,
+        model: Optional[str],
+        sections: List[SpecSection],
+        findings_by_section: Dict[str, List[Dict[str, str]]],
+    ) -> bool:
+        """Store findings for the current sections (entries for old section versions are dropped)."""
+        entry = {
+            "sections": {
+                section.content_hash: findings_by_section.get(section.id, [])
+                for section in sections
+            },
+            "general": findings_by_section.get(GENERAL_FINDINGS, []),
+        }
+        return self.cache.set(
+            generate_plan_review_section_key(spec_id, review_type, tool, model),
+            entry,
+            ttl_hours=SECTION_CACHE_TTL_HOURS,
+            metadata={"review_type": "plan-review-sections", "tool": tool, "model": model},
+        )
@@ -14,6 +14,7 @@ from statistics import mean, median
 from claude_skills.common import ai_config
 from claude_skills.common.ai_tools import execute_tool_with_fallback, ToolStatus
 from claude_skills.common import consultation_limits
+from claude_skills.common.similarity import AgreementReport, agreement_label, cluster_claims
 
 
 def parse_response(tool_output: str, tool_name: str) -> Dict[str, Any]:
@@ -269,6 +270,25 @@ def _parse_synthesis_text(synthesis_text: str) -> Dict[str, Any]:
     return data
 
 
+def compute_claim_agreement(responses: List[Dict[str, Any]]) -> AgreementReport:
+    """
+    Cluster the claims of raw model reviews offline (no AI call).
+
+    Complements the AI synthesis with a deterministic view of which points
+    several models made, even when phrased differently.
+
+    Args:
+        responses: List of response dicts with "tool" and "raw_review" keys
+
+    Returns:
+        AgreementReport across models
+    """
+    return cluster_claims({
+        resp.get("tool") or f"Model {i}": resp.get("raw_review") or ""
+        for i, resp in enumerate(responses, 1)
+    })
+
+
 def build_consensus(
     responses: List[Dict[str, Any]],
     spec_id: str = "unknown",
@@ -293,6 +313,8 @@ def build_consensus(
             "error": "No valid responses to synthesize",
         }
 
+    claim_agreement = compute_claim_agreement(responses).to_dict()
+
     # Call AI synthesis (always 1 tool call, no fallback)
     synthesis_result = synthesize_with_ai(
         responses=responses,
@@ -305,6 +327,7 @@ def build_consensus(
         return {
             "success": False,
             "error": synthesis_result.get("error", "Synthesis failed"),
+            "claim_agreement": claim_agreement,
         }
 
     synthesis_text = synthesis_result.get("synthesis_text", "")
@@ -317,7 +340,9 @@ def build_consensus(
         "num_models": synthesis_result.get("num_models", 0),
         "models": synthesis_result.get("models", []),
         "synthesis_text": synthesis_text,
-        "consensus_level": parsed_data.get("consensus_level"),
+        "consensus_level": parsed_data.get("consensus_level")
+        or agreement_label(claim_agreement["overall_agreement"]),
+        "claim_agreement": claim_agreement,
         "critical_blockers": parsed_data.get("critical_blockers", []),
         "major_suggestions": parsed_data.get("major_suggestions", []),
         "questions": parsed_data.get("questions", []),
@@ -79,7 +79,8 @@ def cmd_create_pr(args, printer: PrettyPrinter) -> int:
             spec_id=args.spec_id,
             spec_path=spec_file,
             specs_dir=specs_dir,
-            max_diff_size_kb=getattr(args, 'max_diff_kb', 50)
+            max_diff_size_kb=getattr(args, 'max_diff_kb', 50),
+            max_diff_tokens=getattr(args, 'max_diff_tokens', None),
         )
 
         # Validate PR readiness
@@ -255,6 +256,11 @@ def register_pr(subparsers, parent_parser):
         default=50,
         help='Maximum diff size in KB before truncation (default: 50)'
     )
+    parser.add_argument(
+        '--max-diff-tokens',
+        type=int,
+        help='Diff budget in tokens (overrides --max-diff-kb); files that do not fit get a summary line'
+    )
 
     parser.set_defaults(func=cmd_create_pr)
 
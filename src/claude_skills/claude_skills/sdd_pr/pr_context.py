@@ -8,82 +8,353 @@ from __future__ import annotations
 
 import subprocess
 import logging
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
 
 from claude_skills.common.spec import load_json_spec
 from claude_skills.common.git_metadata import find_git_root
+from claude_skills.common.prompt_budget import (
+    CHARS_PER_TOKEN,
+    DIFF_HEADER_PREFIX,
+    MIN_TRUNCATED_CHARS,
+    parse_diff_header_path,
+    split_diff_hunks,
+    truncate_diff,
+)
 
 logger = logging.getLogger(__name__)
 
+# Summary lines listed for files that don't fit the diff budget
+MAX_SUMMARY_LINES = 200
 
-def get_spec_git_diffs(repo_root: Path, base_branch: str, max_size_kb: int = 50) -> str:
-    """Get git diff between current branch and base branch.
+# Room kept for the summary block's header and "... and N more files" line
+SUMMARY_HEADER_CHARS = 80
+
+# Largest candidate set passed to git diff as pathspecs (command-line limits)
+MAX_PATHSPEC_FILES = 200
+
+# Most recent commits included in the PR context
+MAX_COMMITS = 200
+
+
+@dataclass
+class DiffFileStat:
+    """Churn of one file on the branch (from ``git diff --numstat``)."""
+    path: str
+    added: int = 0
+    removed: int = 0
+    binary: bool = False
+    relevant: bool = False
+
+    @property
+    def churn(self) -> int:
+        return self.added + self.removed
+
+    def summary_line(self, reason: str) -> str:
+        changes = "binary" if self.binary else f"+{self.added}/-{self.removed}"
+        return f"{self.path} | {changes} ({reason})"
+
+
+@dataclass
+class DiffContext:
+    """Budgeted branch diff for the PR prompt.
+
+    Attributes:
+        text: Rendered diff: included file diffs, then summary lines
+        files: All changed files, in rank order
+        included: Paths whose diff is included in full
+        truncated: Paths whose diff is included with hunks dropped
+        summarized: Paths that only got a summary line
+        timed_out: Whether git had to be stopped before the deadline
+    """
+    text: str = ""
+    files: List[DiffFileStat] = field(default_factory=list)
+    included: List[str] = field(default_factory=list)
+    truncated: List[str] = field(default_factory=list)
+    summarized: List[str] = field(default_factory=list)
+    timed_out: bool = False
+
+
+def _git_diff_command(base_branch: str, *options: str, paths: Iterable[str] = ()) -> List[str]:
+    cmd = ['git', '--literal-pathspecs', '-c', 'core.quotePath=false', 'diff', '--no-color', '--no-renames',
+           *options, f'{base_branch}...HEAD']
+    paths = list(paths)
+    return cmd + ['--', *paths] if paths else cmd
+
+
+def _stream_git(cmd: List[str], repo_root: Path, deadline: float) -> Iterator[str]:
+    """
+    Yield git's stdout line by line, killing git once ``deadline`` passes.
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline passed before git finished
+        subprocess.CalledProcessError: If git exited with an error
+    """
+    process = subprocess.Popen(
+        cmd,
+        cwd=repo_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+    )
+    timer = threading.Timer(max(0.0, deadline - time.monotonic()), process.kill)
+    timer.start()
+    try:
+        for line in process.stdout:
+            yield line
+        process.wait()
+    finally:
+        timer.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+    if time.monotonic() >= deadline:
+        raise subprocess.TimeoutExpired(cmd, 0)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+
+def get_diff_stats(
+    repo_root: Path,
+    base_branch: str,
+    relevant_files: Iterable[str] = (),
+    timeout: float = 10,
+) -> List[DiffFileStat]:
+    """Changed files ranked for the PR prompt.
+
+    Files named by spec tasks come first, then the rest; within each group
+    the most-changed files come first. Binary files go last.
 
     Args:
         repo_root: Path to repository root directory
         base_branch: Base branch name (e.g., 'main', 'develop')
-        max_size_kb: Maximum diff size in KB (truncate if larger)
+        relevant_files: File paths from spec task metadata
+        timeout: Timeout in seconds for ``git diff --numstat``
 
     Returns:
-        Git diff output as string, or empty string if error occurs.
-        Large diffs (>max_size_kb) are truncated with a summary message.
+        Ranked list of DiffFileStat (empty on error)
     """
+    stats = []
+    deadline = time.monotonic() + timeout
     try:
-        result = subprocess.run(
-            ['git', 'diff', f'{base_branch}...HEAD'],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
+        for line in _stream_git(_git_diff_command(base_branch, '--numstat'), repo_root, deadline):
+            parts = line.rstrip('\n').split('\t', 2)
+            if len(parts) != 3:
+                continue
+            added, removed, path = parts
+            binary = added == '-' or removed == '-'
+            stats.append(DiffFileStat(
+                path=path,
+                added=0 if binary else int(added),
+                removed=0 if binary else int(removed),
+                binary=binary,
+            ))
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        logger.warning(f"Git diff --numstat failed: {e}")
+        return []
+
+    relevant = [p.replace('\\', '/') for p in relevant_files if p]
+    relevant = [p[2:] if p.startswith('./') else p for p in relevant]
+    for stat in stats:
+        stat.relevant = any(
+            stat.path == rel or stat.path.endswith('/' + rel) or rel.endswith('/' + stat.path)
+            for rel in relevant
         )
+    stats.sort(key=lambda s: (not s.relevant, s.binary, -s.churn, s.path))
+    return stats
+
+
+def collect_diff_context(
+    repo_root: Path,
+    base_branch: str,
+    max_bytes: int = 50 * 1024,
+    relevant_files: Iterable[str] = (),
+    timeout: float = 30,
+) -> DiffContext:
+    """Stream the branch diff into a bounded, ranked context.
+
+    ``git diff`` output is read one line at a time and only the sections of
+    files that can still fit are buffered (each at most ``max_bytes``), so
+    memory stays bounded regardless of branch size; git is stopped once the
+    last such file has been read or ``timeout`` expires. Files are then
+    emitted in rank order (see get_diff_stats): in full while they fit,
+    hunk-truncated when partly fitting, and as a one-line summary otherwise.
 
-        if result.returncode != 0:
-            logger.warning(f"Git diff failed: {result.stderr}")
-            return ""
-
-        diff_output = result.stdout
-
-        # Check size and truncate if necessary
-        diff_size_kb = len(diff_output.encode('utf-8')) / 1024
-        if diff_size_kb > max_size_kb:
-            logger.info(f"Diff size ({diff_size_kb:.1f}KB) exceeds limit ({max_size_kb}KB), truncating")
-            # Get file-level summary instead
-            result = subprocess.run(
-                ['git', 'diff', '--stat', f'{base_branch}...HEAD'],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10
-            )
-
-            if result.returncode == 0:
-                return (
-                    f"[Diff too large ({diff_size_kb:.1f}KB), showing summary instead]\n\n"
-                    f"{result.stdout}\n\n"
-                    f"[Full diff omitted for brevity]"
-                )
-            else:
-                return f"[Diff too large ({diff_size_kb:.1f}KB), summary unavailable]"
+    Args:
+        repo_root: Path to repository root directory
+        base_branch: Base branch name (e.g., 'main', 'develop')
+        max_bytes: Budget for the rendered diff (characters)
+        relevant_files: File paths from spec task metadata
+        timeout: Overall timeout in seconds for both git invocations
 
-        return diff_output
+    Returns:
+        DiffContext (empty text if there are no changes or git failed)
+    """
+    deadline = time.monotonic() + timeout
+    context = DiffContext(files=get_diff_stats(repo_root, base_branch, relevant_files, timeout=timeout))
+    if not context.files:
+        return context
+
+    # Files that could (partly) fit by their line counts, ~40 characters per
+    # changed line; twice the budget leaves room for hunk-truncated files
+    candidates = set()
+    estimated = 0
+    for stat in context.files:
+        if stat.binary or estimated >= 2 * max_bytes:
+            continue
+        candidates.add(stat.path)
+        estimated += stat.churn * 40
+    last_candidate = max(candidates) if candidates else None
+
+    sections: Dict[str, List[str]] = {}
+    sizes: Dict[str, int] = {}
+    current: Optional[str] = None
+    if candidates:
+        try:
+            # Small candidate sets are passed as pathspecs so git skips other files
+            paths = sorted(candidates) if len(candidates) <= MAX_PATHSPEC_FILES else ()
+            cmd = _git_diff_command(base_branch, paths=paths)
+            with closing(_stream_git(cmd, repo_root, deadline)) as lines:
+                for line in lines:
+                    if line.startswith(DIFF_HEADER_PREFIX):
+                        if current is not None and current == last_candidate:
+                            break
+                        path = parse_diff_header_path(line)
+                        current = path if path in candidates else None
+                        if current is not None:
+                            sections[current] = []
+                            sizes[current] = 0
+                    if current is not None and sizes[current] <= max_bytes:
+                        sections[current].append(line)
+                        sizes[current] += len(line)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Git diff timed out after {timeout}s; using what was read")
+            context.timed_out = True
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Git diff failed: {e}")
+
+    diffs: Dict[str, str] = {}
+    partial: Set[str] = set()
+    for path, lines in sections.items():
+        diffs[path] = ''.join(lines)
+        if sizes[path] > max_bytes:
+            # Only a prefix was buffered: drop its last, incomplete hunk
+            partial.add(path)
+            header, hunks = split_diff_hunks(diffs[path])
+            if len(hunks) > 1:
+                diffs[path] = header + ''.join(hunks[:-1])
+
+    def reason(stat: DiffFileStat) -> str:
+        if stat.binary:
+            return 'not diffable'
+        if context.timed_out and stat.path in candidates and stat.path not in sections:
+            return 'diff timed out'
+        return 'omitted: over budget'
+
+    summary_lines = {stat.path: stat.summary_line(reason(stat)) for stat in context.files}
+
+    # Summary lines share the budget: if anything is left out, lay the diffs
+    # out again with room reserved for the list of what was left out
+    parts, remaining = _layout_diffs(context, diffs, partial, max_bytes)
+    if context.summarized:
+        reserve = min(
+            max_bytes // 5,
+            sum(len(summary_lines[path]) + 1 for path in context.summarized) + SUMMARY_HEADER_CHARS,
+        )
+        parts, remaining = _layout_diffs(context, diffs, partial, max_bytes - reserve)
+        remaining += reserve
+
+    if context.summarized:
+        header = f"\n[{len(context.summarized)} of {len(context.files)} changed files not shown in full]\n"
+        remaining -= len(header)
+        shown = []
+        for path in context.summarized[:MAX_SUMMARY_LINES]:
+            line = summary_lines[path] + '\n'
+            if len(line) > remaining - SUMMARY_HEADER_CHARS:
+                break
+            shown.append(line)
+            remaining -= len(line)
+        more = len(context.summarized) - len(shown)
+        parts.append(header + ''.join(shown) + (f"... and {more} more files\n" if more else ''))
 
-    except subprocess.TimeoutExpired:
-        logger.warning("Git diff timed out (>30s)")
-        return "[Git diff timed out]"
-    except Exception as e:
-        logger.warning(f"Failed to get git diff: {e}")
-        return ""
+    context.text = ''.join(parts)
+    return context
+
+
+def _layout_diffs(
+    context: DiffContext,
+    diffs: Dict[str, str],
+    partial: Set[str],
+    budget: int,
+) -> Tuple[List[str], int]:
+    """Fit file diffs into ``budget`` in rank order; fills the context's file lists."""
+    context.included, context.truncated, context.summarized = [], [], []
+    parts: List[str] = []
+    remaining = budget
+    for stat in context.files:
+        diff = diffs.get(stat.path, '')
+        if diff and len(diff) <= remaining:
+            parts.append(diff)
+            remaining -= len(diff)
+            (context.truncated if stat.path in partial else context.included).append(stat.path)
+        elif diff and remaining >= MIN_TRUNCATED_CHARS:
+            truncated = truncate_diff(diff, remaining)
+            parts.append(truncated if truncated.endswith('\n') else truncated + '\n')
+            remaining -= len(parts[-1])
+            context.truncated.append(stat.path)
+        else:
+            context.summarized.append(stat.path)
+    return parts, remaining
+
+
+def get_spec_git_diffs(
+    repo_root: Path,
+    base_branch: str,
+    max_size_kb: int = 50,
+    relevant_files: Iterable[str] = (),
+    max_tokens: Optional[int] = None,
+) -> str:
+    """Get git diff between current branch and base branch, within a budget.
+
+    Args:
+        repo_root: Path to repository root directory
+        base_branch: Base branch name (e.g., 'main', 'develop')
+        max_size_kb: Maximum diff size in KB
+        relevant_files: File paths from spec task metadata, ranked first
+        max_tokens: Token budget; overrides max_size_kb when given
+
+    Returns:
+        Git diff output as string, or empty string if error occurs.
+        Files that don't fit the budget are listed with a summary line.
+    """
+    max_bytes = max_tokens * CHARS_PER_TOKEN if max_tokens else max_size_kb * 1024
+    context = collect_diff_context(repo_root, base_branch, max_bytes=max_bytes, relevant_files=relevant_files)
+    if context.summarized or context.truncated:
+        logger.info(
+            f"Diff exceeds budget ({max_bytes // 1024}KB): {len(context.included)} file(s) in full, "
+            f"{len(context.truncated)} truncated, {len(context.summarized)} summarized"
+        )
+    return context.text
 
 
-def get_commit_history(repo_root: Path, base_branch: str) -> List[Dict[str, str]]:
+def get_commit_history(
+    repo_root: Path,
+    base_branch: str,
+    max_commits: int = MAX_COMMITS,
+) -> List[Dict[str, str]]:
     """Query git for commit history between base branch and current HEAD.
 
     Args:
         repo_root: Path to repository root directory
         base_branch: Base branch name (e.g., 'main', 'develop')
+        max_commits: Keep only the most recent commits (oldest first)
 
     Returns:
         List of commit dictionaries with keys: sha, message, timestamp.
@@ -91,7 +362,7 @@ def get_commit_history(repo_root: Path, base_branch: str) -> List[Dict[str, str]
     """
     try:
         result = subprocess.run(
-            ["git", "log", f"{base_branch}...HEAD", "--format=%H|%s|%aI", "--reverse"],
+            ["git", "log", f"{base_branch}...HEAD", f"--max-count={max_commits}", "--format=%H|%s|%aI", "--reverse"],
             cwd=repo_root,
             capture_output=True,
             text=True,
@@ -224,7 +495,8 @@ def gather_pr_context(
     spec_id: str,
     spec_path: Path,
     specs_dir: Path,
-    max_diff_size_kb: int = 50
+    max_diff_size_kb: int = 50,
+    max_diff_tokens: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Gather all context needed for AI-powered PR generation.
 
@@ -240,6 +512,7 @@ def gather_pr_context(
         spec_path: Path to spec file
         specs_dir: Path to specs directory
         max_diff_size_kb: Maximum diff size in KB before truncation
+        max_diff_tokens: Diff budget in tokens (overrides max_diff_size_kb)
 
     Returns:
         Dictionary with all collected context:
@@ -315,7 +588,18 @@ def gather_pr_context(
             base_branch = 'main'  # Final fallback
 
     # Gather git diff and commit history
-    git_diff = get_spec_git_diffs(repo_root, base_branch, max_diff_size_kb)
+    # Files named by spec tasks are ranked first within the diff budget
+    task_files = [
+        node.get('metadata', {}).get('file_path')
+        for node in spec_data.get('hierarchy', {}).values()
+    ]
+    git_diff = get_spec_git_diffs(
+        repo_root,
+        base_branch,
+        max_diff_size_kb,
+        relevant_files=[f for f in task_files if f],
+        max_tokens=max_diff_tokens,
+    )
     commits = get_commit_history(repo_root, base_branch)
 
     # Gather all context
@@ -7,6 +7,7 @@ Components:
     SpecRenderer: Basic markdown rendering (current functionality)
     AIEnhancedRenderer: AI-enhanced rendering orchestrator (phases 2-4)
     SpecAnalyzer: Spec analysis engine for critical paths and bottlenecks
+    SpecGraph: Immutable precomputed dependency graph shared by the analyzers
     PriorityRanker: Multi-factor priority scoring for intelligent task ordering
     ComplexityScorer: Task complexity scoring (1-10 scale) for adaptive formatting
     InsightGenerator: Actionable insights and recommendations from spec analysis
@@ -16,6 +17,7 @@ Components:
 from .renderer import SpecRenderer
 from .orchestrator import AIEnhancedRenderer
 from .spec_analyzer import SpecAnalyzer
+from .spec_graph import SpecGraph
 from .priority_ranker import PriorityRanker
 from .complexity_scorer import ComplexityScorer, ComplexityScore
 from .insight_generator import InsightGenerator
@@ -27,6 +29,7 @@ __all__ = [
     'SpecRenderer',
     'AIEnhancedRenderer',
     'SpecAnalyzer',
+    'SpecGraph',
     'PriorityRanker',
     'ComplexityScorer',
     'ComplexityScore',
@@ -137,12 +137,18 @@ class ComplexityScorer:
     def _count_subtasks(self, task_id: str) -> int:
         """Recursively count all subtasks under a task.
 
+        Uses the analyzer's precomputed subtask counts when available.
+
         Args:
             task_id: Task identifier
 
         Returns:
             Total count of subtasks (including nested)
         """
+        graph = getattr(self.analyzer, 'graph', None)
+        if graph is not None and task_id in graph.descendant_counts:
+            return graph.descendant_counts[task_id]
+
         task_data = self.hierarchy.get(task_id, {})
         children = task_data.get('children', [])
 
@@ -149,6 +149,7 @@ class DependencyGraphGenerator:
 
         if simplify:
             tasks = self._filter_major_tasks(tasks)
+        task_set = set(tasks)
 
         # Get critical path if highlighting
         critical_path_set = set()
@@ -172,7 +173,7 @@ class DependencyGraphGenerator:
 
                 # Generate nodes for tasks in this phase
                 for task_id in phase_tasks:
-                    if task_id in tasks:
+                    if task_id in task_set:
                         task_data = self.hierarchy.get(task_id, {})
                         node_line = self._generate_node(
                             task_id,
@@ -189,7 +190,7 @@ class DependencyGraphGenerator:
             for task_id in tasks:
                 deps = self.task_graph.get(task_id, [])
                 for dep_id in deps:
-                    if dep_id in tasks:
+                    if dep_id in task_set:
                         edge_line = self._generate_edge(
                             task_id,
                             dep_id,
@@ -212,7 +213,7 @@ class DependencyGraphGenerator:
             for task_id in tasks:
                 deps = self.task_graph.get(task_id, [])
                 for dep_id in deps:
-                    if dep_id in tasks:  # Only show edge if both nodes visible
+                    if dep_id in task_set:  # Only show edge if both nodes visible
                         edge_line = self._generate_edge(
                             task_id,
                             dep_id,
@@ -393,7 +394,8 @@ class DependencyGraphGenerator:
 
         # Apply critical path style (overrides status for emphasis)
         if critical_path:
-            critical_in_view = [t for t in critical_path if t in tasks]
+            task_set = set(tasks)
+            critical_in_view = [t for t in critical_path if t in task_set]
             if critical_in_view:
                 lines.append(f"    classDef critical stroke:#1565C0,stroke-width:4px")
                 for task_id in critical_in_view:
@@ -16,7 +16,7 @@ from dataclasses import dataclass
 from .markdown_parser import ParsedSpec, ParsedPhase, ParsedGroup, ParsedTask, MarkdownParser
 from .executive_summary import ExecutiveSummaryGenerator
 from .visualization_builder import VisualizationBuilder
-from .narrative_enhancer import NarrativeEnhancer
+from .narrative_enhancer import NarrativeElement, NarrativeEnhancer
 from .insight_generator import InsightGenerator, Insight, InsightSeverity
 from .spec_analyzer import SpecAnalyzer
 
@@ -106,6 +106,7 @@ class MarkdownEnhancer:
         options: Optional[EnhancementOptions] = None,
         *,
         model_override: Any = None,
+        analyzer: Optional[SpecAnalyzer] = None,
     ):
         """Initialize markdown enhancer.
 
@@ -113,6 +114,8 @@ class MarkdownEnhancer:
             spec_data: Complete JSON spec dictionary
             parsed_spec: Parsed markdown structure from MarkdownParser
             options: Enhancement options (uses defaults if None)
+            analyzer: Optional SpecAnalyzer shared with the rest of the render
+                     (created if not provided)
         """
         self.spec_data = spec_data
         self.parsed_spec = parsed_spec
@@ -124,15 +127,17 @@ class MarkdownEnhancer:
             spec_data,
             model_override=model_override,
         )
-        self.viz_builder = VisualizationBuilder(spec_data)
+        self.analyzer = analyzer or SpecAnalyzer(spec_data)
+        self.viz_builder = VisualizationBuilder(spec_data, analyzer=self.analyzer)
         self.narrative_enhancer = NarrativeEnhancer(
             spec_data,
             model_override=model_override,
         )
         self.insight_generator = InsightGenerator(
             spec_data,
-            analyzer=SpecAnalyzer(spec_data)
+            analyzer=self.analyzer
         )
+        self._phase_transitions: Optional[List[NarrativeElement]] = None
 
     def enhance(self) -> str:
         """Generate enhanced markdown with all AI improvements.
@@ -343,8 +348,10 @@ class MarkdownEnhancer:
         Returns:
             Transition markdown or None if generation fails
         """
-        # Use narrative enhancer to generate transition
-        transitions = self.narrative_enhancer.generate_phase_transitions()
+        # Use narrative enhancer to generate transitions (once for all phases)
+        if self._phase_transitions is None:
+            self._phase_transitions = self.narrative_enhancer.generate_phase_transitions()
+        transitions = self._phase_transitions
 
         # Find transition for this phase
         for trans in transitions:
@@ -7,16 +7,53 @@ This module uses AI to enhance spec readability by adding narrative flow:
 - Context for architectural decisions
 
 Transforms dry technical specs into engaging, story-like documents.
+
+Narrative items are generated in batches: several items share one structured
+prompt that returns a JSON array keyed by item id, and batches run
+concurrently. Each item's narrative is cached under a hash of its prompt, so
+re-rendering an unchanged spec makes no AI calls.
 """
 
 from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import json
 import inspect
+import logging
+import re
 
 from claude_skills.common import get_agent_priority, get_timeout, get_enabled_tools, consultation_limits
-from claude_skills.common.ai_config import resolve_tool_model
+from claude_skills.common.ai_config import load_skill_config, resolve_tool_model
 from claude_skills.common import ai_tools
+from claude_skills.common.cache import CacheManager, generate_narrative_key, is_response_cache_bypassed
+from claude_skills.common.config import is_cache_enabled
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NARRATIVE_BATCH_SIZE = 8
+DEFAULT_NARRATIVE_CONCURRENCY = 3
+# A batch prompt may take at most this many times the narrative timeout
+MAX_BATCH_TIMEOUT_FACTOR = 2
+NARRATIVE_FAILED = "*AI narrative generation failed*"
+
+
+def get_narrative_batching_config() -> Dict[str, int]:
+    """Get batch size and concurrency for narrative generation from config.
+
+    Reads ``narrative_batching.batch_size`` and ``narrative_batching.max_concurrency``
+    for sdd-render (defaults to 8 items per prompt and 3 prompts at once).
+    """
+    settings = {
+        'batch_size': DEFAULT_NARRATIVE_BATCH_SIZE,
+        'max_concurrency': DEFAULT_NARRATIVE_CONCURRENCY,
+    }
+    batching = load_skill_config('sdd-render').get('narrative_batching', {})
+    if isinstance(batching, dict):
+        for key in settings:
+            value = batching.get(key)
+            if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+                settings[key] = value
+    return settings
 
 
 @dataclass
@@ -37,6 +74,58 @@ class NarrativeElement:
     metadata: Dict[str, Any]
 
 
+@dataclass
+class _NarrativeItem:
+    """A narrative element still to be generated, with its single-item prompt."""
+    item_id: str
+    element_type: str
+    location: str
+    target_id: str
+    metadata: Dict[str, Any]
+    prompt: str
+
+    def to_element(self, content: str) -> NarrativeElement:
+        return NarrativeElement(
+            element_type=self.element_type,
+            content=content,
+            location=self.location,
+            target_id=self.target_id,
+            metadata=self.metadata,
+        )
+
+
+def _parse_batch_response(output: str, expected_ids: set) -> Dict[str, str]:
+    """Extract ``{id: narrative}`` from a batch response's JSON array.
+
+    Tolerates code fences and text around the array; entries with unknown ids
+    or empty narratives are dropped.
+    """
+    text = output.strip()
+    fenced = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1).strip()
+
+    start, end = text.find('['), text.rfind(']')
+    if start == -1 or end <= start:
+        return {}
+    try:
+        payload = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(payload, list):
+        return {}
+
+    narratives = {}
+    for entry in payload:
+        if not isinstance(entry, dict):
+            continue
+        item_id = str(entry.get('id', ''))
+        narrative = entry.get('narrative')
+        if item_id in expected_ids and isinstance(narrative, str) and narrative.strip():
+            narratives[item_id] = narrative.strip()
+    return narratives
+
+
 class NarrativeEnhancer:
     """Enhances specs with AI-generated narrative elements.
 
@@ -79,17 +168,40 @@ class NarrativeEnhancer:
         ...     print(f"{trans.target_id}: {trans.content}")
     """
 
-    def __init__(self, spec_data: Dict[str, Any], *, model_override: Any = None):
+    def __init__(
+        self,
+        spec_data: Dict[str, Any],
+        *,
+        model_override: Any = None,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        cache: Optional[CacheManager] = None,
+    ):
         """Initialize narrative enhancer.
 
         Args:
             spec_data: Complete JSON spec dictionary
+            model_override: CLI model override (string or mapping)
+            batch_size: Narrative items per AI prompt (defaults to config)
+            max_concurrency: Batches generated at once (defaults to config)
+            use_cache: Cache narratives on disk (defaults to the cache config;
+                       the global --no-cache flag disables it)
+            cache: CacheManager to use instead of the default one
         """
         self.spec_data = spec_data
         self.hierarchy = spec_data.get('hierarchy', {})
         self.metadata = spec_data.get('metadata', {})
         self.model_override = model_override
 
+        batching = get_narrative_batching_config()
+        self.batch_size = max(1, batch_size or batching['batch_size'])
+        self.max_concurrency = max(1, max_concurrency or batching['max_concurrency'])
+        self.use_cache = use_cache
+        self._cache = cache
+        # Narratives generated (or loaded) during this run, by cache key
+        self._narratives: Dict[str, str] = {}
+
     def generate_phase_transitions(self) -> List[NarrativeElement]:
         """Generate transitional text between phases.
 
@@ -105,10 +217,13 @@ class NarrativeEnhancer:
             >>> for trans in transitions:
             ...     print(trans.content)
         """
+        return self._generate_elements(self._phase_transition_items())
+
+    def _phase_transition_items(self) -> List[_NarrativeItem]:
         root = self.hierarchy.get('spec-root', {})
         phase_ids = root.get('children', [])
 
-        transitions = []
+        items = []
 
         for i, phase_id in enumerate(phase_ids):
             if i == 0:
@@ -119,18 +234,16 @@ class NarrativeEnhancer:
                 prev_phase_id = phase_ids[i - 1]
                 prompt = self._build_phase_transition_prompt(prev_phase_id, phase_id)
 
-            # Generate narrative (would use AI agent)
-            narrative = self._generate_narrative_ai(prompt)
-
-            transitions.append(NarrativeElement(
+            items.append(_NarrativeItem(
+                item_id=f'transition:{phase_id}',
                 element_type='phase_transition',
-                content=narrative,
                 location='before_phase',
                 target_id=phase_id,
-                metadata={'phase_index': i}
+                metadata={'phase_index': i},
+                prompt=prompt,
             ))
 
-        return transitions
+        return items
 
     def _build_phase_intro_prompt(self, phase_id: str) -> str:
         """Build prompt for phase introduction.
@@ -201,7 +314,10 @@ Write in a clear, professional tone. Connect the phases smoothly.
             >>> for rat in rationales:
             ...     print(f"Task {rat.target_id}: {rat.content}")
         """
-        rationales = []
+        return self._generate_elements(self._dependency_rationale_items())
+
+    def _dependency_rationale_items(self) -> List[_NarrativeItem]:
+        items = []
 
         for task_id, task_data in self.hierarchy.items():
             if task_id == 'spec-root':
@@ -215,18 +331,16 @@ Write in a clear, professional tone. Connect the phases smoothly.
 
             # Only generate rationale if task has dependencies
             if len(blocked_by) > 0:
-                prompt = self._build_dependency_rationale_prompt(task_id, blocked_by)
-                narrative = self._generate_narrative_ai(prompt)
-
-                rationales.append(NarrativeElement(
+                items.append(_NarrativeItem(
+                    item_id=f'rationale:{task_id}',
                     element_type='dependency_rationale',
-                    content=narrative,
                     location='after_task_title',
                     target_id=task_id,
-                    metadata={'dependency_count': len(blocked_by)}
+                    metadata={'dependency_count': len(blocked_by)},
+                    prompt=self._build_dependency_rationale_prompt(task_id, blocked_by),
                 ))
 
-        return rationales
+        return items
 
     def _build_dependency_rationale_prompt(self, task_id: str, blocked_by: List[str]) -> str:
         """Build prompt for dependency rationale.
@@ -269,11 +383,14 @@ Explain the technical or logical reason for this dependency. Keep it concise and
             >>> enhancer = NarrativeEnhancer(spec_data)
             >>> suggestions = enhancer.generate_implementation_suggestions()
         """
+        return self._generate_elements(self._implementation_suggestion_items())
+
+    def _implementation_suggestion_items(self) -> List[_NarrativeItem]:
         # Get phase information
         root = self.hierarchy.get('spec-root', {})
         phase_ids = root.get('children', [])
 
-        suggestions = []
+        items = []
 
         for phase_id in phase_ids:
             phase_data = self.hierarchy.get(phase_id, {})
@@ -283,18 +400,16 @@ Explain the technical or logical reason for this dependency. Keep it concise and
             tasks = self._get_phase_tasks(phase_id)
 
             if len(tasks) > 0:
-                prompt = self._build_implementation_suggestion_prompt(phase_title, tasks)
-                narrative = self._generate_narrative_ai(prompt)
-
-                suggestions.append(NarrativeElement(
+                items.append(_NarrativeItem(
+                    item_id=f'suggestion:{phase_id}',
                     element_type='implementation_suggestion',
-                    content=narrative,
                     location='after_phase_intro',
                     target_id=phase_id,
-                    metadata={'task_count': len(tasks)}
+                    metadata={'task_count': len(tasks)},
+                    prompt=self._build_implementation_suggestion_prompt(phase_title, tasks),
                 ))
 
-        return suggestions
+        return items
 
     def _build_implementation_suggestion_prompt(
         self,
@@ -367,27 +482,28 @@ Keep it actionable and concise.
         if dry_run:
             return "[AI-generated narrative would appear here]"
 
-        # Get agent priority from config
+        enabled_available = self._enabled_available_agents()
+        if not enabled_available:
+            return self._unavailable_placeholder()
+
+        answer = self._call_agents(prompt, enabled_available, timeout=get_timeout('sdd-render', 'narrative'))
+        return answer[1] if answer is not None else NARRATIVE_FAILED
+
+    def _enabled_available_agents(self) -> List[str]:
+        """Agents from the configured priority list that are enabled and installed."""
         agent_priority = get_agent_priority('sdd-render')
         available_agents = self._get_available_agents()
+        return [agent for agent in agent_priority if agent in available_agents]
 
-        # Filter priority list to only available agents
-        enabled_available = [
-            agent for agent in agent_priority
-            if agent in available_agents
-        ]
-
-        if not enabled_available:
-            # Fallback: return placeholder
-            enabled_tools = get_enabled_tools('sdd-render')
-            tool_names = ', '.join(enabled_tools.keys())
-            return f"*AI narrative generation unavailable. Install {tool_names} for enhanced narratives.*"
+    def _unavailable_placeholder(self) -> str:
+        enabled_tools = get_enabled_tools('sdd-render')
+        tool_names = ', '.join(enabled_tools.keys())
+        return f"*AI narrative generation unavailable. Install {tool_names} for enhanced narratives.*"
 
-        # Try agents in priority order until one succeeds
-        for agent in enabled_available:
+    def _call_agents(self, prompt: str, agents: List[str], *, timeout: int) -> Optional[Tuple[str, str]]:
+        """Try agents in priority order; returns (agent, output) of the first success or None."""
+        for agent in agents:
             try:
-                timeout = get_timeout('sdd-render', 'narrative')
-
                 response = self._invoke_agent(
                     agent,
                     prompt,
@@ -396,14 +512,155 @@ Keep it actionable and concise.
                 )
 
                 if response.success:
-                    return response.output.strip()
+                    return agent, response.output.strip()
 
             except Exception:
                 # Try next agent on unexpected errors
                 continue
 
-        # All agents failed
-        return "*AI narrative generation failed*"
+        return None
+
+    def _generate_elements(self, items: List[_NarrativeItem]) -> List[NarrativeElement]:
+        narratives = self._generate_narratives(items)
+        return [item.to_element(narratives[item.item_id]) for item in items]
+
+    def _get_cache(self) -> Optional[CacheManager]:
+        enabled = self.use_cache
+        if enabled is None:
+            enabled = is_cache_enabled() and not is_response_cache_bypassed()
+        if not enabled:
+            return None
+        if self._cache is None:
+            try:
+                self._cache = CacheManager()
+            except Exception as e:
+                logger.debug(f"Narrative cache unavailable: {e}")
+                self.use_cache = False
+                return None
+        return self._cache
+
+    def _generate_narratives(self, items: List[_NarrativeItem]) -> Dict[str, str]:
+        """Generate narratives for many items, reusing cached ones.
+
+        Returns:
+            Mapping of item id to narrative text (or a placeholder when
+            generation was unavailable or failed)
+        """
+        results: Dict[str, str] = {}
+        pending: List[Tuple[str, _NarrativeItem]] = []
+
+        agents = self._enabled_available_agents()
+        if not agents:
+            placeholder = self._unavailable_placeholder()
+            return {item.item_id: placeholder for item in items}
+
+        # Narratives are keyed on the agent and model that wrote them, so a
+        # model override or config change regenerates them
+        models = {agent: self._resolve_model(agent, feature="narrative") for agent in agents}
+        cache = self._get_cache()
+
+        for item in items:
+            key = generate_narrative_key(item.prompt, agents[0], models[agents[0]])
+            narrative = self._narratives.get(key)
+            if narrative is None and cache is not None:
+                entry = cache.get(key)
+                if isinstance(entry, dict) and isinstance(entry.get('narrative'), str):
+                    narrative = entry['narrative']
+                    self._narratives[key] = narrative
+            if narrative is not None:
+                results[item.item_id] = narrative
+            else:
+                pending.append((key, item))
+
+        if not pending:
+            return results
+
+        generated = self._run_batches([item for _, item in pending], agents)
+        for key, item in pending:
+            agent, narrative = generated.get(item.item_id, (None, None))
+            if not narrative:
+                results[item.item_id] = NARRATIVE_FAILED
+                continue
+            results[item.item_id] = narrative
+            if agent != agents[0]:
+                # A fallback agent answered: store it as that agent's narrative
+                key = generate_narrative_key(item.prompt, agent, models[agent])
+            self._narratives[key] = narrative
+            if cache is not None:
+                cache.set(
+                    key,
+                    {'item_id': item.item_id, 'narrative': narrative},
+                    metadata={'review_type': 'narrative'},
+                )
+
+        return results
+
+    def _run_batches(self, items: List[_NarrativeItem], agents: List[str]) -> Dict[str, Tuple[str, str]]:
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        workers = min(self.max_concurrency, len(batches))
+        if workers <= 1:
+            outputs = [self._run_batch(batch, agents) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outputs = list(executor.map(lambda batch: self._run_batch(batch, agents), batches))
+
+        generated: Dict[str, Tuple[str, str]] = {}
+        for output in outputs:
+            generated.update(output)
+        return generated
+
+    def _run_batch(self, batch: List[_NarrativeItem], agents: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Generate one batch; items missing from the JSON answer are retried singly.
+
+        Returns:
+            Mapping of item id to (agent that wrote it, narrative)
+        """
+        timeout = get_timeout('sdd-render', 'narrative')
+        if len(batch) == 1:
+            answer = self._call_agents(batch[0].prompt, agents, timeout=timeout)
+            return {batch[0].item_id: answer} if answer and answer[1] else {}
+
+        # Output grows with the number of items, so allow longer (up to a cap)
+        batch_timeout = timeout * min(len(batch), MAX_BATCH_TIMEOUT_FACTOR)
+        answer = self._call_agents(self._build_batch_prompt(batch), agents, timeout=batch_timeout)
+        if answer is None:
+            # Every agent failed; retrying item by item would fail the same way
+            return {}
+
+        agent, output = answer
+        narratives = {
+            item_id: (agent, narrative)
+            for item_id, narrative in _parse_batch_response(output, {item.item_id for item in batch}).items()
+        }
+        missing = [item for item in batch if item.item_id not in narratives]
+        if missing:
+            logger.debug(f"Batch response omitted {len(missing)} narrative item(s); generating them individually")
+        for item in missing:
+            answer = self._call_agents(item.prompt, agents, timeout=timeout)
+            if answer and answer[1]:
+                narratives[item.item_id] = answer
+        return narratives
+
+    def _build_batch_prompt(self, items: List[_NarrativeItem]) -> str:
+        """Build one prompt asking for several narrative items as a JSON array.
+
+        Args:
+            items: Items to generate (each keeps its own instructions)
+
+        Returns:
+            Prompt string for AI generation
+        """
+        spec_title = self.metadata.get('title', 'this specification')
+        sections = '\n\n'.join(f"### Item {item.item_id}\n{item.prompt.strip()}" for item in items)
+
+        return f"""Write the short narrative passages requested below for {spec_title}.
+
+Follow each item's instructions independently. Respond with ONLY a JSON array containing
+one object per item and no other text:
+[{{"id": "<item id>", "narrative": "<narrative text>"}}]
+
+{sections}
+"""
 
     def _get_available_agents(self) -> List[str]:
         """Check which AI agents are available.
@@ -462,10 +719,16 @@ Keep it actionable and concise.
             >>> for ntype, elements in narratives.items():
             ...     print(f"{ntype}: {len(elements)} elements")
         """
+        items = {
+            'phase_transitions': self._phase_transition_items(),
+            'dependency_rationales': self._dependency_rationale_items(),
+            'implementation_suggestions': self._implementation_suggestion_items(),
+        }
+        # Generate every item together so batches span all narrative types
+        narratives = self._generate_narratives([item for group in items.values() for item in group])
         return {
-            'phase_transitions': self.generate_phase_transitions(),
-            'dependency_rationales': self.generate_dependency_rationales(),
-            'implementation_suggestions': self.generate_implementation_suggestions()
+            kind: [item.to_element(narratives[item.item_id]) for item in group]
+            for kind, group in items.items()
         }
 
     def apply_narratives_to_markdown(
@@ -136,6 +136,17 @@ class AIEnhancedRenderer:
         self.spec_data = spec_data
         self.base_renderer = SpecRenderer(spec_data)
         self.model_override = model_override
+        self._analyzer: Optional[SpecAnalyzer] = None
+
+    def _get_analyzer(self) -> SpecAnalyzer:
+        """Return the spec analyzer, building its dependency graph once.
+
+        Analysis and enhancement share this analyzer (and its SpecGraph), so
+        the graph is computed once per render.
+        """
+        if self._analyzer is None:
+            self._analyzer = SpecAnalyzer(self.spec_data)
+        return self._analyzer
 
     def _generate_base_markdown(self) -> str:
         """Generate base markdown using SpecRenderer.
@@ -193,7 +204,7 @@ class AIEnhancedRenderer:
         try:
             # Initialize core analyzer
             logger.debug("Initializing SpecAnalyzer...")
-            analyzer = SpecAnalyzer(self.spec_data)
+            analyzer = self._get_analyzer()
 
             # Critical path and bottleneck analysis
             try:
@@ -386,6 +397,7 @@ class AIEnhancedRenderer:
                 parsed_spec=parsed_spec,
                 options=options,
                 model_override=self.model_override,
+                analyzer=self._get_analyzer(),
             )
             enhanced_markdown = enhancer.enhance()
             logger.info("AI enhancement pipeline completed successfully")
@@ -6,12 +6,15 @@ This module provides analysis capabilities for JSON spec files, including:
 - Task graph construction and traversal
 - Dependency relationship analysis
 
-The SpecAnalyzer is the core analysis engine used by AIEnhancedRenderer
+Graph analyses are precomputed once per spec by SpecGraph (see spec_graph.py);
+the SpecAnalyzer is the core analysis engine used by AIEnhancedRenderer
 to provide intelligent insights about spec structure and execution risks.
 """
 
 from typing import Dict, Any, List, Set, Optional, Tuple
-from collections import defaultdict, deque
+from collections import deque
+
+from .spec_graph import SpecGraph
 
 
 class SpecAnalyzer:
@@ -36,15 +39,18 @@ class SpecAnalyzer:
         >>> bottlenecks = analyzer.get_bottlenecks()
     """
 
-    def __init__(self, spec_data: Dict[str, Any]):
+    def __init__(self, spec_data: Dict[str, Any], graph: Optional[SpecGraph] = None):
         """Initialize analyzer with spec data.
 
         Args:
             spec_data: Complete JSON spec dictionary containing hierarchy,
                       metadata, and task information
+            graph: Optional precomputed SpecGraph for this spec (built if
+                  not provided)
         """
         self.spec_data = spec_data
         self.hierarchy = spec_data.get('hierarchy', {})
+        self.graph = graph if graph is not None else SpecGraph.from_spec(spec_data)
 
         # Build internal graph representations
         self.task_graph: Dict[str, List[str]] = {}  # task_id -> [dependent_ids]
@@ -52,43 +58,16 @@ class SpecAnalyzer:
         self._build_graphs()
 
     def _build_graphs(self) -> None:
-        """Build task dependency graphs from hierarchy.
+        """Build task dependency graphs from the shared SpecGraph.
 
-        Constructs both forward and reverse dependency graphs:
+        Exposes both forward and reverse dependency graphs as mutable
+        adjacency lists for callers that expect plain dictionaries:
         - task_graph: Maps each task to tasks that depend on it
         - reverse_graph: Maps each task to tasks it depends on
-
-        This enables efficient traversal for both critical path
-        (forward) and bottleneck detection (reverse).
         """
-        # Initialize graphs for all tasks
-        for task_id, task_data in self.hierarchy.items():
-            if task_id == 'spec-root':
-                continue
-
-            self.task_graph[task_id] = []
-            self.reverse_graph[task_id] = []
-
-        # Build edges from dependencies
-        for task_id, task_data in self.hierarchy.items():
-            if task_id == 'spec-root':
-                continue
-
-            deps = task_data.get('dependencies', {})
-
-            # Process 'blocks' relationships
-            blocks = deps.get('blocks', [])
-            for blocked_task in blocks:
-                if blocked_task in self.hierarchy:
-                    self.task_graph[task_id].append(blocked_task)
-                    self.reverse_graph[blocked_task].append(task_id)
-
-            # Process 'blocked_by' relationships (reverse direction)
-            blocked_by = deps.get('blocked_by', [])
-            for blocker_task in blocked_by:
-                if blocker_task in self.hierarchy:
-                    self.reverse_graph[task_id].append(blocker_task)
-                    self.task_graph[blocker_task].append(task_id)
+        for task_id in self.graph.task_ids:
+            self.task_graph[task_id] = list(self.graph.forward[task_id])
+            self.reverse_graph[task_id] = list(self.graph.reverse[task_id])
 
     def get_critical_path(self) -> List[str]:
         """Detect the critical path through the dependency tree.
@@ -98,7 +77,8 @@ class SpecAnalyzer:
         have zero slack time - any delay ripples through the entire project.
 
         Uses dynamic programming with topological sort to compute the
-        longest path through the dependency graph.
+        longest path through the dependency graph. The path is computed once
+        by the shared SpecGraph.
 
         Returns:
             List of task IDs forming the critical path, in execution order.
@@ -116,57 +96,7 @@ class SpecAnalyzer:
             >>> print(path)
             ['task-1-1', 'task-2-3', 'task-3-1', 'task-4-2']
         """
-        # Get topological ordering
-        topo_order = self._topological_sort()
-        if not topo_order:
-            # Cycle detected or empty graph
-            return []
-
-        # Dynamic programming: compute longest path ending at each task
-        longest_path_length: Dict[str, int] = defaultdict(int)
-        predecessor: Dict[str, Optional[str]] = {}
-
-        for task_id in topo_order:
-            # Check all blockers (incoming edges)
-            blockers = self.reverse_graph.get(task_id, [])
-
-            if not blockers:
-                # Starting task (no dependencies)
-                longest_path_length[task_id] = 1
-                predecessor[task_id] = None
-            else:
-                # Find blocker with longest path
-                max_length = 0
-                best_predecessor = None
-
-                for blocker in blockers:
-                    blocker_length = longest_path_length.get(blocker, 0)
-                    if blocker_length > max_length:
-                        max_length = blocker_length
-                        best_predecessor = blocker
-
-                longest_path_length[task_id] = max_length + 1
-                predecessor[task_id] = best_predecessor
-
-        # Find task with longest path
-        if not longest_path_length:
-            return []
-
-        end_task = max(longest_path_length.keys(),
-                      key=lambda t: longest_path_length[t])
-
-        # Reconstruct path by following predecessors backward
-        path = []
-        current = end_task
-
-        while current is not None:
-            path.append(current)
-            current = predecessor.get(current)
-
-        # Reverse to get execution order (start to end)
-        path.reverse()
-
-        return path
+        return list(self.graph.critical_path)
 
     def get_bottlenecks(self, min_dependents: int = 3) -> List[Tuple[str, int]]:
         """Identify tasks that block many others (bottlenecks).
@@ -223,45 +153,7 @@ class SpecAnalyzer:
                - Add newly zero-in-degree tasks to queue
             3. If all tasks processed, return order; else cycle detected
         """
-        # Calculate in-degrees (number of blockers for each task)
-        in_degree: Dict[str, int] = defaultdict(int)
-
-        for task_id in self.hierarchy:
-            if task_id == 'spec-root':
-                continue
-            in_degree[task_id] = 0
-
-        for task_id in self.reverse_graph:
-            blockers = self.reverse_graph.get(task_id, [])
-            in_degree[task_id] = len(blockers)
-
-        # Find all tasks with no dependencies (in-degree = 0)
-        queue: deque = deque()
-        for task_id, degree in in_degree.items():
-            if degree == 0:
-                queue.append(task_id)
-
-        # Process tasks in topological order
-        topo_order = []
-
-        while queue:
-            current = queue.popleft()
-            topo_order.append(current)
-
-            # Process all tasks blocked by current task
-            dependents = self.task_graph.get(current, [])
-            for dependent in dependents:
-                in_degree[dependent] -= 1
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
-
-        # Check if all tasks were processed (no cycles)
-        expected_count = len([t for t in self.hierarchy if t != 'spec-root'])
-        if len(topo_order) != expected_count:
-            # Cycle detected - return empty list
-            return []
-
-        return topo_order
+        return list(self.graph.topological_order)
 
     def get_task_depth(self, task_id: str) -> int:
         """Calculate the depth of a task in the dependency tree.
@@ -284,7 +176,10 @@ class SpecAnalyzer:
         if task_id not in self.hierarchy:
             return -1
 
-        # BFS to find longest path to this task
+        if task_id in self.graph.depths:
+            return self.graph.depths[task_id]
+
+        # Cyclic graphs have no depth table; fall back to a BFS over blockers
         visited: Set[str] = set()
         queue: deque = deque([(task_id, 0)])
         max_depth = 0
@@ -331,53 +226,13 @@ class SpecAnalyzer:
             Wave 2: task-2-1, task-2-2
             Wave 3: task-3-1
         """
-        # Get topological ordering
-        topo_order = self._topological_sort()
-        if not topo_order:
-            return []
-
-        # Calculate in-degrees for current state
-        in_degree: Dict[str, int] = {}
-        for task_id in self.hierarchy:
-            if task_id == 'spec-root':
-                continue
-
-            if pending_only:
-                task_data = self.hierarchy[task_id]
-                if task_data.get('status') != 'pending':
-                    continue
-
-            blockers = self.reverse_graph.get(task_id, [])
-            in_degree[task_id] = len(blockers)
-
-        # Group tasks into parallel waves
-        waves = []
-        processed: Set[str] = set()
-
-        while len(processed) < len(in_degree):
-            # Find all tasks that can start now (in-degree = 0)
-            current_wave = []
-            for task_id, degree in in_degree.items():
-                if task_id not in processed and degree == 0:
-                    current_wave.append(task_id)
+        if not pending_only:
+            return self.graph.parallel_waves()
 
-            if not current_wave:
-                # All remaining tasks are blocked - shouldn't happen with valid topo sort
-                break
-
-            waves.append(current_wave)
-
-            # Mark wave as processed and update in-degrees
-            for task_id in current_wave:
-                processed.add(task_id)
-
-                # Reduce in-degree for all dependents
-                dependents = self.task_graph.get(task_id, [])
-                for dependent in dependents:
-                    if dependent in in_degree:
-                        in_degree[dependent] -= 1
-
-        return waves
+        return self.graph.parallel_waves(
+            task_id for task_id in self.graph.task_ids
+            if self.hierarchy[task_id].get('status') == 'pending'
+        )
 
     def get_stats(self) -> Dict[str, Any]:
         """Generate analysis statistics for the spec.
@@ -397,35 +252,4 @@ class SpecAnalyzer:
             >>> print(f"Total tasks: {stats['total_tasks']}")
             >>> print(f"Has cycles: {stats['has_cycles']}")
         """
-        total_tasks = len([t for t in self.hierarchy if t != 'spec-root'])
-
-        total_dependencies = sum(
-            len(deps) for deps in self.task_graph.values()
-        )
-
-        max_fan_out = max(
-            (len(deps) for deps in self.task_graph.values()),
-            default=0
-        )
-
-        max_fan_in = max(
-            (len(deps) for deps in self.reverse_graph.values()),
-            default=0
-        )
-
-        avg_dependencies = (
-            total_dependencies / total_tasks if total_tasks > 0 else 0
-        )
-
-        # Check for cycles using topological sort
-        topo_order = self._topological_sort()
-        has_cycles = len(topo_order) == 0 and total_tasks > 0
-
-        return {
-            'total_tasks': total_tasks,
-            'total_dependencies': total_dependencies,
-            'max_fan_out': max_fan_out,
-            'max_fan_in': max_fan_in,
-            'avg_dependencies': round(avg_dependencies, 2),
-            'has_cycles': has_cycles
-        }
+        return self.graph.stats()
@@ -0,0 +1,249 @@
+"""Precomputed dependency graph shared by the sdd_render analyzers.
+
+SpecAnalyzer, PriorityRanker, ComplexityScorer, TaskGrouper, InsightGenerator
+and DependencyGraphGenerator all need the same views of a spec: forward and
+reverse dependency edges, a topological order, task depths, subtask counts
+and the critical path. Recomputing these per call made analysis of large
+specs (hundreds of tasks) quadratic, so SpecGraph builds every view once in
+linear time and exposes them read-only. Build one per render with
+``SpecGraph.from_spec`` and pass it (usually via a SpecAnalyzer) to every
+analyzer.
+"""
+
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+class SpecGraph:
+    """Immutable dependency graph of a spec with precomputed analyses.
+
+    Edges come from both ``blocks`` and ``blocked_by`` declarations, so a
+    dependency declared on both sides appears twice (as it always has in
+    SpecAnalyzer's graphs).
+
+    Attributes:
+        task_ids: All hierarchy nodes except spec-root, in hierarchy order
+        forward: Mapping of task_id -> tuple of tasks it blocks
+        reverse: Mapping of task_id -> tuple of tasks blocking it
+        topological_order: Tasks ordered so blockers precede dependents
+            (empty if the graph has cycles)
+        has_cycles: Whether the dependency graph contains a cycle
+        depths: Mapping of task_id -> longest blocker chain above the task
+            (empty if the graph has cycles)
+        descendant_counts: Mapping of node id -> number of nested children
+        critical_path: Longest dependency chain, in execution order
+        path_lengths: Mapping of task_id -> length of the longest chain
+            ending at the task (empty if the graph has cycles)
+
+    Example:
+        >>> graph = SpecGraph.from_spec(spec_data)
+        >>> graph.critical_path
+        ('task-1-1', 'task-2-1', 'task-2-3')
+        >>> graph.depths['task-2-3']
+        2
+    """
+
+    __slots__ = (
+        'task_ids', 'forward', 'reverse', 'topological_order', 'has_cycles',
+        'depths', 'descendant_counts', 'critical_path', 'path_lengths',
+        '_positions', '_frozen',
+    )
+
+    def __init__(self, hierarchy: Dict[str, Any]):
+        """Build the graph and all derived analyses from a hierarchy.
+
+        Args:
+            hierarchy: The spec's ``hierarchy`` mapping
+        """
+        task_ids = tuple(t for t in hierarchy if t != 'spec-root')
+        positions = {task_id: index for index, task_id in enumerate(task_ids)}
+
+        forward: Dict[str, List[str]] = {task_id: [] for task_id in task_ids}
+        reverse: Dict[str, List[str]] = {task_id: [] for task_id in task_ids}
+        for task_id in task_ids:
+            deps = hierarchy[task_id].get('dependencies') or {}
+            for blocked_task in deps.get('blocks', []):
+                if blocked_task in positions:
+                    forward[task_id].append(blocked_task)
+                    reverse[blocked_task].append(task_id)
+            for blocker_task in deps.get('blocked_by', []):
+                if blocker_task in positions:
+                    reverse[task_id].append(blocker_task)
+                    forward[blocker_task].append(task_id)
+
+        topo_order = self._kahn(task_ids, forward, reverse)
+        has_cycles = len(topo_order) != len(task_ids)
+        if has_cycles:
+            topo_order = []
+
+        path_lengths, critical_path = self._longest_paths(topo_order, reverse)
+        depths = {task_id: length - 1 for task_id, length in path_lengths.items()}
+
+        self.task_ids: Tuple[str, ...] = task_ids
+        self.forward: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {task_id: tuple(edges) for task_id, edges in forward.items()}
+        )
+        self.reverse: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {task_id: tuple(edges) for task_id, edges in reverse.items()}
+        )
+        self.topological_order: Tuple[str, ...] = tuple(topo_order)
+        self.has_cycles: bool = has_cycles
+        self.depths: Mapping[str, int] = MappingProxyType(depths)
+        self.descendant_counts: Mapping[str, int] = MappingProxyType(
+            self._count_descendants(hierarchy)
+        )
+        self.critical_path: Tuple[str, ...] = tuple(critical_path)
+        self.path_lengths: Mapping[str, int] = MappingProxyType(path_lengths)
+        self._positions: Mapping[str, int] = MappingProxyType(positions)
+        self._frozen = True
+
+    @classmethod
+    def from_spec(cls, spec_data: Dict[str, Any]) -> 'SpecGraph':
+        """Build the graph for a complete JSON spec dictionary."""
+        return cls(spec_data.get('hierarchy', {}))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, '_frozen', False):
+            raise AttributeError("SpecGraph is immutable")
+        object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _kahn(task_ids: Tuple[str, ...],
+              forward: Dict[str, List[str]],
+              reverse: Dict[str, List[str]]) -> List[str]:
+        """Kahn's algorithm, seeded with root tasks in hierarchy order."""
+        in_degree = {task_id: len(reverse[task_id]) for task_id in task_ids}
+        queue = deque(task_id for task_id in task_ids if in_degree[task_id] == 0)
+        order: List[str] = []
+
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for dependent in forward[current]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        return order
+
+    @staticmethod
+    def _longest_paths(topo_order: List[str],
+                       reverse: Dict[str, List[str]]) -> Tuple[Dict[str, int], List[str]]:
+        """Longest chain ending at each task, plus the overall longest chain.
+
+        Ties go to the first blocker listed and, for the end of the critical
+        path, to the task earliest in topological order.
+        """
+        lengths: Dict[str, int] = {}
+        predecessor: Dict[str, Optional[str]] = {}
+
+        for task_id in topo_order:
+            best_length = 0
+            best_predecessor = None
+            for blocker in reverse[task_id]:
+                if lengths[blocker] > best_length:
+                    best_length = lengths[blocker]
+                    best_predecessor = blocker
+            lengths[task_id] = best_length + 1
+            predecessor[task_id] = best_predecessor
+
+        if not lengths:
+            return lengths, []
+
+        current: Optional[str] = max(lengths, key=lengths.__getitem__)
+        path: List[str] = []
+        while current is not None:
+            path.append(current)
+            current = predecessor[current]
+        path.reverse()
+
+        return lengths, path
+
+    @staticmethod
+    def _count_descendants(hierarchy: Dict[str, Any]) -> Dict[str, int]:
+        """Number of nested children below every hierarchy node.
+
+        A child listed under several parents counts once per parent, and
+        children missing from the hierarchy count but have no subtasks of
+        their own. Nodes inside a ``children`` cycle count their direct
+        children only.
+        """
+        counts: Dict[str, int] = {}
+        in_progress: Set[str] = set()
+
+        for root in hierarchy:
+            if root in counts:
+                continue
+            stack: List[Tuple[str, bool]] = [(root, False)]
+            while stack:
+                node_id, expanded = stack.pop()
+                children = (hierarchy.get(node_id) or {}).get('children') or []
+                if expanded:
+                    in_progress.discard(node_id)
+                    counts[node_id] = len(children) + sum(counts.get(c, 0) for c in children)
+                    continue
+                if node_id in counts or node_id in in_progress:
+                    continue
+                in_progress.add(node_id)
+                stack.append((node_id, True))
+                for child_id in children:
+                    if child_id in hierarchy and child_id not in counts and child_id not in in_progress:
+                        stack.append((child_id, False))
+
+        return counts
+
+    def parallel_waves(self, candidates: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """Group candidate tasks into waves that can run in parallel.
+
+        Every blocker of a candidate counts towards its in-degree, but only
+        candidates are ever scheduled, so a task blocked by a non-candidate
+        never becomes ready. Each wave lists tasks in hierarchy order.
+
+        Args:
+            candidates: Tasks to schedule (default: every task)
+
+        Returns:
+            Task groups in execution order; empty if the graph has cycles.
+        """
+        if self.has_cycles:
+            return []
+
+        if candidates is None:
+            in_degree = {task_id: len(self.reverse[task_id]) for task_id in self.task_ids}
+        else:
+            in_degree = {
+                task_id: len(self.reverse[task_id])
+                for task_id in candidates if task_id in self._positions
+            }
+
+        wave = sorted((t for t, degree in in_degree.items() if degree == 0),
+                      key=self._positions.__getitem__)
+        waves: List[List[str]] = []
+
+        while wave:
+            waves.append(wave)
+            ready = []
+            for task_id in wave:
+                for dependent in self.forward[task_id]:
+                    if dependent in in_degree:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            ready.append(dependent)
+            wave = sorted(ready, key=self._positions.__getitem__)
+
+        return waves
+
+    def stats(self) -> Dict[str, Any]:
+        """Summary statistics (see SpecAnalyzer.get_stats)."""
+        total_tasks = len(self.task_ids)
+        total_dependencies = sum(len(edges) for edges in self.forward.values())
+
+        return {
+            'total_tasks': total_tasks,
+            'total_dependencies': total_dependencies,
+            'max_fan_out': max((len(edges) for edges in self.forward.values()), default=0),
+            'max_fan_in': max((len(edges) for edges in self.reverse.values()), default=0),
+            'avg_dependencies': round(total_dependencies / total_tasks if total_tasks > 0 else 0, 2),
+            'has_cycles': self.has_cycles,
+        }
@@ -60,15 +60,18 @@ class VisualizationBuilder:
         >>> print(progress_chart)
     """
 
-    def __init__(self, spec_data: Dict[str, Any]):
+    def __init__(self, spec_data: Dict[str, Any], analyzer: Optional[Any] = None):
         """Initialize visualization builder.
 
         Args:
             spec_data: Complete JSON spec dictionary
+            analyzer: Optional SpecAnalyzer used for dependency graphs
+                     (created on first use if not provided)
         """
         self.spec_data = spec_data
         self.hierarchy = spec_data.get('hierarchy', {})
         self.metadata = spec_data.get('metadata', {})
+        self.analyzer = analyzer
 
     def get_progress_data(self) -> ProgressData:
         """Extract progress data from spec.
@@ -238,8 +241,9 @@ pie title Task Status Distribution
             from .dependency_graph import DependencyGraphGenerator, GraphStyle
             from .spec_analyzer import SpecAnalyzer
 
-            analyzer = SpecAnalyzer(self.spec_data)
-            generator = DependencyGraphGenerator(self.spec_data, analyzer)
+            if self.analyzer is None:
+                self.analyzer = SpecAnalyzer(self.spec_data)
+            generator = DependencyGraphGenerator(self.spec_data, self.analyzer)
 
             # Generate graph with filters
             # Note: DependencyGraphGenerator doesn't have show_completed parameter
@@ -373,3 +373,76 @@ def test_resolve_models_for_tools_respects_skill_defaults(
             ("cursor-agent", "skill-cursor"),
         ]
     )
+
+
+def test_get_scheduler_config_reads_global_section(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        ai_config,
+        "load_global_config",
+        lambda: {
+            "scheduler": {
+                "max_concurrency": 6,
+                "per_provider": {"default": 3, "codex": 1, "bad": "x"},
+                "rate_limit": {"per_minute": 30, "burst": 5},
+            }
+        },
+    )
+
+    assert ai_config.get_scheduler_config() == {
+        "max_concurrency": 6,
+        "provider_limits": {"default": 3, "codex": 1},
+        "rate_per_minute": 30,
+        "burst": 5,
+    }
+
+
+def test_get_scheduler_config_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ai_config, "load_global_config", lambda: {})
+
+    assert ai_config.get_scheduler_config() == {
+        "max_concurrency": 8,
+        "provider_limits": {},
+        "rate_per_minute": None,
+        "burst": None,
+    }
+
+
+def test_get_availability_cache_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ai_config, "load_global_config", lambda: {})
+    assert ai_config.get_availability_cache_config() == {"enabled": True, "ttl_seconds": 300}
+
+    monkeypatch.setattr(
+        ai_config,
+        "load_global_config",
+        lambda: {"availability_cache": {"enabled": False, "ttl_seconds": 60}},
+    )
+    assert ai_config.get_availability_cache_config() == {"enabled": False, "ttl_seconds": 60}
+
+
+def test_get_stub_provider_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ai_config, "load_global_config", lambda: {})
+    assert ai_config.get_stub_provider_config() == {}
+
+    monkeypatch.setattr(
+        ai_config,
+        "load_global_config",
+        lambda: {"stub_provider": {"latency_ms": 250, "failure_rate": 0.1}},
+    )
+    assert ai_config.get_stub_provider_config() == {"latency_ms": 250, "failure_rate": 0.1}
+    assert ai_config.is_supported_tool("stub") is True
+    assert ai_config.is_supported_tool("unknown") is False
+
+
+def test_get_completion_policy_returns_valid_policy(
+    set_skill_config: Callable[[Dict[str, Any]], None]
+) -> None:
+    set_skill_config({"consultation": {"completion_policy": " quorum(2) "}})
+    assert ai_config.get_completion_policy("skill") == "quorum(2)"
+
+
+def test_get_completion_policy_falls_back_on_invalid_policy(
+    set_skill_config: Callable[[Dict[str, Any]], None], caplog: pytest.LogCaptureFixture
+) -> None:
+    set_skill_config({"consultation": {"completion_policy": "quorum(two)"}})
+    assert ai_config.get_completion_policy("skill") == "all"
+    assert "quorum(two)" in caplog.text
@@ -3,12 +3,15 @@ from __future__ import annotations
 """Unit tests for `claude_skills.common.ai_tools`."""
 
 import subprocess
+import threading
+import time
 from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from claude_skills.common.ai_tools import (
+    CompletionPolicy,
     MultiToolResponse,
     ToolResponse,
     ToolStatus,
@@ -16,6 +19,7 @@ from claude_skills.common.ai_tools import (
     check_tool_available,
     detect_available_tools,
     execute_tool,
+    execute_tool_with_fallback,
     execute_tools_parallel,
 )
 from claude_skills.common.providers import (
@@ -168,6 +172,12 @@ def test_check_tool_available_not_found(mocker) -> None:
     assert check_tool_available("nonexistent") is False
 
 
+def test_check_tool_available_in_process_provider(mocker) -> None:
+    which = mocker.patch("shutil.which", return_value=None)
+    assert check_tool_available("stub", use_cache=False) is True
+    which.assert_not_called()
+
+
 def test_check_tool_available_uses_detector(mocker) -> None:
     detector = Mock()
     detector.is_available.side_effect = lambda use_probe: not use_probe
@@ -215,6 +225,80 @@ def test_detect_available_tools_handles_version_failures() -> None:
         assert available == []
 
 
+@pytest.fixture
+def availability_cache(tmp_path, mocker):
+    from claude_skills.common import ai_tools
+    from claude_skills.common.cache import ToolAvailabilityCache
+
+    cache = ToolAvailabilityCache(tmp_path / "availability.json")
+    mocker.patch.object(ai_tools, "_get_availability_cache", return_value=cache)
+    return cache
+
+
+def test_check_tool_available_caches_by_executable_mtime(tmp_path, mocker, availability_cache) -> None:
+    import os
+
+    executable = tmp_path / "gemini"
+    executable.write_text("#!/bin/sh\n")
+    mocker.patch("claude_skills.common.ai_tools.get_provider_detector", return_value=None)
+    mocker.patch("shutil.which", return_value=str(executable))
+    probe = mocker.patch(
+        "claude_skills.common.ai_tools.subprocess.run",
+        return_value=subprocess.CompletedProcess([], 0),
+    )
+
+    assert check_tool_available("gemini", check_version=True) is True
+    assert check_tool_available("gemini", check_version=True) is True
+    assert probe.call_count == 1
+
+    # Reinstalling the CLI changes its mtime and invalidates the entry
+    os.utime(executable, (0, executable.stat().st_mtime + 10))
+    probe.return_value = subprocess.CompletedProcess([], 1)
+    assert check_tool_available("gemini", check_version=True) is False
+    assert probe.call_count == 2
+
+    assert check_tool_available("gemini", check_version=True, use_cache=False) is False
+    assert probe.call_count == 3
+
+
+def test_check_tool_available_skips_cache_for_overrides(mocker, availability_cache) -> None:
+    detector = Mock()
+    detector.availability_override.return_value = True
+    detector.is_available.return_value = True
+    mocker.patch("claude_skills.common.ai_tools.get_provider_detector", return_value=detector)
+    mocker.patch("claude_skills.common.ai_tools.check_provider_available", return_value=True)
+    spy = mocker.spy(availability_cache, "set")
+
+    assert check_tool_available("gemini") is True
+    spy.assert_not_called()
+
+
+def test_detect_available_tools_checks_tools_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_check(tool, check_version=False):
+        barrier.wait()
+        return tool != "codex"
+
+    with patch("claude_skills.common.ai_tools.check_tool_available", side_effect=fake_check):
+        assert detect_available_tools() == ["gemini", "cursor-agent"]
+
+
+def test_refresh_tool_availability_bypasses_cache() -> None:
+    from claude_skills.common.ai_tools import refresh_tool_availability
+
+    calls = []
+
+    def fake_check(tool, check_version=False, use_cache=True):
+        calls.append((tool, use_cache))
+        return tool == "codex"
+
+    with patch("claude_skills.common.ai_tools.check_tool_available", side_effect=fake_check):
+        assert refresh_tool_availability(["codex", "gemini"]) == {"codex": True, "gemini": False}
+
+    assert sorted(calls) == [("codex", False), ("gemini", False)]
+
+
 # =============================================================================
 # Command Building Tests
 # =============================================================================
@@ -391,6 +475,299 @@ def test_execute_tools_parallel_handles_failures(mocker) -> None:
     assert mock_execute.call_count == 3
 
 
+def _staggered_execute(delays: dict, release: threading.Event, statuses: dict | None = None):
+    """Fake execute_tool: tools with a delay of None block until released."""
+    statuses = statuses or {}
+
+    def fake(tool, prompt, *, model=None, timeout=90):
+        delay = delays[tool]
+        if delay is None:
+            release.wait(5)
+        else:
+            time.sleep(delay)
+        return ToolResponse(tool=tool, status=statuses.get(tool, ToolStatus.SUCCESS))
+
+    return fake
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        ("all", CompletionPolicy("all")),
+        ("first_success", CompletionPolicy("first_success", count=1)),
+        ("quorum(2)", CompletionPolicy("quorum", count=2)),
+        ("quorum:3", CompletionPolicy("quorum", count=3)),
+        ("deadline(45)", CompletionPolicy("deadline", deadline=45.0)),
+        (None, CompletionPolicy("all")),
+    ],
+)
+def test_completion_policy_parse(spec, expected) -> None:
+    assert CompletionPolicy.parse(spec) == expected
+    assert CompletionPolicy.parse(str(expected)) == expected
+
+
+@pytest.mark.parametrize("spec", ["quorum", "quorum(0)", "deadline(-1)", "fastest"])
+def test_completion_policy_parse_rejects_invalid(spec) -> None:
+    with pytest.raises(ValueError):
+        CompletionPolicy.parse(spec)
+
+
+def test_execute_tools_parallel_first_success_abandons_slow_tools(mocker) -> None:
+    release = threading.Event()
+    mocker.patch(
+        "claude_skills.common.ai_tools.execute_tool",
+        side_effect=_staggered_execute({"gemini": 0.0, "codex": None}, release),
+    )
+
+    start = time.time()
+    result = execute_tools_parallel(["gemini", "codex"], "hello", policy="first_success")
+    release.set()
+
+    assert time.time() - start < 2
+    assert list(result.responses) == ["gemini"]
+    assert result.abandoned == ["codex"]
+    assert result.policy == "first_success"
+    assert result.to_dict()["abandoned"] == ["codex"]
+
+
+def test_execute_tools_parallel_quorum_waits_for_k_successes(mocker) -> None:
+    release = threading.Event()
+    mocker.patch(
+        "claude_skills.common.ai_tools.execute_tool",
+        side_effect=_staggered_execute(
+            {"gemini": 0.0, "codex": 0.05, "claude": 0.1, "cursor-agent": None},
+            release,
+            statuses={"gemini": ToolStatus.ERROR},
+        ),
+    )
+
+    result = execute_tools_parallel(
+        ["gemini", "codex", "claude", "cursor-agent"], "hello", policy=CompletionPolicy.quorum(2)
+    )
+    release.set()
+
+    # The failed tool does not count toward the quorum
+    assert set(result.responses) == {"gemini", "codex", "claude"}
+    assert result.success_count == 2
+    assert result.abandoned == ["cursor-agent"]
+
+
+def test_execute_tools_parallel_deadline_keeps_finished_tools(mocker) -> None:
+    release = threading.Event()
+    mocker.patch(
+        "claude_skills.common.ai_tools.execute_tool",
+        side_effect=_staggered_execute({"gemini": 0.0, "codex": None}, release),
+    )
+
+    result = execute_tools_parallel(["gemini", "codex"], "hello", policy="deadline(0.2)")
+    release.set()
+
+    assert list(result.responses) == ["gemini"]
+    assert result.abandoned == ["codex"]
+
+
+def test_execute_tools_parallel_cancels_abandoned_subprocess(mocker) -> None:
+    from claude_skills.common.providers.cancellation import get_current_token
+
+    tokens = {}
+    codex_started = threading.Event()
+
+    def fake(tool, prompt, *, model=None, timeout=90):
+        tokens[tool] = get_current_token()
+        if tool == "gemini":
+            codex_started.wait(5)
+        if tool == "codex":
+            codex_started.set()
+            deadline = time.time() + 5
+            while not tokens[tool].cancelled and time.time() < deadline:
+                time.sleep(0.01)
+        return ToolResponse(tool=tool, status=ToolStatus.SUCCESS)
+
+    mocker.patch("claude_skills.common.ai_tools.execute_tool", side_effect=fake)
+
+    result = execute_tools_parallel(["gemini", "codex"], "hello", policy="first_success")
+
+    assert result.abandoned == ["codex"]
+    assert tokens["codex"].cancelled is True
+    assert tokens["gemini"].cancelled is False
+
+
+def _patch_fallback_config(mocker, **overrides) -> None:
+    config = {
+        "enabled": True,
+        "max_retries_per_tool": 0,
+        "retry_on_status": ["timeout", "error"],
+        "skip_on_status": ["not_found", "invalid_output"],
+        "retry_delay_seconds": 0,
+        "adaptive_timeouts": True,
+        "hedge_requests": False,
+    }
+    config.update(overrides)
+    mocker.patch("claude_skills.common.ai_tools.ai_config.get_fallback_config", return_value=config)
+    mocker.patch(
+        "claude_skills.common.ai_tools.ai_config.get_tool_priority",
+        return_value=["gemini", "codex", "claude"],
+    )
+    mocker.patch("claude_skills.common.ai_tools.ai_config.get_consultation_limit", return_value=None)
+
+
+def test_execute_tool_with_fallback_uses_adaptive_timeout(mocker) -> None:
+    _patch_fallback_config(mocker, max_retries_per_tool=1)
+    mocker.patch("claude_skills.common.ai_tools.get_adaptive_timeout", return_value=45.0)
+    mock_execute = mocker.patch(
+        "claude_skills.common.ai_tools.execute_tool",
+        side_effect=[
+            ToolResponse(tool="gemini", status=ToolStatus.TIMEOUT),
+            ToolResponse(tool="gemini", status=ToolStatus.SUCCESS),
+        ],
+    )
+
+    result = execute_tool_with_fallback("run-tests", "gemini", "hello", timeout=600)
+
+    assert result.success
+    # First attempt uses the adaptive timeout, the retry the configured one
+    assert [call.kwargs["timeout"] for call in mock_execute.call_args_list] == [45.0, 600]
+
+
+def test_execute_tool_with_fallback_hedges_slow_tool(mocker) -> None:
+    _patch_fallback_config(mocker, hedge_requests=True)
+    mocker.patch("claude_skills.common.ai_tools.get_hedge_delay", return_value=0.05)
+    from claude_skills.common.providers.cancellation import get_current_token
+
+    tokens = {}
+
+    def fake(tool, prompt, *, model=None, timeout=90):
+        tokens[tool] = get_current_token()
+        if tool == "gemini":
+            deadline = time.time() + 5
+            while not tokens[tool].cancelled and time.time() < deadline:
+                time.sleep(0.01)
+            return ToolResponse(tool=tool, status=ToolStatus.ERROR)
+        return ToolResponse(tool=tool, status=ToolStatus.SUCCESS, output="fast")
+
+    mocker.patch("claude_skills.common.ai_tools.execute_tool", side_effect=fake)
+
+    result = execute_tool_with_fallback("run-tests", "gemini", "hello")
+
+    assert result.tool == "codex"
+    assert result.metadata["hedged_with"] == "gemini"
+    assert tokens["gemini"].cancelled is True
+
+
+def test_execute_tool_with_fallback_skips_failed_hedge(mocker) -> None:
+    _patch_fallback_config(mocker, hedge_requests=True)
+    mocker.patch("claude_skills.common.ai_tools.get_hedge_delay", return_value=0.01)
+    calls = []
+
+    def fake(tool, prompt, *, model=None, timeout=90):
+        calls.append(tool)
+        if tool == "gemini":
+            time.sleep(0.1)
+        status = ToolStatus.SUCCESS if tool == "claude" else ToolStatus.ERROR
+        return ToolResponse(tool=tool, status=status)
+
+    mocker.patch("claude_skills.common.ai_tools.execute_tool", side_effect=fake)
+
+    result = execute_tool_with_fallback("run-tests", "gemini", "hello")
+
+    assert result.tool == "claude"
+    # codex already failed as gemini's hedge, so it is not consulted again
+    assert calls.count("codex") == 1
+    assert "hedged_with" not in result.metadata
+
+
+def test_execute_tool_with_fallback_no_hedge_without_history(mocker) -> None:
+    _patch_fallback_config(mocker, hedge_requests=True)
+    mocker.patch("claude_skills.common.ai_tools.get_hedge_delay", return_value=None)
+    mock_execute = mocker.patch(
+        "claude_skills.common.ai_tools.execute_tool",
+        return_value=ToolResponse(tool="gemini", status=ToolStatus.SUCCESS),
+    )
+
+    result = execute_tool_with_fallback("run-tests", "gemini", "hello")
+
+    assert result.tool == "gemini"
+    mock_execute.assert_called_once()
+
+
+@pytest.fixture
+def response_cache(tmp_path, mocker):
+    from claude_skills.common import ai_tools
+    from claude_skills.common.cache import CacheManager, ResponseCache
+
+    cache = ResponseCache(CacheManager(cache_dir=tmp_path / "cache", auto_cleanup=False))
+    mocker.patch.object(ai_tools, "_get_response_cache", side_effect=lambda use_cache: cache)
+    return cache
+
+
+def test_execute_tool_serves_repeated_prompt_from_response_cache(mocker, response_cache) -> None:
+    provider = Mock()
+    provider.generate.return_value = GenerationResult(
+        content="cached answer",
+        model_fqn="gemini:demo",
+        status=ProviderStatus.SUCCESS,
+        raw_payload={"big": "payload"},
+    )
+    mocker.patch("claude_skills.common.ai_tools.resolve_provider", return_value=provider)
+
+    first = execute_tool("gemini", "same prompt", model="demo")
+    second = execute_tool("gemini", "same prompt", model="demo")
+
+    assert provider.generate.call_count == 1
+    assert "cache_hit" not in first.metadata
+    assert second.success
+    assert second.output == "cached answer"
+    assert second.model == "gemini:demo"
+    assert second.metadata["cache_hit"] is True
+    assert "raw_payload" not in second.metadata
+
+
+def test_response_cache_keys_default_model_calls_on_the_provider_default(mocker, response_cache) -> None:
+    provider = Mock()
+    provider.generate.return_value = GenerationResult(
+        content="answer", model_fqn="gemini:old", status=ProviderStatus.SUCCESS,
+    )
+    mocker.patch("claude_skills.common.ai_tools.resolve_provider", return_value=provider)
+    metadata = mocker.patch("claude_skills.common.ai_tools.get_provider_metadata")
+
+    metadata.return_value = Mock(default_model="old")
+    execute_tool("gemini", "prompt")
+    assert execute_tool("gemini", "prompt", model="old").metadata["cache_hit"] is True
+
+    metadata.return_value = Mock(default_model="new")
+    execute_tool("gemini", "prompt")
+    assert provider.generate.call_count == 2
+
+
+def test_execute_tool_does_not_cache_failures(mocker, response_cache) -> None:
+    provider = Mock()
+    provider.generate.side_effect = ProviderTimeoutError("slow", provider="gemini")
+    mocker.patch("claude_skills.common.ai_tools.resolve_provider", return_value=provider)
+
+    execute_tool("gemini", "prompt")
+    execute_tool("gemini", "prompt")
+
+    assert provider.generate.call_count == 2
+
+
+def test_response_cache_is_opt_in_and_bypassable(mocker) -> None:
+    from claude_skills.common import ai_tools
+    from claude_skills.common.cache import set_response_cache_bypass
+
+    config = {"enabled": False, "ttl_hours": 24, "max_size_mb": 200}
+    mocker.patch.object(ai_tools.ai_config, "get_response_cache_config", return_value=config)
+    mocker.patch.object(ai_tools, "ResponseCache")
+
+    assert ai_tools._get_response_cache(None) is None
+    assert ai_tools._get_response_cache(True) is not None
+
+    set_response_cache_bypass(True)
+    try:
+        assert ai_tools._get_response_cache(True) is None
+    finally:
+        set_response_cache_bypass(False)
+
+
 def test_execute_tool_captures_duration(mocker) -> None:
     provider = Mock()
     provider.generate.return_value = GenerationResult(
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+"""
+Tests for the on-disk tool availability cache.
+"""
+
+import pytest
+
+from claude_skills.common.cache import ToolAvailabilityCache, executable_fingerprint
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def executable(tmp_path):
+    path = tmp_path / "bin" / "gemini"
+    path.parent.mkdir()
+    path.write_text("#!/bin/sh\n")
+    return path
+
+
+def test_executable_fingerprint(executable, tmp_path) -> None:
+    fingerprint = executable_fingerprint(str(executable))
+
+    assert fingerprint == (str(executable), executable.stat().st_mtime)
+    assert executable_fingerprint(str(tmp_path / "missing")) is None
+
+
+def test_round_trip_is_keyed_by_check_version(tmp_path, executable) -> None:
+    cache = ToolAvailabilityCache(tmp_path / "availability.json")
+    fingerprint = executable_fingerprint(str(executable))
+
+    assert cache.get("gemini", fingerprint) is None
+    cache.set("gemini", fingerprint, True)
+    cache.set("gemini", fingerprint, False, check_version=True)
+
+    assert cache.get("gemini", fingerprint) is True
+    assert cache.get("gemini", fingerprint, check_version=True) is False
+    assert cache.get("codex", fingerprint) is None
+
+
+def test_changed_executable_invalidates_entry(tmp_path, executable) -> None:
+    cache = ToolAvailabilityCache(tmp_path / "availability.json")
+    path = str(executable)
+    cache.set("gemini", (path, 100.0), True)
+
+    assert cache.get("gemini", (path, 200.0)) is None
+    assert cache.get("gemini", ("/other/gemini", 100.0)) is None
+
+
+def test_entries_expire_after_ttl(tmp_path) -> None:
+    clock = FakeClock()
+    cache = ToolAvailabilityCache(tmp_path / "availability.json", ttl_seconds=60, clock=clock)
+    cache.set("codex", ("/bin/codex", 1.0), True)
+
+    clock.now += 59
+    assert cache.get("codex", ("/bin/codex", 1.0)) is True
+    clock.now += 2
+    assert cache.get("codex", ("/bin/codex", 1.0)) is None
+
+
+def test_clear_and_corrupt_file(tmp_path) -> None:
+    path = tmp_path / "availability.json"
+    cache = ToolAvailabilityCache(path)
+    cache.set("codex", ("/bin/codex", 1.0), True)
+    cache.set("gemini", ("/bin/gemini", 1.0), True)
+
+    assert cache.clear() == 2
+    assert not path.exists()
+    assert cache.clear() == 0
+
+    path.write_text("not json")
+    assert cache.get("codex", ("/bin/codex", 1.0)) is None
+    cache.set("codex", ("/bin/codex", 1.0), False)
+    assert cache.get("codex", ("/bin/codex", 1.0)) is False
@@ -7,7 +7,11 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from claude_skills.common.cache.cli import handle_cache_clear, handle_cache_info
+from claude_skills.common.cache.cli import (
+    handle_cache_clear,
+    handle_cache_info,
+    handle_cache_refresh_tools,
+)
 
 
 pytestmark = pytest.mark.unit
@@ -181,3 +185,35 @@ def test_cache_clear_disabled() -> None:
         exit_code = handle_cache_clear(args, printer)
         assert exit_code == 1
         printer.warning.assert_called_once()
+
+
+def test_cache_refresh_tools_reprobes_all_tools() -> None:
+    args = _make_args(tools=None, check_version=False)
+    printer = Mock()
+
+    with patch("claude_skills.common.cache.cli.ai_tools") as mock_ai_tools:
+        mock_ai_tools.clear_tool_availability_cache.return_value = 3
+        mock_ai_tools.refresh_tool_availability.return_value = {"gemini": True, "codex": False}
+
+        exit_code = handle_cache_refresh_tools(args, printer)
+
+    assert exit_code == 0
+    mock_ai_tools.clear_tool_availability_cache.assert_called_once_with()
+    mock_ai_tools.refresh_tool_availability.assert_called_once_with(None, check_version=False)
+    printer.result.assert_any_call("gemini", "available")
+    printer.result.assert_any_call("codex", "not available")
+    printer.success.assert_called_with("Refreshed 2 tool(s); 1 available")
+
+
+def test_cache_refresh_tools_single_tool_keeps_other_entries() -> None:
+    args = _make_args(tools=["codex"], check_version=True)
+    printer = Mock()
+
+    with patch("claude_skills.common.cache.cli.ai_tools") as mock_ai_tools:
+        mock_ai_tools.refresh_tool_availability.return_value = {"codex": True}
+
+        exit_code = handle_cache_refresh_tools(args, printer)
+
+    assert exit_code == 0
+    mock_ai_tools.clear_tool_availability_cache.assert_not_called()
+    mock_ai_tools.refresh_tool_availability.assert_called_once_with(["codex"], check_version=True)
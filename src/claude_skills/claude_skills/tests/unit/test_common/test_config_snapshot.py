@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+"""
+Tests for the process-wide configuration snapshot cache.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from claude_skills.common import ai_config, config, sdd_config
+from claude_skills.common.config_snapshot import (
+    clear_config_snapshots,
+    load_config_snapshot,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshots() -> Iterator[None]:
+    clear_config_snapshots()
+    yield
+    clear_config_snapshots()
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_snapshot_parses_once_until_mtime_changes(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"value": 1}))
+    calls = []
+
+    def parser(text: str):
+        calls.append(text)
+        return json.loads(text)
+
+    first = load_config_snapshot(config_file, parser, "counting")
+    second = load_config_snapshot(config_file, parser, "counting")
+    assert first is second
+    assert len(calls) == 1
+
+    config_file.write_text(json.dumps({"value": 2}))
+    _bump_mtime(config_file)
+
+    third = load_config_snapshot(config_file, parser, "counting")
+    assert third.data["value"] == 2
+    assert len(calls) == 2
+
+
+def test_snapshot_data_is_immutable(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"section": {"items": [1, 2]}}))
+
+    snapshot = load_config_snapshot(config_file, json.loads, "json")
+    with pytest.raises(TypeError):
+        snapshot.data["section"]["new"] = True
+    assert snapshot.data["section"]["items"] == (1, 2)
+
+    mutable = snapshot.to_dict()
+    mutable["section"]["items"].append(3)
+    assert snapshot.data["section"]["items"] == (1, 2)
+
+
+def test_snapshot_missing_file_returns_none(tmp_path: Path) -> None:
+    assert load_config_snapshot(tmp_path / "missing.json", json.loads, "json") is None
+
+
+def test_snapshot_parse_errors_are_not_cached(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text("{invalid")
+
+    with pytest.raises(json.JSONDecodeError):
+        load_config_snapshot(config_file, json.loads, "json")
+
+    config_file.write_text(json.dumps({"ok": True}))
+    _bump_mtime(config_file)
+    assert load_config_snapshot(config_file, json.loads, "json").data["ok"] is True
+
+
+def test_load_global_config_parses_yaml_once(tmp_path: Path) -> None:
+    config_file = tmp_path / "ai_config.yaml"
+    config_file.write_text("consultation:\n  timeout_seconds: 42\n")
+
+    with patch.object(ai_config, "get_global_config_path", return_value=config_file), \
+            patch.object(ai_config.yaml, "safe_load", wraps=ai_config.yaml.safe_load) as safe_load:
+        first = ai_config.load_global_config()
+        first["consultation"]["timeout_seconds"] = 0
+        second = ai_config.load_global_config()
+
+    assert second["consultation"]["timeout_seconds"] == 42
+    assert safe_load.call_count == 1
+
+
+def test_load_sdd_config_rereads_after_change(tmp_path: Path) -> None:
+    config_dir = tmp_path / ".claude"
+    config_dir.mkdir()
+    config_file = config_dir / "sdd_config.json"
+    config_file.write_text(json.dumps({"work_mode": "single"}))
+
+    assert sdd_config.load_sdd_config(tmp_path)["work_mode"] == "single"
+
+    config_file.write_text(json.dumps({"work_mode": "autonomous"}))
+    _bump_mtime(config_file)
+    assert sdd_config.load_sdd_config(tmp_path)["work_mode"] == "autonomous"
+
+
+def test_load_config_uses_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SDD_CACHE_TTL_HOURS", raising=False)
+    config_dir = tmp_path / ".claude"
+    config_dir.mkdir()
+    (config_dir / "config.json").write_text(json.dumps({"cache": {"ttl_hours": 6}}))
+
+    with patch.object(config.json, "loads", wraps=json.loads) as loads:
+        assert config.load_config(tmp_path)["cache"]["ttl_hours"] == 6
+        assert config.load_config(tmp_path)["cache"]["ttl_hours"] == 6
+
+    assert loads.call_count == 1
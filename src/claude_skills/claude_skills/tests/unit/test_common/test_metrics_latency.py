@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+"""
+Tests for per-provider latency histograms and adaptive timeouts.
+"""
+
+import pytest
+
+from claude_skills.common import metrics
+from claude_skills.common.metrics import (
+    LatencyHistogram,
+    get_adaptive_timeout,
+    get_hedge_delay,
+    get_provider_latency,
+    record_provider_latency,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def latency_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_DIR", tmp_path)
+    monkeypatch.setattr(metrics, "LATENCY_FILE", tmp_path / "provider_latency.json")
+    monkeypatch.setattr(metrics, "_is_test_environment", lambda: False)
+    return tmp_path / "provider_latency.json"
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(4.0)
+    for _ in range(10):
+        histogram.record(50.0)
+
+    assert histogram.count == 100
+    assert histogram.percentile(50) == 5.0
+    assert histogram.percentile(95) == 60.0
+    assert LatencyHistogram().percentile(95) is None
+
+
+def test_histogram_decays_old_samples() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(metrics.MAX_LATENCY_SAMPLES + 1):
+        histogram.record(2.0)
+
+    assert histogram.count <= metrics.MAX_LATENCY_SAMPLES // 2 + 1
+
+
+def test_record_provider_latency_round_trip(latency_store) -> None:
+    record_provider_latency("gemini", None, 4.2)
+    record_provider_latency("gemini", None, 0, timed_out=True)
+    record_provider_latency("codex", "gpt-5", 12.0)
+
+    histogram = get_provider_latency("gemini", None)
+    assert histogram.count == 1
+    assert histogram.timeouts == 1
+    assert get_provider_latency("codex", "gpt-5").percentile(50) == 13.0
+    assert get_provider_latency("codex", None) is None
+
+
+def test_record_provider_latency_skipped_in_tests(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(metrics, "LATENCY_FILE", tmp_path / "provider_latency.json")
+
+    record_provider_latency("gemini", None, 4.2)
+
+    assert not (tmp_path / "provider_latency.json").exists()
+
+
+def test_adaptive_timeout_requires_history(latency_store) -> None:
+    for _ in range(metrics.MIN_LATENCY_SAMPLES - 1):
+        record_provider_latency("gemini", None, 10.0)
+
+    assert get_adaptive_timeout("gemini", None, 600) == 600
+    assert get_hedge_delay("gemini", None) is None
+
+
+def test_adaptive_timeout_derived_from_p95(latency_store) -> None:
+    for _ in range(metrics.MIN_LATENCY_SAMPLES):
+        record_provider_latency("gemini", None, 40.0)
+
+    assert get_adaptive_timeout("gemini", None, 600) == 90.0
+    # Never above the configured timeout, never below the floor
+    assert get_adaptive_timeout("gemini", None, 60) == 60
+    assert get_adaptive_timeout("gemini", None, 600, headroom=0.1) == 30.0
+    assert get_hedge_delay("gemini", None) == 45.0
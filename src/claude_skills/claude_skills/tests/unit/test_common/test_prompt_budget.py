@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+"""
+Tests for token-budgeted prompt assembly.
+"""
+
+import pytest
+
+from claude_skills.common.prompt_budget import (
+    BudgetedPromptBuilder,
+    estimate_tokens,
+    split_diff_hunks,
+    summarize_diff,
+    truncate_diff,
+    truncate_lines,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def _make_diff(hunk_sizes):
+    parts = ["diff --git a/src/a.py b/src/a.py\n--- a/src/a.py\n+++ b/src/a.py\n"]
+    for index, size in enumerate(hunk_sizes, start=1):
+        parts.append(f"@@ -{index},1 +{index},{size} @@\n")
+        parts.extend(f"+line {index}.{n}\n" for n in range(size))
+    return "".join(parts)
+
+
+def test_unbounded_builder_keeps_everything_in_order() -> None:
+    builder = BudgetedPromptBuilder()
+    builder.add("a", "first\n", required=True)
+    builder.add("b", "second\n", priority=3)
+    builder.add("c", "third\n", priority=1)
+
+    assert builder.build() == "first\nsecond\nthird\n"
+    assert builder.omitted == [] and builder.truncated == []
+
+
+def test_builder_respects_priority_and_budget() -> None:
+    builder = BudgetedPromptBuilder(max_chars=400)
+    builder.add("header", "H" * 100 + "\n", required=True)
+    builder.add("low", "L" * 250 + "\n", priority=2, fallback="[low omitted]\n")
+    builder.add("high", "I" * 250 + "\n", priority=1)
+
+    prompt = builder.build()
+
+    assert len(prompt) <= 400
+    assert "I" * 250 in prompt
+    assert "[low omitted]" in prompt
+    assert builder.omitted == ["low"]
+    # Document order is preserved
+    assert prompt.index("H") < prompt.index("[low omitted]") < prompt.index("I")
+
+
+def test_builder_truncates_when_truncator_available() -> None:
+    builder = BudgetedPromptBuilder(max_chars=600)
+    builder.add("header", "header\n", required=True)
+    body = "\n".join(f"line {n}" for n in range(200))
+    builder.add("body", body, priority=1, truncator=truncate_lines)
+
+    prompt = builder.build()
+
+    assert len(prompt) <= 600
+    assert "... (truncated)" in prompt
+    assert builder.truncated == ["body"]
+
+
+def test_builder_shares_budget_within_priority() -> None:
+    builder = BudgetedPromptBuilder(max_chars=1000)
+    builder.add("small", "s" * 100, priority=1)
+    builder.add("big-1", "\n".join(["x" * 20] * 60), priority=1, truncator=truncate_lines)
+    builder.add("big-2", "\n".join(["y" * 20] * 60), priority=1, truncator=truncate_lines)
+
+    prompt = builder.build()
+
+    assert len(prompt) <= 1000
+    assert "s" * 100 in prompt
+    assert prompt.count("x" * 20) > 10
+    assert prompt.count("y" * 20) > 10
+
+
+def test_builder_output_is_deterministic() -> None:
+    def build() -> str:
+        builder = BudgetedPromptBuilder(max_tokens=100)
+        builder.add("header", "header\n", required=True)
+        for index in range(5):
+            builder.add(f"s{index}", f"section {index}\n" * 20, priority=index % 2 + 1, truncator=truncate_lines)
+        return builder.build()
+
+    assert build() == build()
+
+
+def test_estimate_tokens() -> None:
+    assert estimate_tokens("a" * 40) == 10
+
+
+def test_split_and_summarize_diff() -> None:
+    diff = _make_diff([2, 3])
+    header, hunks = split_diff_hunks(diff)
+
+    assert header.startswith("diff --git")
+    assert len(hunks) == 2
+    assert summarize_diff(diff) == "+5/-0 lines in 2 hunks"
+
+
+def test_truncate_diff_keeps_most_relevant_hunks_in_order() -> None:
+    diff = _make_diff([1, 30, 2, 25])
+    truncated = truncate_diff(diff, 600)
+
+    assert len(truncated) <= 600
+    assert "@@ -2,1 +2,30 @@" in truncated
+    assert "more hunks omitted" in truncated
+    # Largest hunk survives, kept hunks appear in original order
+    kept = [line for line in truncated.splitlines() if line.startswith("@@")]
+    assert kept == sorted(kept, key=lambda line: int(line.split()[1].split(",")[0][1:]))
+
+
+def test_truncate_diff_returns_small_diff_unchanged() -> None:
+    diff = _make_diff([1])
+    assert truncate_diff(diff, 10_000) == diff
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+"""
+Tests for the content-addressed AI response cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from claude_skills.common.cache import CacheManager, ResponseCache, generate_response_key
+from claude_skills.common.cache.cache_key import RESPONSE_KEY_PREFIX
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    return CacheManager(cache_dir=tmp_path / "cache", auto_cleanup=False)
+
+
+def test_response_key_depends_on_tool_model_and_prompt() -> None:
+    key = generate_response_key("gemini", "Explain this", model="gemini-2.5-pro")
+
+    assert key.startswith(RESPONSE_KEY_PREFIX)
+    assert key == generate_response_key("gemini", "Explain this", model="gemini-2.5-pro")
+    assert key != generate_response_key("codex", "Explain this", model="gemini-2.5-pro")
+    assert key != generate_response_key("gemini", "Explain that", model="gemini-2.5-pro")
+    assert key != generate_response_key("gemini", "Explain this")
+
+
+def test_response_cache_round_trip(cache_manager) -> None:
+    cache = ResponseCache(cache_manager)
+
+    assert cache.get("gemini", "prompt") is None
+    assert cache.set("gemini", "prompt", {"output": "answer"})
+    assert cache.get("gemini", "prompt") == {"output": "answer"}
+    assert cache.get("gemini", "prompt", model="other") is None
+
+
+def test_response_cache_entries_expire(cache_manager) -> None:
+    cache = ResponseCache(cache_manager, ttl_hours=0.0001)
+    cache.set("gemini", "prompt", {"output": "answer"})
+
+    time.sleep(0.5)
+
+    assert cache.get("gemini", "prompt") is None
+
+
+def test_prune_removes_oldest_entries_with_prefix(cache_manager) -> None:
+    cache_manager.set("other-key", {"keep": True})
+    for index in range(4):
+        cache_manager.set(f"{RESPONSE_KEY_PREFIX}{index}", {"output": "x" * 400})
+        path = cache_manager._get_cache_path(f"{RESPONSE_KEY_PREFIX}{index}")
+        os.utime(path, (1000 + index, 1000 + index))
+    # Serialized timestamps can differ in length, so budget for exactly the two newest entries
+    newest_size = sum(
+        cache_manager._get_cache_path(f"{RESPONSE_KEY_PREFIX}{index}").stat().st_size for index in (2, 3)
+    )
+
+    removed = cache_manager.prune(RESPONSE_KEY_PREFIX, newest_size)
+
+    assert removed == 2
+    assert cache_manager.get(f"{RESPONSE_KEY_PREFIX}0") is None
+    assert cache_manager.get(f"{RESPONSE_KEY_PREFIX}1") is None
+    assert cache_manager.get(f"{RESPONSE_KEY_PREFIX}3") is not None
+    assert cache_manager.get("other-key") == {"keep": True}
+
+
+def test_prune_runs_on_first_write_then_periodically(cache_manager, mocker) -> None:
+    prune = mocker.patch.object(cache_manager, "prune", return_value=0)
+    # 10% of 0.01 MB is about 1 KB, i.e. roughly every third 400-byte entry
+    cache = ResponseCache(cache_manager, max_size_mb=0.01)
+
+    for index in range(8):
+        cache.set("gemini", f"prompt {index}", {"output": "x" * 400})
+
+    assert prune.call_count == 3
+
+
+def test_clear_by_review_type_targets_responses(cache_manager) -> None:
+    ResponseCache(cache_manager).set("gemini", "prompt", {"output": "answer"})
+    cache_manager.set("fidelity", {"v": 1}, metadata={"review_type": "fidelity"})
+
+    assert cache_manager.clear(review_type="ai-response") == 1
+    assert cache_manager.get("fidelity") == {"v": 1}
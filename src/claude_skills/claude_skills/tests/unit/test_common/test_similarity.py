@@ -0,0 +1,117 @@
+"""Unit tests for offline claim similarity and agreement scoring."""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from claude_skills.common.similarity import (
+    agreement_label,
+    best_match,
+    cluster_claims,
+    cluster_items,
+    split_claims,
+    text_similarity,
+    tokenize,
+)
+
+pytestmark = pytest.mark.unit
+
+
+GEMINI = """
+## Analysis
+The root cause is that the fixture scope is wrong; it should be module scoped.
+- The `load_config` function in config.py does not return the parsed value.
+- Consider adding a timeout to the HTTP call.
+
+```python
+def load_config():
+    parse()
+```
+"""
+
+CODEX = """
+1. `load_config` in config.py never returns the parsed configuration value.
+2. Fixture has an incorrect scope, use module scope for the fixture instead.
+3. Logging in the retry loop is far too noisy.
+"""
+
+
+def test_tokenize_stems_and_keeps_identifiers() -> None:
+    assert tokenize("The fixtures were scoped in config.py") == ["fixtur", "scop", "config.py"]
+    assert tokenize("load_config returns") == ["load_config", "return"]
+
+
+def test_split_claims_uses_bullets_sentences_and_skips_code() -> None:
+    claims = split_claims(GEMINI)
+
+    assert claims == [
+        "The root cause is that the fixture scope is wrong; it should be module scoped.",
+        "The load_config function in config.py does not return the parsed value.",
+        "Consider adding a timeout to the HTTP call.",
+    ]
+
+
+def test_text_similarity_scores_paraphrases_above_unrelated_text() -> None:
+    paraphrase = text_similarity(
+        "The load_config function does not return the parsed value",
+        "load_config never returns the parsed configuration value",
+    )
+    unrelated = text_similarity("Add a timeout to the HTTP call", "The fixture scope is wrong")
+
+    assert paraphrase > 0.5
+    assert unrelated == 0.0
+    assert text_similarity("N/A", "n/a") == 1.0
+
+
+def test_paraphrased_claims_cluster_across_sources() -> None:
+    report = cluster_claims({"gemini": GEMINI, "codex": CODEX})
+
+    shared = report.consensus()
+    assert [cluster.sources for cluster in shared] == [["gemini", "codex"], ["gemini", "codex"]]
+    assert {cluster.representative.split()[1] for cluster in shared} == {"root", "load_config"}
+    assert [c.representative for c in report.unique_to("codex")] == ["Logging in the retry loop is far too noisy."]
+    assert report.source_agreement == {"gemini": pytest.approx(2 / 3), "codex": pytest.approx(2 / 3)}
+
+
+def test_clusters_hold_one_claim_per_source() -> None:
+    report = cluster_items({
+        "a": ["missing return in load_config", "missing return in load_config helper"],
+        "b": ["load_config has a missing return"],
+    })
+
+    assert sorted(len(cluster.claims) for cluster in report.clusters) == [1, 2]
+    assert all(cluster.agreement <= 1.0 for cluster in report.clusters)
+
+
+def test_best_match_picks_the_most_similar_candidate() -> None:
+    candidates = ["Sign JWT access tokens", "Session store migration and rollback"]
+
+    assert best_match("the migration lacks a rollback", candidates) == 1
+    assert best_match("logging is noisy", candidates) is None
+
+
+def test_agreement_labels() -> None:
+    assert agreement_label(0.8) == "Strong"
+    assert agreement_label(0.4) == "Moderate"
+    assert agreement_label(0.2) == "Weak"
+    assert agreement_label(0.0) == "Conflicted"
+
+
+def test_many_long_responses_stay_fast() -> None:
+    rng = random.Random(7)
+    vocabulary = [f"term{i}" for i in range(2000)] + "fixture scope import timeout error test".split()
+    responses = {
+        f"agent{k}": "\n".join(
+            "- " + " ".join(rng.choice(vocabulary) for _ in range(15)) + "." for _ in range(300)
+        )
+        for k in range(6)
+    }
+
+    start = time.perf_counter()
+    report = cluster_claims(responses)
+
+    assert time.perf_counter() - start < 5.0
+    assert sum(len(cluster.claims) for cluster in report.clusters) == 1800
@@ -0,0 +1,124 @@
+"""Unit tests for the local test outcome history and flakiness scores."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from claude_skills.common import test_history
+from claude_skills.common.test_history import (
+    RETAINED_OUTCOMES,
+    TestHistory,
+    canonical_test_id,
+    score_outcomes,
+)
+from claude_skills.run_tests import consultation
+
+pytestmark = pytest.mark.unit
+
+
+def test_node_ids_are_canonicalized() -> None:
+    assert canonical_test_id("tests/unit/test_a.py::TestX::test_y[1]") == "tests.unit.test_a.TestX::test_y[1]"
+    assert canonical_test_id("tests/test_a.py::test_y") == "tests.test_a::test_y"
+    assert canonical_test_id("tests.test_a::test_y") == "tests.test_a::test_y"
+
+
+def test_stable_tests_score_zero() -> None:
+    assert score_outcomes("t", [("passed", "a")] * 5).score == 0.0
+    assert score_outcomes("t", [("failed", "a"), ("failed", "b"), ("failed", "c")]).score == 0.0
+
+
+def test_flips_and_mixed_commits_raise_the_score() -> None:
+    flipping = score_outcomes("t", [("passed", "a"), ("failed", "b"), ("passed", "c"), ("failed", "d")])
+    assert (flipping.flips, flipping.score) == (3, 1.0)
+
+    same_commit = score_outcomes(
+        "t", [("passed", "a"), ("passed", "a"), ("failed", "a"), ("passed", "b"), ("passed", "c")]
+    )
+    assert same_commit.mixed_commits == 1
+    assert same_commit.is_flaky()
+
+
+def test_skipped_outcomes_and_short_histories_are_ignored() -> None:
+    score = score_outcomes("t", [("passed", None), ("skipped", None), ("failed", None)])
+
+    assert score.runs == 2
+    assert not score.is_flaky()
+
+
+def test_history_records_and_scores(tmp_path: Path) -> None:
+    history = TestHistory(tmp_path / "history.db")
+
+    assert history.flakiness("tests/test_a.py::test_x").runs == 0
+    assert not (tmp_path / "history.db").exists()
+
+    for outcome in ("passed", "failed", "passed", "failed"):
+        history.record([("tests/test_a.py::test_x", outcome, 0.1), ("tests.test_a::test_y", "passed", 0.2)])
+
+    score = history.flakiness("tests/test_a.py::test_x")
+    assert (score.runs, score.failures, score.flips) == (4, 2, 3)
+    assert [s.test_id for s in history.flaky_tests()] == ["tests.test_a::test_x"]
+
+
+def test_history_keeps_only_recent_outcomes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    history = TestHistory(tmp_path / "history.db")
+    history.record([("tests.test_a::test_gone", "passed", None)])
+    for _ in range(RETAINED_OUTCOMES + 5):
+        history.record([("tests.test_a::test_x", "passed", None), ("tests.test_a::test_y", "failed", None)])
+
+    with history._get_connection() as conn:
+        counts = dict(conn.execute("SELECT test_id, COUNT(*) FROM outcomes GROUP BY test_id"))
+    assert counts == {
+        "tests.test_a::test_gone": 1,
+        "tests.test_a::test_x": RETAINED_OUTCOMES,
+        "tests.test_a::test_y": RETAINED_OUTCOMES,
+    }
+
+    later = test_history.time.time() + (test_history.MAX_OUTCOME_AGE_DAYS + 1) * 86400
+    monkeypatch.setattr(test_history.time, "time", lambda: later)
+    history.record([("tests.test_a::test_x", "passed", None)])
+
+    with history._get_connection() as conn:
+        assert conn.execute("SELECT test_id FROM outcomes").fetchall() == [("tests.test_a::test_x",)]
+
+
+def _flaky_history(tmp_path: Path, node_id: str) -> TestHistory:
+    history = TestHistory(tmp_path / "history.db")
+    for outcome in ("passed", "failed", "passed", "failed"):
+        history.record([(node_id, outcome, None)], commit="abc")
+    return history
+
+
+def test_consultation_is_skipped_when_a_known_flake_passes_on_retry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    test_file = tmp_path / "test_a.py"
+    test_file.write_text("def test_x():\n    pass\n")
+    node_id = f"{test_file}::test_x"
+    history = _flaky_history(tmp_path, node_id)
+    retry = Mock(return_value=True)
+    monkeypatch.setattr(consultation, "retry_test_locally", retry)
+    run = Mock()
+    monkeypatch.setattr(consultation, "run_consultation", run)
+
+    exit_code = consultation.consult_with_auto_routing(
+        "assertion", "AssertionError", "flaky", test_id=node_id, history=history, printer=Mock(),
+    )
+
+    assert exit_code == 0
+    retry.assert_called_once()
+    run.assert_not_called()
+
+
+def test_unknown_tests_are_consulted_without_retry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    retry = Mock()
+    monkeypatch.setattr(consultation, "retry_test_locally", retry)
+
+    note, skip_code = consultation._check_known_flake(
+        "tests/test_a.py::test_x", TestHistory(tmp_path / "history.db"), Mock(), dry_run=False
+    )
+
+    assert (note, skip_code) == (None, None)
+    retry.assert_not_called()
@@ -0,0 +1 @@
+"""Unit tests for context_tracker module."""
@@ -0,0 +1,119 @@
+"""Tests for incremental transcript parsing with checkpoints."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from claude_skills.context_tracker import parser
+from claude_skills.context_tracker.parser import load_checkpoint, parse_transcript
+
+
+def _usage_line(input_tokens: int, output_tokens: int = 1, cache_read: int = 0) -> str:
+    return json.dumps({
+        "type": "assistant",
+        "message": {
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read_input_tokens": cache_read,
+            }
+        },
+    }) + "\n"
+
+
+CLEAR_LINE = json.dumps({
+    "type": "user",
+    "message": {"content": [{"type": "text", "text": "<command-name>/clear</command-name>"}]},
+}) + "\n"
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path: Path) -> Path:
+    return tmp_path / "checkpoints"
+
+
+def _append(path: Path, text: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_appended_lines_are_parsed_incrementally(tmp_path: Path, checkpoint_dir: Path, monkeypatch) -> None:
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(_usage_line(10) + _usage_line(20, cache_read=5))
+
+    first = parse_transcript(transcript, checkpoint_dir=checkpoint_dir)
+    assert first.input_tokens == 30
+    assert first.context_length == 25
+
+    parsed = []
+    original_parse_line = parser._parse_line
+    monkeypatch.setattr(parser, "_parse_line", lambda raw: parsed.append(raw) or original_parse_line(raw))
+    _append(transcript, _usage_line(7))
+
+    second = parse_transcript(transcript, checkpoint_dir=checkpoint_dir)
+
+    assert len(parsed) == 1
+    assert second == parse_transcript(transcript, use_checkpoint=False)
+    assert second.input_tokens == 37
+    assert second.total_tokens == 37 + 3 + 5
+
+
+def test_clear_position_is_checkpointed(tmp_path: Path, checkpoint_dir: Path) -> None:
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(_usage_line(10) + CLEAR_LINE)
+    parse_transcript(transcript, checkpoint_dir=checkpoint_dir)
+
+    _append(transcript, _usage_line(4))
+    metrics = parse_transcript(transcript, checkpoint_dir=checkpoint_dir)
+
+    assert metrics.input_tokens == 4
+    checkpoint = load_checkpoint(transcript, checkpoint_dir)
+    assert checkpoint.last_clear_offset == len(_usage_line(10))
+    assert checkpoint.offset == transcript.stat().st_size
+
+
+def test_partial_last_line_is_reparsed_once_complete(tmp_path: Path, checkpoint_dir: Path) -> None:
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(_usage_line(10) + _usage_line(5).rstrip("\n"))
+
+    assert parse_transcript(transcript, checkpoint_dir=checkpoint_dir).input_tokens == 15
+
+    _append(transcript, "\n" + _usage_line(1))
+
+    assert parse_transcript(transcript, checkpoint_dir=checkpoint_dir).input_tokens == 16
+
+
+@pytest.mark.parametrize("change", ["shrink", "replace", "rewrite"])
+def test_changed_files_are_parsed_from_scratch(tmp_path: Path, checkpoint_dir: Path, change: str) -> None:
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(_usage_line(10) + _usage_line(20))
+    parse_transcript(transcript, checkpoint_dir=checkpoint_dir)
+
+    if change == "shrink":
+        transcript.write_text(_usage_line(3))
+    elif change == "replace":
+        rotated = tmp_path / "new.jsonl"
+        rotated.write_text(_usage_line(10) + _usage_line(20) + _usage_line(3))
+        os.replace(rotated, transcript)
+    else:
+        # Same size and inode, different content
+        with open(transcript, "r+", encoding="utf-8") as f:
+            f.write(_usage_line(11) + _usage_line(21))
+
+    metrics = parse_transcript(transcript, checkpoint_dir=checkpoint_dir)
+
+    assert metrics == parse_transcript(transcript, use_checkpoint=False)
+
+
+def test_unreadable_checkpoint_falls_back_to_full_parse(tmp_path: Path, checkpoint_dir: Path) -> None:
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(_usage_line(10))
+    parse_transcript(transcript, checkpoint_dir=checkpoint_dir)
+    for path in checkpoint_dir.iterdir():
+        path.write_text("not json")
+
+    assert parse_transcript(transcript, checkpoint_dir=checkpoint_dir).input_tokens == 10
@@ -0,0 +1,100 @@
+"""Tests for tail-first session marker search and the marker index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from claude_skills.context_tracker import cli, transcript_search
+from claude_skills.context_tracker.transcript_search import (
+    MarkerIndex,
+    find_marker_in_tail,
+    wait_for_transcript_change,
+)
+
+MARKER = "SESSION_MARKER_abc12345"
+
+
+def test_marker_found_across_block_boundary(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(transcript_search, "SEARCH_BLOCK_BYTES", 16)
+    transcript = tmp_path / "session.jsonl"
+    # Marker starts 10 bytes before the last 16-byte block
+    transcript.write_bytes(b"x" * 100 + MARKER.encode() + b"y" * 3)
+
+    assert find_marker_in_tail(transcript, MARKER, window_bytes=None)
+    assert not find_marker_in_tail(transcript, "SESSION_MARKER_missing", window_bytes=None)
+
+
+def test_search_window_is_bounded(tmp_path: Path) -> None:
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_bytes(MARKER.encode() + b"\n" + b"z" * 5000)
+
+    assert not find_marker_in_tail(transcript, MARKER, window_bytes=1000)
+    assert find_marker_in_tail(transcript, MARKER, window_bytes=None)
+
+
+def test_marker_index_round_trip_and_pruning(tmp_path: Path) -> None:
+    transcripts = [tmp_path / f"t{i}.jsonl" for i in range(3)]
+    for path in transcripts:
+        path.write_text("{}\n")
+    index = MarkerIndex(tmp_path / "markers.json", max_entries=2)
+
+    for i, path in enumerate(transcripts):
+        index.set(f"m{i}", str(path))
+
+    assert index.get("m0") is None
+    assert index.get("m2") == str(transcripts[2])
+    transcripts[2].unlink()
+    assert index.get("m2") is None
+
+
+def test_wait_returns_when_transcript_grows(tmp_path: Path) -> None:
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text("{}\n")
+
+    def grow(_seconds: float) -> None:
+        with open(transcript, "a", encoding="utf-8") as f:
+            f.write("{}\n")
+
+    assert wait_for_transcript_change(lambda: [transcript], timeout=5.0, sleep=grow)
+
+
+def test_wait_times_out_without_changes(tmp_path: Path) -> None:
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text("{}\n")
+    now = [0.0]
+
+    def fake_sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    changed = wait_for_transcript_change(
+        lambda: [transcript], timeout=1.0, clock=lambda: now[0], sleep=fake_sleep
+    )
+
+    assert changed is False
+    assert now[0] == pytest.approx(1.0)
+
+
+def test_found_marker_is_indexed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    home = tmp_path / "home"
+    cwd = tmp_path / "project"
+    cwd.mkdir()
+    project_dir = home / ".claude" / "projects" / str(cwd.resolve()).replace("/", "-").replace("_", "-")
+    project_dir.mkdir(parents=True)
+    (project_dir / "other.jsonl").write_text('{"type": "user"}\n')
+    transcript = project_dir / "session.jsonl"
+    transcript.write_text('{"type": "user"}\n' + f'{{"text": "{MARKER}"}}\n')
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: home))
+    index = MarkerIndex(tmp_path / "markers.json")
+
+    found = cli.find_transcript_by_specific_marker(cwd, MARKER, max_retries=1, marker_index=index)
+
+    assert found == str(transcript)
+    assert index.get(MARKER) == str(transcript)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("indexed markers should not be searched for")
+
+    monkeypatch.setattr(cli, "find_marker_in_tail", fail)
+    assert cli.find_transcript_by_specific_marker(cwd, MARKER, max_retries=1, marker_index=index) == str(transcript)
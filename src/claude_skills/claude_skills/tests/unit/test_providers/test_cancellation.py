@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from claude_skills.common.providers import cancellation
+from claude_skills.common.providers.cancellation import (
+    CancellationToken,
+    cancel_all,
+    cancellation_scope,
+    get_current_token,
+    run_subprocess,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_run_subprocess_matches_subprocess_run() -> None:
+    result = run_subprocess(
+        [sys.executable, "-c", "import sys; print(sys.stdin.read().upper()); sys.exit(3)"],
+        input_data="hello",
+        timeout=10,
+    )
+
+    assert result.returncode == 3
+    assert result.stdout.strip() == "HELLO"
+
+
+def test_run_subprocess_raises_timeout() -> None:
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_subprocess([sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.2)
+
+
+def test_cancel_terminates_running_subprocess() -> None:
+    token = CancellationToken()
+    results = {}
+
+    def worker() -> None:
+        with cancellation_scope(token):
+            results["process"] = run_subprocess(
+                [sys.executable, "-c", "import time; time.sleep(30)"], timeout=30
+            )
+
+    thread = threading.Thread(target=worker)
+    start = time.time()
+    thread.start()
+    time.sleep(0.3)
+    token.cancel()
+    thread.join(10)
+
+    assert not thread.is_alive()
+    assert time.time() - start < 10
+    assert results["process"].returncode != 0
+
+
+def test_cancel_all_shares_one_grace_period(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cancellation, "TERMINATE_GRACE_SECONDS", 0.5)
+    ignore_sigterm = (
+        "import signal, sys, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+        "print('ready', flush=True); time.sleep(30)"
+    )
+    tokens = [CancellationToken() for _ in range(4)]
+    processes = []
+    for token in tokens:
+        process = subprocess.Popen([sys.executable, "-c", ignore_sigterm], stdout=subprocess.PIPE, text=True)
+        process.stdout.readline()
+        token.register(process)
+        processes.append(process)
+
+    start = time.monotonic()
+    cancel_all(tokens)
+    elapsed = time.monotonic() - start
+
+    for process in processes:
+        process.wait(5)
+        process.stdout.close()
+    assert elapsed < 1.5
+    assert all(process.returncode is not None for process in processes)
+    assert all(token.cancelled for token in tokens)
+
+
+def test_cancellation_scope_is_thread_local_and_restored() -> None:
+    token = CancellationToken()
+    seen = {}
+
+    with cancellation_scope(token):
+        thread = threading.Thread(target=lambda: seen.setdefault("other", get_current_token()))
+        thread.start()
+        thread.join()
+        assert get_current_token() is token
+
+    assert seen["other"] is None
+    assert get_current_token() is None
@@ -464,3 +464,69 @@ def test_claude_provider_blocks_web_operations() -> None:
     # Verify WebSearch and WebFetch are in the disallowed tools section
     assert "WebSearch" in disallowed_tools_in_command
     assert "WebFetch" in disallowed_tools_in_command
+
+
+def _stream_events(*texts: str) -> List[str]:
+    """Create mock Claude CLI stream-json lines with partial text deltas."""
+    lines = [json.dumps({"type": "system", "subtype": "init"})]
+    for text in texts:
+        lines.append(json.dumps({
+            "type": "stream_event",
+            "event": {"type": "content_block_delta", "delta": {"type": "text_delta", "text": text}},
+        }))
+    lines.append(json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": "".join(texts)}]}}))
+    lines.append(_payload("".join(texts)))
+    return [line + "\n" for line in lines]
+
+
+def test_claude_provider_streams_partial_messages() -> None:
+    captured: Dict[str, object] = {}
+    chunks: List[str] = []
+
+    def stream_runner(command, *, on_line, timeout=None, env=None):
+        captured["command"] = list(command)
+        for line in _stream_events("Hello", " world"):
+            on_line(line)
+        return FakeProcess(stdout="")
+
+    provider = ClaudeProvider(
+        CLAUDE_METADATA,
+        ProviderHooks(on_stream_chunk=lambda chunk: chunks.append(chunk.content)),
+        stream_runner=stream_runner,
+    )
+
+    result = provider.generate(GenerationRequest(prompt="Say hello", stream=True))
+
+    command = captured["command"]
+    assert command[command.index("--output-format") + 1] == "stream-json"
+    assert "--include-partial-messages" in command
+    assert chunks == ["Hello", " world"]
+    assert result.content == "Hello world"
+    assert result.usage.output_tokens == 75
+    assert result.usage.metadata["time_to_first_token_ms"] is not None
+
+
+def test_claude_provider_falls_back_when_streaming_flags_unsupported() -> None:
+    commands: List[List[str]] = []
+    chunks: List[str] = []
+
+    def stream_runner(command, *, on_line, timeout=None, env=None):
+        commands.append(list(command))
+        return FakeProcess(stderr="error: unknown option '--include-partial-messages'", returncode=1)
+
+    def runner(command, *, timeout=None, env=None):
+        commands.append(list(command))
+        return FakeProcess(stdout=_payload("Full answer"))
+
+    provider = ClaudeProvider(
+        CLAUDE_METADATA,
+        ProviderHooks(on_stream_chunk=lambda chunk: chunks.append(chunk.content)),
+        runner=runner,
+        stream_runner=stream_runner,
+    )
+
+    result = provider.generate(GenerationRequest(prompt="Say hello", stream=True))
+
+    assert [command[command.index("--output-format") + 1] for command in commands] == ["stream-json", "json"]
+    assert chunks == ["Full answer"]
+    assert result.content == "Full answer"
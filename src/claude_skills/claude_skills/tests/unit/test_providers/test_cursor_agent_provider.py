@@ -276,3 +276,40 @@ def test_create_provider_and_availability_override(monkeypatch: pytest.MonkeyPat
     assert is_cursor_agent_available() is False
     monkeypatch.setenv("CURSOR_AGENT_CLI_AVAILABLE_OVERRIDE", "1")
     assert is_cursor_agent_available() is True
+
+
+def test_cursor_agent_provider_streams_partial_output(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config_path = tmp_path / ".cursor" / "cli-config.json"
+    captured: Dict[str, List[str]] = {}
+    chunks: List[str] = []
+    events = [
+        {"type": "system", "subtype": "init", "model": "composer-1"},
+        {"type": "assistant", "message": {"role": "assistant", "content": [{"type": "text", "text": "Streamed"}]}},
+        {"type": "assistant", "message": {"role": "assistant", "content": [{"type": "text", "text": " reply"}]}},
+        {"type": "result", "subtype": "success", "is_error": False, "result": "Streamed reply"},
+    ]
+
+    def stream_runner(command, *, on_line, timeout=None, env=None):
+        captured["command"] = list(command)
+        # The read-only config is in place while the CLI runs
+        assert config_path.exists()
+        for event in events:
+            on_line(json.dumps(event) + "\n")
+        return FakeProcess(stdout="")
+
+    provider = CursorAgentProvider(
+        CURSOR_METADATA,
+        ProviderHooks(on_stream_chunk=lambda chunk: chunks.append(chunk.content)),
+        stream_runner=stream_runner,
+        binary="cursor-agent",
+    )
+
+    result = provider.generate(GenerationRequest(prompt="Explain code", stream=True))
+
+    command = captured["command"]
+    assert command[command.index("--output-format") + 1] == "stream-json"
+    assert "--stream-partial-output" in command
+    assert chunks == ["Streamed", " reply"]
+    assert result.content == "Streamed reply"
+    assert not config_path.exists()
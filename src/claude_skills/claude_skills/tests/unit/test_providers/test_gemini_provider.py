@@ -166,3 +166,65 @@ def test_is_gemini_available_respects_override(monkeypatch: pytest.MonkeyPatch)
 
     monkeypatch.setenv("GEMINI_CLI_AVAILABLE_OVERRIDE", "1")
     assert is_gemini_available() is True
+
+
+def test_gemini_provider_streams_assistant_deltas() -> None:
+    captured: Dict[str, object] = {}
+    chunks: List[str] = []
+    events = [
+        {"type": "init", "model": "gemini-2.5-pro"},
+        {"type": "message", "role": "user", "content": "Say hello"},
+        {"type": "message", "role": "assistant", "content": "Hello", "delta": True},
+        {"type": "message", "role": "assistant", "content": " there", "delta": True},
+        {"type": "result", "status": "success", "stats": {"input_tokens": 8, "output_tokens": 2, "total_tokens": 10}},
+    ]
+
+    def stream_runner(command, *, on_line, timeout=None, env=None):
+        captured["command"] = list(command)
+        for event in events:
+            on_line(json.dumps(event) + "\n")
+        return FakeProcess(stdout="")
+
+    provider = create_provider(
+        hooks=ProviderHooks(on_stream_chunk=lambda chunk: chunks.append(chunk.content)),
+        dependencies={"stream_runner": stream_runner},
+    )
+
+    result = provider.generate(GenerationRequest(prompt="Say hello", stream=True))
+
+    command = captured["command"]
+    assert command[command.index("--output-format") + 1] == "stream-json"
+    assert chunks == ["Hello", " there"]
+    assert result.content == "Hello there"
+    assert result.model_fqn == "gemini:gemini-2.5-pro"
+    assert (result.usage.input_tokens, result.usage.output_tokens, result.usage.total_tokens) == (8, 2, 10)
+
+
+def test_gemini_provider_stream_falls_back_to_json() -> None:
+    chunks: List[str] = []
+
+    def stream_runner(command, *, on_line, timeout=None, env=None):
+        return FakeProcess(stderr='Invalid values: Argument: output-format, Given: "stream-json"', returncode=1)
+
+    provider = GeminiProvider(
+        GEMINI_METADATA,
+        ProviderHooks(on_stream_chunk=lambda chunk: chunks.append(chunk.content)),
+        runner=lambda command, **kwargs: FakeProcess(stdout=_payload("Whole response")),
+        stream_runner=stream_runner,
+    )
+
+    result = provider.generate(GenerationRequest(prompt="Say hello", stream=True))
+
+    assert chunks == ["Whole response"]
+    assert result.content == "Whole response"
+
+
+def test_gemini_provider_stream_reports_failed_result() -> None:
+    def stream_runner(command, *, on_line, timeout=None, env=None):
+        on_line(json.dumps({"type": "result", "status": "error", "error": {"message": "quota exceeded"}}))
+        return FakeProcess(stdout="")
+
+    provider = GeminiProvider(GEMINI_METADATA, ProviderHooks(), stream_runner=stream_runner)
+
+    with pytest.raises(ProviderExecutionError, match="quota exceeded"):
+        provider.generate(GenerationRequest(prompt="Say hello", stream=True))
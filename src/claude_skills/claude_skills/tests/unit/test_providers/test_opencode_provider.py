@@ -6,6 +6,10 @@ from __future__ import annotations
 
 import json
 import socket
+import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
 from unittest.mock import MagicMock, Mock, patch
@@ -19,14 +23,19 @@ from claude_skills.common.providers import (
     ProviderTimeoutError,
     ProviderUnavailableError,
 )
+from claude_skills.common.providers import opencode
 from claude_skills.common.providers.opencode import (
     DEFAULT_SERVER_URL,
     OPENCODE_METADATA,
     READONLY_TOOLS_CONFIG,
     OpenCodeProvider,
+    WrapperSession,
+    WrapperSessionError,
     create_provider,
     is_opencode_available,
 )
+from claude_skills.common.providers.cancellation import CancellationToken, cancellation_scope
+from claude_skills.common.providers.opencode_server import ServerState
 
 
 class FakeProcess:
@@ -920,3 +929,208 @@ def test_provider_del_cleans_up_config_file() -> None:
     # Verify cleanup
     assert not config_path.exists()
     assert not temp_dir.exists()
+
+
+# Stand-in for ``opencode_wrapper.js --serve``: one JSON request per line,
+# replies tagged with the request id; "slow" prompts answer after later ones.
+# Abort messages are appended to "<script>.aborts".
+FAKE_SERVE_WRAPPER = """
+import json, sys, threading, time
+
+def handle(request):
+    prompt = request.get("prompt")
+    if prompt == "crash":
+        sys.stdout.flush()
+        import os; os._exit(3)
+    if prompt == "hang":
+        return
+    if prompt == "slow":
+        time.sleep(0.3)
+    rid = request["id"]
+    with lock:
+        print(json.dumps({"id": rid, "type": "chunk", "content": "echo:"}), flush=True)
+        print(json.dumps({"id": rid, "type": "done", "response": {"text": "echo:" + prompt}}), flush=True)
+
+lock = threading.Lock()
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get("type") == "abort":
+        with open(sys.argv[0] + ".aborts", "a") as f:
+            f.write(request["id"] + "\\n")
+        continue
+    threading.Thread(target=handle, args=(request,)).start()
+"""
+
+
+@pytest.fixture
+def serve_session(tmp_path):
+    script = tmp_path / "fake_wrapper.py"
+    script.write_text(FAKE_SERVE_WRAPPER)
+    session = WrapperSession([sys.executable, str(script)])
+    yield session
+    session.close()
+
+
+def test_wrapper_session_routes_concurrent_requests_by_id(serve_session) -> None:
+    results = {}
+
+    def send(prompt: str) -> None:
+        results[prompt] = serve_session.request({"prompt": prompt}, timeout=10)
+
+    slow = threading.Thread(target=send, args=("slow",))
+    slow.start()
+    send("fast")
+    slow.join()
+
+    assert [m["type"] for m in results["fast"]] == ["chunk", "done"]
+    assert results["fast"][-1]["response"]["text"] == "echo:fast"
+    assert results["slow"][-1]["response"]["text"] == "echo:slow"
+
+
+def test_wrapper_session_reports_exit_and_restarts(serve_session) -> None:
+    with pytest.raises(WrapperSessionError):
+        serve_session.request({"prompt": "crash"}, timeout=10)
+
+    messages = serve_session.request({"prompt": "again"}, timeout=10)
+    assert messages[-1]["response"]["text"] == "echo:again"
+
+
+def _aborted_ids(tmp_path, expected: int) -> List[str]:
+    aborts = tmp_path / "fake_wrapper.py.aborts"
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if aborts.exists() and len(aborts.read_text().split()) >= expected:
+            break
+        time.sleep(0.05)
+    return aborts.read_text().split() if aborts.exists() else []
+
+
+def test_wrapper_session_times_out(serve_session, tmp_path) -> None:
+    with pytest.raises(subprocess.TimeoutExpired):
+        serve_session.request({"prompt": "hang"}, timeout=0.3)
+
+    # The wrapper is told to abort the request the caller gave up on
+    assert _aborted_ids(tmp_path, 1) == ["1"]
+
+
+def test_wrapper_session_aborts_cancelled_request(serve_session, tmp_path) -> None:
+    token = CancellationToken()
+    token.cancel()
+
+    with cancellation_scope(token):
+        with pytest.raises(ProviderExecutionError):
+            serve_session.request({"prompt": "hang"}, timeout=10)
+
+    assert _aborted_ids(tmp_path, 1) == ["1"]
+    messages = serve_session.request({"prompt": "again"}, timeout=10)
+    assert messages[-1]["response"]["text"] == "echo:again"
+    assert _aborted_ids(tmp_path, 1) == ["1"]
+
+
+def test_provider_streams_through_wrapper_session(monkeypatch: pytest.MonkeyPatch, serve_session) -> None:
+    """The provider sends requests to the long-lived wrapper instead of spawning node."""
+    monkeypatch.setattr(OpenCodeProvider, "_ensure_server_running", lambda self: None)
+    chunks: List[str] = []
+
+    def runner(*args, **kwargs):
+        raise AssertionError("per-call wrapper should not run")
+
+    provider = OpenCodeProvider(
+        OPENCODE_METADATA,
+        ProviderHooks(on_stream_chunk=lambda chunk: chunks.append(chunk.content)),
+        runner=runner,
+        wrapper_session=serve_session,
+    )
+
+    result = provider.generate(GenerationRequest(prompt="hi", stream=True, timeout=10))
+
+    assert result.content == "echo:"
+    assert chunks == ["echo:"]
+
+
+def test_provider_falls_back_to_per_call_wrapper(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(OpenCodeProvider, "_ensure_server_running", lambda self: None)
+    session = Mock()
+    session.request.side_effect = WrapperSessionError("wrapper exited")
+
+    provider = OpenCodeProvider(
+        OPENCODE_METADATA,
+        ProviderHooks(),
+        runner=lambda *args, **kwargs: FakeProcess(stdout=_payload("from runner")),
+        wrapper_session=session,
+    )
+
+    result = provider.generate(GenerationRequest(prompt="hi", timeout=10))
+
+    assert result.content == "from runner"
+    session.request.assert_called_once()
+
+
+def test_injected_runner_disables_persistent_wrapper(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(OpenCodeProvider, "_ensure_server_running", lambda self: None)
+    get_session = Mock()
+    monkeypatch.setattr(opencode, "get_wrapper_session", get_session)
+
+    provider = OpenCodeProvider(
+        OPENCODE_METADATA,
+        ProviderHooks(),
+        runner=lambda *args, **kwargs: FakeProcess(stdout=_payload()),
+    )
+    provider.generate(GenerationRequest(prompt="hi", timeout=10))
+
+    get_session.assert_not_called()
+
+
+def test_ensure_server_running_reuses_shared_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    state = ServerState(pid=4242, port=4096, started_at=1.0, last_used=1.0)
+    touched = []
+    monkeypatch.setattr(opencode, "discover_server", lambda port: state if port == 4096 else None)
+    monkeypatch.setattr(opencode, "touch_server_state", touched.append)
+
+    provider = OpenCodeProvider(
+        OPENCODE_METADATA,
+        ProviderHooks(),
+        runner=lambda *args, **kwargs: FakeProcess(stdout=_payload()),
+    )
+    monkeypatch.setattr(
+        provider, "_is_port_open", lambda port, host="localhost": pytest.fail("port probe not needed")
+    )
+
+    provider._ensure_server_running()
+
+    assert touched == [state]
+    assert provider._server_process is None
+
+
+def test_started_server_is_shared_and_survives_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    recorded = []
+    watchdogs = []
+    monkeypatch.setattr(opencode, "discover_server", lambda port: None)
+    monkeypatch.setattr(opencode, "write_server_state", lambda state: recorded.append(state) or True)
+    monkeypatch.setattr(opencode, "spawn_idle_watchdog", watchdogs.append)
+
+    provider = OpenCodeProvider(
+        OPENCODE_METADATA,
+        ProviderHooks(),
+        runner=lambda *args, **kwargs: FakeProcess(stdout=_payload()),
+    )
+    server = MagicMock(pid=31337)
+    server.poll.return_value = None
+    provider._server_process = server
+    provider._config_file_path = provider._create_readonly_config()
+
+    provider._share_server(4096)
+    provider.__del__()
+
+    assert recorded[0].pid == 31337
+    assert recorded[0].port == 4096
+    assert recorded[0].config_path == str(provider._config_file_path)
+    assert watchdogs == [31337]
+    server.terminate.assert_not_called()
+    assert provider._config_file_path.exists()
+
+    # Normally removed by the idle watchdog
+    provider._server_shared = False
+    provider._server_process = None
+    provider._cleanup_config_file()
+
@@ -0,0 +1,145 @@
+"""
+Tests for shared OpenCode server discovery and idle shutdown.
+"""
+
+from __future__ import annotations
+
+import http.server
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from claude_skills.common.providers import opencode_server
+from claude_skills.common.providers.opencode_server import (
+    ServerState,
+    discover_server,
+    is_process_alive,
+    is_server_healthy,
+    read_server_state,
+    run_idle_watchdog,
+    touch_server_state,
+    write_server_state,
+)
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return tmp_path / "opencode_server.json"
+
+
+@pytest.fixture
+def sleeper():
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(60)"],
+        start_new_session=True,
+    )
+    yield process
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_state_round_trip_and_touch(state_file) -> None:
+    assert read_server_state(state_file) is None
+
+    state = ServerState(pid=123, port=4096, started_at=1.0, last_used=1.0, config_path="/tmp/x/opencode.json")
+    assert write_server_state(state, state_file)
+    assert read_server_state(state_file) == state
+
+    touch_server_state(state, state_file)
+    assert read_server_state(state_file).last_used > 1.0
+
+
+def test_read_server_state_ignores_corrupt_file(state_file) -> None:
+    state_file.write_text('{"pid": "not enough fields"}')
+    assert read_server_state(state_file) is None
+
+
+class _StatusHandler(http.server.BaseHTTPRequestHandler):
+    status = 404
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self.send_response(self.status)
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.mark.parametrize("status, healthy", [(200, True), (404, True), (503, False)])
+def test_is_server_healthy_checks_http_status(status, healthy) -> None:
+    handler = type("Handler", (_StatusHandler,), {"status": status})
+    server = http.server.HTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert is_server_healthy(server.server_address[1]) is healthy
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_is_server_healthy_false_when_nothing_listens() -> None:
+    assert is_server_healthy(_free_port(), timeout=0.5) is False
+
+
+def test_discover_server_returns_live_healthy_server(state_file, sleeper, monkeypatch) -> None:
+    monkeypatch.setattr(opencode_server, "is_server_healthy", lambda port: True)
+    state = ServerState(pid=sleeper.pid, port=4096, started_at=1.0, last_used=1.0)
+    write_server_state(state, state_file)
+
+    assert discover_server(4096, state_file) == state
+    assert discover_server(5000, state_file) is None
+    assert state_file.exists()
+
+
+def test_discover_server_clears_state_of_dead_server(state_file, tmp_path) -> None:
+    config_path = tmp_path / "opencode_readonly_x" / "opencode.json"
+    config_path.parent.mkdir()
+    config_path.write_text("{}")
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    write_server_state(
+        ServerState(pid=process.pid, port=4096, started_at=1.0, last_used=1.0, config_path=str(config_path)),
+        state_file,
+    )
+
+    assert discover_server(4096, state_file) is None
+    assert not state_file.exists()
+    assert not config_path.parent.exists()
+
+
+def test_idle_watchdog_waits_for_idle_then_stops_server(state_file, sleeper) -> None:
+    now = [100.0]
+    sleeps = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    write_server_state(ServerState(pid=sleeper.pid, port=4096, started_at=100.0, last_used=100.0), state_file)
+
+    run_idle_watchdog(sleeper.pid, 30, state_file, poll_seconds=10, clock=lambda: now[0], sleep=fake_sleep)
+
+    assert sleeps == [10, 10, 10]
+    sleeper.wait(timeout=5)
+    assert not is_process_alive(sleeper.pid)
+    assert not state_file.exists()
+
+
+def test_idle_watchdog_exits_when_server_replaced(state_file, sleeper) -> None:
+    write_server_state(ServerState(pid=sleeper.pid + 1, port=4096, started_at=1.0, last_used=1.0), state_file)
+
+    run_idle_watchdog(sleeper.pid, 0, state_file, sleep=lambda seconds: pytest.fail("should not wait"))
+
+    assert sleeper.poll() is None
+    assert state_file.exists()
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from claude_skills.common.providers import (
+    GenerationRequest,
+    GenerationResult,
+    ModelDescriptor,
+    ProviderCapability,
+    ProviderContext,
+    ProviderHooks,
+    ProviderMetadata,
+    ProviderStatus,
+    ProviderTimeoutError,
+)
+from claude_skills.common.providers import scheduler as scheduler_module
+from claude_skills.common.providers.scheduler import (
+    ProviderScheduler,
+    TokenBucket,
+    configure_scheduler,
+    get_scheduler,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class SlowProvider(ProviderContext):
+    """Provider whose _execute sleeps and records peak concurrency."""
+
+    def __init__(self, name: str, delay: float, tracker: dict) -> None:
+        metadata = ProviderMetadata(
+            provider_name=name,
+            models=[ModelDescriptor(id="m", display_name="M", capabilities={ProviderCapability.TEXT})],
+            default_model="m",
+        )
+        super().__init__(metadata, ProviderHooks())
+        self._delay = delay
+        self._tracker = tracker
+
+    def _execute(self, request: GenerationRequest) -> GenerationResult:
+        with self._tracker["lock"]:
+            self._tracker["timeouts"].append(request.timeout)
+            self._tracker["active"] += 1
+            self._tracker["peak"] = max(self._tracker["peak"], self._tracker["active"])
+        time.sleep(self._delay)
+        with self._tracker["lock"]:
+            self._tracker["active"] -= 1
+        return GenerationResult(content="ok", model_fqn=f"{self.metadata.provider_name}:m", status=ProviderStatus.SUCCESS)
+
+
+@pytest.fixture
+def tracker() -> dict:
+    return {"lock": threading.Lock(), "active": 0, "peak": 0, "timeouts": []}
+
+
+@pytest.fixture(autouse=True)
+def reset_scheduler(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "_scheduler", None)
+    yield
+
+
+def test_token_bucket_refills_over_time() -> None:
+    now = [0.0]
+    sleeps: List[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0], sleep=fake_sleep)
+
+    assert bucket.acquire() and bucket.acquire()
+    assert sleeps == []
+    assert bucket.acquire()
+    assert sleeps == [pytest.approx(0.5)]
+    assert bucket.acquire(timeout=0.1) is False
+
+
+def test_scheduler_applies_per_provider_and_global_caps() -> None:
+    scheduler = ProviderScheduler(max_concurrency=3, provider_limits={"default": 2, "codex": 1})
+
+    assert scheduler.acquire("gemini") and scheduler.acquire("gemini")
+    assert scheduler.acquire("gemini", timeout=0.05) is False
+    assert scheduler.acquire("codex")
+    assert scheduler.acquire("codex", timeout=0.05) is False
+    # Global cap of 3 is now reached
+    assert scheduler.acquire("claude", timeout=0.05) is False
+    assert scheduler.active() == 3
+
+    scheduler.release("gemini")
+    assert scheduler.acquire("claude", timeout=0.05)
+    assert scheduler.active("gemini") == 1
+
+
+def test_generate_is_bounded_by_scheduler(tracker: dict) -> None:
+    configure_scheduler(max_concurrency=8, provider_limits={"default": 2})
+    provider = SlowProvider("demo", 0.05, tracker)
+
+    threads = [threading.Thread(target=provider.generate, args=(GenerationRequest(prompt="hi"),)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tracker["peak"] == 2
+    assert get_scheduler().active() == 0
+
+
+def test_generate_times_out_waiting_for_slot(tracker: dict) -> None:
+    scheduler = configure_scheduler(max_concurrency=1)
+    scheduler.acquire("other")
+    provider = SlowProvider("demo", 0, tracker)
+
+    with pytest.raises(ProviderTimeoutError):
+        provider.generate(GenerationRequest(prompt="hi", timeout=0.05))
+
+
+def test_slot_wait_counts_against_request_timeout(tracker: dict) -> None:
+    scheduler = configure_scheduler(max_concurrency=1)
+    scheduler.acquire("other")
+    threading.Timer(0.3, scheduler.release, args=("other",)).start()
+    provider = SlowProvider("demo", 0, tracker)
+
+    provider.generate(GenerationRequest(prompt="hi", timeout=2))
+
+    async def run():
+        scheduler.acquire("other")
+        threading.Timer(0.3, scheduler.release, args=("other",)).start()
+        await provider.agenerate(GenerationRequest(prompt="hi", timeout=2))
+
+    asyncio.run(run())
+
+    # Both calls waited ~0.3s for the slot, which leaves ~1.7s to execute
+    assert len(tracker["timeouts"]) == 2
+    assert all(1.0 < timeout <= 1.75 for timeout in tracker["timeouts"])
+
+
+def test_agenerate_runs_concurrently_within_caps(tracker: dict) -> None:
+    configure_scheduler(max_concurrency=3, provider_limits={"default": 5})
+    providers = [SlowProvider(f"p{index}", 0.1, tracker) for index in range(6)]
+
+    async def run_all():
+        return await asyncio.gather(*(p.agenerate(GenerationRequest(prompt="hi")) for p in providers))
+
+    start = time.monotonic()
+    results = asyncio.run(run_all())
+
+    assert [result.content for result in results] == ["ok"] * 6
+    assert tracker["peak"] == 3
+    assert time.monotonic() - start < 0.5
+    assert get_scheduler().active() == 0
+
+
+def test_agenerate_waiters_do_not_starve_slot_holders(tracker: dict) -> None:
+    """More queued agenerate() calls than executor workers still complete."""
+    configure_scheduler(max_concurrency=8, provider_limits={"default": 4})
+    providers = [SlowProvider(f"p{index}", 0.2, tracker) for index in range(5)]
+
+    async def run_all():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+        calls = [p.agenerate(GenerationRequest(prompt="hi")) for p in providers for _ in range(4)]
+        return await asyncio.wait_for(asyncio.gather(*calls), timeout=10)
+
+    results = asyncio.run(run_all())
+
+    assert len(results) == 20
+    assert tracker["peak"] == 8
+    assert get_scheduler().active() == 0
+
+
+def test_agenerate_cancellation_releases_slot(tracker: dict) -> None:
+    configure_scheduler(max_concurrency=1)
+    provider = SlowProvider("demo", 0.2, tracker)
+
+    async def run():
+        task = asyncio.ensure_future(provider.agenerate(GenerationRequest(prompt="hi")))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The worker thread finishes on its own; its slot must be returned
+        await asyncio.sleep(0.3)
+
+    asyncio.run(run())
+
+    assert get_scheduler().active() == 0
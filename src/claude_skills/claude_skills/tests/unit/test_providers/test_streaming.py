@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from typing import List
+
+import pytest
+
+from claude_skills.common.providers import StreamChunk
+from claude_skills.common.providers.streaming import (
+    StreamCollector,
+    parse_json_line,
+    stream_subprocess,
+    streaming_unsupported,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_stream_subprocess_delivers_lines_before_exit() -> None:
+    arrivals: List[tuple] = []
+    start = time.monotonic()
+    script = "import sys, time; print('first', flush=True); time.sleep(0.5); print('second'); sys.exit(2)"
+
+    result = stream_subprocess(
+        [sys.executable, "-c", script],
+        on_line=lambda line: arrivals.append((line.strip(), time.monotonic() - start)),
+        timeout=10,
+    )
+    elapsed = time.monotonic() - start
+
+    assert [line for line, _ in arrivals] == ["first", "second"]
+    assert arrivals[0][1] < elapsed - 0.3
+    assert result.returncode == 2
+    assert result.stdout == "first\nsecond\n"
+
+
+def test_stream_subprocess_raises_timeout() -> None:
+    with pytest.raises(subprocess.TimeoutExpired):
+        stream_subprocess(
+            [sys.executable, "-c", "import time; time.sleep(10)"],
+            on_line=lambda line: None,
+            timeout=0.2,
+        )
+
+
+def test_stream_collector_indexes_chunks() -> None:
+    chunks: List[StreamChunk] = []
+    collector = StreamCollector(chunks.append)
+
+    assert collector.time_to_first_chunk_ms is None
+    collector.add("Hel")
+    collector.add("")
+    collector.add("lo")
+
+    assert [(chunk.content, chunk.index) for chunk in chunks] == [("Hel", 0), ("lo", 1)]
+    assert collector.text == "Hello"
+    assert collector.time_to_first_chunk_ms is not None
+
+
+def test_parse_json_line_ignores_noise() -> None:
+    assert parse_json_line('{"type": "result"}\n') == {"type": "result"}
+    assert parse_json_line("Loading credentials...\n") is None
+    assert parse_json_line("[1, 2]") is None
+    assert parse_json_line("   ") is None
+
+
+def test_streaming_unsupported_detects_flag_errors() -> None:
+    rejected = subprocess.CompletedProcess(["cli"], 1, "", "error: unknown option '--include-partial-messages'")
+    failed = subprocess.CompletedProcess(["cli"], 1, "", "rate limited")
+    ok = subprocess.CompletedProcess(["cli"], 0, "", "unknown option ignored")
+
+    assert streaming_unsupported(rejected) is True
+    assert streaming_unsupported(failed) is False
+    assert streaming_unsupported(ok) is False
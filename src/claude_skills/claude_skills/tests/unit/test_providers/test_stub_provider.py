@@ -0,0 +1,135 @@
+"""
+Tests for the offline stub provider.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict, List
+
+import pytest
+
+from claude_skills.common import ai_config
+from claude_skills.common.providers import (
+    GenerationRequest,
+    ProviderExecutionError,
+    ProviderHooks,
+    ProviderTimeoutError,
+)
+from claude_skills.common.providers.stub import (
+    STUB_METADATA,
+    StubProvider,
+    StubSettings,
+    create_provider,
+    reset_stub_state,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_attempts():
+    reset_stub_state()
+    yield
+    reset_stub_state()
+
+
+def _provider(settings: StubSettings, sleeps: List[float], chunks: List[str] | None = None) -> StubProvider:
+    hooks = ProviderHooks(on_stream_chunk=lambda chunk: chunks.append(chunk.content)) if chunks is not None else ProviderHooks()
+    return StubProvider(STUB_METADATA, hooks, settings=settings, sleep=sleeps.append)
+
+
+def test_stub_echoes_prompt_and_streams_chunks() -> None:
+    sleeps: List[float] = []
+    chunks: List[str] = []
+    provider = _provider(
+        StubSettings(latency_ms=200, chunk_count=4, chunk_interval_ms=10),
+        sleeps,
+        chunks,
+    )
+
+    result = provider.generate(GenerationRequest(prompt="abcdefgh", stream=True))
+
+    assert result.content == "abcdefgh"
+    assert chunks == ["ab", "cd", "ef", "gh"]
+    assert sleeps == pytest.approx([0.2, 0.01, 0.01, 0.01])
+    assert result.model_fqn == "stub:stub"
+    assert result.usage.input_tokens == 2
+    assert result.raw_payload["chunks"] == 4
+
+
+def test_stub_canned_response_from_file(tmp_path) -> None:
+    response_file = tmp_path / "response.json"
+    response_file.write_text(json.dumps({"verdict": "pass"}), encoding="utf-8")
+    settings = StubSettings.from_mapping({"response_file": str(response_file)})
+
+    result = _provider(settings, []).generate(GenerationRequest(prompt="review this"))
+
+    assert settings.response_mode == "canned"
+    assert json.loads(result.content) == {"verdict": "pass"}
+
+
+def test_stub_latency_is_deterministic_per_seed_and_prompt() -> None:
+    settings = StubSettings(latency_distribution="lognormal", latency_ms=500, latency_jitter_ms=250, seed=7)
+
+    def run_once(prompts: List[str]) -> Dict[str, float]:
+        reset_stub_state()
+        provider = _provider(settings, [])
+        return {p: provider.generate(GenerationRequest(prompt=p)).raw_payload["latency_ms"] for p in prompts}
+
+    forward = run_once(["a", "b", "c"])
+    backward = run_once(["c", "b", "a"])
+
+    assert forward == backward
+    assert len(set(forward.values())) == 3
+
+
+def test_stub_retries_of_same_prompt_draw_new_values() -> None:
+    provider = _provider(StubSettings(latency_distribution="uniform", latency_ms=500, latency_jitter_ms=400), [])
+
+    first = provider.generate(GenerationRequest(prompt="same"))
+    second = provider.generate(GenerationRequest(prompt="same"))
+
+    assert first.raw_payload["attempt"] == 0
+    assert second.raw_payload["attempt"] == 1
+    assert first.raw_payload["latency_ms"] != second.raw_payload["latency_ms"]
+
+
+def test_stub_injects_failures_and_timeouts() -> None:
+    with pytest.raises(ProviderExecutionError, match="injected failure"):
+        _provider(StubSettings(failure_rate=1.0), []).generate(GenerationRequest(prompt="x"))
+
+    sleeps: List[float] = []
+    with pytest.raises(ProviderTimeoutError):
+        _provider(StubSettings(timeout_rate=1.0), sleeps).generate(GenerationRequest(prompt="x", timeout=3))
+    assert sleeps == [3]
+
+
+def test_stub_times_out_when_latency_exceeds_request_timeout() -> None:
+    sleeps: List[float] = []
+    with pytest.raises(ProviderTimeoutError):
+        _provider(StubSettings(latency_ms=5000), sleeps).generate(GenerationRequest(prompt="x", timeout=1))
+    assert sleeps == [1]
+
+
+def test_stub_settings_from_mapping_falls_back_on_invalid_values() -> None:
+    settings = StubSettings.from_mapping(
+        {"latency_distribution": "bogus", "latency_ms": "fast", "failure_rate": 3, "chunk_count": 0}
+    )
+
+    assert settings.latency_distribution == "fixed"
+    assert settings.latency_ms == 0.0
+    assert settings.failure_rate == 1.0
+    assert settings.chunk_count == 1
+
+
+def test_stub_factory_reads_ai_config_and_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        ai_config,
+        "get_stub_provider_config",
+        lambda: {"response": "canned", "canned_response": "ok", "latency_ms": 10},
+    )
+
+    provider = create_provider(hooks=ProviderHooks(), overrides={"latency_ms": 0})
+
+    assert provider.settings.canned_response == "ok"
+    assert provider.settings.latency_ms == 0
+    assert create_provider(hooks=ProviderHooks()).generate(GenerationRequest(prompt="hi")).content == "ok"
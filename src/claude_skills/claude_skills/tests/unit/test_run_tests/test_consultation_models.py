@@ -138,3 +138,28 @@ def test_consult_multi_agent_uses_resolved_models(monkeypatch: pytest.MonkeyPatc
         assert execute_calls == [
             (("gemini", "codex"), "formatted-prompt", dict(resolved_models), 42)
         ]
+
+
+def test_synthesize_responses_clusters_claims_across_all_agents() -> None:
+    responses = [
+        consultation.ConsultationResponse(
+            tool="gemini", success=True,
+            output="- load_config does not return the parsed value.\n- Add a timeout to the HTTP call.",
+        ),
+        consultation.ConsultationResponse(
+            tool="codex", success=True,
+            output="- The parsed value is never returned by load_config.",
+        ),
+        consultation.ConsultationResponse(
+            tool="cursor-agent", success=True,
+            output="- load_config never returns the parsed value.",
+        ),
+    ]
+
+    synthesis = consultation.synthesize_responses(responses)
+
+    assert synthesis["consensus"] == [
+        "load_config does not return the parsed value. (gemini, codex, cursor-agent)"
+    ]
+    assert synthesis["unique_insights"]["gemini"] == "Add a timeout to the HTTP call."
+    assert synthesis["agreement"]["sources"] == ["gemini", "codex", "cursor-agent"]
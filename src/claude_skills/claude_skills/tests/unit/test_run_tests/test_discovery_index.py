@@ -0,0 +1,155 @@
+"""Unit tests for AST test analysis and the persisted discovery index."""
+
+from __future__ import annotations
+
+import os
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from claude_skills.run_tests import discovery_index
+from claude_skills.run_tests.discovery_index import TestDiscoveryIndex, analyze_source
+from claude_skills.run_tests.test_discovery import collect_all_markers, get_summary_stats
+
+pytestmark = pytest.mark.unit
+
+TEST_MODULE = textwrap.dedent(
+    '''
+    import os
+    from pathlib import Path
+
+    import pytest
+
+    pytestmark = [pytest.mark.unit, pytest.mark.slow]
+
+    # def test_commented_out():
+    TEMPLATE = """
+    def test_in_a_string():
+        pass
+    """
+
+
+    @pytest.fixture(name="client")
+    def make_client():
+        return object()
+
+
+    @pytest.mark.parametrize("value", [1, 2])
+    def test_values(value):
+        assert value
+
+
+    async def test_async():
+        pass
+
+
+    class TestGroup:
+        @pytest.mark.integration
+        def test_one(self, client):
+            pass
+
+        def helper(self):
+            pass
+    '''
+)
+
+
+def _write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def test_analyze_source_reads_structure_from_the_ast() -> None:
+    info = analyze_source(TEST_MODULE)
+
+    assert info["test_functions"] == ["test_values", "test_async"]
+    assert info["test_classes"] == ["TestGroup"]
+    assert info["test_methods"] == ["TestGroup::test_one"]
+    assert info["fixtures"] == ["client"]
+    assert info["imports"] == ["os", "pathlib", "pytest"]
+    assert info["markers"] == {"unit", "slow", "parametrize", "integration"}
+    assert info["parametrize"] == 1
+
+
+def test_analyze_source_conftest_hooks_and_plugins() -> None:
+    info = analyze_source(textwrap.dedent(
+        """
+        import pytest
+
+        pytest_plugins = ["plugins.db", "plugins.http"]
+
+        def pytest_configure(config):
+            pass
+
+        @pytest.fixture
+        def pytest_tmp():
+            pass
+        """
+    ))
+
+    assert info["plugins"] == ["plugins.db", "plugins.http"]
+    assert info["hooks"] == ["pytest_configure"]
+    assert info["fixtures"] == ["pytest_tmp"]
+
+
+def test_index_reanalyzes_only_modified_files(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    cache_dir = tmp_path / "cache"
+    first = _write(root / "tests" / "test_a.py", "def test_a():\n    pass\n")
+    _write(root / "tests" / "test_b.py", "def test_b():\n    pass\n")
+    _write(root / "tests" / "conftest.py", "import pytest\n\n@pytest.fixture\ndef db():\n    pass\n")
+    _write(root / ".venv" / "lib" / "test_vendored.py", "def test_x():\n    pass\n")
+
+    index = TestDiscoveryIndex(root, cache_dir=cache_dir).refresh()
+    assert index.reanalyzed == 3
+    assert [p.name for p in index.test_files()] == ["test_a.py", "test_b.py"]
+    assert [p.name for p in index.conftest_files()] == ["conftest.py"]
+
+    warm = TestDiscoveryIndex(root, cache_dir=cache_dir).refresh()
+    assert warm.reanalyzed == 0
+    assert warm.analysis(first)["test_functions"] == ["test_a"]
+
+    first.write_text("def test_a():\n    pass\n\ndef test_a2():\n    pass\n")
+    stat = first.stat()
+    os.utime(first, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (root / "tests" / "test_b.py").unlink()
+
+    updated = TestDiscoveryIndex(root, cache_dir=cache_dir).refresh()
+    assert updated.reanalyzed == 1
+    assert updated.analysis(first)["test_functions"] == ["test_a", "test_a2"]
+    assert [p.name for p in updated.test_files()] == ["test_a.py"]
+
+
+def test_warm_index_skips_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = tmp_path / "project"
+    cache_dir = tmp_path / "cache"
+    for i in range(200):
+        _write(root / "tests" / f"test_{i}.py", TEST_MODULE)
+    TestDiscoveryIndex(root, cache_dir=cache_dir).refresh()
+
+    def fail(_path):
+        raise AssertionError("unchanged files should not be re-analyzed")
+
+    monkeypatch.setattr(discovery_index, "analyze_path", fail)
+    start = time.perf_counter()
+    index = TestDiscoveryIndex(root, cache_dir=cache_dir).refresh()
+    elapsed = time.perf_counter() - start
+
+    assert len(index.test_files()) == 200
+    assert elapsed < 1.0
+    stats = get_summary_stats(index.test_files(), index.conftest_files(), index)
+    assert stats["total_tests"] == 200 * 3
+    assert collect_all_markers(index.test_files(), index)["integration"] == 200
+
+
+def test_syntax_errors_are_reported(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    broken = _write(root / "test_broken.py", "def test_(:\n")
+
+    index = TestDiscoveryIndex(root, use_cache=False).refresh()
+
+    assert "Syntax error" in index.analysis(broken)["error"]
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,186 @@
+"""Unit tests for test impact selection."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from claude_skills.run_tests import cli
+from claude_skills.run_tests.impact_selection import (
+    ImpactSelection,
+    get_task_files,
+    select_impacted_tests,
+)
+from claude_skills.run_tests.pytest_runner import PytestRunResult
+
+pytestmark = pytest.mark.unit
+
+
+def _docs() -> SimpleNamespace:
+    """Documentation for: tests/test_api.py -> pkg/api.py -> pkg/core.py, plus unrelated modules."""
+    return SimpleNamespace(data={
+        "functions": [
+            {"name": "core_fn", "file": "pkg/core.py", "callers": [
+                {"name": "handler", "file": "pkg/api.py", "line": 3},
+            ]},
+            {"name": "handler", "file": "pkg/api.py", "calls": []},
+            {"name": "test_handler", "file": "tests/test_api.py", "calls": [
+                {"name": "handler", "file": "pkg/api.py", "line": 5},
+            ]},
+            {"name": "util", "file": "pkg/util.py"},
+            {"name": "test_util", "file": "tests/test_util.py"},
+            {"name": "record", "file": "pkg/test_history.py", "callers": [
+                {"name": "test_record", "file": "tests/test_recording.py", "line": 2},
+            ]},
+            {"name": "run", "file": "pkg/run_tests/runner.py", "callers": [
+                {"name": "test_run", "file": "tests/test_runner.py", "line": 2},
+            ]},
+        ],
+        "modules": [
+            {"name": "test_util", "file": "tests/test_util.py", "imports": ["pkg.util"]},
+        ],
+    })
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    for rel in ("pkg/core.py", "pkg/api.py", "pkg/util.py", "pkg/test_history.py", "pkg/run_tests/runner.py",
+                "tests/test_api.py", "tests/test_util.py", "tests/test_recording.py", "tests/test_runner.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("")
+    return tmp_path
+
+
+def test_transitive_callers_select_tests(project: Path) -> None:
+    selection = select_impacted_tests(["pkg/core.py"], query=_docs(), roots=[project])
+
+    assert selection.full_suite is False
+    assert [Path(f).name for f in selection.test_files] == ["test_api.py"]
+
+
+def test_imports_select_tests_and_repo_paths_match_suffixes(project: Path) -> None:
+    selection = select_impacted_tests(["src/pkg/util.py"], query=_docs(), roots=[project])
+
+    assert [Path(f).name for f in selection.test_files] == ["test_util.py"]
+
+
+def test_changed_test_file_is_selected_directly(project: Path) -> None:
+    selection = select_impacted_tests(["tests/test_util.py"], query=_docs(), roots=[project])
+
+    assert [Path(f).name for f in selection.test_files] == ["test_util.py"]
+
+
+def test_source_module_named_like_a_test_selects_its_tests(project: Path) -> None:
+    selection = select_impacted_tests(["pkg/test_history.py"], query=_docs(), roots=[project])
+
+    assert selection.full_suite is False
+    assert [Path(f).name for f in selection.test_files] == ["test_recording.py"]
+
+
+def test_package_named_like_a_test_directory_is_ordinary_source(project: Path) -> None:
+    selection = select_impacted_tests(["pkg/run_tests/runner.py"], query=_docs(), roots=[project])
+
+    assert selection.full_suite is False
+    assert [Path(f).name for f in selection.test_files] == ["test_runner.py"]
+
+
+def test_python_files_setting_decides_what_is_a_test(project: Path) -> None:
+    (project / "pytest.ini").write_text("[pytest]\npython_files = check_*.py\n")
+    (project / "tests" / "check_api.py").write_text("")
+    docs = _docs()
+    docs.data["functions"].append({"name": "check_handler", "file": "tests/check_api.py", "calls": [
+        {"name": "handler", "file": "pkg/api.py", "line": 2},
+    ]})
+
+    selection = select_impacted_tests(["pkg/core.py"], query=docs, roots=[project])
+
+    assert [Path(f).name for f in selection.test_files] == ["check_api.py"]
+
+
+@pytest.mark.parametrize("changed", [
+    "pytest.ini",
+    "pyproject.toml",
+    "tests/fixtures/payload.json",
+    "tests/conftest.py",
+    "conftest.py",
+    "tests/helpers.py",
+])
+def test_files_affecting_every_test_fall_back_to_full_suite(project: Path, changed: str) -> None:
+    selection = select_impacted_tests(["pkg/core.py", changed], query=_docs(), roots=[project])
+
+    assert selection.full_suite is True
+    assert selection.global_files == [changed]
+    assert selection.test_files == []
+
+
+def test_unknown_source_file_falls_back_to_full_suite(project: Path) -> None:
+    selection = select_impacted_tests(["pkg/core.py", "pkg/new_module.py"], query=_docs(), roots=[project])
+
+    assert selection.full_suite is True
+    assert selection.unknown_files == ["pkg/new_module.py"]
+
+
+def test_missing_documentation_falls_back_to_full_suite(tmp_path: Path) -> None:
+    selection = select_impacted_tests(["pkg/core.py"], docs_path=str(tmp_path / "missing"))
+
+    assert selection.full_suite is True
+    assert "documentation" in selection.reason
+
+
+def test_task_files_include_subtasks() -> None:
+    spec = {"hierarchy": {
+        "task-1": {"metadata": {"file_path": "pkg/api.py"}, "children": ["task-1-1", "task-1-2"]},
+        "task-1-1": {"metadata": {"file_path": "pkg/core.py"}},
+        "task-1-2": {"metadata": {"file_path": "pkg/api.py"}},
+        "task-2": {"metadata": {"file_path": "pkg/util.py"}},
+    }}
+
+    assert get_task_files(spec, "task-1") == ["pkg/api.py", "pkg/core.py"]
+
+
+def _run_args(**overrides) -> argparse.Namespace:
+    values = dict(
+        list=False, preset=None, path=None, pattern=None, extra_args=["-x"], max_failures=None, shards=None,
+        changed=False, impacted_by=None, task=None, docs_path=None, specs_dir=None,
+    )
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def test_cmd_run_passes_selected_tests(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli, "select_impacted_tests", Mock(
+        return_value=ImpactSelection(changed_files=["pkg/core.py"], test_files=["tests/test_api.py"])
+    ))
+    run = Mock(return_value=PytestRunResult(exit_code=0))
+    monkeypatch.setattr(cli, "run_pytest", run)
+
+    assert cli.cmd_run(_run_args(impacted_by=["pkg/core.py"]), Mock()) == 0
+    assert run.call_args.kwargs["extra_args"] == ["tests/test_api.py", "-x"]
+
+
+def test_cmd_run_skips_pytest_when_nothing_is_impacted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli, "select_impacted_tests", Mock(
+        return_value=ImpactSelection(changed_files=["pkg/unused.py"])
+    ))
+    run = Mock()
+    monkeypatch.setattr(cli, "run_pytest", run)
+
+    assert cli.cmd_run(_run_args(impacted_by=["pkg/unused.py"]), Mock()) == 0
+    run.assert_not_called()
+
+
+def test_cmd_run_full_suite_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli, "select_impacted_tests", Mock(
+        return_value=ImpactSelection(changed_files=["pkg/core.py"], full_suite=True, reason="no docs")
+    ))
+    run = Mock(return_value=PytestRunResult(exit_code=0))
+    monkeypatch.setattr(cli, "run_pytest", run)
+    printer = Mock()
+
+    assert cli.cmd_run(_run_args(impacted_by=["pkg/core.py"]), printer) == 0
+    assert run.call_args.kwargs["extra_args"] == ["-x"]
+    printer.warning.assert_called_once()
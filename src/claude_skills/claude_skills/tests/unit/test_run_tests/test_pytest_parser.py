@@ -115,6 +115,19 @@ class TestPytestOutputParser:
         assert result.test_name == "test_validation[case1]"
         assert result.status == TestStatus.PASSED
 
+    def test_parse_parametrized_test_with_any_id_characters(self) -> None:
+        """Parametrize ids may contain paths, spaces and brackets."""
+        parser = PytestOutputParser()
+        line = "tests/test_sharding.py::test_paths[tests/conftest.py-a b[0]] FAILED  [ 10%]"
+
+        result = parser.parse_line(line)
+
+        assert result is not None
+        assert result.file_path == "tests/test_sharding.py"
+        assert result.test_name == "test_paths[tests/conftest.py-a b[0]]"
+        assert result.status == TestStatus.FAILED
+        assert result.percentage == 10
+
     def test_parse_class_method(self) -> None:
         """Test parsing test class method."""
         parser = PytestOutputParser()
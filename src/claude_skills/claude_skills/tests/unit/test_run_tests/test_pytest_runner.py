@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+"""Unit tests for streamed pytest runs."""
+
+import subprocess
+import sys
+import textwrap
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from claude_skills.run_tests import pytest_runner
+from claude_skills.run_tests.pytest_parser import TestStatus
+from claude_skills.run_tests.pytest_runner import run_pytest, stream_pytest
+
+pytestmark = pytest.mark.unit
+
+TestStatus.__test__ = False  # type: ignore[attr-defined]
+
+
+def _fake_pytest(body: str) -> list:
+    """Command that prints pytest-like output from a Python snippet."""
+    return [sys.executable, "-u", "-c", textwrap.dedent(body)]
+
+
+def test_stream_collects_results_as_they_are_printed() -> None:
+    cmd = _fake_pytest(
+        """
+        import sys
+        print("collected 3 items")
+        print("tests/test_a.py::test_one PASSED  [ 33%]")
+        print("tests/test_a.py::test_two FAILED  [ 66%]")
+        print("tests/test_b.py::test_three SKIPPED  [100%]")
+        sys.exit(1)
+        """
+    )
+    seen = []
+    display = Mock()
+
+    result = stream_pytest(cmd, display=display, on_result=seen.append, echo=False)
+
+    assert result.exit_code == 1
+    assert [r.test_name for r in result.results] == ["test_one", "test_two", "test_three"]
+    assert seen == result.results
+    assert [r.test_name for r in result.failures] == ["test_two"]
+    assert (result.progress.passed, result.progress.failed, result.progress.skipped) == (1, 1, 1)
+    assert result.progress.percentage == 100
+    assert display.update.call_count == 3
+    display.finish.assert_called_once_with(result.progress)
+
+
+def test_stream_stops_after_max_failures() -> None:
+    cmd = _fake_pytest(
+        """
+        import time
+        print("tests/test_a.py::test_one FAILED  [ 10%]")
+        print("tests/test_a.py::test_two ERROR  [ 20%]")
+        time.sleep(30)
+        print("tests/test_a.py::test_three PASSED  [ 30%]")
+        """
+    )
+
+    start = time.monotonic()
+    result = stream_pytest(cmd, max_failures=2, echo=False)
+
+    assert time.monotonic() - start < 10
+    assert result.stopped_early is True
+    assert result.exit_code == 1
+    assert len(result.failures) == 2
+
+
+def test_ensure_verbose_respects_existing_verbosity() -> None:
+    assert pytest_runner._ensure_verbose(["pytest", "tests"]) == ["pytest", "-v", "tests"]
+    assert pytest_runner._ensure_verbose(["pytest", "-vv"]) == ["pytest", "-vv"]
+    assert pytest_runner._ensure_verbose(["pytest", "-q"]) == ["pytest", "-q"]
+
+
+def test_interactive_runs_are_passed_through(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def fake_run(cmd, check):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 3)
+
+    monkeypatch.setattr(pytest_runner.subprocess, "run", fake_run)
+    monkeypatch.setattr(pytest_runner, "stream_pytest", Mock(side_effect=AssertionError("should not stream")))
+
+    result = run_pytest(preset="pdb", printer=Mock())
+
+    assert result.exit_code == 3
+    assert calls == [["pytest", "-x", "--pdb"]]
+
+
+def test_run_pytest_streams_with_verbose_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = Mock(return_value=pytest_runner.PytestRunResult(exit_code=0))
+    monkeypatch.setattr(pytest_runner, "stream_pytest", stream)
+
+    result = run_pytest(pattern="login", printer=Mock(), max_failures=5, show_progress=False)
+
+    assert result.exit_code == 0
+    cmd = stream.call_args.args[0]
+    assert cmd == ["pytest", "-v", "-k", "login"]
+    assert stream.call_args.kwargs["max_failures"] == 5
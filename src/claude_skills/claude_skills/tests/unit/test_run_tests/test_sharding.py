@@ -0,0 +1,167 @@
+"""Unit tests for duration-balanced sharded pytest runs."""
+
+from __future__ import annotations
+
+import shutil
+import textwrap
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from claude_skills.run_tests.sharding import (
+    DurationHistory,
+    _split_junit_args,
+    estimate_durations,
+    merge_exit_codes,
+    merge_junit_reports,
+    partition_files,
+    read_shard_durations,
+    run_sharded,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_partition_is_longest_processing_time_first() -> None:
+    durations = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 2.0, "f": 1.0}
+
+    shards = partition_files(durations, 2)
+
+    assert shards == [["a", "d", "f"], ["b", "c", "e"]]
+    assert [sum(durations[f] for f in shard) for shard in shards] == [9.0, 9.0]
+
+
+def test_partition_never_creates_empty_shards() -> None:
+    assert partition_files({"a": 1.0, "b": 2.0}, 8) == [["b"], ["a"]]
+    assert partition_files({}, 4) == []
+
+
+def test_unknown_files_are_estimated_from_test_counts() -> None:
+    expected = estimate_durations({"a": 10, "b": 4, "c": 2}, {"a": 5.0})
+
+    assert expected == {"a": 5.0, "b": 2.0, "c": 1.0}
+
+
+def test_junit_options_are_split_off() -> None:
+    assert _split_junit_args(["pytest", "--junitxml=out.xml", "-x"]) == (["pytest", "-x"], "out.xml")
+    assert _split_junit_args(["pytest", "--junit-xml", "r.xml"]) == (["pytest"], "r.xml")
+    assert _split_junit_args(["pytest", "-v"]) == (["pytest", "-v"], None)
+
+
+def test_merge_exit_codes() -> None:
+    assert merge_exit_codes([0, 0]) == 0
+    assert merge_exit_codes([0, 5]) == 0
+    assert merge_exit_codes([5, 5]) == 5
+    assert merge_exit_codes([1, 0, 2]) == 2
+
+
+def _write_report(path: Path, cases: str, failures: int = 0) -> Path:
+    path.write_text(
+        f'<testsuites><testsuite name="pytest" tests="2" failures="{failures}" errors="0" '
+        f'skipped="0" time="1.5">{cases}</testsuite></testsuites>'
+    )
+    return path
+
+
+def test_junit_reports_are_merged(tmp_path: Path) -> None:
+    first = _write_report(
+        tmp_path / "a.xml",
+        '<testcase file="tests/test_a.py" name="one" time="1.0"/>'
+        '<testcase file="tests/test_a.py" name="two" time="0.5"/>',
+    )
+    second = _write_report(
+        tmp_path / "b.xml",
+        '<testcase file="tests/test_b.py" name="three" time="0.25"><failure/></testcase>',
+        failures=1,
+    )
+
+    merged = tmp_path / "out" / "merged.xml"
+    merge_junit_reports([first, second, tmp_path / "missing.xml"], merged)
+
+    assert [case.get("name") for case in ET.parse(merged).getroot().iter("testcase")] == ["one", "two", "three"]
+    text = merged.read_text()
+    assert 'tests="4"' in text and 'failures="1"' in text
+
+
+def test_shard_durations_are_read_from_the_plugin_file(tmp_path: Path) -> None:
+    durations_file = tmp_path / "durations.json"
+    durations_file.write_text('{"tests/test_a.py": 1.5, "tests/test_b.py": "bad"}')
+
+    assert read_shard_durations(durations_file) == {"tests/test_a.py": 1.5}
+    assert read_shard_durations(tmp_path / "missing.json") == {}
+
+
+def test_duration_history_is_kept_per_rootdir(tmp_path: Path) -> None:
+    history = DurationHistory(tmp_path / "durations.json")
+
+    history.update("/project", {"tests/test_a.py": 1.0})
+    history.update("/project", {"tests/test_b.py": 2.0})
+    history.update("/other", {"tests/test_a.py": 9.0})
+
+    assert history.load("/project") == {"tests/test_a.py": 1.0, "tests/test_b.py": 2.0}
+    assert history.load("/missing") == {}
+
+
+@pytest.mark.skipif(shutil.which("pytest") is None, reason="pytest executable not on PATH")
+def test_sharded_run_end_to_end(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tmp_path / "project"
+    (project / "tests").mkdir(parents=True)
+    (project / "pytest.ini").write_text("[pytest]\n")
+    for i in range(4):
+        (project / "tests" / f"test_m{i}.py").write_text(textwrap.dedent(
+            f"""
+            def test_ok():
+                pass
+
+            def test_maybe():
+                assert {i} != 2
+            """
+        ))
+    monkeypatch.chdir(project)
+    history = DurationHistory(tmp_path / "durations.json")
+
+    result = run_sharded(
+        2,
+        extra_args=["--junitxml=report.xml"],
+        printer=Mock(),
+        show_progress=False,
+        history=history,
+    )
+
+    assert result.exit_code == 1
+    assert (result.progress.passed, result.progress.failed) == (7, 1)
+    assert [r.test_name for r in result.failures] == ["test_maybe"]
+    cases = list(ET.parse(project / "report.xml").getroot().iter("testcase"))
+    assert len(cases) == 8
+    # The report keeps pytest's configured junit family (xunit2: no file attribute)
+    assert all(case.get("file") is None for case in cases)
+    assert sorted(history.load(str(project))) == [f"tests/test_m{i}.py" for i in range(4)]
+
+
+@pytest.mark.skipif(shutil.which("pytest") is None, reason="pytest executable not on PATH")
+def test_sharded_run_counts_every_collected_test(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tmp_path / "project"
+    (project / "tests").mkdir(parents=True)
+    (project / "pytest.ini").write_text("[pytest]\n")
+    for i in range(2):
+        (project / "tests" / f"test_p{i}.py").write_text(textwrap.dedent(
+            """
+            import pytest
+
+            @pytest.mark.parametrize("value", ["tests/conftest.py", "a b", "ok"])
+            def test_ids(value):
+                assert value != "a b"
+            """
+        ))
+    monkeypatch.chdir(project)
+    printer = Mock()
+
+    result = run_sharded(
+        2, printer=printer, show_progress=False, history=DurationHistory(tmp_path / "durations.json")
+    )
+
+    assert (result.progress.passed, result.progress.failed) == (4, 2)
+    assert result.progress.percentage == 100
+    printer.warning.assert_not_called()
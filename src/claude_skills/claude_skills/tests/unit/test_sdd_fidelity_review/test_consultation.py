@@ -427,4 +427,23 @@ def test_categorize_issues_assigns_severity() -> None:
     severities = {item.issue: item.severity for item in categorized}
     assert any(sev is IssueSeverity.CRITICAL for issue, sev in severities.items() if "Security" in issue)
     assert any(sev in {IssueSeverity.MEDIUM, IssueSeverity.HIGH} for issue, sev in severities.items() if "Missing tests" in issue)
-    assert any(sev is IssueSeverity.LOW for issue, sev in severities.items() if "typo" in issue.lower())
\ No newline at end of file
+    assert any(sev is IssueSeverity.LOW for issue, sev in severities.items() if "typo" in issue.lower())
+
+def test_detect_consensus_matches_paraphrased_issues() -> None:
+    parsed = [
+        ParsedReviewResponse(
+            verdict=FidelityVerdict.FAIL,
+            issues=["load_config does not return the parsed value", "Docs are outdated"],
+            recommendations=[],
+        ),
+        ParsedReviewResponse(
+            verdict=FidelityVerdict.FAIL,
+            issues=["The parsed value is never returned by load_config"],
+            recommendations=[],
+        ),
+    ]
+
+    consensus = detect_consensus(parsed, min_agreement=2, similarity_threshold=0.5)
+
+    assert consensus.consensus_issues == ["load_config does not return the parsed value"]
+    assert len(consensus.all_issues) == 3
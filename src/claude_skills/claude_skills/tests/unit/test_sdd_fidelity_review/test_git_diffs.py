@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude_skills.sdd_fidelity_review.git_diffs import GitDiffCollector, split_diff_by_file
+
+
+pytestmark = pytest.mark.unit
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    if shutil.which("git") is None:
+        pytest.skip("git not available")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("a = 1\n")
+    (tmp_path / "src" / "b file.py").write_text("b = 1\n")
+    (tmp_path / "src" / "unchanged.py").write_text("c = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    (tmp_path / "src" / "a.py").write_text("a = 2\n")
+    (tmp_path / "src" / "b file.py").write_text("b = 2\n")
+    return tmp_path
+
+
+def test_split_diff_by_file_handles_spaces_and_quotes() -> None:
+    output = (
+        "diff --git a/src/x.py b/src/x.py\n+x\n"
+        "diff --git a/src/y z.py b/src/y z.py\n+y\n"
+        'diff --git "a/src/tab\\tname.py" "b/src/tab\\tname.py"\n+t\n'
+    )
+    sections = split_diff_by_file(output)
+    assert set(sections) == {"src/x.py", "src/y z.py", "src/tab\tname.py"}
+    assert sections["src/y z.py"].endswith("+y\n")
+
+
+def test_collector_batches_files_into_one_command(git_repo: Path) -> None:
+    collector = GitDiffCollector(git_repo)
+    paths = ["src/a.py", "src/b file.py", "src/unchanged.py", "src/a.py"]
+
+    diffs = collector.get_diffs(paths)
+
+    assert collector.commands_run == 1
+    assert "+a = 2" in diffs["src/a.py"]
+    assert "+b = 2" in diffs["src/b file.py"]
+    assert diffs["src/unchanged.py"] == ""
+
+
+def test_collector_caches_by_ref_and_path(git_repo: Path) -> None:
+    collector = GitDiffCollector(git_repo)
+    collector.get_diffs(["src/a.py"])
+    collector.get_diff("src/a.py")
+    assert collector.commands_run == 1
+
+    collector.get_diff("src/a.py", base_ref="HEAD", compare_ref="HEAD")
+    assert collector.commands_run == 2
+
+
+def test_collector_maps_absolute_and_directory_paths(git_repo: Path) -> None:
+    collector = GitDiffCollector(git_repo)
+    absolute = str(git_repo / "src" / "a.py")
+
+    diffs = collector.get_diffs([absolute, "src"])
+
+    assert "+a = 2" in diffs[absolute]
+    assert "+a = 2" in diffs["src"] and "+b = 2" in diffs["src"]
+
+
+def test_collector_isolates_failing_path(git_repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    outside = tmp_path_factory.mktemp("outside") / "other.py"
+    collector = GitDiffCollector(git_repo)
+
+    diffs = collector.get_diffs(["src/a.py", str(outside)])
+
+    assert "+a = 2" in diffs["src/a.py"]
+    assert diffs[str(outside)] is None
+
+
+def test_collector_without_repo_returns_none() -> None:
+    collector = GitDiffCollector(None)
+    with patch("subprocess.run") as mock_run:
+        assert collector.get_diffs(["src/a.py"]) == {"src/a.py": None}
+    mock_run.assert_not_called()
+
+
+def test_collector_handles_timeout() -> None:
+    collector = GitDiffCollector(Path("/repo"))
+    with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd=["git"], timeout=30)):
+        assert collector.get_diff("src/a.py") is None
+
+
+def test_collector_uses_compare_ref() -> None:
+    collector = GitDiffCollector(Path("/repo"))
+    completed = MagicMock(returncode=0, stdout="", stderr="")
+    with patch("subprocess.run", return_value=completed) as mock_run:
+        collector.get_diff("src/a.py", base_ref="abc123", compare_ref="def456")
+
+    command = mock_run.call_args.args[0]
+    assert command[-4:] == ["abc123", "def456", "--", "src/a.py"]
+    assert "--no-color" in command
@@ -264,12 +264,37 @@ def test_get_task_diffs_collects_primary_file(sample_spec: Dict[str, object]) ->
     reviewer = _make_reviewer(sample_spec)
 
     diff_output = "diff --git a/src/auth.py b/src/auth.py\n+change"
-    with patch.object(reviewer, "get_file_diff", return_value=diff_output):
-        diffs = reviewer.get_task_diffs("task-1")
+    with patch("claude_skills.sdd_fidelity_review.review.find_git_root", return_value=Path("/repo")):
+        completed = MagicMock(returncode=0, stdout=diff_output, stderr="")
+        with patch("subprocess.run", return_value=completed):
+            diffs = reviewer.get_task_diffs("task-1")
 
     assert diffs == {"src/auth.py": diff_output}
 
 
+def test_get_phase_diffs_batches_git_invocations(sample_spec: Dict[str, object]) -> None:
+    sample_spec["hierarchy"]["task-2"]["metadata"]["files"] = ["src/auth.py"]
+    reviewer = _make_reviewer(sample_spec)
+
+    diff_output = (
+        "diff --git a/src/auth.py b/src/auth.py\n+login\n"
+        "diff --git a/src/auth_logout.py b/src/auth_logout.py\n+logout\n"
+    )
+    with patch("claude_skills.sdd_fidelity_review.review.find_git_root", return_value=Path("/repo")) as mock_root:
+        completed = MagicMock(returncode=0, stdout=diff_output, stderr="")
+        with patch("subprocess.run", return_value=completed) as mock_run:
+            diffs = reviewer.get_phase_diffs("phase-1")
+            reviewer.get_task_diffs("task-1")
+
+    mock_run.assert_called_once()
+    mock_root.assert_called_once()
+    command = mock_run.call_args.args[0]
+    assert command[command.index("--") + 1:] == ["src/auth.py", "src/auth_logout.py"]
+    assert diffs["task-1"] == {"src/auth.py": "diff --git a/src/auth.py b/src/auth.py\n+login\n"}
+    assert diffs["task-2"]["src/auth_logout.py"].endswith("+logout\n")
+    assert diffs["task-2"]["src/auth.py"] == diffs["task-1"]["src/auth.py"]
+
+
 def test_get_task_test_results_runs_pytest(tmp_path: Path, sample_spec: Dict[str, object]) -> None:
     test_file = tmp_path / "tests" / "auth" / "test_login.py"
     test_file.parent.mkdir(parents=True)
@@ -279,10 +304,53 @@ def test_get_task_test_results_runs_pytest(tmp_path: Path, sample_spec: Dict[str
     sample_spec["hierarchy"]["task-1"]["metadata"]["verification_files"] = [abs_test_path]
 
     reviewer = _make_reviewer(sample_spec)
+    reviewer.test_results.use_cache = False
 
     fake_results = {"total": 1, "passed": 1, "failed": 0, "errors": 0, "skipped": 0, "tests": {}}
-    with patch.object(reviewer, "_run_and_parse_tests", return_value=fake_results) as mock_runner:
+    with patch.object(reviewer.test_results, "run_tests", return_value=fake_results) as mock_runner:
         results = reviewer.get_task_test_results("task-1")
+        reviewer.get_task_test_results("task-1")
 
     assert results == fake_results
-    mock_runner.assert_called_once_with(abs_test_path)
+    mock_runner.assert_called_once_with([abs_test_path])
+
+
+def test_get_scope_test_results_runs_all_files_once(tmp_path: Path, sample_spec: Dict[str, object]) -> None:
+    login_test = tmp_path / "test_login.py"
+    logout_test = tmp_path / "test_logout.py"
+    for test_file in (login_test, logout_test):
+        test_file.write_text("def test_dummy():\n    assert True\n")
+
+    sample_spec["hierarchy"]["task-1"]["metadata"]["verification_files"] = [str(login_test)]
+    sample_spec["hierarchy"]["task-2"]["metadata"]["verification_files"] = [str(logout_test), str(login_test)]
+    reviewer = _make_reviewer(sample_spec)
+    reviewer.test_results.use_cache = False
+
+    fake_results = {"total": 2, "passed": 2, "failed": 0, "errors": 0, "skipped": 0, "tests": {}}
+    with patch.object(reviewer.test_results, "run_tests", return_value=fake_results) as mock_runner:
+        results = reviewer.get_scope_test_results(reviewer.get_phase_tasks("phase-1"))
+
+    assert results == fake_results
+    mock_runner.assert_called_once_with(sorted([str(login_test), str(logout_test)]))
+
+
+def test_generate_review_prompt_fits_token_budget(sample_spec: Dict[str, object]) -> None:
+    reviewer = _make_reviewer(sample_spec)
+
+    hunks = "".join(
+        f"@@ -{n},1 +{n},20 @@\n" + "".join(f"+line {n}.{i}\n" for i in range(20))
+        for n in range(1, 60)
+    )
+    diff = "diff --git a/src/auth.py b/src/auth.py\n--- a/src/auth.py\n+++ b/src/auth.py\n" + hunks
+    with patch.object(reviewer.diff_collector, "get_diffs", return_value={"src/auth.py": diff}):
+        full_prompt = reviewer.generate_review_prompt(task_id="task-1", include_tests=False, max_prompt_tokens=None)
+        budget_prompt = reviewer.generate_review_prompt(task_id="task-1", include_tests=False, max_prompt_tokens=2000)
+        repeat_prompt = reviewer.generate_review_prompt(task_id="task-1", include_tests=False, max_prompt_tokens=2000)
+
+    assert diff in full_prompt
+    assert len(budget_prompt) <= 2000 * 4
+    assert budget_prompt == repeat_prompt
+    assert "*Changes: +1180/-0 lines in 59 hunks*" in budget_prompt
+    assert "more hunks omitted" in budget_prompt
+    assert "## Review Questions" in budget_prompt
+    assert reviewer.last_prompt_stats["truncated_sections"] == ["diff:src/auth.py"]
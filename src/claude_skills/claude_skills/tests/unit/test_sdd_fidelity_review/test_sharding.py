@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from claude_skills.common.ai_tools import MultiToolResponse, ToolResponse, ToolStatus
+from claude_skills.common.cache.cache_manager import CacheManager
+from claude_skills.sdd_fidelity_review.consultation import FidelityVerdict, ParsedReviewResponse
+from claude_skills.sdd_fidelity_review.git_diffs import GitDiffCollector
+from claude_skills.sdd_fidelity_review.report import FidelityReport
+from claude_skills.sdd_fidelity_review.review import FidelityReviewer
+from claude_skills.sdd_fidelity_review.sharding import (
+    ReviewShard,
+    ShardResult,
+    merge_shard_responses,
+    plan_review_shards,
+    run_sharded_review,
+)
+
+
+pytestmark = pytest.mark.unit
+
+CONSULTATION = "claude_skills.sdd_fidelity_review.consultation"
+
+
+def _task(title: str, parent: str, file_path: str) -> Dict[str, object]:
+    return {
+        "title": title,
+        "type": "task",
+        "status": "pending",
+        "parent": parent,
+        "metadata": {"description": title, "file_path": file_path},
+    }
+
+
+@pytest.fixture
+def spec_data() -> Dict[str, object]:
+    return {
+        "title": "Sharded Spec",
+        "hierarchy": {
+            "spec-root": {"title": "Root", "type": "spec"},
+            "phase-1": {"title": "Phase 1", "type": "phase", "parent": "spec-root"},
+            "group-1": {"title": "Group 1", "type": "group", "parent": "phase-1"},
+            "task-1-1": _task("Login", "group-1", "src/login.py"),
+            "task-1-2": _task("Logout", "phase-1", "src/logout.py"),
+            "phase-2": {"title": "Phase 2", "type": "phase", "parent": "spec-root"},
+            "task-2-1": _task("Audit", "phase-2", "src/audit.py"),
+            "phase-3": {"title": "Empty", "type": "phase", "parent": "spec-root"},
+        },
+        "journals": [],
+    }
+
+
+def _make_reviewer(spec_data: Dict[str, object]) -> FidelityReviewer:
+    with patch("claude_skills.sdd_fidelity_review.review.load_json_spec", return_value=spec_data):
+        reviewer = FidelityReviewer("sharded-spec", spec_path=Path("/specs"))
+    reviewer._diff_collector = GitDiffCollector(None)
+    return reviewer
+
+
+def _parsed(tool: str, verdict: FidelityVerdict, issues: List[str]) -> ParsedReviewResponse:
+    return ParsedReviewResponse(verdict=verdict, issues=issues, provider=tool)
+
+
+def test_plan_review_shards_by_phase(spec_data: Dict[str, object]) -> None:
+    shards = plan_review_shards(_make_reviewer(spec_data), "phase")
+
+    assert [shard.shard_id for shard in shards] == ["phase-1", "phase-2"]
+    assert shards[0].task_ids == ["task-1-1", "task-1-2"]
+    assert set(shards[0].file_paths) == {"src/login.py", "src/logout.py"}
+
+
+def test_plan_review_shards_by_group(spec_data: Dict[str, object]) -> None:
+    shards = plan_review_shards(_make_reviewer(spec_data), "group")
+
+    assert [(shard.shard_id, shard.scope) for shard in shards] == [
+        ("group-1", "group"),
+        ("task-1-2", "task"),
+        ("task-2-1", "task"),
+    ]
+
+
+def test_plan_review_shards_rejects_unknown_mode(spec_data: Dict[str, object]) -> None:
+    with pytest.raises(ValueError):
+        plan_review_shards(_make_reviewer(spec_data), "file")
+
+
+def test_changing_a_task_only_changes_its_shard(spec_data: Dict[str, object]) -> None:
+    before = plan_review_shards(_make_reviewer(spec_data), "phase")
+
+    changed = copy.deepcopy(spec_data)
+    changed["hierarchy"]["task-2-1"]["metadata"]["description"] = "Audit every request"
+    after = plan_review_shards(_make_reviewer(changed), "phase")
+
+    assert before[0].content_hash == after[0].content_hash
+    assert before[1].content_hash != after[1].content_hash
+
+
+def test_merge_shard_responses_keeps_worst_verdict_per_tool() -> None:
+    shard_a = ReviewShard("phase-1", "phase")
+    shard_b = ReviewShard("phase-2", "phase")
+    results = [
+        ShardResult(shard_a, parsed_responses=[
+            _parsed("gemini", FidelityVerdict.PASS, []),
+            _parsed("codex", FidelityVerdict.PASS, []),
+        ]),
+        ShardResult(shard_b, parsed_responses=[
+            _parsed("gemini", FidelityVerdict.FAIL, ["Missing audit log"]),
+            _parsed("codex", FidelityVerdict.PARTIAL, ["Missing audit log"]),
+        ]),
+    ]
+
+    merged = merge_shard_responses(results)
+
+    assert [(resp.provider, resp.verdict) for resp in merged] == [
+        ("gemini", FidelityVerdict.FAIL),
+        ("codex", FidelityVerdict.PARTIAL),
+    ]
+    assert merged[0].issues == ["[phase-2] Missing audit log"]
+    assert merged[0].structured_response == {"shards": {"phase-1": "pass", "phase-2": "fail"}}
+
+
+def test_run_sharded_review_respects_concurrency_cap(spec_data: Dict[str, object]) -> None:
+    reviewer = _make_reviewer(spec_data)
+    shards = plan_review_shards(reviewer, "group")
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_consult(prompt, **kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return [ToolResponse(tool="gemini", status=ToolStatus.SUCCESS, output='{"verdict": "pass"}')]
+
+    with patch("claude_skills.sdd_fidelity_review.sharding.consult_multiple_ai_on_fidelity", side_effect=fake_consult) as mock_consult:
+        results = run_sharded_review(reviewer, shards, tools=["gemini"], max_concurrency=2, include_tests=False)
+
+    assert peak <= 2
+    assert [result.shard.shard_id for result in results] == ["group-1", "task-1-2", "task-2-1"]
+    cache_params = [call.kwargs["cache_key_params"] for call in mock_consult.call_args_list]
+    assert {params["target"] for params in cache_params} == {"group-1", "task-1-2", "task-2-1"}
+    assert all(params["content_hash"] for params in cache_params)
+
+
+def test_rerun_only_reconsults_changed_shard(tmp_path: Path, spec_data: Dict[str, object]) -> None:
+    cache = CacheManager(cache_dir=tmp_path / "cache", auto_cleanup=False)
+    consulted_prompts: List[str] = []
+
+    def fake_parallel(tools, prompt, models=None, timeout=None):
+        consulted_prompts.append(prompt)
+        response = ToolResponse(tool="gemini", status=ToolStatus.SUCCESS, output='{"verdict": "pass"}')
+        return MultiToolResponse(responses={"gemini": response})
+
+    def review(data: Dict[str, object]) -> None:
+        reviewer = _make_reviewer(data)
+        shards = plan_review_shards(reviewer, "phase")
+        run_sharded_review(reviewer, shards, tools=["gemini"], include_tests=False)
+
+    with patch(f"{CONSULTATION}.CacheManager", return_value=cache), \
+            patch(f"{CONSULTATION}.is_cache_enabled", return_value=True), \
+            patch(f"{CONSULTATION}.ai_tools.check_tool_available", return_value=True), \
+            patch(f"{CONSULTATION}.get_enabled_fidelity_tools", return_value={"gemini": {}}), \
+            patch(f"{CONSULTATION}.ai_config.resolve_models_for_tools", return_value={"gemini": None}), \
+            patch(f"{CONSULTATION}.ai_tools.execute_tools_parallel", side_effect=fake_parallel):
+        review(spec_data)
+        assert len(consulted_prompts) == 2
+
+        consulted_prompts.clear()
+        changed = copy.deepcopy(spec_data)
+        changed["hierarchy"]["task-2-1"]["metadata"]["description"] = "Audit every request"
+        review(changed)
+
+    assert len(consulted_prompts) == 1
+    assert "phase-2" in consulted_prompts[0]
+
+
+def test_report_json_includes_shards() -> None:
+    shards = [{"shard_id": "phase-1", "scope": "phase", "verdicts": {"gemini": "pass"}}]
+    report = FidelityReport({"spec_id": "spec", "shards": shards})
+
+    assert report.generate_json()["shards"] == shards
+    assert "shards" not in FidelityReport({"spec_id": "spec"}).generate_json()
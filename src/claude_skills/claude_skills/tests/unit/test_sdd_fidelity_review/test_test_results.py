@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude_skills.common.cache.cache_manager import CacheManager
+from claude_skills.common.test_history import TestHistory
+from claude_skills.sdd_fidelity_review.test_results import ReviewTestResultProvider, parse_junit_xml
+
+
+pytestmark = pytest.mark.unit
+
+
+FAKE_RESULTS = {"total": 1, "passed": 1, "failed": 0, "errors": 0, "skipped": 0, "duration": 0.1, "tests": {}}
+
+
+@pytest.fixture
+def test_file(tmp_path: Path) -> Path:
+    path = tmp_path / "test_sample.py"
+    path.write_text("def test_ok():\n    assert True\n")
+    return path
+
+
+def test_parse_junit_xml_aggregates_multiple_suites(tmp_path: Path) -> None:
+    xml_path = tmp_path / "report.xml"
+    xml_path.write_text(
+        """<?xml version="1.0"?>
+        <testsuites>
+            <testsuite name="a" tests="1" failures="0" errors="0" skipped="0" time="0.5">
+                <testcase classname="tests.test_a" name="test_one" time="0.5"/>
+            </testsuite>
+            <testsuite name="b" tests="2" failures="1" errors="0" skipped="1" time="1.0">
+                <testcase classname="tests.test_b" name="test_two" time="0.5">
+                    <failure message="boom">trace</failure>
+                </testcase>
+                <testcase classname="tests.test_b" name="test_three" time="0.5">
+                    <skipped message="skip"/>
+                </testcase>
+            </testsuite>
+        </testsuites>
+        """
+    )
+
+    results = parse_junit_xml(str(xml_path))
+
+    assert results["total"] == 3
+    assert results["passed"] == 1
+    assert results["failed"] == 1
+    assert results["skipped"] == 1
+    assert results["tests"]["tests.test_b::test_two"]["status"] == "failed"
+
+
+def test_build_command_adds_xdist_workers() -> None:
+    provider = ReviewTestResultProvider(workers=4, use_cache=False)
+    with patch("claude_skills.sdd_fidelity_review.test_results.is_xdist_available", return_value=True):
+        cmd = provider.build_command(["tests/a.py", "tests/b.py"], "/tmp/out.xml")
+    assert cmd[:3] == ["pytest", "tests/a.py", "tests/b.py"]
+    assert cmd[-2:] == ["-n", "4"]
+
+    with patch("claude_skills.sdd_fidelity_review.test_results.is_xdist_available", return_value=False):
+        cmd = provider.build_command(["tests/a.py"], "/tmp/out.xml")
+    assert "-n" not in cmd
+
+
+def test_get_results_skips_missing_files(tmp_path: Path) -> None:
+    provider = ReviewTestResultProvider(use_cache=False)
+    with patch.object(provider, "run_tests") as mock_run:
+        assert provider.get_results([str(tmp_path / "missing.py")]) is None
+    mock_run.assert_not_called()
+
+
+def test_get_results_reuses_cache_until_sources_change(tmp_path: Path, test_file: Path) -> None:
+    source = tmp_path / "module.py"
+    source.write_text("VALUE = 1\n")
+    cache = CacheManager(cache_dir=tmp_path / "cache", auto_cleanup=False)
+
+    provider = ReviewTestResultProvider(use_cache=True, cache=cache)
+    with patch.object(provider, "run_tests", return_value=FAKE_RESULTS) as mock_run:
+        provider.get_results([str(test_file)], [str(source)])
+    mock_run.assert_called_once()
+
+    # A fresh provider (new review) hits the persistent cache
+    fresh = ReviewTestResultProvider(use_cache=True, cache=cache)
+    with patch.object(fresh, "run_tests", return_value=FAKE_RESULTS) as mock_run:
+        assert fresh.get_results([str(test_file)], [str(source)]) == FAKE_RESULTS
+    mock_run.assert_not_called()
+
+    source.write_text("VALUE = 2\n")
+    with patch.object(fresh, "run_tests", return_value=FAKE_RESULTS) as mock_run:
+        fresh.get_results([str(test_file)], [str(source)])
+    mock_run.assert_called_once()
+
+
+def test_run_tests_invokes_pytest_once(test_file: Path, tmp_path: Path) -> None:
+    provider = ReviewTestResultProvider(use_cache=False)
+    other = tmp_path / "test_other.py"
+    other.write_text("def test_ok():\n    assert True\n")
+
+    def fake_run(cmd, **kwargs):
+        xml_arg = next(arg for arg in cmd if arg.startswith("--junit-xml="))
+        Path(xml_arg.split("=", 1)[1]).write_text(
+            '<testsuite tests="2" failures="0" errors="0" skipped="0" time="0.2">'
+            '<testcase classname="t" name="a"/><testcase classname="t" name="b"/></testsuite>'
+        )
+        return MagicMock(returncode=0)
+
+    with patch("subprocess.run", side_effect=fake_run) as mock_run:
+        results = provider.run_tests([str(test_file), str(other)])
+
+    mock_run.assert_called_once()
+    assert results["total"] == 2
+    assert results["passed"] == 2
+
+
+def test_run_tests_records_outcome_history(test_file: Path, tmp_path: Path) -> None:
+    history = TestHistory(tmp_path / "history.db")
+    provider = ReviewTestResultProvider(use_cache=False, history=history)
+
+    def fake_run(cmd, **kwargs):
+        xml_arg = next(arg for arg in cmd if arg.startswith("--junit-xml="))
+        Path(xml_arg.split("=", 1)[1]).write_text(
+            '<testsuite tests="1" failures="1" errors="0" skipped="0" time="0.2">'
+            '<testcase classname="t" name="a" time="0.2"><failure message="boom"/></testcase></testsuite>'
+        )
+        return MagicMock(returncode=1)
+
+    with patch("subprocess.run", side_effect=fake_run), \
+            patch("claude_skills.sdd_fidelity_review.test_results.get_current_git_commit", return_value="abc"):
+        provider.run_tests([str(test_file)])
+
+    score = history.flakiness("t::a")
+    assert (score.runs, score.failures) == (1, 1)
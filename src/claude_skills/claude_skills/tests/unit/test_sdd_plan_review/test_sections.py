@@ -0,0 +1,144 @@
+"""Unit tests for section-level reuse in plan reviews."""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from claude_skills.common.ai_tools import MultiToolResponse, ToolResponse, ToolStatus
+from claude_skills.common.cache import CacheManager
+from claude_skills.sdd_plan_review import reviewer
+from claude_skills.sdd_plan_review.prompts import build_review_prompt
+from claude_skills.sdd_plan_review.sections import (
+    GENERAL_FINDINGS,
+    SectionReviewCache,
+    attribute_findings,
+    extract_findings,
+    split_spec_sections,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _spec(task_2_1: str = "Write the session store migration") -> Dict[str, Any]:
+    def node(title: str, parent: str | None, children: List[str], **extra: Any) -> Dict[str, Any]:
+        return {"type": "task", "title": title, "status": "pending", "parent": parent,
+                "children": children, "metadata": {}, **extra}
+
+    return {
+        "spec_id": "auth-2025-01-01-001",
+        "title": "Session auth",
+        "last_updated": "2025-01-01T00:00:00Z",
+        "hierarchy": {
+            "spec-root": node("Session auth", None, ["phase-1", "phase-2"]),
+            "phase-1": node("Token issuing", "spec-root", ["task-1-1", "task-1-2"]),
+            "task-1-1": node("Sign JWT access tokens with a rotating key", "phase-1", []),
+            "task-1-2": node("Expose the refresh endpoint", "phase-1", []),
+            "phase-2": node("Persistence", "spec-root", ["task-2-1"]),
+            "task-2-1": node(task_2_1, "phase-2", []),
+        },
+    }
+
+
+REVIEW = """# Review Summary
+
+## Critical Blockers
+
+- **[Security]** task-1-2 refresh tokens never expire
+  - **Fix:** Add an expiry.
+
+## Major Suggestions
+
+- **[Data Model]** The session store migration has no rollback plan for the database
+- **[Architecture]** Logging is inconsistent across the codebase
+
+## Questions
+
+None identified
+"""
+
+
+def test_sections_follow_phases_and_ignore_progress() -> None:
+    spec = _spec()
+    sections = split_spec_sections(json.dumps(spec))
+
+    assert [s.id for s in sections] == ["overview", "phase-1", "phase-2"]
+    assert sections[1].node_ids == ["phase-1", "task-1-1", "task-1-2"]
+    assert sections[0].node_ids == ["spec-root"]
+
+    spec["hierarchy"]["task-1-1"]["status"] = "completed"
+    spec["last_updated"] = "2025-02-01T00:00:00Z"
+    assert [s.content_hash for s in split_spec_sections(json.dumps(spec))] == [s.content_hash for s in sections]
+
+    changed = split_spec_sections(json.dumps(_spec("Write the session store migration and backfill")))
+    assert [a.content_hash == b.content_hash for a, b in zip(sections, changed)] == [True, True, False]
+
+
+def test_non_json_specs_are_a_single_section() -> None:
+    assert [s.id for s in split_spec_sections("# Markdown spec")] == ["spec"]
+
+
+def test_findings_are_extracted_and_attributed() -> None:
+    findings = extract_findings(REVIEW)
+    assert [f["category"] for f in findings] == ["Critical Blockers", "Major Suggestions", "Major Suggestions"]
+    assert findings[0]["text"].endswith("Add an expiry.")
+
+    by_section = attribute_findings(findings, split_spec_sections(json.dumps(_spec())))
+    assert [f["category"] for f in by_section["phase-1"]] == ["Critical Blockers"]
+    assert "migration" in by_section["phase-2"][0]["text"]
+    assert "Logging" in by_section[GENERAL_FINDINGS][0]["text"]
+
+
+def test_prompt_prefix_is_stable_across_re_reviews() -> None:
+    first = build_review_prompt(split_spec_sections(json.dumps(_spec())), "full", "s", "t")
+    edited = split_spec_sections(json.dumps(_spec("Write the session store migration and backfill")))
+    again = build_review_prompt(edited, "full", "s", "t", changed_ids=["phase-2"])
+
+    assert first.suffix == ""
+    assert "**SPECIFICATION TO REVIEW:**" in first.prefix
+    assert first.prefix.startswith(again.prefix)
+    assert "backfill" not in again.prefix
+    assert "backfill" in again.suffix and "re-review" in again.suffix
+
+
+def _fake_parallel(calls: List[Dict[str, Any]], output: str):
+    def _execute(tools: List[str], prompt: str, models: Dict[str, Any], timeout: int, **kwargs: Any):
+        calls.append({"tools": list(tools), "prompt": prompt})
+        responses = {
+            tool: ToolResponse(tool=tool, status=ToolStatus.SUCCESS, output=output, duration=1.0)
+            for tool in tools
+        }
+        return MultiToolResponse(responses=responses, success_count=len(tools), failure_count=0)
+    return _execute
+
+
+def test_re_review_only_sends_changed_sections(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(reviewer, "is_cache_enabled", lambda: True)
+    monkeypatch.setattr(reviewer, "is_response_cache_bypassed", lambda: False)
+    monkeypatch.setattr(reviewer.ai_config, "resolve_models_for_tools",
+                        lambda skill, tools, override=None, context=None: OrderedDict((t, None) for t in tools))
+    monkeypatch.setattr(reviewer, "build_consensus", lambda responses, **kwargs: {"success": True})
+    cache = SectionReviewCache(CacheManager(cache_dir=tmp_path, auto_cleanup=False))
+    calls: List[Dict[str, Any]] = []
+    monkeypatch.setattr(reviewer, "execute_tools_parallel", _fake_parallel(calls, REVIEW))
+
+    def review(spec: Dict[str, Any]) -> Dict[str, Any]:
+        return reviewer.review_with_tools(json.dumps(spec), ["gemini"], spec_id="auth", silent=True,
+                                          use_cache=True, section_cache=cache)
+
+    first = review(_spec())
+    unchanged = review(_spec())
+    edited = review(_spec("Write the session store migration and backfill"))
+
+    assert len(calls) == 2
+    assert "CHANGED SECTIONS" not in calls[0]["prompt"]
+    assert unchanged["raw_responses"][0]["cached"] is True
+    assert "refresh tokens never expire" in unchanged["raw_responses"][0]["output"]
+    assert "backfill" in calls[1]["prompt"].split("CHANGED SECTIONS")[1]
+    assert edited["reused_sections"] == {"gemini": ["overview", "phase-1"]}
+    assert "## Earlier Findings (unchanged sections)" in edited["raw_responses"][0]["output"]
+    assert edited["prompt"]["prefix_chars"] < first["prompt"]["prefix_chars"]
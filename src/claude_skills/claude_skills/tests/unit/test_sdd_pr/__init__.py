@@ -0,0 +1 @@
+"""Unit test package for `claude_skills.sdd_pr` components."""
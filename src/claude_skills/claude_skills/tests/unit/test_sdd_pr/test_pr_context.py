@@ -0,0 +1,89 @@
+"""Unit tests for bounded PR diff context collection."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from claude_skills.sdd_pr.pr_context import (
+    collect_diff_context,
+    get_commit_history,
+    get_diff_stats,
+    get_spec_git_diffs,
+)
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.skipif(shutil.which("git") is None, reason="git not available"),
+]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Branch `feature` off `main` changing a small task file, a big file and a binary file."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "task.py").write_text("def task():\n    return 1\n")
+    (tmp_path / "README.md").write_text("readme\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    (tmp_path / "src" / "task.py").write_text("def task():\n    return 2\n")
+    (tmp_path / "generated.txt").write_text("".join(f"line {i}\n" for i in range(5000)))
+    (tmp_path / "logo.bin").write_bytes(bytes(range(256)) * 4)
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "feature work")
+    (tmp_path / "README.md").write_text("readme\nmore\n")
+    _git(tmp_path, "commit", "-q", "-am", "docs")
+    return tmp_path
+
+
+def test_stats_rank_task_files_then_churn(repo: Path) -> None:
+    stats = get_diff_stats(repo, "main", relevant_files=["./src/task.py"])
+
+    assert [s.path for s in stats] == ["src/task.py", "generated.txt", "README.md", "logo.bin"]
+    assert stats[0].relevant and (stats[0].added, stats[0].removed) == (1, 1)
+    assert stats[-1].binary
+
+
+def test_small_diff_is_included_in_full(repo: Path) -> None:
+    context = collect_diff_context(repo, "main", max_bytes=1024 * 1024)
+
+    assert context.included == ["generated.txt", "src/task.py", "README.md"]
+    assert context.summarized == ["logo.bin"]
+    assert "+    return 2" in context.text
+    assert "logo.bin | binary (not diffable)" in context.text
+
+
+def test_budget_keeps_relevant_files_and_summarizes_the_rest(repo: Path) -> None:
+    context = collect_diff_context(repo, "main", max_bytes=2000, relevant_files=["src/task.py"])
+
+    assert context.included[0] == "src/task.py"
+    assert "generated.txt" in context.truncated
+    assert len(context.text) < 2000 + 500
+    assert "+    return 2" in context.text
+    assert "changed files not shown in full" in context.text
+
+
+def test_tiny_budget_only_lists_files(repo: Path) -> None:
+    text = get_spec_git_diffs(repo, "main", max_tokens=60)
+
+    assert "generated.txt | +5000/-0 (omitted: over budget)" in text
+    assert "@@" not in text
+    assert len(text) <= 60 * 4
+
+
+def test_commit_history_is_bounded_to_recent_commits(repo: Path) -> None:
+    commits = get_commit_history(repo, "main", max_commits=1)
+
+    assert [c["message"] for c in commits] == ["docs"]
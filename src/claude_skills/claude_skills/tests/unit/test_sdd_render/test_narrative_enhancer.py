@@ -0,0 +1,187 @@
+"""Tests for batched, cached narrative generation in NarrativeEnhancer."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from claude_skills.common.cache import CacheManager
+from claude_skills.sdd_render.narrative_enhancer import NARRATIVE_FAILED, NarrativeEnhancer
+
+
+def _spec(phase_count: int) -> Dict[str, Any]:
+    hierarchy: Dict[str, Any] = {
+        "spec-root": {"type": "spec", "children": [f"phase-{i}" for i in range(1, phase_count + 1)]},
+    }
+    for i in range(1, phase_count + 1):
+        hierarchy[f"phase-{i}"] = {"type": "phase", "title": f"Phase {i}", "children": [f"task-{i}"]}
+        hierarchy[f"task-{i}"] = {
+            "type": "task",
+            "title": f"Task {i}",
+            "dependencies": {"blocked_by": [f"task-{i - 1}"] if i > 1 else []},
+        }
+    return {"metadata": {"title": "Demo"}, "hierarchy": hierarchy}
+
+
+class FakeAgent:
+    """Answers batch prompts with a JSON array and single prompts with text."""
+
+    def __init__(self, *, drop_ids: tuple = ()) -> None:
+        self.prompts: List[str] = []
+        self.drop_ids = drop_ids
+        self._lock = threading.Lock()
+
+    def __call__(self, agent, prompt, *, feature, timeout, tracker=None):
+        with self._lock:
+            self.prompts.append(prompt)
+        item_ids = re.findall(r"^### Item (\S+)$", prompt, re.MULTILINE)
+        if item_ids:
+            output = json.dumps([
+                {"id": item_id, "narrative": f"Narrative for {item_id}"}
+                for item_id in item_ids if item_id not in self.drop_ids
+            ])
+        else:
+            output = "Single narrative"
+        return SimpleNamespace(success=True, output=output)
+
+    @property
+    def batch_prompts(self) -> List[str]:
+        return [p for p in self.prompts if "### Item" in p]
+
+
+def _install(monkeypatch: pytest.MonkeyPatch, agent: FakeAgent) -> None:
+    monkeypatch.setattr(NarrativeEnhancer, "_invoke_agent", lambda self, *args, **kwargs: agent(*args, **kwargs))
+    monkeypatch.setattr(NarrativeEnhancer, "_enabled_available_agents", lambda self: ["gemini"])
+
+
+@pytest.fixture
+def fake_agent(monkeypatch: pytest.MonkeyPatch) -> FakeAgent:
+    agent = FakeAgent()
+    _install(monkeypatch, agent)
+    return agent
+
+
+def test_items_are_batched_into_json_prompts(fake_agent: FakeAgent) -> None:
+    enhancer = NarrativeEnhancer(_spec(12), batch_size=5, max_concurrency=3, use_cache=False)
+
+    narratives = enhancer.enhance_spec_narrative()
+
+    # 12 transitions + 11 rationales + 12 suggestions = 35 items in 7 batches
+    assert len(fake_agent.prompts) == 7
+    assert len(fake_agent.batch_prompts) == 7
+    transitions = narratives["phase_transitions"]
+    assert [t.target_id for t in transitions][:2] == ["phase-1", "phase-2"]
+    assert transitions[1].content == "Narrative for transition:phase-2"
+    assert narratives["dependency_rationales"][0].content == "Narrative for rationale:task-2"
+    assert len(narratives["implementation_suggestions"]) == 12
+
+
+def test_items_missing_from_batch_response_are_generated_individually(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agent = FakeAgent(drop_ids=("transition:phase-2",))
+    _install(monkeypatch, agent)
+    enhancer = NarrativeEnhancer(_spec(3), batch_size=10, use_cache=False)
+
+    transitions = enhancer.generate_phase_transitions()
+
+    assert [t.content for t in transitions] == [
+        "Narrative for transition:phase-1",
+        "Single narrative",
+        "Narrative for transition:phase-3",
+    ]
+    assert len(agent.prompts) == 2
+
+
+def test_cached_narratives_skip_ai_calls(fake_agent: FakeAgent, tmp_path) -> None:
+    cache = CacheManager(cache_dir=tmp_path, auto_cleanup=False)
+    first = NarrativeEnhancer(_spec(4), batch_size=4, use_cache=True, cache=cache).enhance_spec_narrative()
+    calls_after_first_render = len(fake_agent.prompts)
+
+    second = NarrativeEnhancer(_spec(4), batch_size=4, use_cache=True, cache=cache).enhance_spec_narrative()
+
+    assert calls_after_first_render > 0
+    assert len(fake_agent.prompts) == calls_after_first_render
+    assert [e.content for e in second["phase_transitions"]] == [e.content for e in first["phase_transitions"]]
+
+
+def test_model_override_bypasses_narratives_cached_for_another_model(fake_agent: FakeAgent, tmp_path) -> None:
+    cache = CacheManager(cache_dir=tmp_path, auto_cleanup=False)
+    NarrativeEnhancer(_spec(2), use_cache=True, cache=cache).generate_phase_transitions()
+    calls_after_first_render = len(fake_agent.prompts)
+
+    NarrativeEnhancer(_spec(2), use_cache=True, cache=cache, model_override="other-model").generate_phase_transitions()
+
+    assert len(fake_agent.prompts) == 2 * calls_after_first_render
+
+
+def test_repeated_calls_reuse_narratives_in_memory(fake_agent: FakeAgent) -> None:
+    enhancer = NarrativeEnhancer(_spec(3), use_cache=False)
+
+    enhancer.generate_phase_transitions()
+    enhancer.generate_phase_transitions()
+
+    assert len(fake_agent.prompts) == 1
+
+
+def test_failed_batches_are_not_cached(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setattr(
+        NarrativeEnhancer,
+        "_invoke_agent",
+        lambda self, agent, prompt, **kwargs: SimpleNamespace(success=False, output=""),
+    )
+    monkeypatch.setattr(NarrativeEnhancer, "_enabled_available_agents", lambda self: ["gemini"])
+    cache = CacheManager(cache_dir=tmp_path, auto_cleanup=False)
+
+    transitions = NarrativeEnhancer(_spec(2), use_cache=True, cache=cache).generate_phase_transitions()
+
+    assert [t.content for t in transitions] == [NARRATIVE_FAILED, NARRATIVE_FAILED]
+    assert cache.get_stats()["total_entries"] == 0
+
+
+def test_fallback_narratives_are_not_cached_as_the_primary_agents(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    failing = {"gemini"}
+    calls: List[str] = []
+
+    def invoke(self, agent, prompt, **kwargs):
+        calls.append(agent)
+        if agent in failing:
+            return SimpleNamespace(success=False, output="")
+        return SimpleNamespace(success=True, output=f"{agent} narrative")
+
+    monkeypatch.setattr(NarrativeEnhancer, "_invoke_agent", invoke)
+    monkeypatch.setattr(NarrativeEnhancer, "_enabled_available_agents", lambda self: ["gemini", "codex"])
+    cache = CacheManager(cache_dir=tmp_path, auto_cleanup=False)
+
+    first = NarrativeEnhancer(_spec(1), use_cache=True, cache=cache).generate_phase_transitions()
+    failing.clear()
+    second = NarrativeEnhancer(_spec(1), use_cache=True, cache=cache).generate_phase_transitions()
+
+    assert [t.content for t in first] == ["codex narrative"]
+    # gemini works again: its narrative is generated, not codex's replayed
+    assert [t.content for t in second] == ["gemini narrative"]
+    assert calls == ["gemini", "codex", "gemini"]
+
+
+def test_batch_timeout_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    agent = FakeAgent()
+    timeouts: List[int] = []
+
+    def invoke(self, *args, timeout, **kwargs):
+        timeouts.append(timeout)
+        return agent(*args, timeout=timeout, **kwargs)
+
+    monkeypatch.setattr(NarrativeEnhancer, "_invoke_agent", invoke)
+    monkeypatch.setattr(NarrativeEnhancer, "_enabled_available_agents", lambda self: ["gemini"])
+    monkeypatch.setattr("claude_skills.sdd_render.narrative_enhancer.get_timeout", lambda *args: 60)
+
+    NarrativeEnhancer(_spec(8), batch_size=8, use_cache=False).generate_phase_transitions()
+
+    assert timeouts == [120]
@@ -0,0 +1,187 @@
+"""Unit tests and a scaling check for SpecGraph."""
+
+import sys
+from typing import Any, Dict
+
+import pytest
+
+from claude_skills.sdd_render import (
+    ComplexityScorer,
+    DependencyGraphGenerator,
+    InsightGenerator,
+    PriorityRanker,
+    SpecAnalyzer,
+    SpecGraph,
+    TaskGrouper,
+)
+
+
+def _large_spec(phase_count: int = 20, tasks_per_phase: int = 20) -> Dict[str, Any]:
+    """Spec with phase_count * tasks_per_phase tasks in chained phases."""
+    hierarchy: Dict[str, Any] = {
+        "spec-root": {
+            "type": "spec",
+            "children": [f"phase-{p}" for p in range(phase_count)],
+        }
+    }
+    for p in range(phase_count):
+        task_ids = [f"task-{p}-{t}" for t in range(tasks_per_phase)]
+        hierarchy[f"phase-{p}"] = {"type": "phase", "title": f"Phase {p}", "children": task_ids}
+        for t, task_id in enumerate(task_ids):
+            blocked_by = []
+            if t > 0:
+                blocked_by.append(f"task-{p}-{t - 1}")
+            if p > 0:
+                blocked_by.append(f"task-{p - 1}-{t}")
+            hierarchy[task_id] = {
+                "type": "task",
+                "title": f"Task {p}.{t}",
+                "status": "pending" if p >= phase_count // 2 else "completed",
+                "parent": f"phase-{p}",
+                "children": [],
+                "dependencies": {"blocked_by": blocked_by},
+                "metadata": {"file_path": f"src/module_{t % 7}.py", "estimated_hours": 1 + t % 5},
+            }
+    return {"spec_id": "large", "metadata": {}, "hierarchy": hierarchy}
+
+
+def _chain_spec() -> Dict[str, Any]:
+    return {
+        "hierarchy": {
+            "spec-root": {"type": "spec", "children": ["phase-1"]},
+            "phase-1": {"type": "phase", "children": ["a", "b", "c", "d"]},
+            "a": {"type": "task", "status": "completed", "dependencies": {"blocks": ["b", "c"]}},
+            "b": {"type": "task", "status": "pending", "dependencies": {"blocked_by": ["a"]}},
+            "c": {"type": "task", "status": "pending", "dependencies": {"blocks": ["d"]}},
+            "d": {"type": "task", "status": "pending", "dependencies": {"blocked_by": ["b"]},
+                  "children": ["d-1"]},
+            "d-1": {"type": "subtask", "status": "pending", "children": ["d-1-1", "missing"]},
+            "d-1-1": {"type": "subtask", "status": "pending"},
+        }
+    }
+
+
+class TestSpecGraph:
+    """Tests for SpecGraph."""
+
+    def test_edges_keep_both_declarations(self):
+        graph = SpecGraph.from_spec(_chain_spec())
+
+        # a -> b is declared on both sides, so it appears twice
+        assert graph.forward["a"] == ("b", "c", "b")
+        assert graph.reverse["b"] == ("a", "a")
+        assert graph.reverse["d"] == ("c", "b")
+        assert "spec-root" not in graph.forward
+
+    def test_derived_analyses(self):
+        graph = SpecGraph.from_spec(_chain_spec())
+
+        assert graph.has_cycles is False
+        assert graph.topological_order.index("a") < graph.topological_order.index("b")
+        assert graph.depths["a"] == 0
+        assert graph.depths["d"] == 2
+        assert graph.critical_path == ("a", "c", "d")
+        assert graph.descendant_counts["d"] == 3
+        assert graph.descendant_counts["phase-1"] == 7
+
+    def test_graph_is_immutable(self):
+        graph = SpecGraph.from_spec(_chain_spec())
+
+        with pytest.raises(AttributeError):
+            graph.critical_path = ()
+        with pytest.raises(TypeError):
+            graph.forward["a"] = ()
+
+    def test_parallel_waves_only_schedule_candidates(self):
+        graph = SpecGraph.from_spec(_chain_spec())
+
+        assert graph.parallel_waves() == [["phase-1", "a", "d-1", "d-1-1"], ["b", "c"], ["d"]]
+        # d is also blocked by c, which is not a candidate, so it never becomes ready
+        assert graph.parallel_waves(["a", "b", "d"]) == [["a"], ["b"]]
+
+    def test_cycles(self):
+        spec = {
+            "hierarchy": {
+                "x": {"dependencies": {"blocks": ["y"]}},
+                "y": {"dependencies": {"blocks": ["x"]}},
+            }
+        }
+        graph = SpecGraph.from_spec(spec)
+        analyzer = SpecAnalyzer(spec, graph=graph)
+
+        assert graph.has_cycles is True
+        assert graph.critical_path == ()
+        assert graph.parallel_waves() == []
+        assert analyzer.get_task_depth("x") == 1
+        assert analyzer.get_stats()["has_cycles"] is True
+
+
+class TestSharedGraph:
+    """The analyzers reuse one precomputed graph."""
+
+    def test_analyzer_uses_given_graph(self, sample_spec_data):
+        graph = SpecGraph.from_spec(sample_spec_data)
+        analyzer = SpecAnalyzer(sample_spec_data, graph=graph)
+
+        assert analyzer.graph is graph
+        assert analyzer.get_critical_path() == list(graph.critical_path)
+        assert analyzer.task_graph == {t: list(e) for t, e in graph.forward.items()}
+
+    def test_complexity_scorer_uses_descendant_counts(self, sample_spec_data):
+        analyzer = SpecAnalyzer(sample_spec_data)
+        scorer = ComplexityScorer(sample_spec_data, analyzer)
+
+        for task_id in sample_spec_data["hierarchy"]:
+            assert scorer._count_subtasks(task_id) == analyzer.graph.descendant_counts[task_id]
+
+    @staticmethod
+    def _analyze(spec):
+        analyzer = SpecAnalyzer(spec)
+        ranker = PriorityRanker(spec, analyzer)
+        scorer = ComplexityScorer(spec, analyzer)
+        analyzer.get_critical_path()
+        analyzer.get_bottlenecks()
+        waves = analyzer.get_parallelizable_tasks(pending_only=False)
+        analyzer.get_stats()
+        ranker.rank_tasks()
+        scorer.score_all_tasks()
+        InsightGenerator(spec, analyzer, ranker, scorer).generate_all_insights()
+        DependencyGraphGenerator(spec, analyzer).generate_graph()
+        TaskGrouper(spec, analyzer).group_by_dependency()
+        return analyzer, waves
+
+    @classmethod
+    def _executed_lines(cls, spec) -> int:
+        """Lines executed in sdd_render during a full analysis (a deterministic work count)."""
+        count = 0
+
+        def trace_lines(frame, event, arg):
+            nonlocal count
+            if event == "line":
+                count += 1
+            return trace_lines
+
+        def trace_calls(frame, event, arg):
+            return trace_lines if "sdd_render" in frame.f_code.co_filename else None
+
+        previous = sys.gettrace()
+        sys.settrace(trace_calls)
+        try:
+            cls._analyze(spec)
+        finally:
+            sys.settrace(previous)
+        return count
+
+    def test_large_spec_analysis(self):
+        """Full analysis of a 400-task grid spec."""
+        analyzer, waves = self._analyze(_large_spec())
+
+        assert len(analyzer.graph.critical_path) == 20 + 20 - 1
+        assert len(waves) == 20 + 20 - 1
+
+    def test_analysis_work_scales_linearly(self):
+        """4x the tasks costs ~4x the work; the old per-wave rescans made long chains quadratic (~9x)."""
+        small = self._executed_lines(_large_spec(phase_count=1, tasks_per_phase=100))
+        large = self._executed_lines(_large_spec(phase_count=1, tasks_per_phase=400))
+
+        assert large / small < 5, f"4x tasks took {large / small:.1f}x the work"